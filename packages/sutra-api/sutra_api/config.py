@@ -97,6 +97,9 @@ class Settings(BaseSettings):
     rate_limit_learn: int = 10000    # Effectively unlimited
     rate_limit_reason: int = 10000   # Effectively unlimited
     rate_limit_search: int = 10000   # Effectively unlimited
+    # Shared memory segment name: workers on one host share rate limits
+    # (unset = each worker limits independently)
+    rate_limit_shared_memory: Optional[str] = None
 
     class Config:
         """Pydantic configuration."""
@@ -139,7 +139,7 @@ if MONITORING_AVAILABLE:
     logger.info("✅ Production monitoring enabled - zero external dependencies")
 
 # Add rate limiting middleware  
-from .middleware import RateLimitMiddleware
+from .middleware import RateLimitMiddleware, SharedMemoryRateLimitBackend
 
 app.add_middleware(
     RateLimitMiddleware,
@@ -150,6 +150,11 @@ app.add_middleware(
         "/learn/batch": settings.rate_limit_learn // 2,
         "/search": settings.rate_limit_search,
     },
+    backend=(
+        SharedMemoryRateLimitBackend(settings.rate_limit_shared_memory)
+        if settings.rate_limit_shared_memory
+        else None
+    ),
 )
 
 # Include routers
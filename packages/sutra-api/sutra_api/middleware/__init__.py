@@ -11,7 +11,12 @@ from .auth import (
     require_role,
 )
 
-from .rate_limit import RateLimitMiddleware
+from .rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimitMiddleware,
+    SharedMemoryRateLimitBackend,
+)
 
 __all__ = [
     "create_access_token",
@@ -21,4 +26,7 @@ __all__ = [
     "get_current_active_user",
     "require_role",
     "RateLimitMiddleware",
+    "RateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "SharedMemoryRateLimitBackend",
 ]
@@ -1,26 +1,265 @@
 """
 Rate limiting middleware for Sutra API.
 
-Implements simple in-memory rate limiting to prevent API abuse.
-For production, consider using Redis-backed rate limiting (slowapi + redis).
+Implements sliding-window-counter rate limiting to prevent API abuse: each
+(ip, endpoint) key keeps the request counts of the current and previous
+fixed windows, and the previous count is weighted by how much of it still
+overlaps the sliding window. Checks are O(1) with constant state per key.
+
+State lives in a pluggable RateLimitBackend: per-process memory by default,
+or a shared-memory table so several API workers on one host enforce a
+single limit.
 """
 
+import hashlib
+import math
+import os
+import struct
+import tempfile
 import time
-from collections import defaultdict
-from typing import Callable, Dict, Tuple
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, Request, Response, status
 from starlette.middleware.base import BaseHTTPMiddleware
 
 
+def sliding_window_hit(
+    window: int,
+    current: int,
+    previous: int,
+    now: float,
+    limit: int,
+    window_seconds: float,
+) -> Tuple[bool, float, int, int, int]:
+    """
+    Apply one request to a key's sliding-window-counter state.
+
+    Args:
+        window: Index of the fixed window ``current`` counts
+        current: Requests allowed in that window
+        previous: Requests allowed in the window before it
+        now: Current time (seconds)
+        limit: Requests allowed per sliding window
+        window_seconds: Window length
+
+    Returns:
+        (allowed, retry_after_seconds, window, current, previous) - the
+        updated state; only allowed requests are counted
+    """
+    position = now / window_seconds
+    now_window = int(position)
+    elapsed = position - now_window  # fraction of the current window
+
+    if window != now_window:
+        previous = current if window == now_window - 1 else 0
+        current = 0
+        window = now_window
+
+    if previous * (1.0 - elapsed) + current < limit:
+        return True, 0.0, window, current + 1, previous
+
+    # Time until the weighted count drops below the limit
+    if current >= limit:
+        # Needs the next window, and current (then previous) to decay enough
+        wait = (1.0 - elapsed) + max(0.0, 1.0 - limit / current)
+    else:
+        wait = max(0.0, 1.0 - (limit - current) / previous - elapsed)
+    return False, wait * window_seconds, window, current, previous
+
+
+class RateLimitBackend(ABC):
+    """Storage for rate limit state, shared by whoever shares the backend."""
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window_seconds: float) -> Tuple[bool, float]:
+        """
+        Count a request for key if it is within limit.
+
+        Returns:
+            (allowed, retry_after_seconds)
+        """
+
+
+class _WindowCounter:
+    """Sliding-window-counter state of one key."""
+
+    __slots__ = ("window", "current", "previous")
+
+    def __init__(self):
+        self.window = 0
+        self.current = 0
+        self.previous = 0
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-process rate limit state.
+
+    Idle keys expire through a time wheel: a key is filed under the window
+    it was last active in, and two windows later that bucket is drained a
+    few keys per request rather than in one sweep.
+    """
+
+    def __init__(self, expire_batch: int = 32):
+        self.counters: Dict[str, _WindowCounter] = {}
+        self.expire_batch = expire_batch
+        self._wheel: Dict[int, List[str]] = {}  # window -> keys that became active in it
+        self._expiring: Deque[str] = deque()
+        self._expired_through = 0  # windows up to here were moved to _expiring
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> Tuple[bool, float]:
+        now = time.time()
+        counter = self.counters.get(key)
+        if counter is None:
+            counter = self.counters[key] = _WindowCounter()
+        last_window = counter.window
+
+        allowed, retry_after, counter.window, counter.current, counter.previous = (
+            sliding_window_hit(
+                counter.window, counter.current, counter.previous, now, limit, window_seconds
+            )
+        )
+        if counter.window != last_window:
+            self._wheel.setdefault(counter.window, []).append(key)
+        self._expire(counter.window)
+        return allowed, retry_after
+
+    def _expire(self, now_window: int):
+        """Drop up to expire_batch keys idle for two full windows."""
+        stale_through = now_window - 2  # counts from these windows no longer matter
+        if stale_through > self._expired_through:
+            for window in [w for w in self._wheel if w <= stale_through]:
+                self._expiring.extend(self._wheel.pop(window))
+            self._expired_through = stale_through
+
+        for _ in range(min(self.expire_batch, len(self._expiring))):
+            key = self._expiring.popleft()
+            counter = self.counters.get(key)
+            if counter is not None and counter.window <= stale_through:
+                del self.counters[key]
+
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Rate limit state in a named shared-memory table, shared by every process
+    on the host that opens the same name (e.g. uvicorn/gunicorn workers).
+
+    The table is open-addressed with fixed 24-byte slots (key hash, window,
+    current, previous); a slot idle for two windows is reused in place, so
+    expiry needs no sweep. Updates are serialized with an flock on a lock
+    file next to the segment. If a key finds no free slot within
+    ``max_probes`` the request is allowed (fail open).
+    """
+
+    _SLOT = struct.Struct("<QqII")
+
+    def __init__(self, name: str = "sutra_rate_limit", slots: int = 65536, max_probes: int = 16):
+        """
+        Args:
+            name: Shared memory segment name (same name = same limits)
+            slots: Table size; should comfortably exceed active keys
+            max_probes: Slots searched per key before failing open
+        """
+        import fcntl
+        from multiprocessing import shared_memory
+
+        self._untracked = False  # unregistered from the resource tracker by hand
+        self._flock = fcntl.flock
+        self._lock_ex, self._lock_un = fcntl.LOCK_EX, fcntl.LOCK_UN
+        self.slots = slots
+        self.max_probes = max_probes
+        size = slots * self._SLOT.size
+
+        self._lock_fd = os.open(
+            os.path.join(tempfile.gettempdir(), f"{name}.lock"), os.O_RDWR | os.O_CREAT, 0o600
+        )
+        self._flock(self._lock_fd, self._lock_ex)
+        try:
+            try:
+                self._shm = self._open_segment(shared_memory, name, True, size)
+            except FileExistsError:
+                self._shm = self._open_segment(shared_memory, name, False, size)
+        finally:
+            self._flock(self._lock_fd, self._lock_un)
+        if self._shm.size < size:
+            raise ValueError(f"Shared memory segment {name} is smaller than {slots} slots")
+        self._buf = self._shm.buf
+
+    def _open_segment(self, shared_memory, name: str, create: bool, size: int):
+        """Open the segment without the resource tracker unlinking it at exit."""
+        try:
+            return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+        except TypeError:  # Python < 3.13
+            from multiprocessing import resource_tracker
+
+            shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+            resource_tracker.unregister(shm._name, "shared_memory")
+            self._untracked = True
+            return shm
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # Stable across processes (unlike hash()); 0 marks an empty slot
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> Tuple[bool, float]:
+        key_hash = self._hash(key)
+        slot_struct, buf = self._SLOT, self._buf
+        now = time.time()
+        now_window = int(now / window_seconds)
+
+        self._flock(self._lock_fd, self._lock_ex)
+        try:
+            free = None
+            index = key_hash % self.slots
+            for _ in range(self.max_probes):
+                offset = index * slot_struct.size
+                slot_hash, window, current, previous = slot_struct.unpack_from(buf, offset)
+                if slot_hash == key_hash:
+                    break
+                if free is None and (slot_hash == 0 or window < now_window - 1):
+                    free = offset  # empty, or idle long enough to forget
+                index = (index + 1) % self.slots
+            else:
+                if free is None:
+                    return True, 0.0  # table full around this key: fail open
+                offset, window, current, previous = free, 0, 0, 0
+
+            allowed, retry_after, window, current, previous = sliding_window_hit(
+                window, current, previous, now, limit, window_seconds
+            )
+            slot_struct.pack_into(buf, offset, key_hash, window, current, previous)
+            return allowed, retry_after
+        finally:
+            self._flock(self._lock_fd, self._lock_un)
+
+    def close(self):
+        """Detach this process from the table."""
+        self._buf = None
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self):
+        """Remove the shared segment (once no worker needs it)."""
+        if self._untracked:
+            # unlink() unregisters it from the tracker again on Python < 3.13
+            from multiprocessing import resource_tracker
+
+            resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
-    Simple in-memory rate limiting middleware.
+    Rate limiting middleware.
 
     Tracks requests per IP address and endpoint combination.
-    Uses sliding window algorithm for accurate rate limiting.
+    Uses a sliding window counter (O(1) per request).
 
-    Note: This is a basic implementation for single-server deployments.
+    Note: Limits are per process unless a shared backend is passed
+    (SharedMemoryRateLimitBackend covers several workers on one host).
     For multi-server production, use Redis-backed rate limiting (slowapi).
     """
 
@@ -32,6 +271,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         endpoint_limits: Dict[str, int] = None,
         trusted_proxies: list = None,
         behind_proxy: bool = False,
+        backend: Optional[RateLimitBackend] = None,
     ):
         """
         Initialize rate limiting middleware.
@@ -42,6 +282,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             window_seconds: Time window in seconds (default: 60)
             endpoint_limits: Per-endpoint limits override
                 Example: {"/learn": 30, "/reason": 20}
+            backend: Where counters are kept (default: this process's memory)
         """
         super().__init__(app)
         self.default_limit = default_limit
@@ -50,12 +291,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.trusted_proxies = set(trusted_proxies or [])
         self.behind_proxy = behind_proxy
 
-        # Track requests: {(ip, endpoint): [(timestamp, ...)]}
-        self.request_log: Dict[Tuple[str, str], list] = defaultdict(list)
-
-        # Cleanup old entries periodically
-        self.last_cleanup = time.time()
-        self.cleanup_interval = 300  # 5 minutes
+        # Sliding window counters per "ip|endpoint"
+        self.backend = backend or InMemoryRateLimitBackend()
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request with rate limiting."""
@@ -71,24 +308,22 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Get rate limit for this endpoint
         limit = self.endpoint_limits.get(endpoint, self.default_limit)
 
-        # Check rate limit
-        if not self._is_allowed(client_ip, endpoint, limit):
+        # Check rate limit (and count the request if allowed)
+        allowed, retry_after = self.backend.hit(
+            f"{client_ip}|{endpoint}", limit, self.window_seconds
+        )
+        if not allowed:
+            retry_after = max(1, math.ceil(retry_after))
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail={
                     "error": "RateLimitExceeded",
                     "message": f"Rate limit exceeded: {limit} requests per {self.window_seconds} seconds",
-                    "retry_after": self.window_seconds,
+                    "retry_after": retry_after,
                 },
-                headers={"Retry-After": str(self.window_seconds)},
+                headers={"Retry-After": str(retry_after)},
             )
 
-        # Record this request
-        self._record_request(client_ip, endpoint)
-
-        # Periodic cleanup
-        self._maybe_cleanup()
-
         return await call_next(request)
 
     def _get_client_ip(self, request: Request) -> str:
@@ -128,55 +363,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return "unknown"
 
-    def _is_allowed(self, client_ip: str, endpoint: str, limit: int) -> bool:
-        """Check if request is within rate limit."""
-        key = (client_ip, endpoint)
-        now = time.time()
-        window_start = now - self.window_seconds
-
-        # Get requests within current window
-        requests = self.request_log.get(key, [])
-        recent_requests = [ts for ts in requests if ts > window_start]
-
-        return len(recent_requests) < limit
-
-    def _record_request(self, client_ip: str, endpoint: str) -> None:
-        """Record a request timestamp."""
-        key = (client_ip, endpoint)
-        now = time.time()
-        window_start = now - self.window_seconds
-
-        # Clean old timestamps and add new one
-        requests = self.request_log.get(key, [])
-        requests = [ts for ts in requests if ts > window_start]
-        requests.append(now)
-        self.request_log[key] = requests
-
-    def _maybe_cleanup(self) -> None:
-        """Periodically cleanup old request logs to prevent memory bloat."""
-        now = time.time()
-
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
-
-        window_start = now - self.window_seconds
-
-        # Remove expired entries
-        keys_to_delete = []
-        for key, timestamps in self.request_log.items():
-            # Keep only recent timestamps
-            recent = [ts for ts in timestamps if ts > window_start]
-            if recent:
-                self.request_log[key] = recent
-            else:
-                keys_to_delete.append(key)
-
-        # Delete empty entries
-        for key in keys_to_delete:
-            del self.request_log[key]
-
-        self.last_cleanup = now
-
 
 def create_rate_limit_middleware(
     default_limit: int = 60,
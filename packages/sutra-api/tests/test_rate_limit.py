@@ -0,0 +1,198 @@
+"""
+Rate Limiting Tests.
+
+Tests for the sliding-window-counter maths and the rate limit backends.
+"""
+
+import os
+import tempfile
+import uuid
+
+import pytest
+
+from sutra_api.middleware import rate_limit
+from sutra_api.middleware.rate_limit import (
+    InMemoryRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+    sliding_window_hit,
+)
+
+
+class FakeClock:
+    """Replaces time.time() in the rate limit module."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "time", clock)
+    return clock
+
+
+class TestSlidingWindowHit:
+    """Test the sliding-window-counter state update."""
+
+    def test_allowed_request_is_counted(self):
+        """Test an allowed request increments the current window."""
+        assert sliding_window_hit(1, 3, 2, 15.0, 10, 10) == (True, 0.0, 1, 4, 2)
+
+    def test_previous_window_is_weighted_by_overlap(self):
+        """Test the previous count decays as the window slides."""
+        # 20% into window 1: 10 * 0.8 + 1 = 9 < 10
+        allowed, _, _, current, _ = sliding_window_hit(1, 1, 10, 12.0, 10, 10)
+        assert allowed and current == 2
+        # 10 * 0.8 + 2 = 10, not below the limit
+        allowed, _, _, current, _ = sliding_window_hit(1, 2, 10, 12.0, 10, 10)
+        assert not allowed and current == 2
+
+    def test_rollover_to_next_window(self):
+        """Test the current count becomes the previous one in the next window."""
+        assert sliding_window_hit(0, 7, 4, 11.0, 10, 10)[2:] == (1, 1, 7)
+
+    def test_rollover_past_idle_window(self):
+        """Test counts older than the previous window are forgotten."""
+        assert sliding_window_hit(0, 7, 4, 25.0, 10, 10)[2:] == (2, 1, 0)
+
+    def test_retry_after_with_previous_window(self):
+        """Test Retry-After is when the decaying previous count allows a request."""
+        allowed, retry_after, *_ = sliding_window_hit(1, 6, 10, 12.0, 10, 10)
+        assert not allowed
+        assert retry_after == pytest.approx(4.0)
+
+        # Still at the limit just before then, allowed just after
+        assert not sliding_window_hit(1, 6, 10, 12.0 + retry_after - 0.01, 10, 10)[0]
+        assert sliding_window_hit(1, 6, 10, 12.0 + retry_after + 0.01, 10, 10)[0]
+
+    def test_retry_after_when_current_window_is_full(self):
+        """Test Retry-After spans into the next window when current alone hits the limit."""
+        allowed, retry_after, *_ = sliding_window_hit(1, 10, 0, 12.0, 10, 10)
+        assert not allowed
+        assert retry_after == pytest.approx(8.0)
+
+        assert not sliding_window_hit(1, 10, 0, 12.0 + retry_after - 0.01, 10, 10)[0]
+        assert sliding_window_hit(1, 10, 0, 12.0 + retry_after + 0.01, 10, 10)[0]
+
+    def test_denied_request_is_not_counted(self):
+        """Test a rejected request leaves the counts unchanged."""
+        assert sliding_window_hit(1, 10, 0, 12.0, 10, 10)[2:] == (1, 10, 0)
+
+
+class TestInMemoryBackend:
+    """Test the per-process backend and its time-wheel expiry."""
+
+    def test_limit_and_window_slide(self, clock):
+        """Test requests are limited per key until the window slides on."""
+        backend = InMemoryRateLimitBackend()
+        clock.now = 1005.0
+        assert all(backend.hit("a", 3, 10)[0] for _ in range(3))
+        allowed, retry_after = backend.hit("a", 3, 10)
+        assert not allowed and retry_after > 0
+        assert backend.hit("b", 3, 10)[0]
+
+        clock.now = 1025.0
+        assert backend.hit("a", 3, 10)[0]
+
+    def test_idle_keys_expire_after_two_windows(self, clock):
+        """Test keys idle for two full windows are dropped."""
+        backend = InMemoryRateLimitBackend()
+        clock.now = 1005.0
+        backend.hit("a", 10, 10)
+        backend.hit("b", 10, 10)
+
+        clock.now = 1015.0
+        backend.hit("b", 10, 10)  # b stays active
+        assert set(backend.counters) == {"a", "b"}
+
+        clock.now = 1025.0
+        backend.hit("c", 10, 10)
+        assert set(backend.counters) == {"b", "c"}
+
+    def test_expiry_is_drained_in_batches(self, clock):
+        """Test at most expire_batch keys are dropped per request."""
+        backend = InMemoryRateLimitBackend(expire_batch=2)
+        clock.now = 1005.0
+        for i in range(5):
+            backend.hit(f"k{i}", 10, 10)
+
+        clock.now = 1025.0
+        backend.hit("new", 10, 10)
+        assert len(backend.counters) == 4
+        backend.hit("new", 10, 10)
+        assert len(backend.counters) == 2
+        backend.hit("new", 10, 10)
+        assert set(backend.counters) == {"new"}
+
+
+@pytest.fixture
+def shared_backend():
+    """Factory for shared-memory backends; segments are removed afterwards."""
+    pytest.importorskip("fcntl")
+    name = f"sutra_rl_test_{uuid.uuid4().hex[:8]}"
+    backends = []
+
+    def make(**kwargs):
+        backend = SharedMemoryRateLimitBackend(name=name, **kwargs)
+        backends.append(backend)
+        return backend
+
+    yield make
+
+    for backend in backends:
+        backend.close()
+    if backends:
+        backends[0].unlink()
+        os.remove(os.path.join(tempfile.gettempdir(), f"{name}.lock"))
+
+
+class TestSharedMemoryBackend:
+    """Test the shared-memory backend's table."""
+
+    def test_instances_share_limits(self, shared_backend, clock):
+        """Test backends opened with the same name count against one limit."""
+        first = shared_backend(slots=64)
+        second = shared_backend(slots=64)
+        clock.now = 1005.0
+
+        assert first.hit("a", 2, 10)[0]
+        assert second.hit("a", 2, 10)[0]
+        assert not first.hit("a", 2, 10)[0]
+        assert not second.hit("a", 2, 10)[0]
+
+    def test_colliding_keys_probe_to_next_slot(self, shared_backend, clock):
+        """Test keys hashing to the same slot are kept apart by probing."""
+        backend = shared_backend(slots=2, max_probes=2)
+        clock.now = 1005.0
+
+        assert backend.hit("a", 1, 10)[0]
+        assert backend.hit("b", 1, 10)[0]
+        assert not backend.hit("a", 1, 10)[0]
+        assert not backend.hit("b", 1, 10)[0]
+
+    def test_idle_slot_is_reused(self, shared_backend, clock):
+        """Test a slot idle for two windows is taken over by a new key."""
+        backend = shared_backend(slots=1, max_probes=1)
+        clock.now = 1005.0
+        assert backend.hit("a", 1, 10)[0]
+
+        clock.now = 1025.0
+        assert backend.hit("b", 1, 10)[0]
+        assert not backend.hit("b", 1, 10)[0]
+        # a's state is gone and its only slot is held by b
+        assert backend.hit("a", 1, 10) == (True, 0.0)
+
+    def test_full_table_fails_open(self, shared_backend, clock):
+        """Test a key with no free slot within max_probes is allowed."""
+        backend = shared_backend(slots=1, max_probes=1)
+        clock.now = 1005.0
+        assert backend.hit("a", 1, 10)[0]
+
+        for _ in range(5):
+            assert backend.hit("b", 1, 10) == (True, 0.0)
+        # The key holding the slot is still limited
+        assert not backend.hit("a", 1, 10)[0]
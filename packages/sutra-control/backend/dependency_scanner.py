@@ -4,10 +4,12 @@ Monitors all package dependencies across Python, Rust, and Node.js
 """
 
 import json
+import hashlib
 import subprocess
 import asyncio
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 import toml
@@ -53,6 +55,20 @@ class Dependency:
         if self.vulnerabilities is None:
             self.vulnerabilities = []
 
+# Files whose content determines a package's scan result
+DEPENDENCY_FILES = {
+    PackageType.PYTHON: ["requirements.txt", "requirements-dev.txt", "pyproject.toml", "poetry.lock", "Pipfile.lock"],
+    PackageType.RUST: ["Cargo.toml", "Cargo.lock"],
+    PackageType.NODE: ["package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml"],
+}
+
+# Tools whose version determines a package's scan result
+SCAN_TOOLS = {
+    PackageType.PYTHON: [["pip-audit", "--version"], ["pip", "--version"]],
+    PackageType.RUST: [["cargo", "audit", "--version"], ["cargo", "outdated", "--version"]],
+    PackageType.NODE: [["npm", "--version"]],
+}
+
 @dataclass
 class PackageHealth:
     package_path: str
@@ -65,34 +81,170 @@ class PackageHealth:
     last_scanned: datetime
     dependencies: List[Dependency]
 
+@dataclass
+class CachedScan:
+    fingerprint: str
+    health: PackageHealth
+    scanned_at: float
+
 class DependencyScanner:
-    def __init__(self, project_root: Path):
+    """
+    Scans project packages for dependencies, vulnerabilities and updates.
+
+    Results are cached per package, keyed by a hash of its manifest and
+    lockfile contents plus the scanner tool versions. A cached result whose
+    key changed or that is older than ``max_age`` seconds is still served,
+    while a background task rescans the package. Scans run concurrently, at
+    most ``max_concurrency`` packages at a time, with non-blocking tool
+    subprocesses.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        max_concurrency: int = 4,
+        max_age: float = 6 * 3600,
+        tool_timeout: float = 300.0,
+    ):
         self.project_root = Path(project_root)
-        self.cache = {}
+        self.cache: Dict[Tuple[str, PackageType], CachedScan] = {}
         self.last_scan = None
-        
-    async def scan_all_packages(self) -> Dict[str, PackageHealth]:
-        """Scan all packages in the project for dependencies and vulnerabilities"""
+        self.max_age = max_age
+        self.tool_timeout = tool_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._refreshing: Dict[Tuple[str, PackageType], asyncio.Task] = {}
+        self._tool_versions: Dict[PackageType, Tuple[str, float]] = {}
+        
+    async def scan_all_packages(self, force: bool = False) -> Dict[str, PackageHealth]:
+        """
+        Scan all packages in the project for dependencies and vulnerabilities
+
+        Args:
+            force: Rescan every package now instead of serving cached results
+
+        Returns:
+            Package path -> health report. Stale cached reports are returned
+            as-is and refreshed in the background; only packages never
+            scanned before are waited for.
+        """
         results = {}
         
         # Find all package locations
         packages = await self._discover_packages()
         
-        # Scan each package in parallel
         tasks = []
         for pkg_path, pkg_type in packages:
-            tasks.append(self._scan_package(pkg_path, pkg_type))
-        
+            key = (pkg_path, pkg_type)
+            fingerprint = await self._fingerprint(pkg_path, pkg_type)
+            cached = self.cache.get(key)
+            if cached is None or force:
+                # Join an in-flight scan of this package rather than starting another
+                tasks.append(asyncio.shield(self._refresh_in_background(key, fingerprint)))
+                continue
+            if cached.fingerprint != fingerprint or time.time() - cached.scanned_at > self.max_age:
+                self._refresh_in_background(key, fingerprint)
+            results[pkg_path] = cached.health
+        
+        # Scan uncached packages concurrently (bounded by the semaphore)
         health_reports = await asyncio.gather(*tasks, return_exceptions=True)
         
         for report in health_reports:
             if isinstance(report, PackageHealth):
                 results[report.package_path] = report
-            else:
+            elif report is not None:  # None: scan failed, already logged
                 logger.error(f"Error scanning package: {report}")
         
         self.last_scan = datetime.now()
         return results
+
+    async def refresh_in_background(self):
+        """Rescan every package without waiting (e.g. to warm the cache at startup)."""
+        for pkg_path, pkg_type in await self._discover_packages():
+            key = (pkg_path, pkg_type)
+            self._refresh_in_background(key, await self._fingerprint(pkg_path, pkg_type))
+
+    def _refresh_in_background(self, key: Tuple[str, PackageType], fingerprint: str) -> asyncio.Task:
+        """Start a rescan of one package, or return the one already in flight."""
+        task = self._refreshing.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh(key, fingerprint))
+            self._refreshing[key] = task
+
+            def forget(done: asyncio.Task):
+                if self._refreshing.get(key) is done:
+                    del self._refreshing[key]
+
+            task.add_done_callback(forget)
+        return task
+
+    async def _refresh(self, key: Tuple[str, PackageType], fingerprint: str) -> Optional[PackageHealth]:
+        """
+        Scan one package (bounded concurrency) and cache the result.
+
+        Returns None if the scan failed; the error is logged here, since
+        nobody may be awaiting the task.
+        """
+        async with self._semaphore:
+            try:
+                health = await self._scan_package(*key)
+            except Exception as e:
+                logger.error(f"Error scanning package {key[0]}: {e}")
+                return None
+        self.cache[key] = CachedScan(fingerprint, health, time.time())
+        return health
+
+    async def _fingerprint(self, pkg_path: str, pkg_type: PackageType) -> str:
+        """Hash of the package's dependency files and scanner tool versions."""
+        digest = hashlib.sha256((await self._tool_version(pkg_type)).encode())
+        for name in DEPENDENCY_FILES[pkg_type]:
+            path = Path(pkg_path) / name
+            if path.is_file():
+                digest.update(name.encode())
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    async def _tool_version(self, pkg_type: PackageType) -> str:
+        """Versions of the scanner tools for a package type (re-checked every max_age)."""
+        cached = self._tool_versions.get(pkg_type)
+        if cached and time.time() - cached[1] < self.max_age:
+            return cached[0]
+        versions = []
+        for args in SCAN_TOOLS[pkg_type]:
+            try:
+                result = await self._run_tool(args, self.project_root)
+                versions.append(result.stdout.strip())
+            except (subprocess.SubprocessError, FileNotFoundError):
+                versions.append("unavailable")
+        version = "|".join(versions)
+        self._tool_versions[pkg_type] = (version, time.time())
+        return version
+
+    async def _run_tool(self, args: List[str], cwd) -> subprocess.CompletedProcess:
+        """
+        Run a scanner tool without blocking the event loop.
+
+        Raises:
+            FileNotFoundError: If the tool is not installed
+            subprocess.TimeoutExpired: If it runs longer than tool_timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), self.tool_timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, self.tool_timeout)
+        return subprocess.CompletedProcess(
+            args,
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
     
     async def _discover_packages(self) -> List[tuple]:
         """Discover all packages in the project"""
@@ -173,15 +325,16 @@ class DependencyScanner:
             deps = await self._parse_pyproject(pkg_path / "pyproject.toml")
             dependencies.extend(deps)
         
-        # Run pip-audit for vulnerability scanning
-        vulnerabilities = await self._run_pip_audit(pkg_path)
+        # Run pip-audit and the outdated check concurrently
+        vulnerabilities, outdated = await asyncio.gather(
+            self._run_pip_audit(pkg_path), self._check_pip_outdated(pkg_path)
+        )
         
         # Map vulnerabilities to dependencies
         for dep in dependencies:
             dep.vulnerabilities = vulnerabilities.get(dep.name, [])
         
-        # Check for outdated packages
-        outdated = await self._check_pip_outdated(pkg_path)
+        # Mark outdated packages
         for dep in dependencies:
             if dep.name in outdated:
                 dep.outdated = True
@@ -213,13 +366,14 @@ class DependencyScanner:
                 license=None
             ))
         
-        # Run cargo-audit for vulnerability scanning
-        vulnerabilities = await self._run_cargo_audit(pkg_path)
+        # Run cargo-audit and the outdated check concurrently
+        vulnerabilities, outdated = await asyncio.gather(
+            self._run_cargo_audit(pkg_path), self._check_cargo_outdated(pkg_path)
+        )
         for dep in dependencies:
             dep.vulnerabilities = vulnerabilities.get(dep.name, [])
         
-        # Check for outdated packages
-        outdated = await self._check_cargo_outdated(pkg_path)
+        # Mark outdated packages
         for dep in dependencies:
             if dep.name in outdated:
                 dep.outdated = True
@@ -254,13 +408,14 @@ class DependencyScanner:
                 license=None
             ))
         
-        # Run npm audit for vulnerability scanning
-        vulnerabilities = await self._run_npm_audit(pkg_path)
+        # Run npm audit and the outdated check concurrently
+        vulnerabilities, outdated = await asyncio.gather(
+            self._run_npm_audit(pkg_path), self._check_npm_outdated(pkg_path)
+        )
         for dep in dependencies:
             dep.vulnerabilities = vulnerabilities.get(dep.name, [])
         
-        # Check for outdated packages
-        outdated = await self._check_npm_outdated(pkg_path)
+        # Mark outdated packages
         for dep in dependencies:
             if dep.name in outdated:
                 dep.outdated = True
@@ -332,12 +487,7 @@ class DependencyScanner:
         vulnerabilities = {}
         try:
             # Run pip-audit
-            result = subprocess.run(
-                ["pip-audit", "--format", "json", "--desc"],
-                capture_output=True,
-                text=True,
-                cwd=pkg_path
-            )
+            result = await self._run_tool(["pip-audit", "--format", "json", "--desc"], pkg_path)
             
             if result.returncode == 0:
                 audit_data = json.loads(result.stdout)
@@ -364,12 +514,7 @@ class DependencyScanner:
         """Run cargo-audit to check for vulnerabilities"""
         vulnerabilities = {}
         try:
-            result = subprocess.run(
-                ["cargo", "audit", "--json"],
-                capture_output=True,
-                text=True,
-                cwd=pkg_path
-            )
+            result = await self._run_tool(["cargo", "audit", "--json"], pkg_path)
             
             # Parse JSON output line by line
             for line in result.stdout.strip().split("\n"):
@@ -402,12 +547,7 @@ class DependencyScanner:
         """Run npm audit to check for vulnerabilities"""
         vulnerabilities = {}
         try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                capture_output=True,
-                text=True,
-                cwd=pkg_path
-            )
+            result = await self._run_tool(["npm", "audit", "--json"], pkg_path)
             
             audit_data = json.loads(result.stdout)
             for advisory_id, advisory in audit_data.get("advisories", {}).items():
@@ -432,12 +572,7 @@ class DependencyScanner:
         """Check for outdated Python packages"""
         outdated = {}
         try:
-            result = subprocess.run(
-                ["pip", "list", "--outdated", "--format", "json"],
-                capture_output=True,
-                text=True,
-                cwd=pkg_path
-            )
+            result = await self._run_tool(["pip", "list", "--outdated", "--format", "json"], pkg_path)
             
             if result.returncode == 0:
                 packages = json.loads(result.stdout)
@@ -452,12 +587,7 @@ class DependencyScanner:
         """Check for outdated Rust packages"""
         outdated = {}
         try:
-            result = subprocess.run(
-                ["cargo", "outdated", "--format", "json"],
-                capture_output=True,
-                text=True,
-                cwd=pkg_path
-            )
+            result = await self._run_tool(["cargo", "outdated", "--format", "json"], pkg_path)
             
             if result.returncode == 0:
                 data = json.loads(result.stdout)
@@ -473,12 +603,7 @@ class DependencyScanner:
         """Check for outdated Node packages"""
         outdated = {}
         try:
-            result = subprocess.run(
-                ["npm", "outdated", "--json"],
-                capture_output=True,
-                text=True,
-                cwd=pkg_path
-            )
+            result = await self._run_tool(["npm", "outdated", "--json"], pkg_path)
             
             # npm outdated returns non-zero if there are outdated packages
             if result.stdout:
@@ -9,6 +9,7 @@ import logging
 import os
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 import json
 
@@ -25,6 +26,8 @@ from sutra_storage_client import StorageClient
 from backend.grid_api import GridManager
 # Import dependency scanner
 from backend.dependency_scanner import DependencyScanner, PackageHealth, VulnerabilitySeverity
+# Import shared WebSocket status broadcaster
+from backend.status_broadcaster import StatusBroadcaster
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -439,14 +442,25 @@ async def semantic_query_gateway(request: dict):
 
 # ===== Dependency Management Endpoints =====
 
+# Shared scanner so results are cached across requests
+dependency_scanner = DependencyScanner(Path("/app").parent.parent)  # Adjust based on Docker setup
+
+
+@app.on_event("startup")
+async def warm_dependency_cache():
+    """Scan dependencies in the background so the dashboard loads from cache"""
+    await dependency_scanner.refresh_in_background()
+
+
 @app.get("/api/dependencies/scan")
-async def scan_dependencies():
-    """Scan all packages for dependencies and vulnerabilities"""
+async def scan_dependencies(refresh: bool = False):
+    """Scan all packages for dependencies and vulnerabilities
+
+    Serves cached results (refreshing stale ones in the background) unless
+    refresh=true forces a full rescan.
+    """
     try:
-        from pathlib import Path
-        project_root = Path("/app").parent.parent  # Adjust based on Docker setup
-        scanner = DependencyScanner(project_root)
-        health_reports = await scanner.scan_all_packages()
+        health_reports = await dependency_scanner.scan_all_packages(force=refresh)
         
         # Convert to JSON-serializable format
         results = {}
@@ -489,10 +503,7 @@ async def scan_dependencies():
 async def get_dependency_summary():
     """Get summary of dependency health across all packages"""
     try:
-        from pathlib import Path
-        project_root = Path("/app").parent.parent
-        scanner = DependencyScanner(project_root)
-        health_reports = await scanner.scan_all_packages()
+        health_reports = await dependency_scanner.scan_all_packages()
         
         # Calculate totals
         total_deps = 0
@@ -546,10 +557,7 @@ async def get_dependency_summary():
 async def get_sbom():
     """Generate Software Bill of Materials (SBOM)"""
     try:
-        from pathlib import Path
-        project_root = Path("/app").parent.parent
-        scanner = DependencyScanner(project_root)
-        sbom = await scanner.generate_sbom()
+        sbom = await dependency_scanner.generate_sbom()
         return sbom
     except Exception as e:
         logger.error(f"SBOM generation failed: {e}")
@@ -563,10 +571,7 @@ async def get_vulnerabilities(
 ):
     """Get all vulnerabilities, optionally filtered"""
     try:
-        from pathlib import Path
-        project_root = Path("/app").parent.parent
-        scanner = DependencyScanner(project_root)
-        health_reports = await scanner.scan_all_packages()
+        health_reports = await dependency_scanner.scan_all_packages()
         
         vulnerabilities = []
         for path, health in health_reports.items():
@@ -601,6 +606,22 @@ async def get_vulnerabilities(
         raise HTTPException(status_code=500, detail="Failed to get vulnerabilities")
 
 
+async def sample_status() -> Dict[str, Any]:
+    """Abstracted system status pushed to /ws clients"""
+    health, metrics = await asyncio.gather(
+        gateway.get_system_health(), gateway.get_system_metrics()
+    )
+    return {
+        "health": health.dict(),
+        "metrics": metrics.dict(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+# One sampler shared by all WebSocket clients (paused while none are connected)
+status_broadcaster = StatusBroadcaster(sample_status, interval=2.0)
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates - no internal details exposed"""
@@ -609,27 +630,16 @@ async def websocket_endpoint(websocket: WebSocket):
     logger.info(f"Client connected. Active connections: {len(active_connections)}")
     
     try:
-        while True:
-            # Send abstracted system status
-            health = await gateway.get_system_health()
-            metrics = await gateway.get_system_metrics()
-            
-            data = {
-                "health": health.dict(),
-                "metrics": metrics.dict(),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            await websocket.send_json(data)
-            await asyncio.sleep(2)  # Update every 2 seconds
-            
+        # Full snapshot first, then deltas every 2 seconds
+        await status_broadcaster.stream(websocket)
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
-        logger.info(f"Client disconnected. Active connections: {len(active_connections)}")
+        logger.info("Client disconnected")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
         if websocket in active_connections:
             active_connections.remove(websocket)
+        logger.info(f"Active connections: {len(active_connections)}")
 
 
 # Serve PWA files explicitly before catch-all route
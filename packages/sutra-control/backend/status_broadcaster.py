@@ -0,0 +1,119 @@
+"""
+Shared status broadcaster for the Control Center WebSocket.
+
+One background sampler computes the system status snapshot per interval and
+fans it out to every connected client, so storage is polled once per
+interval no matter how many dashboards are open. Sampling stops while no
+client is connected.
+
+Wire format (JSON text frames):
+- ``{"type": "snapshot", "health": {...}, "metrics": {...}, "timestamp": ...}``
+  is sent first, with every field
+- ``{"type": "delta", ...}`` frames then carry only the fields that changed
+  since the frame that client last received
+
+Each client has its own sender that always sends the latest snapshot: a slow
+client skips the frames it could not keep up with (its next delta is computed
+against what it last received) and never holds up the others.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+def status_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of ``new`` that differ from ``old``, one level into nested dicts."""
+    delta = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            changed = {k: v for k, v in value.items() if previous.get(k) != v}
+            if changed:
+                delta[key] = changed
+        elif previous != value:
+            delta[key] = value
+    return delta
+
+
+def _encode(frame_type: str, fields: Dict[str, Any]) -> str:
+    return json.dumps({"type": frame_type, **fields}, default=str)
+
+
+class StatusBroadcaster:
+    """Samples status once per interval and streams it to all subscribers."""
+
+    def __init__(self, sample: Callable[[], Awaitable[Dict[str, Any]]], interval: float = 2.0):
+        """
+        Args:
+            sample: Coroutine function returning the current status snapshot
+            interval: Seconds between samples
+        """
+        self._sample = sample
+        self.interval = interval
+        self._subscribers = 0
+        self._version = 0
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._delta_text: Optional[str] = None  # delta from version - 1, encoded once
+        self._updated = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscribers(self) -> int:
+        return self._subscribers
+
+    async def stream(self, websocket: WebSocket):
+        """Send status frames to one client until sending fails (disconnect)."""
+        self._subscribers += 1
+        sent_version = self._version
+        if self._task is None:
+            # Resuming: the last snapshot is stale, wait for a fresh sample
+            self._task = asyncio.create_task(self._run())
+        elif self._snapshot is not None:
+            sent_version -= 1  # send the current snapshot right away
+        sent: Optional[Dict[str, Any]] = None
+
+        try:
+            while True:
+                async with self._updated:
+                    await self._updated.wait_for(lambda: self._version > sent_version)
+                    version, snapshot, delta_text = self._version, self._snapshot, self._delta_text
+
+                if sent is None:
+                    text = _encode("snapshot", snapshot)
+                elif version == sent_version + 1:
+                    text = delta_text  # shared by every client that kept up
+                else:
+                    # Skipped stale frames: diff against what this client has
+                    delta = status_delta(sent, snapshot)
+                    text = _encode("delta", delta) if delta else None
+
+                if text is not None:
+                    await websocket.send_text(text)
+                sent_version, sent = version, snapshot
+        finally:
+            self._subscribers -= 1
+
+    async def _run(self):
+        """Sample every interval while anyone is subscribed."""
+        try:
+            while self._subscribers:
+                try:
+                    snapshot = await self._sample()
+                except Exception as e:
+                    logger.error(f"Status sampling failed: {e}")
+                else:
+                    delta = status_delta(self._snapshot, snapshot) if self._snapshot else None
+                    async with self._updated:
+                        self._version += 1
+                        self._snapshot = snapshot
+                        self._delta_text = _encode("delta", delta) if delta else None
+                        self._updated.notify_all()
+                await asyncio.sleep(self.interval)
+        finally:
+            self._task = None
@@ -151,9 +151,17 @@ export const useAppStore = create<AppState>()(
         newWs.onmessage = (event) => {
           try {
             const data = JSON.parse(event.data);
-            // Backend sends { health, metrics, timestamp }
-            // We need to extract just health and metrics for SystemStatus
-            if (data.health && data.metrics) {
+            // Backend sends a { type: 'snapshot', health, metrics, timestamp }
+            // frame, then { type: 'delta', ... } frames with changed fields only
+            const current = get().systemStatus;
+            if (data.type === 'delta') {
+              if (current && (data.health || data.metrics)) {
+                get().setSystemStatus({
+                  health: { ...current.health, ...data.health },
+                  metrics: { ...current.metrics, ...data.metrics },
+                });
+              }
+            } else if (data.health && data.metrics) {
               const systemStatus: SystemStatus = {
                 health: data.health,
                 metrics: data.metrics,
@@ -28,9 +28,11 @@ from .config import (
 )
 from .exceptions import (
     AssociationError,
+    BatchLearningError,
     ConceptError,
     ConfigurationError,
     LearningError,
+    PartialWriteError,
     StorageError,
     SutraError,
     ValidationError,
@@ -62,9 +64,9 @@ except ImportError:
 
 # NLP processing (optional, requires spacy)
 try:
-    from .utils.nlp import TextProcessor
+    from .utils.nlp import TextProcessor, get_text_processor
 
-    __all_nlp__ = ["TextProcessor"]
+    __all_nlp__ = ["TextProcessor", "get_text_processor"]
 except ImportError:
     __all_nlp__ = []
 
@@ -104,8 +106,10 @@ __all__ = (
         "ConceptError",
         "AssociationError",
         "LearningError",
+        "BatchLearningError",
         "ValidationError",
         "StorageError",
+        "PartialWriteError",
         "ConfigurationError",
     ]
     + __all_nlp__
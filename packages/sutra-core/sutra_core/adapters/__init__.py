@@ -8,13 +8,19 @@ This module provides adapters for ingesting knowledge from various sources:
 - Streaming systems (Kafka, message queues)
 """
 
-from .base import ChunkMetadata, LearningProgress, MassLearningAdapter
+from .base import (
+    ChunkMetadata,
+    LearningCheckpoint,
+    LearningProgress,
+    MassLearningAdapter,
+)
 from .dataset_adapter import DatasetAdapter
 from .file_adapter import FileAdapter
 
 __all__ = [
     "MassLearningAdapter",
     "LearningProgress",
+    "LearningCheckpoint",
     "ChunkMetadata",
     "FileAdapter",
     "DatasetAdapter",
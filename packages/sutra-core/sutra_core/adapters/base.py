@@ -5,10 +5,16 @@ Defines the abstract interface that all mass learning adapters must implement,
 along with common data structures for progress tracking and metadata.
 """
 
+import json
 import logging
+import os
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +61,61 @@ class LearningProgress:
         return self.bytes_processed / self.elapsed_seconds
 
 
+@dataclass
+class LearningCheckpoint:
+    """Resume point of a mass learning run (stored in a JSON sidecar file)."""
+
+    source: str
+    source_size: int
+    source_mtime: float
+    chunks_consumed: int  # stream position: chunks read, including failed ones
+    chunks_processed: int
+    concepts_created: int
+    associations_created: int
+    bytes_processed: int
+    resume_state: Optional[Dict[str, Any]] = None  # get_chunks() kwargs to seek with
+    updated_at: float = 0.0
+    # [start, end) stream positions of chunks whose batch failed; retried on resume
+    failed_ranges: List[List[int]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LearningCheckpoint"]:
+        """Read a checkpoint file; returns None if missing or unreadable."""
+        try:
+            return cls(**json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+    def save(self, path: Path) -> None:
+        """Write atomically (temp file + rename) so a crash never truncates it."""
+        self.updated_at = time.time()
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(asdict(self)))
+        os.replace(tmp_path, path)
+
+
+def _to_ranges(positions: Iterable[int]) -> List[List[int]]:
+    """Chunk positions as sorted [start, end) runs."""
+    ranges: List[List[int]] = []
+    for position in sorted(positions):
+        if ranges and ranges[-1][1] == position:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([position, position + 1])
+    return ranges
+
+
+def _from_ranges(ranges: List[List[int]]) -> Set[int]:
+    return {position for start, end in ranges for position in range(start, end)}
+
+
+# Queue sentinel marking the end of the chunk stream
+_END_OF_STREAM = object()
+
+
 class MassLearningAdapter(ABC):
     """
     Abstract base class for mass learning adapters.
@@ -68,6 +129,8 @@ class MassLearningAdapter(ABC):
         batch_size: int = 50,
         chunk_size: int = 1000,
         progress_callback: Optional[Callable[[LearningProgress], None]] = None,
+        checkpoint_interval: int = 10,
+        prefetch_batches: int = 2,
     ):
         """
         Initialize the adapter.
@@ -76,10 +139,20 @@ class MassLearningAdapter(ABC):
             batch_size: Number of chunks to process in each batch
             chunk_size: Target size for text chunks (characters)
             progress_callback: Optional callback for progress updates
+            checkpoint_interval: Write the resume checkpoint every N batches
+            prefetch_batches: Batches read ahead on a background thread while
+                the learner works (0 = read on the calling thread, no overlap)
         """
         self.batch_size = batch_size
         self.chunk_size = chunk_size
         self.progress_callback = progress_callback
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.prefetch_batches = prefetch_batches
+
+    # Adapters whose chunks report ``extra["resume"]`` (get_chunks() kwargs
+    # that restart the stream right after that chunk) resume by seeking
+    # instead of re-reading and skipping already consumed chunks.
+    supports_offset_resume = False
 
     @abstractmethod
     def get_chunks(self, source: str, **kwargs) -> Iterator[tuple[str, ChunkMetadata]]:
@@ -129,23 +202,35 @@ class MassLearningAdapter(ABC):
         source: str,
         source_name: Optional[str] = None,
         category: Optional[str] = None,
+        resume: bool = False,
+        checkpoint_path: Optional[str] = None,
         **kwargs,
     ) -> LearningProgress:
         """
         Learn all content from a data source.
 
+        Chunks are read on a background thread into a bounded queue, so
+        reading overlaps with embedding and storage writes (with
+        ``prefetch_batches=0`` they are read on the calling thread instead). Every
+        ``checkpoint_interval`` batches the position is written to a sidecar
+        file, together with the chunks of batches that failed; with
+        ``resume=True`` a crashed or failed run retries those chunks and
+        continues from the position. Concept IDs are content hashes, so
+        re-learning the chunks of a partially checkpointed batch is
+        idempotent.
+
         Args:
             learner: AdaptiveLearner instance
             source: Source identifier
             source_name: Human-readable source name
             category: Content category for organization
+            resume: Continue from the checkpoint file if one matches the source
+            checkpoint_path: Checkpoint file (default: "<source>.checkpoint.json")
             **kwargs: Source-specific parameters
 
         Returns:
             Final learning progress
         """
-        import time
-
         start_time = time.time()
 
         # Get source information
@@ -165,16 +250,174 @@ class MassLearningAdapter(ABC):
             errors=[],
         )
 
+        checkpoint_file = Path(checkpoint_path or f"{source}.checkpoint.json")
+        checkpoint = self._new_checkpoint(source, source_info)
+        if resume:
+            checkpoint = self._restore_checkpoint(checkpoint_file, checkpoint, progress)
+
         logger.info(f"Starting mass learning from {progress.current_source}")
         logger.info(f"Estimated {total_chunks} chunks, {progress.total_bytes} bytes")
 
-        # Process in batches
-        batch_contents = []
-        batch_metadatas = []
+        reader: Optional[threading.Thread] = None
+        if self.prefetch_batches > 0:
+            batches: "queue.Queue" = queue.Queue(maxsize=self.prefetch_batches)
+            stop = threading.Event()
+            reader = threading.Thread(
+                target=self._read_batches,
+                args=(source, source_name, category, checkpoint, kwargs, batches, stop),
+                name="sutra-chunk-reader",
+                daemon=True,
+            )
+            reader.start()
+            items = iter(batches.get, _END_OF_STREAM)
+        else:
+            # No overlap: read each batch on this thread when it is needed
+            items = self._iter_batches(
+                source, source_name, category, checkpoint, kwargs
+            )
+
+        batch_count = 0
+        try:
+            for item in items:
+                if isinstance(item, Exception):
+                    error_msg = f"Error processing {source}: {str(item)}"
+                    progress.errors.append(error_msg)
+                    logger.error(error_msg, exc_info=item)
+                    break
+
+                batch_contents, batch_metadatas, positions = item
+                learned = self._process_batch(
+                    learner, batch_contents, batch_metadatas, progress
+                )
+                batch_count += 1
+
+                # Failed chunks are recorded for retry; retried ones that
+                # succeeded are cleared
+                failed = _from_ranges(checkpoint.failed_ranges)
+                if learned:
+                    failed.difference_update(positions)
+                else:
+                    failed.update(positions)
+                checkpoint.failed_ranges = _to_ranges(failed)
+
+                # Only chunks past the position move it (retried ones lie before it)
+                if positions[-1] >= checkpoint.chunks_consumed:
+                    checkpoint.chunks_consumed = positions[-1] + 1
+                    resume_state = (batch_metadatas[-1].extra or {}).get("resume")
+                    if resume_state is not None:
+                        checkpoint.resume_state = resume_state
+                if batch_count % self.checkpoint_interval == 0:
+                    self._save_checkpoint(checkpoint_file, checkpoint, progress)
+
+                # Update progress
+                progress.elapsed_seconds = time.time() - start_time
+                if self.progress_callback:
+                    self.progress_callback(progress)
+        except BaseException:
+            # Interrupted (e.g. Ctrl-C): keep the position reached so far
+            self._save_checkpoint(checkpoint_file, checkpoint, progress)
+            raise
+        finally:
+            if reader is None:
+                items.close()
+            else:
+                stop.set()
+                # Unblock a reader waiting on a full queue
+                while reader.is_alive():
+                    try:
+                        batches.get_nowait()
+                    except queue.Empty:
+                        reader.join(timeout=0.1)
+
+        if not progress.errors:
+            # Completed: the next run starts from scratch
+            checkpoint_file.unlink(missing_ok=True)
+        else:
+            self._save_checkpoint(checkpoint_file, checkpoint, progress)
+
+        # Final progress update
+        progress.elapsed_seconds = time.time() - start_time
+        if self.progress_callback:
+            self.progress_callback(progress)
+
+        logger.info(
+            f"Mass learning completed: {progress.chunks_processed} chunks, "
+            f"{progress.concepts_created} concepts, {progress.associations_created} associations"
+        )
+
+        return progress
+
+    def _read_batches(
+        self,
+        source: str,
+        source_name: Optional[str],
+        category: Optional[str],
+        checkpoint: LearningCheckpoint,
+        kwargs: Dict[str, Any],
+        batches: "queue.Queue",
+        stop: threading.Event,
+    ) -> None:
+        """Producer thread: feed _iter_batches() items into the bounded queue."""
+
+        def _put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        items = self._iter_batches(source, source_name, category, checkpoint, kwargs)
+        try:
+            for item in items:
+                if not _put(item):
+                    return
+            _put(_END_OF_STREAM)
+        finally:
+            items.close()
+
+    def _iter_batches(
+        self,
+        source: str,
+        source_name: Optional[str],
+        category: Optional[str],
+        checkpoint: LearningCheckpoint,
+        kwargs: Dict[str, Any],
+    ) -> Iterator[Any]:
+        """
+        Group chunks into (contents, metadatas, positions) batches.
 
+        Each batch carries the stream positions of its chunks. On resume,
+        chunks before the checkpoint position are skipped except failed
+        ones; with failed chunks to retry, the stream is re-read from the
+        start instead of seeking. A read error is yielded (after the chunks
+        read before it) rather than raised.
+        """
+        chunk_kwargs = dict(kwargs)
+        retry = _from_ranges(checkpoint.failed_ranges)
+        skip_before = 0
+        position = 0
+        if checkpoint.chunks_consumed:
+            if (
+                self.supports_offset_resume
+                and checkpoint.resume_state is not None
+                and not retry
+            ):
+                chunk_kwargs.update(checkpoint.resume_state)
+                position = checkpoint.chunks_consumed
+            else:
+                skip_before = checkpoint.chunks_consumed
+
+        batch_contents: List[tuple] = []
+        batch_metadatas: List[ChunkMetadata] = []
+        batch_positions: List[int] = []
         try:
-            for content, metadata in self.get_chunks(source, **kwargs):
-                # Add to current batch
+            for content, metadata in self.get_chunks(source, **chunk_kwargs):
+                position += 1
+                if position - 1 < skip_before and position - 1 not in retry:
+                    continue
+
                 batch_contents.append(
                     (
                         content,
@@ -183,40 +426,75 @@ class MassLearningAdapter(ABC):
                     )
                 )
                 batch_metadatas.append(metadata)
+                batch_positions.append(position - 1)
 
-                # Process batch when full
                 if len(batch_contents) >= self.batch_size:
-                    self._process_batch(
-                        learner, batch_contents, batch_metadatas, progress
-                    )
-                    batch_contents = []
-                    batch_metadatas = []
-
-                    # Update progress
-                    progress.elapsed_seconds = time.time() - start_time
-                    if self.progress_callback:
-                        self.progress_callback(progress)
+                    yield batch_contents, batch_metadatas, batch_positions
+                    batch_contents, batch_metadatas, batch_positions = [], [], []
 
+            # Process remaining items
+            if batch_contents:
+                yield batch_contents, batch_metadatas, batch_positions
         except Exception as e:
-            error_msg = f"Error processing {source}: {str(e)}"
-            progress.errors.append(error_msg)
-            logger.error(error_msg, exc_info=True)
-
-        # Process remaining items
-        if batch_contents:
-            self._process_batch(learner, batch_contents, batch_metadatas, progress)
-
-        # Final progress update
-        progress.elapsed_seconds = time.time() - start_time
-        if self.progress_callback:
-            self.progress_callback(progress)
+            # Deliver what was read before the failure, then the error
+            if batch_contents:
+                yield batch_contents, batch_metadatas, batch_positions
+            yield e
+
+    def _new_checkpoint(
+        self, source: str, source_info: Dict[str, Any]
+    ) -> LearningCheckpoint:
+        return LearningCheckpoint(
+            source=str(source),
+            source_size=int(source_info.get("size_bytes", 0)),
+            source_mtime=float(source_info.get("modified_time", 0.0)),
+            chunks_consumed=0,
+            chunks_processed=0,
+            concepts_created=0,
+            associations_created=0,
+            bytes_processed=0,
+        )
 
+    def _restore_checkpoint(
+        self,
+        path: Path,
+        fresh: LearningCheckpoint,
+        progress: LearningProgress,
+    ) -> LearningCheckpoint:
+        """Load a matching checkpoint and restore progress counters from it."""
+        saved = LearningCheckpoint.load(path)
+        if saved is None:
+            logger.info(f"No checkpoint at {path}, starting from the beginning")
+            return fresh
+        if (saved.source, saved.source_size, saved.source_mtime) != (
+            fresh.source,
+            fresh.source_size,
+            fresh.source_mtime,
+        ):
+            logger.warning(f"Checkpoint {path} is for a different/changed source, ignoring")
+            return fresh
+
+        progress.chunks_processed = saved.chunks_processed
+        progress.concepts_created = saved.concepts_created
+        progress.associations_created = saved.associations_created
+        progress.bytes_processed = saved.bytes_processed
         logger.info(
-            f"Mass learning completed: {progress.chunks_processed} chunks, "
-            f"{progress.concepts_created} concepts, {progress.associations_created} associations"
+            f"Resuming {saved.source} after {saved.chunks_consumed} chunks "
+            f"({saved.bytes_processed} bytes)"
         )
+        return saved
 
-        return progress
+    def _save_checkpoint(
+        self, path: Path, checkpoint: LearningCheckpoint, progress: LearningProgress
+    ) -> None:
+        checkpoint.chunks_processed = progress.chunks_processed
+        checkpoint.concepts_created = progress.concepts_created
+        checkpoint.associations_created = progress.associations_created
+        checkpoint.bytes_processed = progress.bytes_processed
+        try:
+            checkpoint.save(path)
+        except OSError as e:
+            logger.warning(f"Failed to write checkpoint {path}: {e}")
 
     def _process_batch(
         self,
@@ -224,25 +502,30 @@ class MassLearningAdapter(ABC):
         batch_contents: List[tuple[str, str, Optional[str]]],
         batch_metadatas: List[ChunkMetadata],
         progress: LearningProgress,
-    ) -> None:
-        """Process a batch of content chunks."""
+    ) -> bool:
+        """Process a batch of content chunks; returns False if it failed."""
 
         try:
-            # Learn batch using adaptive learner
-            for content, source, category in batch_contents:
-                concept_id = learner.learn_adaptive(
-                    content=content, source=source, category=category
-                )
+            # Learn batch using adaptive learner (bulk path when available)
+            if hasattr(learner, "learn_adaptive_batch"):
+                learner.learn_adaptive_batch(batch_contents)
+            else:
+                for content, source, category in batch_contents:
+                    learner.learn_adaptive(
+                        content=content, source=source, category=category
+                    )
 
-                # Update statistics (simplified - could be more accurate)
-                progress.concepts_created += 1
-                progress.associations_created += 2  # Estimate
+            # Update statistics (simplified - could be more accurate)
+            progress.concepts_created += len(batch_contents)
+            progress.associations_created += 2 * len(batch_contents)  # Estimate
 
             # Update progress counters
             progress.chunks_processed += len(batch_contents)
             progress.bytes_processed += sum(m.size_chars for m in batch_metadatas)
+            return True
 
         except Exception as e:
             error_msg = f"Error processing batch: {str(e)}"
             progress.errors.append(error_msg)
             logger.error(error_msg, exc_info=True)
+            return False
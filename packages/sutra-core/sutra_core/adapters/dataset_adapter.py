@@ -5,6 +5,7 @@ This adapter efficiently processes large text datasets like Wikipedia dumps,
 handling article boundaries and streaming for memory efficiency.
 """
 
+import copy
 import hashlib
 import logging
 import re
@@ -12,6 +13,14 @@ from pathlib import Path
 from typing import Any, Dict, Iterator, Optional, Tuple
 
 from .base import ChunkMetadata, MassLearningAdapter
+from .streaming import (
+    can_scan_bytes,
+    compile_bytes_pattern,
+    group_spans,
+    imap_ordered,
+    iter_separated,
+    mapped_file,
+)
 from .text_formats import FormatDetector, ProcessingStrategy, TextFormat
 
 logger = logging.getLogger(__name__)
@@ -28,6 +37,8 @@ class DatasetAdapter(MassLearningAdapter):
     - Memory-efficient processing of 100MB+ files
     """
 
+    supports_offset_resume = True
+
     def __init__(
         self,
         batch_size: int = 100,
@@ -36,6 +47,8 @@ class DatasetAdapter(MassLearningAdapter):
         min_article_length: int = 200,
         max_article_length: int = 10000,
         stream_buffer_size: int = 8192,
+        preprocess_workers: int = 0,
+        preprocess_range_bytes: int = 4 * 1024 * 1024,
     ):
         """
         Initialize dataset adapter.
@@ -46,13 +59,19 @@ class DatasetAdapter(MassLearningAdapter):
             progress_callback: Optional callback for progress updates
             min_article_length: Skip articles shorter than this
             max_article_length: Split articles longer than this
-            stream_buffer_size: Buffer size for file streaming (bytes)
+            stream_buffer_size: Read buffer size (bytes) for files that cannot
+                be scanned as bytes (see _iter_articles)
+            preprocess_workers: Worker processes that decode, split and
+                classify articles in parallel (0 or 1 = inline)
+            preprocess_range_bytes: Bytes of articles per worker task
         """
         super().__init__(batch_size, chunk_size, progress_callback)
 
         self.min_article_length = min_article_length
         self.max_article_length = max_article_length
         self.stream_buffer_size = stream_buffer_size
+        self.preprocess_workers = preprocess_workers
+        self.preprocess_range_bytes = preprocess_range_bytes
 
     def get_chunks(self, source: str, **kwargs) -> Iterator[Tuple[str, ChunkMetadata]]:
         """
@@ -63,7 +82,9 @@ class DatasetAdapter(MassLearningAdapter):
             **kwargs: Additional parameters:
                 - encoding: file encoding (default: 'utf-8')
                 - category: content category
-                - article_separator: regex pattern for article boundaries
+                - text_format: TextFormat (or its value) to skip detection
+                - start_offset / start_index / skip_segments: resume position,
+                  as reported in each chunk's ``extra["resume"]``
 
         Yields:
             Tuple of (article_content, metadata) for each article
@@ -94,59 +115,179 @@ class DatasetAdapter(MassLearningAdapter):
             f"Processing dataset: {source} ({self._format_size(file_path.stat().st_size)}) as {text_format.value}"
         )
 
+        start_offset = kwargs.get("start_offset", 0)
+        article_index = kwargs.get("start_index", 0)
+        skip_segments = kwargs.get("skip_segments", 0)
+        source_name = str(file_path.name)
+
         try:
-            article_index = 0
-
-            # Stream the file to handle large datasets
-            with open(
-                file_path,
-                "r",
-                encoding=encoding,
-                errors="replace",
-                buffering=self.stream_buffer_size,
-            ) as f:
-
-                buffer = ""
-
-                while True:
-                    # Read chunk into buffer
-                    chunk = f.read(self.stream_buffer_size)
-                    if not chunk:
-                        # Process final article if any
-                        if buffer.strip():
-                            yield from self._process_article(
-                                buffer.strip(),
-                                article_index,
-                                str(file_path.name),
-                                category,
-                            )
-                        break
-
-                    buffer += chunk
-
-                    # Split by article boundaries
-                    articles = re.split(article_separator, buffer)
-
-                    # Keep last incomplete article in buffer
-                    buffer = articles[-1]
-
-                    # Process complete articles
-                    for article_text in articles[:-1]:
-                        article_text = article_text.strip()
-
-                        if len(article_text) >= self.min_article_length:
-                            yield from self._process_article(
-                                article_text,
-                                article_index,
-                                str(file_path.name),
-                                category,
-                            )
-                            article_index += 1
+            if self.preprocess_workers > 1:
+                articles = self._preprocess_parallel(
+                    file_path,
+                    encoding,
+                    article_separator,
+                    start_offset,
+                    source_name,
+                    category,
+                )
+            else:
+                articles = (
+                    (article_start, is_last, article_text, None)
+                    for article_start, article_text, is_last in self._iter_articles(
+                        file_path, encoding, article_separator, start_offset
+                    )
+                    # The trailing article is taken whatever its length (and
+                    # does not advance the index), matching the buffer flush
+                    if is_last or len(article_text) >= self.min_article_length
+                )
+
+            for article_start, is_last, article_text, chunks in articles:
+                if chunks is None:
+                    segments = self._process_article(
+                        article_text, article_index, source_name, category
+                    )
+                else:
+                    # Preprocessed with a placeholder index
+                    segments = (
+                        (text, self._reindex(metadata, article_index))
+                        for text, metadata in chunks
+                    )
+
+                for segment_number, (text, metadata) in enumerate(segments, 1):
+                    if segment_number <= skip_segments:
+                        continue
+                    # Re-scan from this article, skipping what was yielded
+                    metadata.extra["resume"] = {
+                        "start_offset": article_start,
+                        "start_index": article_index,
+                        "skip_segments": segment_number,
+                        "text_format": text_format.value,
+                    }
+                    yield text, metadata
+
+                skip_segments = 0
+                if not is_last:
+                    article_index += 1
 
         except Exception as e:
             logger.error(f"Error reading dataset {source}: {e}")
             raise
 
+    def _iter_articles(
+        self, file_path: Path, encoding: str, separator: str, start_offset: int = 0
+    ) -> Iterator[Tuple[int, str, bool]]:
+        """
+        Scan article boundaries in one linear pass.
+
+        The file is memory-mapped and the separator is matched on raw bytes
+        with a single finditer, so each byte is scanned once and memory use
+        is bounded by the largest article rather than the file. Files that
+        cannot be scanned as bytes (UTF-16, CRLF line endings) fall back to
+        decoding the whole file and scanning the text the same way.
+
+        Yields:
+            (start_offset, stripped article text, is_last) for each article;
+            offsets are bytes (mmap scan) or characters (fallback) and are
+            only meaningful when passed back as ``start_offset``
+        """
+        with mapped_file(file_path) as data:
+            if data is None:
+                return
+            if can_scan_bytes(data, encoding):
+                pattern = compile_bytes_pattern(separator)
+                for start, end, _ in iter_separated(data, pattern, start_offset):
+                    text = data[start:end].decode(encoding, errors="replace").strip()
+                    is_last = end == len(data)
+                    if text or not is_last:
+                        yield start, text, is_last
+                return
+
+        with open(
+            file_path,
+            "r",
+            encoding=encoding,
+            errors="replace",
+            buffering=self.stream_buffer_size,
+        ) as f:
+            content = f.read()
+        pattern = re.compile(separator)
+        for start, end, _ in iter_separated(content, pattern, start_offset):
+            text = content[start:end].strip()
+            is_last = end == len(content)
+            if text or not is_last:
+                yield start, text, is_last
+
+    def _preprocess_parallel(
+        self,
+        file_path: Path,
+        encoding: str,
+        separator: str,
+        start_offset: int,
+        source_name: str,
+        category: str,
+    ) -> Iterator[Tuple[int, bool, Optional[str], Optional[list]]]:
+        """
+        Preprocess articles in a process pool, in file order.
+
+        This process only scans separators (one linear pass over the mapped
+        bytes) and groups articles into ranges of ~preprocess_range_bytes;
+        workers decode, split and classify whole ranges. Articles come back
+        as (start_offset, is_last, text, chunks) with chunks built for
+        article index 0, or with text only when the chunks depend on the
+        final index (see _preprocess_articles).
+        """
+        with mapped_file(file_path) as data:
+            if data is None:
+                return
+            if not can_scan_bytes(data, encoding):
+                # Decoded-text fallback: no byte ranges to hand out
+                for article_start, article_text, is_last in self._iter_articles(
+                    file_path, encoding, separator, start_offset
+                ):
+                    if is_last or len(article_text) >= self.min_article_length:
+                        yield article_start, is_last, article_text, None
+                return
+
+            worker = copy.copy(self)
+            worker.progress_callback = None  # may not be picklable
+
+            pattern = compile_bytes_pattern(separator)
+            spans = (
+                (start, end, end == len(data))
+                for start, end, _ in iter_separated(data, pattern, start_offset)
+            )
+            tasks = (
+                (worker, str(file_path), encoding, group, source_name, category)
+                for group in group_spans(spans, self.preprocess_range_bytes)
+            )
+            for articles in imap_ordered(
+                _preprocess_articles, tasks, self.preprocess_workers
+            ):
+                yield from articles
+
+    def _reindex(self, metadata: ChunkMetadata, article_index: int) -> ChunkMetadata:
+        """Move a preprocessed chunk from placeholder index 0 to article_index."""
+        segment_index = metadata.extra.get("segment_index")
+        metadata.chunk_id = self._chunk_id(
+            metadata.source, article_index, segment_index
+        )
+        metadata.chunk_index = (
+            article_index
+            if segment_index is None
+            else f"{article_index}_{segment_index}"
+        )
+        metadata.extra["article_index"] = article_index
+        return metadata
+
+    @staticmethod
+    def _chunk_id(
+        source_name: str, article_index: int, segment_index: Optional[int] = None
+    ) -> str:
+        key = f"{source_name}:{article_index}"
+        if segment_index is not None:
+            key += f":{segment_index}"
+        return hashlib.md5(key.encode()).hexdigest()[:16]
+
     def _process_article(
         self, article_text: str, article_index: int, source_name: str, category: str
     ) -> Iterator[Tuple[str, ChunkMetadata]]:
@@ -172,9 +313,7 @@ class DatasetAdapter(MassLearningAdapter):
             )
         else:
             # Process as single article
-            chunk_id = hashlib.md5(
-                f"{source_name}:{article_index}".encode()
-            ).hexdigest()[:16]
+            chunk_id = self._chunk_id(source_name, article_index)
 
             # Infer more specific category from content
             inferred_category = self._infer_category_detailed(content)
@@ -227,9 +366,7 @@ class DatasetAdapter(MassLearningAdapter):
                 and len(current_segment) > len(title) + 10
             ):
                 # Yield current segment
-                chunk_id = hashlib.md5(
-                    f"{source_name}:{article_index}:{segment_index}".encode()
-                ).hexdigest()[:16]
+                chunk_id = self._chunk_id(source_name, article_index, segment_index)
 
                 metadata = ChunkMetadata(
                     chunk_id=chunk_id,
@@ -256,9 +393,7 @@ class DatasetAdapter(MassLearningAdapter):
 
         # Yield final segment
         if len(current_segment.strip()) > len(title) + 10:
-            chunk_id = hashlib.md5(
-                f"{source_name}:{article_index}:{segment_index}".encode()
-            ).hexdigest()[:16]
+            chunk_id = self._chunk_id(source_name, article_index, segment_index)
 
             metadata = ChunkMetadata(
                 chunk_id=chunk_id,
@@ -481,3 +616,23 @@ class DatasetAdapter(MassLearningAdapter):
             return best_category[0]
 
         return "general"
+
+
+def _preprocess_articles(task) -> list:
+    """Process-pool worker: decode, filter, split and classify one byte range."""
+    adapter, path, encoding, spans, source_name, category = task
+    results = []
+    with mapped_file(path) as data:
+        for start, end, is_last in spans:
+            text = data[start:end].decode(encoding, errors="replace").strip()
+            if is_last and not text:
+                continue
+            if not is_last and len(text) < adapter.min_article_length:
+                continue
+            if "\n" not in text:
+                # Untitled: the fallback title embeds the final article index
+                results.append((start, is_last, text, None))
+                continue
+            chunks = list(adapter._process_article(text, 0, source_name, category))
+            results.append((start, is_last, None, chunks))
+    return results
@@ -5,14 +5,29 @@ This adapter leverages Sutra's existing parallel association extraction
 and adaptive learning to efficiently process large text files.
 """
 
+import copy
 import hashlib
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .base import ChunkMetadata, MassLearningAdapter
-from .text_processing import IntelligentTextProcessor
+from .streaming import (
+    can_scan_bytes,
+    compile_bytes_pattern,
+    context_window,
+    group_spans,
+    imap_ordered,
+    iter_separated,
+    mapped_file,
+)
+from .text_processing import (
+    ARTICLE_PATTERN,
+    PARAGRAPH_PATTERN,
+    IntelligentTextProcessor,
+    TextSegment,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +50,8 @@ class FileAdapter(MassLearningAdapter):
         progress_callback=None,
         min_segment_length: int = 100,
         max_segment_length: int = 3000,
+        preprocess_workers: int = 0,
+        preprocess_range_bytes: int = 4 * 1024 * 1024,
     ):
         """
         Initialize file adapter.
@@ -45,12 +62,17 @@ class FileAdapter(MassLearningAdapter):
             progress_callback: Optional callback for progress updates
             min_segment_length: Minimum segment size
             max_segment_length: Maximum segment size before splitting
+            preprocess_workers: Worker processes that segment and classify
+                the file in parallel (0 or 1 = inline)
+            preprocess_range_bytes: Bytes of text per worker task
         """
         super().__init__(batch_size, chunk_size, progress_callback)
 
         self.text_processor = IntelligentTextProcessor(
             min_segment_length=min_segment_length, max_segment_length=max_segment_length
         )
+        self.preprocess_workers = preprocess_workers
+        self.preprocess_range_bytes = preprocess_range_bytes
 
     def get_chunks(self, source: str, **kwargs) -> Iterator[Tuple[str, ChunkMetadata]]:
         """
@@ -81,46 +103,169 @@ class FileAdapter(MassLearningAdapter):
         logger.info(f"Processing {source} as {file_format} format")
 
         try:
-            # Stream file content to avoid loading entire file into memory
-            with open(file_path, "r", encoding=encoding, errors="replace") as f:
-                # For very large files, we could process in chunks
-                # For now, load full content for better structure detection
-                content = f.read()
+            chunk_index = 0
+            for segment, segment_category in self._iter_segments(
+                file_path, file_format, encoding, category
+            ):
+                # Create unique chunk ID
+                chunk_id = hashlib.md5(
+                    f"{source}:{segment.start_pos}:{segment.end_pos}".encode()
+                ).hexdigest()[:16]
+
+                metadata = ChunkMetadata(
+                    chunk_id=chunk_id,
+                    source=str(file_path.name),
+                    category=segment_category,
+                    size_chars=len(segment.content),
+                    chunk_index=chunk_index,
+                    extra={
+                        "segment_type": segment.segment_type,
+                        "start_pos": segment.start_pos,
+                        "end_pos": segment.end_pos,
+                        "context": segment.context,
+                        "file_format": file_format,
+                    },
+                )
+
+                yield segment.content, metadata
+                chunk_index += 1
+
+        except Exception as e:
+            logger.error(f"Error reading file {source}: {e}")
+            raise
+
+    def _iter_segments(
+        self,
+        file_path: Path,
+        file_format: str,
+        encoding: str,
+        category: Optional[str],
+    ) -> Iterator[Tuple[TextSegment, str]]:
+        """
+        Segment the file without loading it into memory.
+
+        The file is memory-mapped and article/paragraph boundaries are found
+        with one finditer pass over the raw bytes; only the text between
+        boundaries is decoded. Segments and positions match the full-text
+        processors; context is taken around each article's or paragraph's
+        actual position in the file. Files that cannot be scanned as bytes
+        (UTF-16, CRLF line endings) are read and processed as a whole.
 
-                # Process based on detected format
+        Yields:
+            (segment, category) pairs; category is inferred when not given
+        """
+        processor = self.text_processor
+        with mapped_file(file_path) as data:
+            if data is None:
+                return
+            if can_scan_bytes(data, encoding):
+                if self.preprocess_workers > 1:
+                    yield from self._preprocess_parallel(
+                        data, file_path, file_format, encoding, category
+                    )
+                    return
                 if file_format == "wikipedia":
-                    segments = self.text_processor.process_wikipedia_format(content)
+                    spans = self._article_spans(data)
+                    segments = processor.process_wikipedia_stream(
+                        self._article_items(data, encoding, spans)
+                    )
                 else:
-                    segments = self.text_processor.process_plain_text(content)
-
-                chunk_index = 0
-                for segment in segments:
-                    # Create unique chunk ID
-                    chunk_id = hashlib.md5(
-                        f"{source}:{segment.start_pos}:{segment.end_pos}".encode()
-                    ).hexdigest()[:16]
-
-                    metadata = ChunkMetadata(
-                        chunk_id=chunk_id,
-                        source=str(file_path.name),
-                        category=category or self._infer_category(segment.content),
-                        size_chars=len(segment.content),
-                        chunk_index=chunk_index,
-                        extra={
-                            "segment_type": segment.segment_type,
-                            "start_pos": segment.start_pos,
-                            "end_pos": segment.end_pos,
-                            "context": segment.context,
-                            "file_format": file_format,
-                        },
+                    spans = self._paragraph_spans(data)
+                    segments = processor.process_plain_text_stream(
+                        self._paragraph_items(data, encoding, spans)
                     )
+                for segment in segments:
+                    yield segment, category or self._infer_category(segment.content)
+                return
 
-                    yield segment.content, metadata
-                    chunk_index += 1
+        with open(file_path, "r", encoding=encoding, errors="replace") as f:
+            content = f.read()
+        if file_format == "wikipedia":
+            segments = processor.process_wikipedia_format(content)
+        else:
+            segments = processor.process_plain_text(content)
+        for segment in segments:
+            yield segment, category or self._infer_category(segment.content)
 
-        except Exception as e:
-            logger.error(f"Error reading file {source}: {e}")
-            raise
+    def _preprocess_parallel(
+        self,
+        data,
+        file_path: Path,
+        file_format: str,
+        encoding: str,
+        category: Optional[str],
+    ) -> Iterator[Tuple[TextSegment, str]]:
+        """
+        Segment and classify the file in a process pool, in file order.
+
+        This process only scans boundaries and groups them into ranges of
+        ~preprocess_range_bytes. Workers return segments positioned from 0
+        plus how far their range advances the position, which is added back
+        here, so positions (and chunk IDs) match a sequential pass.
+        """
+        worker = copy.copy(self)
+        worker.progress_callback = None  # may not be picklable
+
+        if file_format == "wikipedia":
+            spans = self._article_spans(data)
+        else:
+            spans = self._paragraph_spans(data)
+        tasks = (
+            (worker, str(file_path), encoding, file_format, group, category)
+            for group in group_spans(spans, self.preprocess_range_bytes)
+        )
+
+        base_pos = 0
+        for segments, advance in imap_ordered(
+            _preprocess_segments, tasks, self.preprocess_workers
+        ):
+            for segment, segment_category in segments:
+                segment.start_pos += base_pos
+                segment.end_pos += base_pos
+                yield segment, segment_category
+            base_pos += advance
+
+    @staticmethod
+    def _paragraph_spans(data) -> Iterator[Tuple[int, int]]:
+        """Byte ranges of paragraphs (including empty ones) in a mapped file."""
+        pattern = compile_bytes_pattern(PARAGRAPH_PATTERN)
+        for start, end, _ in iter_separated(data, pattern):
+            yield start, end
+
+    @staticmethod
+    def _article_spans(data) -> Iterator[Tuple[int, int]]:
+        """Byte ranges from each article header to the next in a mapped file."""
+        pattern = compile_bytes_pattern(ARTICLE_PATTERN)
+        previous = None
+        for header in pattern.finditer(data):
+            if previous is not None:
+                yield previous, header.start()
+            previous = header.start()
+        if previous is not None:
+            yield previous, len(data)
+
+    def _paragraph_items(
+        self, data, encoding: str, spans: Iterable[Tuple[int, int]]
+    ) -> Iterator[Tuple[str, str]]:
+        """(paragraph, context) pairs for process_plain_text_stream()."""
+        window = self.text_processor.context_window
+        for start, end in spans:
+            paragraph = data[start:end].decode(encoding, errors="replace")
+            yield paragraph, context_window(data, start, window, encoding)
+
+    def _article_items(
+        self, data, encoding: str, spans: Iterable[Tuple[int, int]]
+    ) -> Iterator[Tuple[str, str, str]]:
+        """(title, content, context) triples for process_wikipedia_stream()."""
+        pattern = compile_bytes_pattern(ARTICLE_PATTERN)
+        window = self.text_processor.context_window
+        for start, end in spans:
+            header = pattern.match(data, start)
+            yield (
+                header.group(1).decode(encoding, errors="replace"),
+                data[header.end() : end].decode(encoding, errors="replace"),
+                context_window(data, start, window, encoding),
+            )
 
     def estimate_total_chunks(self, source: str, **kwargs) -> int:
         """
@@ -192,6 +337,12 @@ class FileAdapter(MassLearningAdapter):
         for better performance on large files.
         """
 
+        # Resumable runs use the checkpointing base implementation
+        if kwargs.get("resume") or kwargs.get("checkpoint_path"):
+            return super().learn_from_source(
+                learner, source, source_name, category, **kwargs
+            )
+
         # Check if we have parallel extraction available
         try:
             from ..learning.associations_parallel import ParallelAssociationExtractor
@@ -206,15 +357,29 @@ class FileAdapter(MassLearningAdapter):
 
                 # Collect all chunks first for batch processing
                 chunk_data = []
+                pending = []
+
+                def _learn_pending():
+                    # Create concepts in bulk using adaptive learner
+                    concept_ids = learner.learn_adaptive_batch(pending)
+                    chunk_data.extend(
+                        (concept_id, content)
+                        for concept_id, (content, _, _) in zip(concept_ids, pending)
+                    )
+                    pending.clear()
 
                 for content, metadata in self.get_chunks(source, **kwargs):
-                    # Create concept first using adaptive learner
-                    concept_id = learner.learn_adaptive(
-                        content=content,
-                        source=source_name or metadata.source,
-                        category=category or metadata.category,
+                    pending.append(
+                        (
+                            content,
+                            source_name or metadata.source,
+                            category or metadata.category,
+                        )
                     )
-                    chunk_data.append((concept_id, content))
+                    if len(pending) >= self.batch_size:
+                        _learn_pending()
+                if pending:
+                    _learn_pending()
 
                 # Use parallel extraction for associations
                 if hasattr(learner, "association_extractor") and chunk_data:
@@ -321,3 +486,23 @@ class FileAdapter(MassLearningAdapter):
             return "culture"
         else:
             return "general"
+
+
+def _preprocess_segments(task) -> Tuple[List[Tuple[TextSegment, str]], int]:
+    """Process-pool worker: segment and classify one byte range of a file."""
+    adapter, path, encoding, file_format, spans, category = task
+    processor = adapter.text_processor
+    with mapped_file(path) as data:
+        # Position advance mirrors IntelligentTextProcessor's bookkeeping
+        if file_format == "wikipedia":
+            items = list(adapter._article_items(data, encoding, spans))
+            advance = sum(len(t.strip()) + len(c.strip()) + 10 for t, c, _ in items)
+            segments = processor.process_wikipedia_stream(items)
+        else:
+            items = list(adapter._paragraph_items(data, encoding, spans))
+            advance = sum(len(p.strip()) + 2 for p, _ in items)
+            segments = processor.process_plain_text_stream(items)
+        return [
+            (segment, category or adapter._infer_category(segment.content))
+            for segment in segments
+        ], advance
@@ -0,0 +1,151 @@
+"""
+Memory-mapped, linear-time text scanning for mass learning adapters.
+
+Adapters scan a memory-mapped file for boundary matches (article separators,
+paragraph breaks, title lines) with a single ``finditer`` pass and decode
+only the ranges between them. Each byte is scanned once and memory stays
+flat regardless of file or article size.
+
+Boundary patterns are matched on the raw bytes, so this requires an
+ASCII-compatible encoding (UTF-8, Latin-1, ...) and ``\n`` line endings
+(text-mode reads translate ``\r\n``); see can_scan_bytes(). Adapters fall
+back to scanning the decoded text otherwise.
+"""
+
+import mmap
+import multiprocessing as mp
+import re
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+# imap_ordered() runs in the adapters' reader thread (see
+# MassLearningAdapter.learn_from_source), and forking a multi-threaded
+# process can leave locks held in the child, so workers start fresh
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+)
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Whether ASCII text (and thus ASCII boundary patterns) encode byte-for-byte."""
+    try:
+        return "a\n=#-".encode(encoding) == b"a\n=#-"
+    except LookupError:
+        return False
+
+
+def can_scan_bytes(data, encoding: str) -> bool:
+    """Whether ``data`` can be split with bytes patterns instead of decoded text."""
+    return is_ascii_compatible(encoding) and data.find(b"\r") == -1
+
+
+def compile_bytes_pattern(pattern: Union[str, Pattern], flags: int = 0) -> Pattern:
+    """Compile a str regex for matching on raw (mapped) bytes."""
+    if isinstance(pattern, re.Pattern):
+        flags |= pattern.flags & ~re.UNICODE
+        pattern = pattern.pattern
+    return re.compile(pattern.encode("ascii"), flags)
+
+
+@contextmanager
+def mapped_file(path: Union[str, Path]) -> Iterator[Optional[mmap.mmap]]:
+    """Memory-map a file read-only; yields None for an empty file."""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            yield None
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+def iter_separated(
+    data, separator: Pattern, start: int = 0
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield byte ranges between separator matches, in one linear pass.
+
+    Args:
+        data: bytes-like object (e.g. an mmap)
+        separator: Compiled bytes pattern
+        start: Byte offset to start scanning at
+
+    Yields:
+        (segment_start, segment_end, next_start) for each segment; the last
+        segment runs to the end of ``data``
+    """
+    pos = start
+    for match in separator.finditer(data, start):
+        if match.end() == match.start():
+            continue  # empty matches are not boundaries
+        yield pos, match.start(), match.end()
+        pos = match.end()
+    yield pos, len(data), len(data)
+
+
+def context_window(data, offset: int, window: int, encoding: str) -> str:
+    """Whitespace-normalized text within ``window`` bytes around ``offset``."""
+    start = max(0, offset - window)
+    text = data[start : offset + window].decode(encoding, errors="replace")
+    return " ".join(text.split())[:200]
+
+
+def group_spans(spans: Iterable[Tuple], range_bytes: int) -> Iterator[List[Tuple]]:
+    """
+    Group consecutive (start, end, ...) spans into ranges of about range_bytes.
+
+    Ranges always end on a span boundary, so each one can be processed
+    independently (e.g. by a worker process) with the same result as a
+    sequential pass.
+    """
+    group: List[Tuple] = []
+    for span in spans:
+        group.append(span)
+        if span[1] - group[0][0] >= range_bytes:
+            yield group
+            group = []
+    if group:
+        yield group
+
+
+def imap_ordered(
+    func: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    processes: int,
+    max_pending: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Run ``func`` over ``tasks`` in a process pool, yielding results in task order.
+
+    Tasks are consumed lazily and at most ``max_pending`` (default: two per
+    process) are in flight, so a slow consumer bounds memory instead of
+    results piling up. Workers are started with POOL_START_METHOD, so
+    ``func`` and the tasks must be picklable by reference (module-level).
+    """
+    max_pending = max_pending or processes * 2
+    pending: deque = deque()
+    pool = mp.get_context(POOL_START_METHOD).Pool(processes=processes)
+    try:
+        for task in tasks:
+            pending.append(pool.apply_async(func, (task,)))
+            if len(pending) >= max_pending:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
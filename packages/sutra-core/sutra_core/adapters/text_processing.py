@@ -7,7 +7,12 @@ and respects document structure for optimal concept extraction.
 
 import re
 from dataclasses import dataclass
-from typing import Iterator, List, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+# Wikipedia article/section headers and paragraph breaks
+ARTICLE_PATTERN = re.compile(r"^([A-Z][^\n]+)\n={2,}\n", re.MULTILINE)
+SECTION_PATTERN = re.compile(r"^([A-Z][^\n]+)\n-{2,}\n", re.MULTILINE)
+PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
 
 
 @dataclass
@@ -57,86 +62,106 @@ class IntelligentTextProcessor:
         Yields:
             TextSegment objects for each article/section
         """
-        # Wikipedia article boundaries (common patterns)
-        article_pattern = r"^([A-Z][^\n]+)\n={2,}\n"
-        section_pattern = r"^([A-Z][^\n]+)\n-{2,}\n"
-
         # Split by articles first
-        articles = re.split(article_pattern, content, flags=re.MULTILINE)
+        articles = ARTICLE_PATTERN.split(content)
+        pairs = (
+            (articles[i], articles[i + 1], None)
+            for i in range(1, len(articles) - 1, 2)  # Skip first empty and alternate
+        )
+        return self._wikipedia_segments(
+            pairs, lambda pos: self._get_context(content, pos, self.context_window)
+        )
+
+    def process_wikipedia_stream(
+        self, articles: Iterable[Tuple[str, str, str]]
+    ) -> Iterator[TextSegment]:
+        """
+        Process Wikipedia-style articles produced incrementally.
 
-        current_pos = 0
+        Segments (and their positions) are identical to process_wikipedia_format()
+        on the full text; context comes from each item instead of the text.
 
-        for i in range(1, len(articles), 2):  # Skip first empty and alternate
-            if i + 1 < len(articles):
-                title = articles[i].strip()
-                article_content = articles[i + 1].strip()
+        Args:
+            articles: (title, article content, context) triples, e.g. from a
+                memory-mapped scan for ARTICLE_PATTERN
 
-                if (
-                    not article_content
-                    or len(article_content) < self.min_segment_length
-                ):
-                    current_pos += len(title) + len(article_content) + 10
-                    continue
+        Yields:
+            TextSegment objects for each article/section
+        """
+        return self._wikipedia_segments(articles, None)
 
-                # Process sections within article
-                sections = re.split(
-                    section_pattern, article_content, flags=re.MULTILINE
-                )
+    def _wikipedia_segments(
+        self,
+        articles: Iterable[Tuple[str, str, Optional[str]]],
+        context_at: Optional[Callable[[int], str]],
+    ) -> Iterator[TextSegment]:
+        current_pos = 0
 
-                if len(sections) > 1:
-                    # Multiple sections - process each
-                    section_pos = current_pos + len(title) + 10
+        for title, article_content, article_context in articles:
+            title = title.strip()
+            article_content = article_content.strip()
 
-                    for j in range(1, len(sections), 2):
-                        if j + 1 < len(sections):
-                            section_title = sections[j].strip()
-                            section_content = sections[j + 1].strip()
+            if not article_content or len(article_content) < self.min_segment_length:
+                current_pos += len(title) + len(article_content) + 10
+                continue
 
-                            full_content = (
-                                f"{title}\n\n{section_title}\n{section_content}"
-                            )
+            # Process sections within article
+            sections = SECTION_PATTERN.split(article_content)
 
-                            if len(full_content) >= self.min_segment_length:
-                                # Get context from surrounding sections
-                                context = self._get_context(
-                                    content, section_pos, self.context_window
-                                )
-
-                                yield TextSegment(
-                                    content=full_content,
-                                    start_pos=section_pos,
-                                    end_pos=section_pos + len(full_content),
-                                    segment_type="section",
-                                    context=context,
-                                )
-
-                            section_pos += (
-                                len(section_title) + len(section_content) + 10
-                            )
-                else:
-                    # Single article without sections
-                    full_content = f"{title}\n\n{article_content}"
+            if len(sections) > 1:
+                # Multiple sections - process each
+                section_pos = current_pos + len(title) + 10
 
-                    if len(full_content) >= self.min_segment_length:
-                        context = self._get_context(
-                            content, current_pos, self.context_window
-                        )
+                for j in range(1, len(sections), 2):
+                    if j + 1 < len(sections):
+                        section_title = sections[j].strip()
+                        section_content = sections[j + 1].strip()
 
-                        # Split long articles into paragraphs
-                        if len(full_content) > self.max_segment_length:
-                            yield from self._split_long_content(
-                                full_content, current_pos, "article", context
+                        full_content = f"{title}\n\n{section_title}\n{section_content}"
+
+                        if len(full_content) >= self.min_segment_length:
+                            # Get context from surrounding sections
+                            context = (
+                                article_context
+                                if article_context is not None
+                                else context_at(section_pos)
                             )
-                        else:
+
                             yield TextSegment(
                                 content=full_content,
-                                start_pos=current_pos,
-                                end_pos=current_pos + len(full_content),
-                                segment_type="article",
+                                start_pos=section_pos,
+                                end_pos=section_pos + len(full_content),
+                                segment_type="section",
                                 context=context,
                             )
 
-                current_pos += len(title) + len(article_content) + 10
+                        section_pos += len(section_title) + len(section_content) + 10
+            else:
+                # Single article without sections
+                full_content = f"{title}\n\n{article_content}"
+
+                if len(full_content) >= self.min_segment_length:
+                    context = (
+                        article_context
+                        if article_context is not None
+                        else context_at(current_pos)
+                    )
+
+                    # Split long articles into paragraphs
+                    if len(full_content) > self.max_segment_length:
+                        yield from self._split_long_content(
+                            full_content, current_pos, "article", context
+                        )
+                    else:
+                        yield TextSegment(
+                            content=full_content,
+                            start_pos=current_pos,
+                            end_pos=current_pos + len(full_content),
+                            segment_type="article",
+                            context=context,
+                        )
+
+            current_pos += len(title) + len(article_content) + 10
 
     def process_plain_text(self, content: str) -> Iterator[TextSegment]:
         """
@@ -149,17 +174,46 @@ class IntelligentTextProcessor:
             TextSegment objects for meaningful text units
         """
         # Split by double newlines (paragraphs)
-        paragraphs = re.split(r"\n\s*\n", content)
+        paragraphs = PARAGRAPH_PATTERN.split(content)
+        return self._plain_text_segments(
+            ((paragraph, None) for paragraph in paragraphs),
+            lambda pos: self._get_context(content, pos, self.context_window),
+        )
+
+    def process_plain_text_stream(
+        self, paragraphs: Iterable[Tuple[str, str]]
+    ) -> Iterator[TextSegment]:
+        """
+        Process plain text paragraphs produced incrementally.
+
+        Segments (and their positions) are identical to process_plain_text()
+        on the full text; context comes from each item instead of the text.
+
+        Args:
+            paragraphs: (paragraph, context) pairs, e.g. from a memory-mapped
+                scan for PARAGRAPH_PATTERN
+
+        Yields:
+            TextSegment objects for meaningful text units
+        """
+        return self._plain_text_segments(paragraphs, None)
+
+    def _plain_text_segments(
+        self,
+        paragraphs: Iterable[Tuple[str, Optional[str]]],
+        context_at: Optional[Callable[[int], str]],
+    ) -> Iterator[TextSegment]:
         current_pos = 0
 
-        for paragraph in paragraphs:
+        for paragraph, context in paragraphs:
             paragraph = paragraph.strip()
 
             if len(paragraph) < self.min_segment_length:
                 current_pos += len(paragraph) + 2
                 continue
 
-            context = self._get_context(content, current_pos, self.context_window)
+            if context is None:
+                context = context_at(current_pos)
 
             if len(paragraph) > self.max_segment_length:
                 # Split long paragraphs by sentences
@@ -181,7 +235,7 @@ class IntelligentTextProcessor:
         """Split content that's too long into smaller segments."""
 
         # Try splitting by paragraphs first
-        paragraphs = re.split(r"\n\s*\n", content)
+        paragraphs = PARAGRAPH_PATTERN.split(content)
 
         if len(paragraphs) > 1:
             current_pos = start_pos
@@ -52,6 +52,9 @@ class ReasoningEngineConfig:
     # Entity cache
     enable_entity_cache: bool = False
 
+    # Per-stage request profiling (fraction of ask() calls)
+    profile_sample_rate: float = 0.0
+
     def validate(self) -> None:
         """Validate configuration."""
         if self.max_cache_size <= 0:
@@ -68,6 +71,11 @@ class ReasoningEngineConfig:
                 f"association_workers must be > 0, got {self.association_workers}"
             )
 
+        if not (0.0 <= self.profile_sample_rate <= 1.0):
+            raise ValueError(
+                f"profile_sample_rate must be in [0, 1], got {self.profile_sample_rate}"
+            )
+
         # Validate storage config
         self.storage_config.validate()
 
@@ -161,6 +169,13 @@ class ReasoningEngineConfigBuilder:
         self._config.enable_entity_cache = enabled
         return self
 
+    def with_profiling(
+        self, sample_rate: float = 0.01
+    ) -> "ReasoningEngineConfigBuilder":
+        """Configure per-stage profiling of sampled ask() requests."""
+        self._config.profile_sample_rate = sample_rate
+        return self
+
     def build(self) -> ReasoningEngineConfig:
         """Build and validate configuration."""
         self._config.validate()
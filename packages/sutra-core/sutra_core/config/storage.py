@@ -41,6 +41,9 @@ class StorageConfig:
     circuit_breaker_failure_threshold: int = SYSTEM_CONFIG.CIRCUIT_BREAKER_FAILURE_THRESHOLD
     circuit_breaker_timeout_seconds: int = SYSTEM_CONFIG.CIRCUIT_BREAKER_TIMEOUT_SECONDS
 
+    # Log storage requests slower than this (None = disabled)
+    slow_request_threshold_ms: Optional[float] = None
+
     def validate(self) -> None:
         """Validate storage configuration."""
         if not self.server_address:
@@ -55,6 +58,11 @@ class StorageConfig:
         if self.timeout_seconds <= 0:
             raise ValueError(f"timeout_seconds must be > 0, got {self.timeout_seconds}")
 
+        if self.slow_request_threshold_ms is not None and self.slow_request_threshold_ms <= 0:
+            raise ValueError(
+                f"slow_request_threshold_ms must be > 0, got {self.slow_request_threshold_ms}"
+            )
+
         logger.debug(f"Storage config validated: {self.server_address}")
 
 
@@ -64,6 +72,7 @@ def create_storage_config(
     vector_dimension: Optional[int] = None,
     timeout_seconds: Optional[int] = None,
     max_retries: Optional[int] = None,
+    slow_request_threshold_ms: Optional[float] = None,
 ) -> StorageConfig:
     """
     Create storage configuration from environment and edition spec.
@@ -74,6 +83,8 @@ def create_storage_config(
         vector_dimension: Override vector dimension (auto-detected from model)
         timeout_seconds: Override timeout (default from SYSTEM_CONFIG)
         max_retries: Override max retries (default from SYSTEM_CONFIG)
+        slow_request_threshold_ms: Slow-request log threshold
+            (from SUTRA_STORAGE_SLOW_REQUEST_MS; unset = disabled)
 
     Returns:
         Validated StorageConfig instance
@@ -102,6 +113,9 @@ def create_storage_config(
     if vector_dimension is None:
         vector_dimension = get_vector_dimension(edition_spec.embedding_model)
 
+    if slow_request_threshold_ms is None and os.getenv("SUTRA_STORAGE_SLOW_REQUEST_MS"):
+        slow_request_threshold_ms = float(os.environ["SUTRA_STORAGE_SLOW_REQUEST_MS"])
+
     # Create config
     config = StorageConfig(
         server_address=resolved_server_address,
@@ -109,6 +123,7 @@ def create_storage_config(
         max_retries=max_retries or SYSTEM_CONFIG.TCP_MAX_RETRIES,
         vector_dimension=vector_dimension,
         edition=edition_spec.edition,
+        slow_request_threshold_ms=slow_request_threshold_ms,
     )
 
     config.validate()
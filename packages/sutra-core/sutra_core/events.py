@@ -8,15 +8,41 @@ Events stored in Sutra Storage, queryable via natural language:
 - "Show me learning failures"
 
 Architecture:
-    Application → EventEmitter → Storage (TCP) → Natural Language Queries
+    Application → EventEmitter → ring buffer → writer thread → Storage (TCP)
+        → Natural Language Queries
+
+Rollups: instead of one concept per event, events are aggregated per
+(component, event type) into minute and hour EventRollup concepts (counts,
+latency histogram, error samples). Only exemplars (the first event of each
+minute) and failures are stored individually. A RollupIndex concept per
+hour lists which rollups exist, so ObservabilityQueryInterface can fetch
+them by ID without scanning storage.
+
+Several aggregators write rollups for the same hour (the reasoning engine,
+SelfObserver, every API worker process, a restarted process), so rollup
+and index IDs include the aggregator's writer ID. Each writer links its
+hour index from a shared per-hour anchor concept; readers follow the
+anchor's associations to every writer's index and merge their rollups.
 """
 
+import logging
+import os
+import random
+import socket
+import threading
 import time
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+from collections import deque
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+import hashlib
 import json
+import uuid
+
+from .exceptions import PartialWriteError
+
+logger = logging.getLogger(__name__)
 
 
 class ApplicationEventType(Enum):
@@ -142,25 +168,512 @@ class ApplicationEvent:
         return json.dumps(data)
 
 
+# Upper bounds (ms) of the rollup latency histogram buckets; one overflow bucket follows
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Prefix of the machine-readable line in rollup/index concept content
+ROLLUP_DATA_PREFIX = "rollup_data: "
+
+MINUTE_FORMAT = "%Y%m%d_%H%M"
+HOUR_FORMAT = "%Y%m%d_%H"
+
+
+def parse_event_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO event timestamp ('Z' or offset; naive means UTC) to UTC."""
+    ts = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
+def _stable_id(prefix: str, key: str) -> str:
+    return f"{prefix}_{hashlib.sha256(key.encode()).hexdigest()[:16]}"
+
+
+def default_writer_id() -> str:
+    """Writer ID unique to this aggregator instance (host, pid, random suffix)."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def _data_line(content: str) -> Optional[Dict[str, Any]]:
+    for line in content.splitlines():
+        if line.startswith(ROLLUP_DATA_PREFIX):
+            try:
+                return json.loads(line[len(ROLLUP_DATA_PREFIX):])
+            except ValueError:
+                return None
+    return None
+
+
+@dataclass
+class EventRollup:
+    """Aggregate of one (component, event type) over a minute or hour bucket."""
+    component: str
+    event_type: str
+    bucket: str  # MINUTE_FORMAT or HOUR_FORMAT
+    count: int = 0
+    failures: int = 0
+    duration_count: int = 0
+    duration_sum_ms: float = 0.0
+    duration_min_ms: Optional[float] = None
+    duration_max_ms: Optional[float] = None
+    latency_histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    error_samples: List[str] = field(default_factory=list)
+    writer: str = ""  # EventAggregator.writer_id ("" for rollups written before it existed)
+
+    @staticmethod
+    def concept_id_for(component: str, event_type: str, bucket: str, writer: str = "") -> str:
+        """Deterministic concept ID, so a rollup can be rewritten and looked up."""
+        key = f"{component}_{event_type}_{bucket}"
+        return _stable_id("rollup", f"{key}_{writer}" if writer else key)
+
+    @property
+    def concept_id(self) -> str:
+        return self.concept_id_for(self.component, self.event_type, self.bucket, self.writer)
+
+    @property
+    def is_hourly(self) -> bool:
+        return len(self.bucket) == len("YYYYMMDD_HH")
+
+    @property
+    def avg_duration_ms(self) -> Optional[float]:
+        if not self.duration_count:
+            return None
+        return self.duration_sum_ms / self.duration_count
+
+    def add(
+        self,
+        success: bool,
+        duration_ms: Optional[float],
+        error_message: Optional[str],
+        max_error_samples: int,
+    ) -> None:
+        """Fold one event into the aggregate."""
+        self.count += 1
+        if not success:
+            self.failures += 1
+            if error_message and len(self.error_samples) < max_error_samples:
+                self.error_samples.append(error_message[:200])
+        if duration_ms is not None:
+            self.duration_count += 1
+            self.duration_sum_ms += duration_ms
+            if self.duration_min_ms is None or duration_ms < self.duration_min_ms:
+                self.duration_min_ms = duration_ms
+            if self.duration_max_ms is None or duration_ms > self.duration_max_ms:
+                self.duration_max_ms = duration_ms
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if duration_ms <= bound:
+                    self.latency_histogram[i] += 1
+                    break
+            else:
+                self.latency_histogram[-1] += 1
+
+    def merge(self, other: "EventRollup", max_error_samples: int = 3) -> None:
+        """Fold another writer's rollup of the same series and bucket into this one."""
+        self.count += other.count
+        self.failures += other.failures
+        self.duration_count += other.duration_count
+        self.duration_sum_ms += other.duration_sum_ms
+        if other.duration_min_ms is not None and (
+            self.duration_min_ms is None or other.duration_min_ms < self.duration_min_ms
+        ):
+            self.duration_min_ms = other.duration_min_ms
+        if other.duration_max_ms is not None and (
+            self.duration_max_ms is None or other.duration_max_ms > self.duration_max_ms
+        ):
+            self.duration_max_ms = other.duration_max_ms
+        self.latency_histogram = [
+            a + b for a, b in zip(self.latency_histogram, other.latency_histogram)
+        ]
+        self.error_samples = (self.error_samples + other.error_samples)[:max_error_samples]
+
+    def percentile_ms(self, q: float) -> Optional[float]:
+        """Histogram upper bound at or below which a fraction q of durations fall."""
+        return histogram_percentile(self.latency_histogram, q, self.duration_max_ms)
+
+    def to_concept_content(self) -> str:
+        """Natural-language summary plus a machine-readable data line."""
+        if self.is_hourly:
+            when = datetime.strptime(self.bucket, HOUR_FORMAT).strftime("%Y-%m-%dT%H:00 (hour)")
+        else:
+            when = datetime.strptime(self.bucket, MINUTE_FORMAT).strftime("%Y-%m-%dT%H:%M")
+        summary = (
+            f"{self.component} {self.event_type} at {when}: "
+            f"{self.count} events, {self.failures} failed"
+        )
+        if self.duration_count:
+            summary += (
+                f", average {self.avg_duration_ms:.1f}ms, "
+                f"p95 under {self.percentile_ms(0.95):.0f}ms, "
+                f"max {self.duration_max_ms:.1f}ms"
+            )
+        if self.error_samples:
+            summary += f"; errors: {'; '.join(self.error_samples)}"
+        return f"{summary}\n{ROLLUP_DATA_PREFIX}{json.dumps(asdict(self))}"
+
+    @classmethod
+    def from_concept_content(cls, content: str) -> Optional["EventRollup"]:
+        """Parse a rollup concept's content; None if it is not a rollup."""
+        data = _data_line(content)
+        if not data or "event_type" not in data:
+            return None
+        try:
+            return cls(**data)
+        except TypeError:
+            return None
+
+    def to_concept(self):
+        """Rollup as a storable Concept."""
+        from .graph.concepts import Concept
+        return Concept(
+            id=self.concept_id,
+            content=self.to_concept_content(),
+            confidence=1.0,
+            strength=1.0,
+            source="application_events",
+            category=f"rollup_{self.event_type}",
+        )
+
+
+def histogram_percentile(
+    histogram: List[int], q: float, max_ms: Optional[float] = None
+) -> Optional[float]:
+    """Upper bucket bound at quantile q (the overflow bucket reports max_ms)."""
+    total = sum(histogram)
+    if not total:
+        return None
+    threshold = q * total
+    seen = 0
+    for i, n in enumerate(histogram):
+        seen += n
+        if seen >= threshold and n:
+            if i < len(LATENCY_BUCKETS_MS):
+                return float(LATENCY_BUCKETS_MS[i])
+            break
+    return max_ms if max_ms is not None else float(LATENCY_BUCKETS_MS[-1])
+
+
+@dataclass
+class RollupIndex:
+    """
+    Which rollups one writer has in one hour: {"component|event_type": [minute buckets]}.
+
+    Every writer's index is linked from the hour's anchor concept.
+    """
+    hour: str  # HOUR_FORMAT
+    keys: Dict[str, List[str]] = field(default_factory=dict)
+    writer: str = ""
+
+    @staticmethod
+    def concept_id_for(hour: str, writer: str = "") -> str:
+        return _stable_id("rollup_index", f"{hour}_{writer}" if writer else hour)
+
+    @staticmethod
+    def anchor_id_for(hour: str) -> str:
+        """ID of the hour's anchor concept, shared by all writers."""
+        return _stable_id("rollup_hour", hour)
+
+    @property
+    def concept_id(self) -> str:
+        return self.concept_id_for(self.hour, self.writer)
+
+    def to_concept_content(self) -> str:
+        return (
+            f"Event rollup index for hour {self.hour}: {len(self.keys)} event series\n"
+            f"{ROLLUP_DATA_PREFIX}{json.dumps(asdict(self))}"
+        )
+
+    @classmethod
+    def from_concept_content(cls, content: str) -> Optional["RollupIndex"]:
+        data = _data_line(content)
+        if not data or "hour" not in data:
+            return None
+        try:
+            return cls(**data)
+        except TypeError:
+            return None
+
+    def to_concept(self):
+        from .graph.concepts import Concept
+        return Concept(
+            id=self.concept_id,
+            content=self.to_concept_content(),
+            confidence=1.0,
+            strength=1.0,
+            source="application_events",
+            category="rollup_index",
+        )
+
+    def anchor_concept(self):
+        """The hour's anchor concept (identical for every writer)."""
+        from .graph.concepts import Concept
+        return Concept(
+            id=self.anchor_id_for(self.hour),
+            content=f"Event rollup indexes for hour {self.hour}",
+            confidence=1.0,
+            strength=1.0,
+            source="application_events",
+            category="rollup_anchor",
+        )
+
+    def anchor_association(self):
+        """Association from the hour's anchor to this writer's index."""
+        from .graph.concepts import Association, AssociationType
+        return Association(
+            source_id=self.anchor_id_for(self.hour),
+            target_id=self.concept_id,
+            assoc_type=AssociationType.HIERARCHICAL,
+            confidence=1.0,
+        )
+
+
+def store_rollups(storage, items: List[Any]) -> None:
+    """
+    Write drained rollups and hour indexes, linking each index to its hour anchor.
+
+    Raises:
+        Exception: Storage errors (callers treat them as non-fatal)
+    """
+    concepts = [(item.to_concept(), None) for item in items]
+    associations = []
+    for item in items:
+        if isinstance(item, RollupIndex):
+            concepts.append((item.anchor_concept(), None))
+            associations.append(item.anchor_association())
+
+    if hasattr(storage, "add_concepts"):
+        storage.add_concepts(concepts)
+    else:
+        for concept, embedding in concepts:
+            storage.add_concept(concept, embedding)
+    if hasattr(storage, "add_associations"):
+        storage.add_associations(associations)
+    else:
+        for association in associations:
+            storage.add_association(association)
+
+
+class EventAggregator:
+    """
+    Rolls events up per (component, event type) into minute and hour buckets.
+
+    add() decides whether an event must also be stored on its own: the
+    first event of each minute bucket (an exemplar) and failures, up to
+    max_individual_failures per minute. drain() hands back rollups (and
+    hour indexes) for buckets that ended more than close_delay_seconds ago.
+    Events arriving after their bucket was closed are counted in the
+    earliest open minute, so a written rollup is never overwritten with
+    partial counts. Rollups and indexes carry writer_id, so aggregators
+    writing the same hour do not overwrite each other. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_error_samples: int = 3,
+        max_individual_failures: int = 20,
+        close_delay_seconds: float = 60.0,
+        writer_id: Optional[str] = None,
+    ):
+        self.writer_id = writer_id or default_writer_id()
+        self.max_error_samples = max_error_samples
+        self.max_individual_failures = max_individual_failures
+        self.close_delay_seconds = close_delay_seconds
+        self._minutes: Dict[Tuple[str, str, str], EventRollup] = {}
+        self._hours: Dict[Tuple[str, str, str], EventRollup] = {}
+        self._indexes: Dict[str, Dict[str, Set[str]]] = {}
+        self._watermark: Optional[datetime] = None  # buckets before it are closed
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        component: str,
+        event_type: str,
+        timestamp: str,
+        success: bool = True,
+        duration_ms: Optional[float] = None,
+        error_message: Optional[str] = None,
+    ) -> bool:
+        """
+        Aggregate one event.
+
+        Returns:
+            True if the event should also be written individually
+        """
+        ts = parse_event_timestamp(timestamp)
+
+        with self._lock:
+            if self._watermark is not None and ts < self._watermark:
+                ts = self._watermark  # late: its own bucket is already written
+            minute = ts.strftime(MINUTE_FORMAT)
+            hour = ts.strftime(HOUR_FORMAT)
+
+            rollup = self._minutes.get((component, event_type, minute))
+            exemplar = rollup is None
+            if exemplar:
+                rollup = EventRollup(component, event_type, minute, writer=self.writer_id)
+                self._minutes[(component, event_type, minute)] = rollup
+            rollup.add(success, duration_ms, error_message, self.max_error_samples)
+
+            hourly = self._hours.get((component, event_type, hour))
+            if hourly is None:
+                hourly = EventRollup(component, event_type, hour, writer=self.writer_id)
+                self._hours[(component, event_type, hour)] = hourly
+            hourly.add(success, duration_ms, error_message, self.max_error_samples)
+
+            self._indexes.setdefault(hour, {}).setdefault(
+                f"{component}|{event_type}", set()
+            ).add(minute)
+
+            return exemplar or (
+                not success and rollup.failures <= self.max_individual_failures
+            )
+
+    def drain(
+        self, now: Optional[datetime] = None, include_open: bool = False
+    ) -> List[Any]:
+        """
+        Collect rollups to write.
+
+        Closed minute/hour buckets are returned and forgotten; with
+        include_open, snapshots of still-open buckets are returned too (they
+        keep aggregating and are rewritten under the same ID later). Hour
+        indexes are returned whenever one of their rollups is.
+
+        Returns:
+            EventRollup and RollupIndex objects
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=self.close_delay_seconds)
+        # Minute/hour buckets starting before these have ended by the cutoff
+        open_minute = cutoff.strftime(MINUTE_FORMAT)
+        open_hour = cutoff.strftime(HOUR_FORMAT)
+        out: List[Any] = []
+        touched_hours: Set[str] = set()
+
+        with self._lock:
+            watermark = cutoff.replace(second=0, microsecond=0)
+            if self._watermark is None or watermark > self._watermark:
+                self._watermark = watermark
+
+            for key, rollup in list(self._minutes.items()):
+                if rollup.bucket < open_minute:
+                    out.append(self._minutes.pop(key))
+                elif include_open:
+                    out.append(_snapshot(rollup))
+                else:
+                    continue
+                touched_hours.add(rollup.bucket[: len("YYYYMMDD_HH")])
+
+            for key, rollup in list(self._hours.items()):
+                if rollup.bucket < open_hour:
+                    out.append(self._hours.pop(key))
+                elif include_open:
+                    out.append(_snapshot(rollup))
+
+            for hour in sorted(touched_hours):
+                keys = self._indexes.get(hour)
+                if keys is None:
+                    continue
+                out.append(
+                    RollupIndex(
+                        hour, {k: sorted(v) for k, v in keys.items()}, self.writer_id
+                    )
+                )
+                if hour < open_hour and not any(
+                    r.bucket.startswith(hour) for r in self._minutes.values()
+                ):
+                    del self._indexes[hour]
+
+        return out
+
+
+def _snapshot(rollup: EventRollup) -> EventRollup:
+    return EventRollup(**asdict(rollup))  # asdict deep-copies the lists
+
+
 class EventEmitter:
     """
     Event emitter that writes application events to Sutra Storage via TCP.
     
     Integrates with sutra-grid-events architecture but for application-level events.
     Uses the same TCP protocol and storage backend.
+
+    emit() only appends to a bounded in-memory ring buffer; a background
+    thread drains it and writes events to storage in batches, so callers
+    (e.g. ReasoningEngine.ask) never wait on storage RPCs. When the buffer
+    is full the oldest events are dropped; with overflow_policy="sample",
+    events are additionally sampled once the buffer is half full. Drops
+    are counted in stats().
+
+    With rollups enabled (the default), events are aggregated by an
+    EventAggregator and only exemplars and failures become individual
+    concepts; see the module docstring.
     """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "sample")
     
-    def __init__(self, storage_adapter, component: str = "application"):
+    def __init__(
+        self,
+        storage_adapter,
+        component: str = "application",
+        max_buffer_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        overflow_policy: str = "drop_oldest",
+        overload_sample_rate: float = 0.1,
+        async_writes: bool = True,
+        rollups: bool = True,
+    ):
         """
         Initialize event emitter.
         
         Args:
             storage_adapter: TcpStorageAdapter or RustStorageAdapter
             component: Component name (e.g., "reasoning_engine", "hybrid_api")
+            max_buffer_size: Events buffered before the oldest are dropped
+            batch_size: Maximum events written per storage batch
+            flush_interval: Seconds the writer waits for a batch to fill
+            overflow_policy: "drop_oldest" or "sample" (see class docstring)
+            overload_sample_rate: Fraction of events kept under "sample"
+                once the buffer is half full
+            async_writes: Write on the background thread (False = write
+                synchronously inside emit(), e.g. for scripts and tests)
+            rollups: Aggregate events into rollup concepts instead of
+                writing every event individually
         """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {self.OVERFLOW_POLICIES}, "
+                f"got {overflow_policy!r}"
+            )
         self.storage = storage_adapter
         self.component = component
         self.enabled = True
+
+        self.max_buffer_size = max_buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.overload_sample_rate = overload_sample_rate
+        self.async_writes = async_writes
+        self._aggregator: Optional[EventAggregator] = EventAggregator() if rollups else None
+
+        self._buffer: deque = deque(maxlen=max_buffer_size)
+        self._cond = threading.Condition()
+        self._writing = 0  # events taken off the buffer, not yet written
+        self._flush_requested = False
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+
+        # Counters (read via stats())
+        self._emitted = 0
+        self._written = 0
+        self._rolled_up = 0
+        self._failed = 0
+        self._dropped_oldest = 0
+        self._sampled_out = 0
         
     def emit(self, event: ApplicationEvent):
         """
@@ -170,39 +683,241 @@ class EventEmitter:
         """
         if not self.enabled:
             return
-        
+
+        if not self.async_writes:
+            written, rolled_up = self._write_batch([event])
+            self._write_rollups()
+            with self._cond:
+                self._emitted += 1
+                self._written += written
+                self._rolled_up += rolled_up
+                self._failed += 1 - written - rolled_up
+            return
+
+        with self._cond:
+            self._emitted += 1
+            backlog = len(self._buffer)
+            if (
+                self.overflow_policy == "sample"
+                and backlog * 2 >= self.max_buffer_size
+                and random.random() >= self.overload_sample_rate
+            ):
+                self._sampled_out += 1
+                return
+            if backlog == self.max_buffer_size:
+                self._dropped_oldest += 1  # deque(maxlen) evicts it
+            self._buffer.append(event)
+
+            if self._writer is None or not self._writer.is_alive():
+                self._start_writer()
+            elif backlog + 1 >= self.batch_size:
+                self._cond.notify()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Write all buffered events (and open rollups) now and wait for them.
+
+        Returns:
+            True if everything was written within the timeout
+        """
+        if not self.async_writes:
+            self._write_rollups(include_open=True)
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._writer is None or not self._writer.is_alive():
+                return not self._buffer
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._flush_requested:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush buffered events and stop the writer thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join(timeout)
+        with self._cond:
+            self._writer = None
+            self._stopping = False
+        if self._buffer:
+            logger.warning(f"Event emitter closed with {len(self._buffer)} unwritten events")
+
+    def stats(self) -> Dict[str, int]:
+        """Emission counters, including events lost to overload."""
+        with self._cond:
+            return {
+                "emitted": self._emitted,
+                "written": self._written,
+                "rolled_up": self._rolled_up,
+                "failed": self._failed,
+                "dropped_oldest": self._dropped_oldest,
+                "sampled_out": self._sampled_out,
+                "buffered": len(self._buffer) + self._writing,
+            }
+
+    def _start_writer(self) -> None:
+        # Called with self._cond held
+        self._writer = threading.Thread(
+            target=self._writer_loop, name=f"event-writer-{self.component}", daemon=True
+        )
+        self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Drain the buffer in batches until close()."""
+        while True:
+            with self._cond:
+                if (
+                    len(self._buffer) < self.batch_size
+                    and not self._flush_requested
+                    and not self._stopping
+                ):
+                    self._cond.wait(self.flush_interval)
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self.batch_size, len(self._buffer)))
+                ]
+                self._writing = len(batch)
+                # Buffer drained for a flush()/close(): also write open rollups
+                finishing = not self._buffer and (self._flush_requested or self._stopping)
+                stopping = self._stopping
+
+            written = rolled_up = 0
+            if batch:
+                written, rolled_up = self._write_batch(batch)
+            self._write_rollups(include_open=finishing)
+
+            with self._cond:
+                self._writing = 0
+                self._written += written
+                self._rolled_up += rolled_up
+                self._failed += len(batch) - written - rolled_up
+                if finishing:
+                    self._flush_requested = False
+                self._cond.notify_all()
+                if finishing and stopping:
+                    return
+
+    def _write_batch(self, events: List[ApplicationEvent]) -> Tuple[int, int]:
+        """
+        Write events as concepts plus their associations.
+
+        With rollups, events that need no individual concept are only
+        aggregated.
+
+        Returns:
+            (events whose concept was written, events only rolled up)
+        """
+        from .graph.concepts import Concept
+
+        concepts: List[Tuple[Any, Any]] = []
+        associations = []
+        rolled_up = 0
+        for event in events:
+            try:
+                if self._aggregator is not None and not self._aggregator.add(
+                    event.component,
+                    event.event_type.value,
+                    event.timestamp,
+                    event.success,
+                    event.duration_ms,
+                    event.error_message,
+                ):
+                    rolled_up += 1
+                    continue
+
+                # Generate unique event ID
+                event_id = self._generate_event_id(event)
+
+                concept = Concept(
+                    id=event_id,
+                    # Convert to natural language concept
+                    content=event.to_concept_content(),
+                    confidence=1.0,
+                    strength=1.0,
+                    source="application_events",
+                    category=f"event_{event.event_type.value}",
+                    created=event.timestamp,
+                    last_accessed=event.timestamp,
+                    access_count=1,
+                )
+                concepts.append((concept, None))  # events carry no embedding
+            except Exception as e:
+                # Never crash the main application due to observability
+                logger.warning(f"Failed to build event {event.event_type.value}: {e}")
+                continue
+
+            try:
+                # Create associations for temporal and semantic queries
+                associations.extend(self._event_associations(event, event_id))
+            except Exception:
+                # Silent failure for associations
+                pass
+
         try:
-            # Generate unique event ID
-            event_id = self._generate_event_id(event)
-            
-            # Convert to natural language concept
-            concept_content = event.to_concept_content()
-            
-            # Write to storage as concept
-            from .graph.concepts import Concept, Association, AssociationType
-            
-            concept = Concept(
-                id=event_id,
-                content=concept_content,
-                confidence=1.0,
-                strength=1.0,
-                source="application_events",
-                category=f"event_{event.event_type.value}",
-                created=event.timestamp,
-                last_accessed=event.timestamp,
-                access_count=1,
+            written = self._add_concepts(concepts)
+        except PartialWriteError as e:
+            logger.warning(f"Failed to emit {len(e.failed)}/{len(concepts)} events: {e}")
+            written = e.written
+            # Skip the associations of events that were not stored
+            unstored = {concepts[i][0].id for i in e.failed}
+            associations = [a for a in associations if a.source_id not in unstored]
+        except Exception as e:
+            logger.warning(f"Failed to emit {len(concepts)} events: {e}")
+            return 0, rolled_up
+
+        try:
+            if hasattr(self.storage, "add_associations"):
+                self.storage.add_associations(associations)
+            else:
+                for association in associations:
+                    self.storage.add_association(association)
+        except Exception:
+            # Silent failure for associations
+            pass
+
+        return written, rolled_up
+
+    def _add_concepts(self, concepts: List[Tuple[Any, Any]]) -> int:
+        """Store concepts; like add_concepts(), raise PartialWriteError on failures."""
+        if hasattr(self.storage, "add_concepts"):
+            return self.storage.add_concepts(concepts)
+        failed = []
+        error: Optional[Exception] = None
+        for i, (concept, embedding) in enumerate(concepts):
+            try:
+                self.storage.add_concept(concept, embedding)
+            except Exception as e:
+                failed.append(i)
+                error = e
+        if failed:
+            raise PartialWriteError(
+                f"Failed to store {len(failed)}/{len(concepts)} concepts: {error}",
+                written=len(concepts) - len(failed),
+                failed=failed,
             )
-            
-            # Add concept (non-blocking)
-            self.storage.add_concept(concept)
-            
-            # Create associations for temporal and semantic queries
-            self._create_event_associations(event, event_id)
-            
+        return len(concepts)
+
+    def _write_rollups(self, include_open: bool = False) -> None:
+        """Write rollups (and hour indexes) of closed buckets, or all buckets."""
+        if self._aggregator is None:
+            return
+        try:
+            items = self._aggregator.drain(include_open=include_open)
+            if not items:
+                return
+            store_rollups(self.storage, items)
         except Exception as e:
             # Never crash the main application due to observability
-            import logging
-            logging.warning(f"Failed to emit event: {e}")
+            logger.warning(f"Failed to write event rollups: {e}")
     
     def _generate_event_id(self, event: ApplicationEvent) -> str:
         """Generate stable event ID."""
@@ -213,53 +928,50 @@ class EventEmitter:
             hash_input += f"_{event.metadata['query']}"
         return f"evt_{hashlib.sha256(hash_input.encode()).hexdigest()[:16]}"
     
-    def _create_event_associations(self, event: ApplicationEvent, event_id: str):
-        """Create associations for event querying."""
+    def _event_associations(self, event: ApplicationEvent, event_id: str) -> list:
+        """Build the associations used for event querying."""
         from .graph.concepts import Association, AssociationType
-        
-        try:
-            # Association: component -> event_type -> event
-            type_concept_id = f"event_type_{event.event_type.value}"
-            
-            assoc = Association(
+
+        # Association: component -> event_type -> event
+        type_concept_id = f"event_type_{event.event_type.value}"
+        associations = [
+            Association(
                 source_id=event_id,
                 target_id=type_concept_id,
-                assoc_type=AssociationType.CATEGORICAL,
+                assoc_type=AssociationType.HIERARCHICAL,
                 confidence=1.0,
-                strength=1.0,
+                weight=1.0,
             )
-            self.storage.add_association(assoc)
-            
-            # Association: event -> timestamp (for temporal queries)
-            ts = datetime.fromisoformat(event.timestamp.replace('Z', '+00:00'))
-            timestamp_id = f"ts_{ts.strftime('%Y%m%d_%H%M')}"  # Minute-level buckets
-            
-            ts_assoc = Association(
+        ]
+
+        # Association: event -> timestamp (for temporal queries)
+        ts = datetime.fromisoformat(event.timestamp.replace('Z', '+00:00'))
+        timestamp_id = f"ts_{ts.strftime('%Y%m%d_%H%M')}"  # Minute-level buckets
+        associations.append(
+            Association(
                 source_id=event_id,
                 target_id=timestamp_id,
                 assoc_type=AssociationType.TEMPORAL,
                 confidence=1.0,
-                strength=1.0,
+                weight=1.0,
             )
-            self.storage.add_association(ts_assoc)
-            
-            # If error event, associate with error type
-            if not event.success and event.error_message:
-                error_type = event.error_message.split(':')[0] if ':' in event.error_message else event.error_message[:30]
-                error_concept_id = f"error_{error_type.replace(' ', '_').lower()}"
-                
-                error_assoc = Association(
+        )
+
+        # If error event, associate with error type
+        if not event.success and event.error_message:
+            error_type = event.error_message.split(':')[0] if ':' in event.error_message else event.error_message[:30]
+            error_concept_id = f"error_{error_type.replace(' ', '_').lower()}"
+            associations.append(
+                Association(
                     source_id=event_id,
                     target_id=error_concept_id,
                     assoc_type=AssociationType.CAUSAL,
                     confidence=0.9,
-                    strength=1.0,
+                    weight=1.0,
                 )
-                self.storage.add_association(error_assoc)
-        
-        except Exception:
-            # Silent failure for associations
-            pass
+            )
+
+        return associations
     
     def emit_query_start(self, query: str):
         """Emit query received event."""
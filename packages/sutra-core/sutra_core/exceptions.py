@@ -5,6 +5,8 @@ This module defines specific exception types for better error handling
 and user feedback across the Sutra AI ecosystem.
 """
 
+from typing import Dict, List
+
 
 class SutraError(Exception):
     """Base exception for all Sutra AI errors."""
@@ -30,6 +32,20 @@ class LearningError(SutraError):
     pass
 
 
+class BatchLearningError(LearningError):
+    """
+    A batch learning call stopped partway.
+
+    ``completed`` maps the input index of every fully learned item (stored
+    and associations extracted) to its concept ID; only the other items
+    need to be learned again.
+    """
+
+    def __init__(self, message: str, completed: Dict[int, str]):
+        super().__init__(message)
+        self.completed = completed
+
+
 class ValidationError(SutraError):
     """Errors related to data validation."""
 
@@ -42,6 +58,20 @@ class StorageError(SutraError):
     pass
 
 
+class PartialWriteError(StorageError):
+    """
+    A multi-item storage write stored only some of its items.
+
+    Every item is attempted; ``failed`` holds the input indices of the items
+    that were not confirmed stored, ``written`` the number that were.
+    """
+
+    def __init__(self, message: str, written: int, failed: List[int]):
+        super().__init__(message)
+        self.written = written
+        self.failed = failed
+
+
 class ConfigurationError(SutraError):
     """Errors related to system configuration."""
 
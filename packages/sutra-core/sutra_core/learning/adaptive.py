@@ -7,10 +7,12 @@ This module implements:
 - Dynamic learning strategies for different concept strengths
 """
 
+import copy
 import hashlib
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from ..exceptions import BatchLearningError, PartialWriteError
 from ..graph.concepts import Concept
 from .associations import AssociationExtractor
 
@@ -154,11 +156,7 @@ class AdaptiveLearner:
                         
                 except Exception as e:
                     logger.warning(f"EmbeddingGemma failed: {e}, using fallback")
-                    
-                    # Fallback: Create normalized dummy 768-dim embedding
-                    import numpy as np
-                    embedding = np.random.normal(0, 0.1, 768).astype(np.float32)
-                    embedding = embedding / np.linalg.norm(embedding)  # Normalize
+                    embedding = self._fallback_embedding()
                     logger.debug(f"Created 768-dim fallback embedding: {content[:30]}...")
             
             # Store in Rust storage (always, with embedding)
@@ -186,6 +184,146 @@ class AdaptiveLearner:
 
         return concept_id
 
+    def learn_adaptive_batch(
+        self, items: Sequence[Tuple[str, Optional[str], Optional[str]]]
+    ) -> List[str]:
+        """
+        Learn many items with one embedding call and bulk storage I/O.
+
+        Equivalent to calling learn_adaptive() on each item in order, with
+        the same returned IDs and strength semantics:
+        - Items are deduplicated by content-hash concept ID
+        - Existing concepts are fetched in one bulk lookup and reinforced
+          (per occurrence, from their stored state, as learn_adaptive does)
+        - All new texts are embedded with a single encode_batch() call
+        - New concepts are written in one bulk call
+        - Association extraction still runs per item
+
+        Args:
+            items: (content, source, category) tuples
+
+        Returns:
+            Concept ID for each item, in input order
+
+        Raises:
+            BatchLearningError: If the batch stopped partway; its ``completed``
+                items are learned, the others (or their associations) are not
+        """
+        import numpy as np
+
+        if not items:
+            return []
+
+        concept_ids = [
+            hashlib.md5(content.encode()).hexdigest()[:16] for content, _, _ in items
+        ]
+
+        # First occurrence of each ID (dict preserves insertion order)
+        first_index: Dict[str, int] = {}
+        for i, concept_id in enumerate(concept_ids):
+            first_index.setdefault(concept_id, i)
+
+        # Bulk lookup of existing concepts
+        get_concepts = getattr(self.storage, "get_concepts", None)
+        if get_concepts is not None:
+            stored = get_concepts(list(first_index))
+        else:
+            stored = {cid: self.storage.get_concept(cid) for cid in first_index}
+
+        # New concepts: one embedding batch, one bulk write
+        new_ids = [cid for cid in first_index if stored.get(cid) is None]
+        # New concepts that could not be written: their items are not learned
+        unstored = set()
+        if new_ids:
+            new_concepts = []
+            for cid in new_ids:
+                content, source, category = items[first_index[cid]]
+                new_concepts.append(
+                    Concept(id=cid, content=content, source=source, category=category)
+                )
+
+            try:
+                embeddings = self._get_embedding_processor().encode_batch(
+                    [c.content for c in new_concepts], prompt_name="Retrieval-document"
+                )
+                if len(embeddings) != len(new_concepts):
+                    raise ValueError(
+                        f"Expected {len(new_concepts)} embeddings, got {len(embeddings)}"
+                    )
+            except Exception as e:
+                logger.warning(f"EmbeddingGemma batch failed: {e}, using fallback")
+                embeddings = [self._fallback_embedding() for _ in new_concepts]
+
+            pairs = [
+                (concept, np.asarray(embedding, dtype=np.float32))
+                for concept, embedding in zip(new_concepts, embeddings)
+            ]
+            add_concepts = getattr(self.storage, "add_concepts", None)
+            if add_concepts is not None:
+                try:
+                    add_concepts(pairs)
+                except PartialWriteError as e:
+                    logger.warning(f"Bulk concept write incomplete: {e}")
+                    unstored = {pairs[i][0].id for i in e.failed}
+            else:
+                for concept, embedding in pairs:
+                    self.storage.add_concept(concept, embedding)
+            logger.debug(f"✅ Stored {len(pairs) - len(unstored)} new concepts in bulk")
+
+            # Stored state of a new concept is its initial state
+            for concept, _ in pairs:
+                if concept.id not in unstored:
+                    stored[concept.id] = concept
+
+        # NLP pre-parse for extractors that use spaCy
+        prepare_batch = getattr(self.association_extractor, "prepare_batch", None)
+        if prepare_batch is not None:
+            prepare_batch([content for content, _, _ in items])
+
+        created = set(new_ids)
+        completed: Dict[int, str] = {}
+        for i, ((content, _, _), concept_id) in enumerate(zip(items, concept_ids)):
+            if concept_id in unstored:
+                continue
+            try:
+                if concept_id in created and first_index[concept_id] == i:
+                    concept = stored[concept_id]
+                else:
+                    # Repeat occurrence: reinforce a fresh copy of the stored
+                    # state (learn_adaptive re-reads storage and only persists
+                    # when an embedding is supplied)
+                    concept = copy.copy(stored[concept_id])
+                    concept.access()
+                    self._apply_adaptive_reinforcement(concept)
+
+                self.association_extractor.extract_associations_adaptive(
+                    content, concept_id, depth=self._get_extraction_depth(concept)
+                )
+            except Exception as e:
+                raise BatchLearningError(
+                    f"Batch learning stopped at item {i}: {e}", completed
+                ) from e
+            completed[i] = concept_id
+
+        if unstored:
+            raise BatchLearningError(
+                f"{len(unstored)} new concepts could not be stored", completed
+            )
+
+        logger.debug(
+            f"Batch learned {len(items)} items: {len(new_ids)} new, "
+            f"{len(first_index) - len(new_ids)} existing concepts"
+        )
+        return concept_ids
+
+    @staticmethod
+    def _fallback_embedding():
+        """Normalized random 768-dim embedding used when EmbeddingGemma fails."""
+        import numpy as np
+
+        embedding = np.random.normal(0, 0.1, 768).astype(np.float32)
+        return embedding / np.linalg.norm(embedding)  # Normalize
+
     def _apply_adaptive_reinforcement(self, concept: Concept) -> None:
         """
         Apply adaptive reinforcement based on concept strength.
@@ -8,11 +8,12 @@ This module handles:
 """
 
 import hashlib
+import logging
 import re
 from collections import defaultdict
 
 # Import Optional for type hints
-from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from ..graph.concepts import Association, AssociationType, Concept
 from ..utils.text import extract_words, get_association_patterns
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
     from ..utils.nlp import TextProcessor
     from .entity_cache import EntityCache
 
+logger = logging.getLogger(__name__)
+
 
 class AssociationExtractor:
     """Extracts and manages associations between concepts (Rust-backed)."""
@@ -130,6 +133,36 @@ class AssociationExtractor:
 
         return associations_created
 
+    def prepare_batch(self, contents: List[str]) -> None:
+        """
+        Pre-parse a batch of documents before per-item extraction.
+
+        Runs the batch through spaCy's ``nlp.pipe`` so the per-document
+        co-occurrence step finds its parse in the processor's Doc cache.
+        No-op when spaCy is unavailable.
+
+        Args:
+            contents: Documents about to be learned
+        """
+        processor = self.nlp_processor
+        if processor is None:
+            try:
+                from ..utils.nlp import get_text_processor
+
+                processor = get_text_processor()
+            except Exception:
+                return
+
+        # Never parse more than the cache can hold, or early docs get evicted
+        limit = getattr(processor, "doc_cache_size", 0)
+        texts = [c for c in contents if c and c.strip()][:limit]
+        if not texts:
+            return
+        try:
+            processor.parse_batch(texts)
+        except Exception as e:
+            logger.debug(f"Batch NLP parse failed, extraction will parse per item: {e}")
+
     def _extract_cooccurrence_associations(self, content: str, concept_id: str) -> int:
         """
         Extract co-occurrence based semantic associations using noun chunks.
@@ -151,22 +184,20 @@ class AssociationExtractor:
         if self.nlp_processor:
             processor = self.nlp_processor
         else:
-            # Fallback: create new processor (slower, for backward compatibility)
+            # Fallback: process-wide shared processor (models load once)
             # NOTE: This will fail if spaCy not installed - that's OK, we use fallback
             try:
-                from ..utils.nlp import TextProcessor
+                from ..utils.nlp import get_text_processor
 
-                processor = TextProcessor()
+                processor = get_text_processor()
             except Exception:
                 # spaCy unavailable - use simple sliding window fallback (still works!)
                 return self._extract_cooccurrence_fallback(content, concept_id)
 
         try:
-            # Extract meaningful noun chunks (lemmatized)
-            tokens = processor.extract_meaningful_tokens(content)
-
-            # Use noun chunks for semantic associations
-            doc = processor.nlp(content)
+            # Use noun chunks (lemmatized roots) for semantic associations;
+            # parse() shares the cached Doc with other extraction stages
+            doc = processor.parse(content)
             chunks = [chunk.root.lemma_.lower() for chunk in doc.noun_chunks]
 
             # Limit chunks to most relevant
@@ -5,19 +5,24 @@ This module provides multiprocessing-based parallel extraction of associations
 from concept batches, achieving 3-4x speedup over sequential processing.
 
 Key features:
-- Process pool for parallel regex pattern matching
+- Long-lived process pool for parallel regex pattern matching
+- Patterns compiled once per process (worker initializer + module cache)
 - Smart batching (only parallelize when beneficial)
 - Graceful fallback to sequential for small batches
-- Minimal data serialization overhead
+- Minimal data serialization overhead (patterns are not shipped per task)
 """
 
 import logging
 import multiprocessing as mp
+import re
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
 
+from ..exceptions import PartialWriteError
 from ..graph.concepts import AssociationType
 
 logger = logging.getLogger(__name__)
@@ -48,9 +53,88 @@ class AssociationResult:
     associations_count: int
 
 
+# Pattern shape produced by get_association_patterns(): "(.+?) <connector> (.+)"
+_PATTERN_PREFIX = "(.+?)"
+_PATTERN_SUFFIX = "(.+)"
+
+# One compiled pattern group per association type:
+# (assoc_type_name, connector gate or None, [compiled patterns])
+CompiledPatternSet = Tuple[Tuple[str, Optional[Pattern], Tuple[Pattern, ...]], ...]
+
+
+@lru_cache(maxsize=8)
+def _compile_pattern_set(patterns: Tuple[Tuple[str, str], ...]) -> CompiledPatternSet:
+    """
+    Compile association patterns once, grouped by association type.
+
+    Each type also gets a single alternation "gate" regex over its connector
+    phrases (e.g. " causes | leads to | results in "). Text that fails the
+    gate skips that type's patterns entirely; text that passes runs the
+    individual patterns, so matches are identical to running every pattern.
+
+    Args:
+        patterns: Tuple of (regex_pattern, association_type_name) pairs
+
+    Returns:
+        Tuple of (association_type_name, gate, compiled_patterns)
+    """
+    grouped: Dict[str, List[str]] = {}
+    for pattern_str, assoc_type_name in patterns:
+        grouped.setdefault(assoc_type_name, []).append(pattern_str)
+
+    compiled = []
+    for assoc_type_name, type_patterns in grouped.items():
+        connectors = [
+            p[len(_PATTERN_PREFIX) : -len(_PATTERN_SUFFIX)]
+            for p in type_patterns
+            if p.startswith(_PATTERN_PREFIX) and p.endswith(_PATTERN_SUFFIX)
+        ]
+        gate = None
+        if len(connectors) == len(type_patterns):
+            gate = re.compile("|".join(f"(?:{c})" for c in connectors))
+        compiled.append(
+            (assoc_type_name, gate, tuple(re.compile(p) for p in type_patterns))
+        )
+    return tuple(compiled)
+
+
+# Compiled pattern set of a pool worker process (set by _init_worker)
+_worker_patterns: Optional[CompiledPatternSet] = None
+
+
+def _init_worker(patterns: Tuple[Tuple[str, str], ...]) -> None:
+    """Pool initializer: compile the pattern set once per worker process."""
+    global _worker_patterns
+    _worker_patterns = _compile_pattern_set(patterns)
+
+
+def _extract_associations_task(task: "AssociationTask") -> "AssociationResult":
+    """Pool task entry point using the worker's precompiled patterns."""
+    return _extract_with_compiled(task, _worker_patterns or ())
+
+
 def _extract_associations_worker(
     task: AssociationTask,
     patterns: List[Tuple[str, str]],  # (pattern_str, assoc_type_name)
+) -> AssociationResult:
+    """
+    Extract associations for one task (in-process entry point).
+
+    Compiled patterns are cached per process, so repeated calls do not
+    recompile.
+
+    Args:
+        task: Association extraction task data
+        patterns: List of (regex_pattern, association_type) tuples
+
+    Returns:
+        AssociationResult with extracted associations
+    """
+    return _extract_with_compiled(task, _compile_pattern_set(tuple(patterns)))
+
+
+def _extract_with_compiled(
+    task: AssociationTask, compiled_patterns: CompiledPatternSet
 ) -> AssociationResult:
     """
     Worker function for parallel association extraction.
@@ -60,13 +144,12 @@ def _extract_associations_worker(
 
     Args:
         task: Association extraction task data
-        patterns: List of (regex_pattern, association_type) tuples
+        compiled_patterns: Pattern set from _compile_pattern_set()
 
     Returns:
         AssociationResult with extracted associations
     """
     import hashlib
-    import re
 
     start_time = time.time()
     associations = []
@@ -83,46 +166,49 @@ def _extract_associations_worker(
 
     # Extract pattern-based associations
     content_lower = task.content.lower()
-    for pattern_str, assoc_type_name in patterns:
-        try:
-            pattern = re.compile(pattern_str)
-            matches = pattern.finditer(content_lower)
-
-            for match in matches:
-                source_text = match.group(1).strip()
-                target_text = match.group(2).strip()
-
-                if not source_text or not target_text:
-                    continue
-
-                # Create or get concept IDs
-                source_id = get_or_create_concept_id(source_text)
-                target_id = get_or_create_concept_id(target_text)
-
-                # Add association between extracted concepts
-                associations.append((source_id, target_id, assoc_type_name, 0.8))
-
-                # Add central links if enabled
-                if task.enable_central_links:
-                    associations.append(
-                        (
-                            task.concept_id,
-                            source_id,
-                            task.central_link_type,
-                            task.central_link_confidence,
+    for assoc_type_name, gate, type_patterns in compiled_patterns:
+        # Cheap connector check before running the backtracking patterns
+        if gate is not None and gate.search(content_lower) is None:
+            continue
+        for pattern in type_patterns:
+            try:
+                matches = pattern.finditer(content_lower)
+
+                for match in matches:
+                    source_text = match.group(1).strip()
+                    target_text = match.group(2).strip()
+
+                    if not source_text or not target_text:
+                        continue
+
+                    # Create or get concept IDs
+                    source_id = get_or_create_concept_id(source_text)
+                    target_id = get_or_create_concept_id(target_text)
+
+                    # Add association between extracted concepts
+                    associations.append((source_id, target_id, assoc_type_name, 0.8))
+
+                    # Add central links if enabled
+                    if task.enable_central_links:
+                        associations.append(
+                            (
+                                task.concept_id,
+                                source_id,
+                                task.central_link_type,
+                                task.central_link_confidence,
+                            )
                         )
-                    )
-                    associations.append(
-                        (
-                            task.concept_id,
-                            target_id,
-                            task.central_link_type,
-                            task.central_link_confidence,
+                        associations.append(
+                            (
+                                task.concept_id,
+                                target_id,
+                                task.central_link_type,
+                                task.central_link_confidence,
+                            )
                         )
-                    )
-        except Exception as e:
-            logger.debug(f"Pattern matching error: {e}")
-            continue
+            except Exception as e:
+                logger.debug(f"Pattern matching error: {e}")
+                continue
 
     processing_time = time.time() - start_time
 
@@ -155,6 +241,7 @@ class ParallelAssociationExtractor:
         num_workers: Optional[int] = None,
         parallel_threshold: int = 20,
         entity_cache: Optional["EntityCache"] = None,
+        known_ids_cache_size: int = 100_000,
     ):
         """
         Initialize parallel association extractor.
@@ -167,6 +254,7 @@ class ParallelAssociationExtractor:
             num_workers: Number of worker processes (None = CPU count - 1)
             parallel_threshold: Minimum batch size for parallel processing
             entity_cache: Optional EntityCache for LLM-extracted entities
+            known_ids_cache_size: Max concept IDs remembered as present in storage
         """
         self.storage = storage
         # Temporary working structures (TODO: remove once fully refactored)
@@ -191,10 +279,21 @@ class ParallelAssociationExtractor:
         # Cache association patterns (loaded once)
         from ..utils.text import get_association_patterns
 
-        self.patterns = [
+        self.patterns: Tuple[Tuple[str, str], ...] = tuple(
             (pattern_str, assoc_type.name)
             for pattern_str, assoc_type in get_association_patterns()
-        ]
+        )
+        self._compiled_patterns = _compile_pattern_set(self.patterns)
+
+        # Long-lived worker pool (created on first parallel batch, see close())
+        self._pool: Optional["mp.pool.Pool"] = None
+        self._pool_lock = threading.Lock()
+
+        # LRU of concept IDs known to exist in storage (skips existence RPCs).
+        # Only positives are cached: a missing concept may be stored later.
+        self._known_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._known_ids_lock = threading.Lock()  # learn() may run concurrently
+        self.known_ids_cache_size = known_ids_cache_size
 
         # Performance tracking
         self.total_processed = 0
@@ -265,46 +364,106 @@ class ParallelAssociationExtractor:
             depth=depth,
         )
 
-        result = _extract_associations_worker(task, self.patterns)
+        result = _extract_with_compiled(task, self._compiled_patterns)
 
         # Apply results to shared data structures
         self._apply_result(result)
 
         # Persist associations to Rust storage if available
         # Only persist if both concepts exist in Rust (have been stored with embeddings)
-        try:
-            if (
-                self.storage is not None
-                and result.associations
-                and hasattr(self.storage, "add_association")
-                and hasattr(self.storage, "has_concept")
-            ):
-                type_map = {
-                    "SEMANTIC": AssociationType.SEMANTIC,
-                    "CAUSAL": AssociationType.CAUSAL,
-                    "TEMPORAL": AssociationType.TEMPORAL,
-                    "HIERARCHICAL": AssociationType.HIERARCHICAL,
-                    "COMPOSITIONAL": AssociationType.COMPOSITIONAL,
-                }
-                from ..graph.concepts import Association
-
-                for src, tgt, assoc_type_name, conf in result.associations:
-                    # Only persist if both concepts exist in Rust
-                    if self.storage.has_concept(src) and self.storage.has_concept(tgt):
-                        assoc = Association(
-                            source_id=src,
-                            target_id=tgt,
-                            assoc_type=type_map.get(
-                                assoc_type_name.upper(), AssociationType.SEMANTIC
-                            ),
-                            confidence=conf,
-                        )
-                        self.storage.add_association(assoc)
-        except Exception:
-            pass
+        if self.storage is not None and result.associations:
+            try:
+                self._persist_associations(result.associations)
+            except Exception as e:
+                logger.debug(f"Failed to persist associations for {concept_id}: {e}")
 
         return result.associations_count
 
+    def _existing_concept_ids(self, concept_ids: Set[str]) -> Set[str]:
+        """
+        Resolve which concept IDs exist in storage.
+
+        IDs in the known-ID LRU are answered locally; the rest are resolved
+        with one pipelined ``contains_many`` call when the storage supports it.
+        """
+        with self._known_ids_lock:
+            existing = {cid for cid in concept_ids if cid in self._known_ids}
+        unknown = concept_ids - existing
+        if unknown:
+            if hasattr(self.storage, "contains_many"):
+                found = set(self.storage.contains_many(unknown))
+            else:
+                contains = getattr(self.storage, "contains", None) or getattr(
+                    self.storage, "has_concept"
+                )
+                found = {cid for cid in unknown if contains(cid)}
+            existing |= found
+
+        self._remember_known_ids(existing)
+        return existing
+
+    def _remember_known_ids(self, concept_ids: Iterable[str]) -> None:
+        """Mark concept IDs as present in storage (most recently used)."""
+        with self._known_ids_lock:
+            for cid in concept_ids:
+                self._known_ids[cid] = None
+                self._known_ids.move_to_end(cid)
+            while len(self._known_ids) > self.known_ids_cache_size:
+                self._known_ids.popitem(last=False)
+
+    def _persist_associations(
+        self, associations: List[Tuple[str, str, str, float]]
+    ) -> int:
+        """
+        Write extracted associations whose endpoints both exist in storage.
+
+        Existence of all referenced IDs is resolved once per batch and the
+        edges are written with a single (pipelined) ``add_associations`` call
+        when the storage supports it.
+
+        Returns:
+            Number of associations written (a partial failure is logged and
+            the written count returned)
+        """
+        from ..graph.concepts import Association
+
+        if not hasattr(self.storage, "add_association"):
+            return 0
+
+        # Deduplicate edges; keep the first confidence seen
+        edges: Dict[Tuple[str, str, str], float] = {}
+        for src, tgt, assoc_type_name, conf in associations:
+            edges.setdefault((src, tgt, assoc_type_name), conf)
+
+        referenced = {src for src, _, _ in edges} | {tgt for _, tgt, _ in edges}
+        existing = self._existing_concept_ids(referenced)
+
+        batch = [
+            Association(
+                source_id=src,
+                target_id=tgt,
+                assoc_type=AssociationType.__members__.get(
+                    assoc_type_name.upper(), AssociationType.SEMANTIC
+                ),
+                confidence=conf,
+            )
+            for (src, tgt, assoc_type_name), conf in edges.items()
+            if src in existing and tgt in existing
+        ]
+        if not batch:
+            return 0
+
+        if hasattr(self.storage, "add_associations"):
+            try:
+                return self.storage.add_associations(batch)
+            except PartialWriteError as e:
+                logger.debug(f"Persisted {e.written}/{len(batch)} associations: {e}")
+                return e.written
+
+        for assoc in batch:
+            self.storage.add_association(assoc)
+        return len(batch)
+
     def _create_associations_from_entities(
         self, concept_id: str, entities: List[Dict]
     ) -> int:
@@ -394,29 +553,35 @@ class ParallelAssociationExtractor:
         # Use parallel for large batches
         return self._extract_parallel(concept_data, depth)
 
+    def _make_tasks(
+        self, concept_data: List[Tuple[str, str]], depth: int
+    ) -> List[AssociationTask]:
+        return [
+            AssociationTask(
+                concept_id=concept_id,
+                content=content,
+                enable_central_links=self.enable_central_links,
+                central_link_confidence=self.central_link_confidence,
+                central_link_type=self.central_link_type.name,
+                depth=depth,
+            )
+            for concept_id, content in concept_data
+        ]
+
     def _extract_sequential(
         self, concept_data: List[Tuple[str, str]], depth: int
     ) -> int:
-        """Sequential extraction (fallback for small batches)."""
+        """Sequential extraction (fallback for small batches).
+
+        Runs the same extraction as the pool workers, in-process.
+        """
         start_time = time.time()
         total_associations = 0
 
-        for concept_id, content in concept_data:
-            # Use existing sequential extractor logic
-            from .associations import AssociationExtractor
-
-            extractor = AssociationExtractor(
-                self.concepts,
-                self.word_to_concepts,
-                self.concept_neighbors,
-                self.associations,
-                self.enable_central_links,
-                self.central_link_confidence,
-                self.central_link_type,
-                storage=self.storage,
-            )
-            count = extractor.extract_associations_adaptive(content, concept_id, depth)
-            total_associations += count
+        for task in self._make_tasks(concept_data, depth):
+            result = _extract_with_compiled(task, self._compiled_patterns)
+            self._apply_result(result)
+            total_associations += result.associations_count
 
         elapsed = time.time() - start_time
         self.total_sequential_time += elapsed
@@ -424,7 +589,7 @@ class ParallelAssociationExtractor:
 
         logger.debug(
             f"Sequential extraction: {len(concept_data)} concepts in {elapsed:.3f}s "
-            f"({len(concept_data)/elapsed:.1f} concepts/sec)"
+            f"({len(concept_data)/max(elapsed, 1e-9):.1f} concepts/sec)"
         )
 
         return total_associations
@@ -437,30 +602,40 @@ class ParallelAssociationExtractor:
             result: Association extraction result
         """
         # Create new concepts
+        from ..graph.concepts import Concept
+        from ..utils.text import extract_words
+
+        new_concepts = []
         for concept_id, content in result.concepts_to_create:
             if concept_id not in self.concepts:
-                from ..graph.concepts import Concept
-
                 concept = Concept(id=concept_id, content=content, confidence=0.7)
                 self.concepts[concept_id] = concept
+                new_concepts.append(concept)
                 # Index concept words
-                from ..utils.text import extract_words
-
-                words = extract_words(content)
-                for word in words:
+                for word in extract_words(content):
                     self.word_to_concepts[word].add(concept_id)
 
-                # PRODUCTION: Persist sub-concepts to Rust storage
-                if self.storage is not None and hasattr(self.storage, "add_concept"):
-                    try:
-                        import numpy as np
-
-                        # Store with placeholder embedding (no NLP in parallel path)
-                        self.storage.add_concept(
-                            concept, np.zeros(384, dtype=np.float32)
-                        )
-                    except Exception:
-                        pass  # Non-fatal
+        # PRODUCTION: Persist sub-concepts to Rust storage in one pipelined
+        # call. No NLP in the parallel path, so they are stored without a
+        # vector (graph-only) rather than with a placeholder embedding.
+        if (
+            new_concepts
+            and self.storage is not None
+            and hasattr(self.storage, "add_concepts")
+        ):
+            try:
+                self.storage.add_concepts([(c, None) for c in new_concepts])
+                self._remember_known_ids(c.id for c in new_concepts)
+            except PartialWriteError as e:
+                failed = set(e.failed)
+                self._remember_known_ids(
+                    c.id for i, c in enumerate(new_concepts) if i not in failed
+                )
+                logger.debug(
+                    f"Persisted {e.written}/{len(new_concepts)} sub-concepts: {e}"
+                )
+            except Exception as e:
+                logger.debug(f"Failed to persist {len(new_concepts)} sub-concepts: {e}")
 
         # Create associations
         for source_id, target_id, assoc_type_name, confidence in result.associations:
@@ -481,35 +656,54 @@ class ParallelAssociationExtractor:
                 self.concept_neighbors[source_id].add(target_id)
                 self.concept_neighbors[target_id].add(source_id)
 
+    def _get_pool(self) -> "mp.pool.Pool":
+        """Return the long-lived worker pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = mp.Pool(
+                    processes=self.num_workers,
+                    initializer=_init_worker,
+                    initargs=(self.patterns,),
+                )
+                logger.info(
+                    f"Started association worker pool ({self.num_workers} workers)"
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool (waits for in-flight tasks)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+            logger.info("Association worker pool shut down")
+
     def _extract_parallel(self, concept_data: List[Tuple[str, str]], depth: int) -> int:
-        """Parallel extraction using process pool."""
+        """Parallel extraction using the persistent process pool."""
         start_time = time.time()
 
-        # Prepare tasks
-        tasks = [
-            AssociationTask(
-                concept_id=concept_id,
-                content=content,
-                enable_central_links=self.enable_central_links,
-                central_link_confidence=self.central_link_confidence,
-                central_link_type=self.central_link_type.name,
-                depth=depth,
-            )
-            for concept_id, content in concept_data
-        ]
+        tasks = self._make_tasks(concept_data, depth)
+        # A few chunks per worker balances IPC overhead against stragglers
+        chunksize = max(1, len(tasks) // (self.num_workers * 4))
 
         # Process in parallel
         try:
-            with mp.Pool(processes=self.num_workers) as pool:
-                # Map tasks to workers
-                results = pool.starmap(
-                    _extract_associations_worker,
-                    [(task, self.patterns) for task in tasks],
+            pool = self._get_pool()
+            results = list(
+                pool.imap_unordered(
+                    _extract_associations_task, tasks, chunksize=chunksize
                 )
+            )
         except Exception as e:
             logger.warning(
                 f"Parallel extraction failed: {e}, falling back to sequential"
             )
+            # Discard a possibly broken pool; the next batch starts a fresh one
+            with self._pool_lock:
+                pool, self._pool = self._pool, None
+            if pool is not None:
+                pool.terminate()
             return self._extract_sequential(concept_data, depth)
 
         # Collect results and update shared state
@@ -3,12 +3,30 @@ Entity cache for fast entity lookups.
 
 This module provides a simple interface for the reasoning engine
 to access cached entity extractions without calling LLMs.
+
+Files in the shared storage directory (the protocol of the background
+entity extraction service):
+- entity_cache.json: {concept_id: {"entities": [...]} or [...]}, written by
+  the service; re-parsed only when its mtime or size changes
+- processing_queue.json: JSON array of concept IDs awaiting extraction,
+  drained by the service; cache misses are collected in memory and merged
+  into it in batches
+- processing_queue.lock: flock(2) lock file; the queue is only read and
+  rewritten while holding it, and the service must hold it too when it
+  rewrites the queue, so neither side overwrites the other's changes
 """
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, queue writes are unlocked
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -21,39 +39,83 @@ class EntityCache:
     Does NOT call LLMs - just reads cached data.
     """
 
-    def __init__(self, storage_path: str = "./knowledge"):
+    def __init__(
+        self,
+        storage_path: str = "./knowledge",
+        flush_interval: float = 5.0,
+        flush_batch_size: int = 256,
+    ):
         """
         Initialize entity cache.
 
         Args:
             storage_path: Path to shared storage directory
+            flush_interval: Seconds a cache miss may wait before it is
+                written to the processing queue
+            flush_batch_size: Pending misses that trigger an immediate write
         """
         self.storage_path = Path(storage_path)
         self.entity_cache_path = self.storage_path / "entity_cache.json"
         self.processing_queue_path = self.storage_path / "processing_queue.json"
+        self.queue_lock_path = self.storage_path / "processing_queue.lock"
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
 
         # In-memory cache for fast access
         self._cache: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+        # (mtime, size) of the cache file as last read; None = missing
+        self._cache_stamp: Optional[Tuple[float, int]] = None
+
+        # Misses not yet in the queue file (dict keeps arrival order), and
+        # the queue length as of the last flush
+        self._pending: Dict[str, None] = {}
+        self._queue_length = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
         self._load_cache()
 
+    @staticmethod
+    def _stamp(path: Path) -> Optional[Tuple[float, int]]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime, stat.st_size
+
     def _load_cache(self) -> None:
         """Load entity cache from disk into memory."""
         if not self.entity_cache_path.exists():
             logger.warning(f"Entity cache not found at {self.entity_cache_path}")
             return
 
+        with self._lock:
+            self._refresh_cache_locked()
+        logger.info(f"Loaded {len(self._cache)} cached entity extractions")
+
+    def _refresh_cache_locked(self) -> bool:
+        """Re-parse the cache file if it changed; returns True if it was read."""
+        stamp = self._stamp(self.entity_cache_path)
+        if stamp == self._cache_stamp:
+            return False
+
         try:
-            data = json.loads(self.entity_cache_path.read_text())
-            # Extract just the entities (discard metadata)
-            for concept_id, cache_entry in data.items():
-                if isinstance(cache_entry, dict) and "entities" in cache_entry:
-                    self._cache[concept_id] = cache_entry["entities"]
-                else:
-                    self._cache[concept_id] = cache_entry
-
-            logger.info(f"Loaded {len(self._cache)} cached entity extractions")
+            data = json.loads(self.entity_cache_path.read_text()) if stamp else {}
         except Exception as e:
+            # Possibly caught mid-write: keep the old cache, retry next reload
             logger.error(f"Error loading entity cache: {e}")
+            return False
+
+        self._cache.clear()
+        # Extract just the entities (discard metadata)
+        for concept_id, cache_entry in data.items():
+            if isinstance(cache_entry, dict) and "entities" in cache_entry:
+                self._cache[concept_id] = cache_entry["entities"]
+            else:
+                self._cache[concept_id] = cache_entry
+        self._cache_stamp = stamp
+        return True
 
     def get(self, concept_id: str) -> Optional[List[Dict]]:
         """
@@ -77,31 +139,92 @@ class EntityCache:
         Add concept to processing queue for background extraction.
 
         This tells the background service to extract entities for this concept.
+        O(1): the ID is collected in memory and written with other misses by
+        flush(), once flush_batch_size are pending or flush_interval seconds
+        after the first of them (and on close()).
         """
+        with self._lock:
+            if concept_id in self._cache or concept_id in self._pending:
+                return
+            self._pending[concept_id] = None
+            if len(self._pending) < self.flush_batch_size:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        self.flush_interval, self.flush
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Merge pending misses into processing_queue.json.
+
+        Under the queue lock, the file is re-read, pending IDs not already in
+        it are appended, IDs whose entities are cached meanwhile are dropped,
+        and the result is written to a temporary file and moved into place.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            try:
+                self.storage_path.mkdir(parents=True, exist_ok=True)
+                with open(self.queue_lock_path, "a") as lock_file:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    queue = self._merge_queue_locked()
+            except Exception as e:
+                # Keep the misses; the next flush retries them
+                logger.error(f"Error writing processing queue: {e}")
+                return
+            logger.debug(
+                f"Queued {len(self._pending)} concepts for entity extraction "
+                f"({len(queue)} in queue)"
+            )
+            self._pending.clear()
+            self._queue_length = len(queue)
+
+    def _merge_queue_locked(self) -> List[str]:
+        """Read-merge-write the queue file; caller holds both locks."""
         try:
-            # Load current queue
-            if self.processing_queue_path.exists():
-                queue = json.loads(self.processing_queue_path.read_text())
-            else:
-                queue = []
+            queue = json.loads(self.processing_queue_path.read_text())
+        except FileNotFoundError:
+            queue = []
+        merged = dict.fromkeys(queue)
+        merged.update(self._pending)
+        queue = [cid for cid in merged if cid not in self._cache]
+
+        tmp_path = self.processing_queue_path.with_name(
+            self.processing_queue_path.name + f".{os.getpid()}.tmp"
+        )
+        tmp_path.write_text(json.dumps(queue))
+        os.replace(tmp_path, self.processing_queue_path)
+        return queue
 
-            # Add if not already in queue
-            if concept_id not in queue:
-                queue.append(concept_id)
-                self.processing_queue_path.write_text(json.dumps(queue, indent=2))
-                logger.debug(f"Added {concept_id} to processing queue")
+    def reload(self) -> None:
+        """
+        Reload cache from disk (for picking up background updates).
 
-        except Exception as e:
-            logger.error(f"Error adding to processing queue: {e}")
+        The cache file is re-parsed only if its mtime or size changed.
+        """
+        with self._lock:
+            reloaded = self._refresh_cache_locked()
+        if reloaded:
+            logger.debug(f"Entity cache reloaded: {len(self._cache)} entries")
 
-    def reload(self) -> None:
-        """Reload cache from disk (for picking up background updates)."""
-        self._cache.clear()
-        self._load_cache()
+    def close(self) -> None:
+        """Write out pending processing queue entries."""
+        self.flush()
 
     def stats(self) -> Dict:
         """Get cache statistics."""
         return {
             "cached_concepts": len(self._cache),
             "total_entities": sum(len(entities) for entities in self._cache.values()),
+            "queued_concepts": self._queue_length,
+            "pending_queue_writes": len(self._pending),
         }
@@ -13,17 +13,90 @@ Key Features:
 """
 
 import asyncio
+import itertools
 import json
+import math
 import time
-from collections import defaultdict, deque
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from threading import RLock
+from typing import Callable, Dict, Iterator, List, Optional, Any, Sequence, Tuple
+from threading import Event, RLock, Thread, local
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Metric types, as named in the Prometheus exposition format
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+UNTYPED = "untyped"
+
+# Points kept per series (~3 hours at 1 point/sec)
+DEFAULT_RETENTION_POINTS = 10000
+
+# Label sets per metric before new ones are folded into the overflow series
+DEFAULT_MAX_SERIES = 1000
+
+# Histogram bucket upper bounds, in seconds (Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Frozen, sorted label set identifying one series of a metric
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Interned (metric name, label set) handle for the lock-free recording path
+MetricKey = Tuple[str, LabelKey]
+
+# Label set of the series that absorbs label sets beyond a metric's cap
+OVERFLOW_LABELS: LabelKey = (("overflow", "true"),)
+
+
+def label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    """Frozen label tuple for a label dict (order-independent)."""
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def bucket_quantile(
+    bounds: Sequence[float],
+    counts: Sequence[int],
+    q: float,
+    lowest: float,
+    highest: float,
+) -> Optional[float]:
+    """
+    Estimate quantile q from fixed-bucket counts.
+
+    Interpolates linearly within the bucket holding the q-th observation,
+    like Prometheus' histogram_quantile(); ``lowest``/``highest`` (the
+    observed min/max) bound the first and overflow buckets.
+
+    Args:
+        bounds: Sorted bucket upper bounds
+        counts: Per-bucket (not cumulative) counts, plus one overflow bucket
+        q: Quantile in [0, 1]
+        lowest: Smallest observed value
+        highest: Largest observed value
+
+    Returns:
+        Estimated value, or None when there are no observations
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    rank = q * total
+    cumulative = 0
+    for i, n in enumerate(counts):
+        if n and cumulative + n >= rank:
+            lower = max(bounds[i - 1], lowest) if i > 0 else lowest
+            upper = min(bounds[i], highest) if i < len(bounds) else highest
+            return lower + (upper - lower) * max(rank - cumulative, 0.0) / n
+        cumulative += n
+    return highest
+
 
 @dataclass
 class MetricPoint:
@@ -31,37 +104,380 @@ class MetricPoint:
     timestamp: float
     value: float
     labels: Dict[str, str] = field(default_factory=dict)
-    
 
-@dataclass  
+
 class MetricSeries:
-    """Time series for a metric with configurable retention."""
-    name: str
-    points: deque = field(default_factory=lambda: deque(maxlen=10000))  # ~3 hours at 1 point/sec
-    labels: Dict[str, str] = field(default_factory=dict)
-    
+    """
+    Time series for one label set of a metric, with bounded retention.
+
+    Timestamps and values are kept in two ``array('d')`` ring buffers
+    (16 bytes per point) that grow up to ``capacity`` points and then
+    overwrite the oldest. ``value`` is the current value, i.e. the running
+    total for counters, so updates are O(1).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        capacity: int = DEFAULT_RETENTION_POINTS,
+    ):
+        self.name = name
+        self.labels = dict(labels or {})
+        self.capacity = capacity
+        self.value = 0.0
+        self.updated_at = 0.0
+        self._timestamps = array("d")
+        self._values = array("d")
+        self._head = 0  # oldest point once the buffers are full
+
+    def __len__(self) -> int:
+        return len(self._values)
+
     def add_point(self, value: float, labels: Optional[Dict[str, str]] = None):
         """Add a metric point with current timestamp."""
-        point = MetricPoint(
-            timestamp=time.time(),
-            value=value,
-            labels=labels or {}
+        # labels: accepted for compatibility; a series' labels are fixed
+        self._append(value)
+
+    def _append(self, value: float) -> int:
+        """Store a point at the current time; returns its buffer index."""
+        now = time.time()
+        if len(self._values) < self.capacity:
+            index = len(self._values)
+            self._timestamps.append(now)
+            self._values.append(value)
+        else:
+            index = self._head
+            self._timestamps[index] = now
+            self._values[index] = value
+            self._head = (index + 1) % self.capacity
+        self.value = value
+        self.updated_at = now
+        return index
+
+    def inc(self, amount: float = 1.0):
+        """Add to the running total (counters)."""
+        self.add_point(self.value + amount)
+
+    def _newest_first(self) -> Iterator[int]:
+        """Buffer indices from the newest point to the oldest."""
+        return itertools.chain(
+            range(self._head - 1, -1, -1), range(len(self._values) - 1, self._head - 1, -1)
         )
-        self.points.append(point)
-    
+
+    @property
+    def points(self) -> List[MetricPoint]:
+        """All retained points, oldest first (materialized; prefer get_range)."""
+        return self.get_range(0.0, math.inf)
+
     def get_latest(self) -> Optional[MetricPoint]:
         """Get the most recent metric point."""
-        return self.points[-1] if self.points else None
-    
+        if not self._values:
+            return None
+        return MetricPoint(self.updated_at, self.value, self.labels)
+
     def get_range(self, start_time: float, end_time: float) -> List[MetricPoint]:
         """Get metric points within time range."""
-        return [p for p in self.points if start_time <= p.timestamp <= end_time]
-    
+        ts, values = self._timestamps, self._values
+        points = [
+            MetricPoint(ts[i], values[i], self.labels)
+            for i in self._newest_first()
+            if start_time <= ts[i] <= end_time
+        ]
+        points.reverse()
+        return points
+
+    def window_sum(self, duration_seconds: float) -> Tuple[float, int]:
+        """(sum, count) of the values recorded in the last N seconds."""
+        cutoff_time = time.time() - duration_seconds
+        ts, values = self._timestamps, self._values
+        total, count = 0.0, 0
+        for i in self._newest_first():
+            if ts[i] < cutoff_time:
+                break
+            total += values[i]
+            count += 1
+        return total, count
+
     def get_average(self, duration_seconds: int = 300) -> float:
         """Get average value over the last N seconds."""
+        total, count = self.window_sum(duration_seconds)
+        return total / count if count else 0.0
+
+    def get_rate(self, duration_seconds: int = 60) -> float:
+        """Per-second increase of a counter over the last N seconds."""
+        if not self._values:
+            return 0.0
         cutoff_time = time.time() - duration_seconds
-        recent_points = [p.value for p in self.points if p.timestamp >= cutoff_time]
-        return sum(recent_points) / len(recent_points) if recent_points else 0.0
+        ts = self._timestamps
+        base = None
+        for i in self._newest_first():
+            if ts[i] < cutoff_time:
+                base = self._values[i]
+                break
+        if base is None:
+            # Every retained point is in the window: the series started
+            # within it, or lost older points to retention
+            base = 0.0 if len(self._values) < self.capacity else self._values[self._head]
+        return (self.value - base) / duration_seconds
+
+
+class HistogramSeries(MetricSeries):
+    """
+    Histogram for one label set: fixed bucket counts plus recent observations.
+
+    Bucket counts, sum and count are cumulative since start (as exported to
+    Prometheus) and give p50/p95/p99 estimates. The inherited ring buffer
+    keeps recent observations for windowed averages; a batch merged from
+    thread shards is stored as one point (its mean) weighted by its count.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        capacity: int = DEFAULT_RETENTION_POINTS,
+    ):
+        super().__init__(name, labels, capacity)
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = array("q", [0]) * (len(self.buckets) + 1)  # + overflow
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._weights = array("d")  # observations per point
+
+    def observe(self, value: float):
+        """Record one observation."""
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._append_weighted(value, 1.0)
+
+    def merge(
+        self,
+        bucket_deltas: Sequence[float],
+        total: float,
+        lowest: float,
+        highest: float,
+    ):
+        """
+        Add a batch of observations recorded elsewhere (a thread shard).
+
+        Args:
+            bucket_deltas: New observations per bucket (+ overflow)
+            total: Sum of the new observations
+            lowest: Smallest value in the batch
+            highest: Largest value in the batch
+        """
+        count = 0
+        for i, n in enumerate(bucket_deltas):
+            if n:
+                self.bucket_counts[i] += int(n)
+                count += int(n)
+        if not count:
+            return
+        self.count += count
+        self.sum += total
+        self.min = min(self.min, lowest)
+        self.max = max(self.max, highest)
+        self._append_weighted(total / count, float(count))
+
+    def add_point(self, value: float, labels: Optional[Dict[str, str]] = None):
+        """Add an unweighted point (does not touch the buckets)."""
+        self._append_weighted(value, 1.0)
+
+    def _append_weighted(self, value: float, weight: float):
+        index = self._append(value)
+        if index == len(self._weights):
+            self._weights.append(weight)
+        else:
+            self._weights[index] = weight
+
+    def window_sum(self, duration_seconds: float) -> Tuple[float, int]:
+        """(sum, count) of the observations recorded in the last N seconds."""
+        cutoff_time = time.time() - duration_seconds
+        ts, values, weights = self._timestamps, self._values, self._weights
+        total, count = 0.0, 0.0
+        for i in self._newest_first():
+            if ts[i] < cutoff_time:
+                break
+            total += values[i] * weights[i]
+            count += weights[i]
+        return total, int(count)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0-1) over all observations."""
+        return bucket_quantile(self.buckets, self.bucket_counts, q, self.min, self.max)
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        """p50/p95/p99 estimates."""
+        return {f"p{round(q * 100)}": self.percentile(q) for q in (0.5, 0.95, 0.99)}
+
+
+class MetricFamily:
+    """
+    All series of one metric name, keyed by their frozen label set.
+
+    The aggregate accessors (get_latest, get_average, ...) combine every
+    label set, so unlabelled metrics behave like a single series.
+
+    At most ``max_series`` label sets get their own series; later ones are
+    recorded into a single ``{overflow="true"}`` series, so a high-cardinality
+    label cannot grow memory without bound.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        metric_type: str = UNTYPED,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        capacity: int = DEFAULT_RETENTION_POINTS,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        self.name = name
+        self.type = metric_type
+        self.buckets = tuple(sorted(buckets))
+        self.capacity = capacity
+        self.max_series = max_series
+        self.series: Dict[LabelKey, MetricSeries] = {}
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in list(self.series.values()))
+
+    def series_key(self, key: LabelKey) -> LabelKey:
+        """The label set a series is recorded under (OVERFLOW_LABELS past the cap)."""
+        if key in self.series or len(self.series) < self.max_series:
+            return key
+        if OVERFLOW_LABELS not in self.series:
+            logger.warning(
+                f"Metric {self.name} reached {self.max_series} series; "
+                f"recording new label sets as {{overflow=\"true\"}}"
+            )
+        return OVERFLOW_LABELS
+
+    def labels(self, key: LabelKey) -> MetricSeries:
+        """Get or create the series for a label set (see series_key())."""
+        series = self.series.get(key)
+        if series is None:
+            key = self.series_key(key)
+            series = self.series.get(key)
+        if series is None:
+            if self.type == HISTOGRAM:
+                series = HistogramSeries(self.name, dict(key), self.buckets, self.capacity)
+            else:
+                series = MetricSeries(self.name, dict(key), self.capacity)
+            self.series[key] = series
+        return series
+
+    def get_latest(self) -> Optional[MetricPoint]:
+        """Latest point: the total over label sets for counters, else the newest."""
+        active = [s for s in list(self.series.values()) if len(s)]
+        if not active:
+            return None
+        newest = max(active, key=lambda s: s.updated_at)
+        if self.type == COUNTER:
+            return MetricPoint(newest.updated_at, sum(s.value for s in active))
+        return newest.get_latest()
+
+    def get_range(self, start_time: float, end_time: float) -> List[MetricPoint]:
+        """Points of every label set within time range, oldest first."""
+        points = [
+            p for s in list(self.series.values()) for p in s.get_range(start_time, end_time)
+        ]
+        points.sort(key=lambda p: p.timestamp)
+        return points
+
+    def get_average(self, duration_seconds: int = 300) -> float:
+        """Average of all values recorded in the last N seconds."""
+        total, count = 0.0, 0
+        for series in list(self.series.values()):
+            s_total, s_count = series.window_sum(duration_seconds)
+            total += s_total
+            count += s_count
+        return total / count if count else 0.0
+
+    def get_rate(self, duration_seconds: int = 60) -> float:
+        """Per-second increase summed over label sets (counters)."""
+        return sum(s.get_rate(duration_seconds) for s in list(self.series.values()))
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimated quantile q over all label sets (histograms)."""
+        histograms = [
+            s for s in list(self.series.values()) if isinstance(s, HistogramSeries) and s.count
+        ]
+        if not histograms:
+            return None
+        counts = [sum(c) for c in zip(*(h.bucket_counts for h in histograms))]
+        return bucket_quantile(
+            self.buckets,
+            counts,
+            q,
+            min(h.min for h in histograms),
+            max(h.max for h in histograms),
+        )
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        """p50/p95/p99 estimates over all label sets."""
+        return {f"p{round(q * 100)}": self.percentile(q) for q in (0.5, 0.95, 0.99)}
+
+
+def _format_value(value: float) -> str:
+    """Sample value in exposition format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _format_labels(key: LabelKey) -> str:
+    """``{k="v",...}`` with exposition-format escaping ("" when unlabelled)."""
+    if not key:
+        return ""
+    pairs = []
+    for k, v in key:
+        v = v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{k}="{v}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _ShardHistogram:
+    """One thread's cumulative histogram for a series."""
+
+    __slots__ = ("bounds", "data", "merged", "sum_index")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.sum_index = len(bounds) + 1
+        # Bucket counts (+ overflow), sum, min, max
+        self.data = array("d", [0.0]) * (self.sum_index + 1) + array("d", [math.inf, -math.inf])
+        # Bucket counts and sum already folded into the series
+        self.merged = array("d", [0.0]) * (self.sum_index + 1)
+
+
+class _ThreadShard:
+    """
+    One thread's metric accumulators, merged into the series on scrape.
+
+    Only the owning thread writes ``values`` and histogram ``data``; the
+    collector reads them under its lock and only writes the ``merged``
+    watermarks, so recording needs no lock and allocates nothing once a
+    series has its slot.
+    """
+
+    __slots__ = ("slots", "values", "merged", "histograms")
+
+    def __init__(self):
+        self.slots: Dict[MetricKey, int] = {}
+        self.values = array("d")  # cumulative counter / gauge increments
+        self.merged = array("d")  # part of values already folded into the series
+        self.histograms: Dict[MetricKey, _ShardHistogram] = {}
 
 
 class InternalMetricsCollector:
@@ -70,11 +486,30 @@ class InternalMetricsCollector:
     
     Provides Prometheus-like functionality without external dependencies.
     All metrics are queryable via natural language through the reasoning engine.
+
+    Each metric name maps to a MetricFamily holding one series per distinct
+    label set, so ``requests_total{endpoint="a"}`` and ``{endpoint="b"}``
+    are counted separately.
+
+    Counter increments and histogram observations are recorded lock-free
+    into per-thread shards and folded into the series whenever metrics are
+    read (get_metric, export_prometheus_format, ...), so counter points and
+    rates have scrape resolution. Hot paths can intern a series once with
+    metric_key() and record with inc()/observe() to also skip label hashing.
     """
     
-    def __init__(self):
-        self.metrics: Dict[str, MetricSeries] = {}
+    def __init__(
+        self,
+        retention_points: int = DEFAULT_RETENTION_POINTS,
+        max_series_per_metric: int = DEFAULT_MAX_SERIES,
+    ):
+        self.metrics: Dict[str, MetricFamily] = {}
+        self.retention_points = retention_points
+        self.max_series_per_metric = max_series_per_metric
         self.lock = RLock()
+        self._interned: Dict[MetricKey, MetricKey] = {}
+        self._shards: List[_ThreadShard] = []
+        self._local = local()
         self.start_time = time.time()
         
         # Initialize system metrics
@@ -101,49 +536,216 @@ class InternalMetricsCollector:
         
         with self.lock:
             for metric_name in system_metrics:
-                self.metrics[metric_name] = MetricSeries(name=metric_name)
+                # Typed by their first update
+                self.metrics[metric_name] = MetricFamily(
+                    metric_name,
+                    capacity=self.retention_points,
+                    max_series=self.max_series_per_metric,
+                )
+
+    def _family(
+        self,
+        name: str,
+        metric_type: str,
+        buckets: Optional[Sequence[float]] = None,
+    ) -> MetricFamily:
+        """Get or create a metric family; caller holds the lock."""
+        family = self.metrics.get(name)
+        if family is None:
+            family = MetricFamily(
+                name,
+                metric_type,
+                buckets or DEFAULT_BUCKETS,
+                self.retention_points,
+                self.max_series_per_metric,
+            )
+            self.metrics[name] = family
+        elif family.type != metric_type:
+            if family.type != UNTYPED or family.series:
+                raise ValueError(f"Metric {name} is a {family.type}, not a {metric_type}")
+            family.type = metric_type
+            if buckets:
+                family.buckets = tuple(sorted(buckets))
+        return family
+    
+    def metric_key(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        metric_type: str = COUNTER,
+        buckets: Optional[Sequence[float]] = None,
+    ) -> MetricKey:
+        """
+        Intern a series for the lock-free inc()/observe() path.
+
+        Creates the metric (checking its type) on first use; callers should
+        keep the returned key rather than call this per update. Past the
+        metric's series cap the overflow series' key is returned.
+
+        Args:
+            name: Metric name
+            labels: Label set of the series
+            metric_type: COUNTER or GAUGE (for inc) or HISTOGRAM (for observe)
+            buckets: Histogram bucket upper bounds, used when the metric is created
+
+        Raises:
+            ValueError: If the metric exists with a different type
+        """
+        key = (name, label_key(labels))
+        with self.lock:
+            family = self._family(name, metric_type, buckets)
+            series_key = family.series_key(key[1])
+            family.labels(series_key)
+            if series_key != key[1]:
+                # Not interned: overflowed label sets must not grow the key table
+                key = (name, series_key)
+            return self._interned.setdefault(key, key)
+
+    def _cached_key(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]],
+        metric_type: str,
+        buckets: Optional[Sequence[float]] = None,
+    ) -> MetricKey:
+        """metric_key(), skipping the lock when the series is already interned."""
+        interned = self._interned.get((name, label_key(labels)))
+        family = self.metrics.get(name)
+        if interned is None or family is None or family.type != metric_type:
+            return self.metric_key(name, labels, metric_type, buckets)
+        return interned
+
+    def _shard(self) -> _ThreadShard:
+        """The calling thread's shard."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _ThreadShard()
+            with self.lock:
+                self._shards.append(shard)
+            return shard
+
+    def _add_slot(self, shard: _ThreadShard, key: MetricKey) -> int:
+        family = self.metrics[key[0]]
+        if family.type == HISTOGRAM:
+            raise ValueError(f"Metric {key[0]} is a histogram; use observe()")
+        shard.values.append(0.0)
+        shard.merged.append(0.0)
+        slot = shard.slots[key] = len(shard.values) - 1
+        return slot
+
+    def _add_histogram(self, shard: _ThreadShard, key: MetricKey) -> _ShardHistogram:
+        family = self.metrics[key[0]]
+        if family.type != HISTOGRAM:
+            raise ValueError(f"Metric {key[0]} is a {family.type}, not a histogram")
+        hist = shard.histograms[key] = _ShardHistogram(family.buckets)
+        return hist
+
+    def inc(self, key: MetricKey, value: float = 1.0):
+        """
+        Add to an interned counter or gauge on the calling thread's shard.
+
+        Lock-free; gauges recorded this way (e.g. in-flight requests, +1/-1)
+        read as the sum of all increments.
+        """
+        shard = self._shard()
+        slot = shard.slots.get(key)
+        if slot is None:
+            slot = self._add_slot(shard, key)
+        shard.values[slot] += value
+
+    def observe(self, key: MetricKey, value: float):
+        """Record an observation of an interned histogram (lock-free)."""
+        shard = self._shard()
+        hist = shard.histograms.get(key)
+        if hist is None:
+            hist = self._add_histogram(shard, key)
+        data = hist.data
+        data[bisect_left(hist.bounds, value)] += 1.0
+        i = hist.sum_index
+        data[i] += value
+        if value < data[i + 1]:
+            data[i + 1] = value
+        if value > data[i + 2]:
+            data[i + 2] = value
+
+    def _merge_shards(self):
+        """Fold shard increments into the series; caller holds the lock."""
+        for shard in self._shards:
+            values, folded = shard.values, shard.merged
+            for (name, key), slot in list(shard.slots.items()):
+                delta = values[slot] - folded[slot]
+                if delta:
+                    folded[slot] += delta
+                    self.metrics[name].labels(key).inc(delta)
+            for (name, key), hist in list(shard.histograms.items()):
+                snapshot = hist.data[:]  # one atomic copy
+                i = hist.sum_index
+                deltas = [snapshot[j] - hist.merged[j] for j in range(i)]
+                if any(deltas):
+                    total = snapshot[i] - hist.merged[i]
+                    hist.merged[:] = snapshot[: i + 1]
+                    self.metrics[name].labels(key).merge(
+                        deltas, total, snapshot[i + 1], snapshot[i + 2]
+                    )
     
     def counter_inc(self, name: str, labels: Optional[Dict[str, str]] = None, value: float = 1.0):
         """Increment a counter metric."""
-        with self.lock:
-            if name not in self.metrics:
-                self.metrics[name] = MetricSeries(name=name)
-            
-            # For counters, we track cumulative values
-            latest = self.metrics[name].get_latest()
-            new_value = (latest.value if latest else 0.0) + value
-            self.metrics[name].add_point(new_value, labels)
+        self.inc(self._cached_key(name, labels, COUNTER), value)
     
     def gauge_set(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Set a gauge metric to a specific value."""
+        key = label_key(labels)
         with self.lock:
-            if name not in self.metrics:
-                self.metrics[name] = MetricSeries(name=name)
-            
-            self.metrics[name].add_point(value, labels)
+            self._merge_shards()  # pending inc() deltas predate this value
+            self._family(name, GAUGE).labels(key).add_point(value)
     
-    def histogram_observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
-        """Record a histogram observation."""
-        # For simplicity, we treat histograms as gauges with statistical analysis
-        self.gauge_set(name, value, labels)
+    def histogram_observe(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Optional[Sequence[float]] = None,
+    ):
+        """
+        Record a histogram observation.
+
+        Args:
+            name: Metric name
+            value: Observed value (seconds, for the default buckets)
+            labels: Label set of the series
+            buckets: Bucket upper bounds; only used when the metric is created
+        """
+        self.observe(self._cached_key(name, labels, HISTOGRAM, buckets), value)
     
-    def get_metric(self, name: str) -> Optional[MetricSeries]:
-        """Get a metric series by name."""
+    def get_metric(self, name: str) -> Optional[MetricFamily]:
+        """Get a metric family by name."""
         with self.lock:
+            self._merge_shards()
             return self.metrics.get(name)
+
+    def get_series(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[MetricSeries]:
+        """Get the series for one label set of a metric."""
+        with self.lock:
+            self._merge_shards()
+            family = self.metrics.get(name)
+            return family.series.get(label_key(labels)) if family else None
     
-    def get_all_metrics(self) -> Dict[str, MetricSeries]:
+    def get_all_metrics(self) -> Dict[str, MetricFamily]:
         """Get all metrics (thread-safe copy)."""
         with self.lock:
+            self._merge_shards()
             return dict(self.metrics)
     
     def get_system_stats(self) -> Dict[str, Any]:
         """Get current system statistics."""
         with self.lock:
+            self._merge_shards()
             stats = {
                 "uptime_seconds": time.time() - self.start_time,
                 "metrics_count": len(self.metrics),
-                "total_data_points": sum(len(m.points) for m in self.metrics.values()),
+                "series_count": sum(len(m.series) for m in self.metrics.values()),
+                "total_data_points": sum(len(m) for m in self.metrics.values()),
                 "timestamp": datetime.utcnow().isoformat(),
             }
             
@@ -165,22 +767,35 @@ class InternalMetricsCollector:
             return stats
     
     def export_prometheus_format(self) -> str:
-        """Export metrics in Prometheus format for compatibility."""
+        """
+        Export metrics in the Prometheus text exposition format.
+
+        Emits a ``# TYPE`` line per metric and one sample per label set;
+        histograms are exported as cumulative ``_bucket{le=...}`` samples
+        plus ``_sum`` and ``_count``.
+        """
         lines = []
         
         with self.lock:
-            for name, series in self.metrics.items():
-                latest = series.get_latest()
-                if latest:
-                    # Format: metric_name{label1="value1"} value timestamp
-                    label_str = ""
-                    if latest.labels:
-                        label_pairs = [f'{k}="{v}"' for k, v in latest.labels.items()]
-                        label_str = "{" + ",".join(label_pairs) + "}"
-                    
-                    lines.append(f"{name}{label_str} {latest.value} {int(latest.timestamp * 1000)}")
+            self._merge_shards()
+            for name, family in self.metrics.items():
+                if not family.series:
+                    continue
+                lines.append(f"# TYPE {name} {family.type}")
+                for key, series in family.series.items():
+                    if isinstance(series, HistogramSeries):
+                        cumulative = 0
+                        for bound, n in zip(series.buckets + (math.inf,), series.bucket_counts):
+                            cumulative += n
+                            le = key + (("le", _format_value(bound)),)
+                            lines.append(f"{name}_bucket{_format_labels(le)} {cumulative}")
+                        label_str = _format_labels(key)
+                        lines.append(f"{name}_sum{label_str} {_format_value(series.sum)}")
+                        lines.append(f"{name}_count{label_str} {series.count}")
+                    elif len(series):
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(series.value)}")
         
-        return "\n".join(lines)
+        return "\n".join(lines) + "\n" if lines else ""
     
     def query_natural_language(self, query: str) -> Dict[str, Any]:
         """
@@ -223,10 +838,11 @@ class InternalMetricsCollector:
             latest = api_requests.get_latest()
             if latest:
                 result["total_requests"] = latest.value
-                result["requests_per_minute"] = api_requests.get_average(60) * 60  # Rough estimate
+                result["requests_per_minute"] = api_requests.get_rate(60) * 60
         
         if api_duration:
             result["average_response_time_ms"] = api_duration.get_average(300) * 1000
+            result.update(_percentiles_ms(api_duration, "response_time"))
         
         return result
     
@@ -234,12 +850,14 @@ class InternalMetricsCollector:
         """Get latency-related metrics."""
         metrics = {}
         
-        for name, series in self.metrics.items():
+        for name, family in self.get_all_metrics().items():
             if "duration" in name or "latency" in name:
-                avg = series.get_average(300)  # 5-minute average
+                avg = family.get_average(300)  # 5-minute average
+                latest = family.get_latest()
                 metrics[name] = {
                     "average_ms": avg * 1000,
-                    "latest_ms": series.get_latest().value * 1000 if series.get_latest() else 0
+                    "latest_ms": latest.value * 1000 if latest else 0,
+                    **_percentiles_ms(family),
                 }
         
         return {"metric_type": "latency_metrics", "metrics": metrics}
@@ -264,6 +882,7 @@ class InternalMetricsCollector:
         
         if query_duration:
             result["average_query_time_ms"] = query_duration.get_average(300) * 1000
+            result.update(_percentiles_ms(query_duration, "query_time"))
         
         return result
     
@@ -318,6 +937,18 @@ class InternalMetricsCollector:
         return result
 
 
+def _percentiles_ms(family: MetricFamily, prefix: str = "") -> Dict[str, float]:
+    """p50/p95/p99 of a seconds histogram as ``{"<prefix>_p95_ms": ...}``."""
+    if family.type != HISTOGRAM:
+        return {}
+    prefix = f"{prefix}_" if prefix else ""
+    return {
+        f"{prefix}{name}_ms": value * 1000
+        for name, value in family.percentiles().items()
+        if value is not None
+    }
+
+
 # Global metrics collector instance
 _metrics_collector: Optional[InternalMetricsCollector] = None
 
@@ -357,28 +988,83 @@ class ProductionMonitor:
     Production-grade monitoring for Sutra AI using internal metrics.
     
     Provides comprehensive system monitoring without external dependencies.
+
+    System sampling (psutil) runs on a dedicated daemon thread and CPU usage
+    is read as a non-blocking delta between samples, so nothing blocks the
+    event loop. Health checks run concurrently, each bounded by a timeout,
+    and publish ``sutra_<check>_healthy`` gauges plus a
+    ``sutra_health_check_duration_seconds{check=...}`` histogram.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        collection_interval: float = 30.0,
+        health_check_interval: float = 60.0,
+        health_check_timeout: float = 5.0,
+    ):
         self.collector = get_metrics_collector()
         self.alerts = []
-        self.health_checks = {}
+        self.health_checks: Dict[str, Dict[str, Any]] = {}
+        self.collection_interval = collection_interval
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        # name -> check returning True when healthy (async or sync)
+        self._checks: Dict[str, Callable[[], Any]] = {
+            "api": self._check_api_health,
+            "storage": self._check_storage_health,
+            "embedding": self._check_embedding_health,
+        }
+        self._stop = Event()
+        self._sampler: Optional[Thread] = None
+        self._health_task: Optional[asyncio.Task] = None
+
+    def register_health_check(self, name: str, check: Callable[[], Any]):
+        """
+        Add a health check, published as ``sutra_<name>_healthy``.
+
+        Args:
+            name: Check name
+            check: Callable returning True when healthy; coroutine functions
+                run on the event loop, plain functions in the default executor
+        """
+        self._checks[name] = check
         
     def start_monitoring(self):
-        """Start background monitoring tasks."""
-        asyncio.create_task(self._collect_system_metrics())
-        asyncio.create_task(self._run_health_checks())
+        """Start background monitoring (call from a running event loop)."""
+        self._stop.clear()
+        if self._sampler is None or not self._sampler.is_alive():
+            self._sampler = Thread(
+                target=self._collect_system_metrics, name="sutra-system-metrics", daemon=True
+            )
+            self._sampler.start()
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.get_running_loop().create_task(self._run_health_checks())
         logger.info("Production monitoring started - zero external dependencies")
+
+    def stop_monitoring(self):
+        """Stop the sampler thread and the health check task."""
+        self._stop.set()
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
     
-    async def _collect_system_metrics(self):
-        """Collect system metrics in background."""
-        while True:
+    def _collect_system_metrics(self):
+        """Sample system metrics until stopped (runs on the sampler thread)."""
+        try:
+            import psutil
+        except ImportError:
+            logger.warning("psutil not installed - system metrics disabled")
+            return
+
+        # First call only sets the baseline for the non-blocking delta, so
+        # the first sample is taken after a short window
+        psutil.cpu_percent(interval=None)
+        delay = min(1.0, self.collection_interval)
+        while not self._stop.wait(delay):
+            delay = self.collection_interval
             try:
-                import psutil
-                
-                # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
-                gauge_set("sutra_system_cpu_usage_percent", cpu_percent)
+                # CPU usage since the previous sample
+                gauge_set("sutra_system_cpu_usage_percent", psutil.cpu_percent(interval=None))
                 
                 # Memory usage
                 memory = psutil.virtual_memory()
@@ -392,29 +1078,45 @@ class ProductionMonitor:
                 
             except Exception as e:
                 logger.error(f"Failed to collect system metrics: {e}")
-            
-            await asyncio.sleep(30)  # Collect every 30 seconds
     
     async def _run_health_checks(self):
-        """Run health checks and update metrics."""
+        """Run all health checks concurrently every interval."""
         while True:
             try:
-                # Check API health
-                api_healthy = await self._check_api_health()
-                gauge_set("sutra_api_healthy", 1.0 if api_healthy else 0.0)
-                
-                # Check storage health  
-                storage_healthy = await self._check_storage_health()
-                gauge_set("sutra_storage_healthy", 1.0 if storage_healthy else 0.0)
-                
-                # Check embedding service health
-                embedding_healthy = await self._check_embedding_health()
-                gauge_set("sutra_embedding_healthy", 1.0 if embedding_healthy else 0.0)
-                
+                await asyncio.gather(
+                    *(self._run_health_check(name, check) for name, check in list(self._checks.items()))
+                )
             except Exception as e:
                 logger.error(f"Health check failed: {e}")
             
-            await asyncio.sleep(60)  # Check every minute
+            await asyncio.sleep(self.health_check_interval)
+
+    async def _run_health_check(self, name: str, check: Callable[[], Any]):
+        """Run one check with a timeout and publish its result."""
+        start = time.perf_counter()
+        error = None
+        try:
+            if asyncio.iscoroutinefunction(check):
+                pending = check()
+            else:
+                pending = asyncio.get_running_loop().run_in_executor(None, check)
+            healthy = bool(await asyncio.wait_for(pending, self.health_check_timeout))
+        except asyncio.TimeoutError:
+            healthy, error = False, f"timed out after {self.health_check_timeout}s"
+        except Exception as e:
+            healthy, error = False, str(e)
+        duration = time.perf_counter() - start
+
+        gauge_set(f"sutra_{name}_healthy", 1.0 if healthy else 0.0)
+        histogram_observe("sutra_health_check_duration_seconds", duration, {"check": name})
+        self.health_checks[name] = {
+            "healthy": healthy,
+            "duration_ms": duration * 1000,
+            "error": error,
+            "checked_at": datetime.utcnow().isoformat(),
+        }
+        if error:
+            logger.warning(f"Health check {name} failed: {error}")
     
     async def _check_api_health(self) -> bool:
         """Check API service health."""
@@ -441,6 +1143,7 @@ class ProductionMonitor:
             "memory_metrics": self.collector._get_memory_metrics(),
             "cpu_metrics": self.collector._get_cpu_metrics(),
             "grid_metrics": self.collector._get_grid_metrics(),
+            "health_checks": dict(self.health_checks),
             "alerts": self.alerts,
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -7,16 +7,24 @@ Integrates with Sutra's internal monitoring system.
 
 import time
 from datetime import datetime
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Tuple
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 import logging
 
-from .internal_metrics import counter_inc, gauge_set, histogram_observe
+from .internal_metrics import GAUGE, HISTOGRAM, get_metrics_collector
 
 logger = logging.getLogger(__name__)
 
+# Endpoint label of requests that matched no route (404s, scanners, ...)
+UNMATCHED_ENDPOINT = "unmatched"
+
+# Method label values; anything else is recorded as "OTHER"
+KNOWN_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH")
+)
+
 
 class SutraMetricsMiddleware(BaseHTTPMiddleware):
     """
@@ -28,80 +36,67 @@ class SutraMetricsMiddleware(BaseHTTPMiddleware):
     - Response status codes
     - Error rates
     - Concurrent requests
+
+    Series are interned once per (method, endpoint, status) and recorded
+    through the collector's lock-free per-thread path, so a request costs
+    a few array updates rather than global-lock round trips and label dicts.
+
+    Endpoint labels are route templates; requests that match no route are
+    labelled "unmatched" and unknown methods "OTHER", so arbitrary client
+    input cannot create series.
     """
     
-    def __init__(self, app: ASGIApp, service_name: str = "sutra"):
+    def __init__(self, app: ASGIApp, service_name: str = "sutra", metrics_collector=None):
         super().__init__(app)
         self.service_name = service_name
-        self.active_requests = 0
+        self.collector = metrics_collector or get_metrics_collector()
+        self._active_key = self.collector.metric_key(
+            f"{service_name}_active_requests", metric_type=GAUGE
+        )
+        # (method, endpoint, status) -> interned keys of that request's series
+        self._request_keys: Dict[Tuple[str, str, int], Tuple] = {}
         
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and collect metrics."""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        collector = self.collector
         
         # Track active requests
-        self.active_requests += 1
-        gauge_set(f"{self.service_name}_active_requests", self.active_requests)
+        collector.inc(self._active_key, 1.0)
         
         # Extract request info
-        method = request.method
-        path = self._get_route_path(request)
+        method = request.method if request.method in KNOWN_METHODS else "OTHER"
         
         try:
             # Process request
             response = await call_next(request)
             
-            # Collect metrics
-            duration = time.time() - start_time
+            # Collect metrics (the router has set the matched route by now)
+            duration = time.perf_counter() - start_time
             status_code = response.status_code
+            path = self._get_route_path(request)
             
-            # Request counter
-            counter_inc(
-                f"{self.service_name}_requests_total",
-                labels={
-                    "method": method,
-                    "endpoint": path,
-                    "status": str(status_code),
-                }
-            )
+            keys = self._request_keys.get((method, path, status_code))
+            if keys is None:
+                keys = self._intern_request_keys(method, path, status_code)
+            requests_key, duration_key, responses_key, errors_key = keys
             
-            # Request duration
-            histogram_observe(
-                f"{self.service_name}_request_duration_seconds",
-                duration,
-                labels={
-                    "method": method,
-                    "endpoint": path,
-                }
-            )
-            
-            # Status code counter
-            counter_inc(
-                f"{self.service_name}_responses_total",
-                labels={
-                    "status": str(status_code),
-                    "status_class": f"{status_code // 100}xx",
-                }
-            )
+            collector.inc(requests_key)
+            collector.observe(duration_key, duration)
+            collector.inc(responses_key)
             
             # Error rate (4xx, 5xx)
-            if status_code >= 400:
-                counter_inc(
-                    f"{self.service_name}_errors_total",
-                    labels={
-                        "method": method,
-                        "endpoint": path,
-                        "status": str(status_code),
-                    }
-                )
+            if errors_key is not None:
+                collector.inc(errors_key)
             
             return response
             
         except Exception as e:
             # Track exceptions
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
+            path = self._get_route_path(request)
             
-            counter_inc(
+            collector.counter_inc(
                 f"{self.service_name}_exceptions_total",
                 labels={
                     "method": method,
@@ -110,7 +105,7 @@ class SutraMetricsMiddleware(BaseHTTPMiddleware):
                 }
             )
             
-            histogram_observe(
+            collector.histogram_observe(
                 f"{self.service_name}_request_duration_seconds",
                 duration,
                 labels={
@@ -119,39 +114,46 @@ class SutraMetricsMiddleware(BaseHTTPMiddleware):
                 }
             )
             
-            logger.error(f"Exception in {method} {path}: {e}")
+            logger.error(f"Exception in {method} {request.url.path}: {e}")
             raise
             
         finally:
             # Update active requests
-            self.active_requests -= 1
-            gauge_set(f"{self.service_name}_active_requests", self.active_requests)
+            collector.inc(self._active_key, -1.0)
+    
+    def _intern_request_keys(self, method: str, path: str, status_code: int) -> Tuple:
+        """Intern the series one (method, endpoint, status) records into."""
+        collector = self.collector
+        status = str(status_code)
+        keys = (
+            collector.metric_key(
+                f"{self.service_name}_requests_total",
+                {"method": method, "endpoint": path, "status": status},
+            ),
+            collector.metric_key(
+                f"{self.service_name}_request_duration_seconds",
+                {"method": method, "endpoint": path},
+                metric_type=HISTOGRAM,
+            ),
+            collector.metric_key(
+                f"{self.service_name}_responses_total",
+                {"status": status, "status_class": f"{status_code // 100}xx"},
+            ),
+            collector.metric_key(
+                f"{self.service_name}_errors_total",
+                {"method": method, "endpoint": path, "status": status},
+            )
+            if status_code >= 400
+            else None,
+        )
+        self._request_keys[(method, path, status_code)] = keys
+        return keys
     
     def _get_route_path(self, request: Request) -> str:
-        """Extract route path template for consistent labeling."""
-        # Try to get the route path template
+        """Route path template of the request, or UNMATCHED_ENDPOINT."""
         route = request.scope.get("route")
-        if route:
-            return route.path
-        
-        # Fall back to raw path (less ideal for high-cardinality paths)
-        path = request.url.path
-        
-        # Normalize common patterns to reduce cardinality
-        if path.startswith("/api/v"):
-            # Handle versioned APIs
-            parts = path.split("/")
-            if len(parts) >= 4:
-                # /api/v1/users/123 -> /api/v1/users/{id}
-                normalized = "/".join(parts[:3])
-                if len(parts) > 3:
-                    # Replace IDs with template
-                    for i, part in enumerate(parts[3:], 3):
-                        if part.isdigit() or len(part) > 20:  # Likely an ID
-                            parts[i] = "{id}"
-                return "/".join(parts)
-        
-        return path
+        path = getattr(route, "path", None)
+        return path if path else UNMATCHED_ENDPOINT
 
 
 class ProductionMetricsEndpoint:
@@ -162,7 +164,6 @@ class ProductionMetricsEndpoint:
     """
     
     def __init__(self, metrics_collector=None):
-        from .internal_metrics import get_metrics_collector
         self.collector = metrics_collector or get_metrics_collector()
     
     def get_metrics_response(self, format: str = "json") -> Dict[str, Any]:
@@ -178,18 +179,29 @@ class ProductionMetricsEndpoint:
             "content": {
                 "system_stats": self.collector.get_system_stats(),
                 "metrics": {
-                    name: {
-                        "latest_value": series.get_latest().value if series.get_latest() else 0,
-                        "average_5min": series.get_average(300),
-                        "data_points": len(series.points),
-                    }
-                    for name, series in self.collector.get_all_metrics().items()
+                    name: self._summarize(family)
+                    for name, family in self.collector.get_all_metrics().items()
                 },
                 "timestamp": datetime.utcnow().isoformat(),
             },
             "media_type": "application/json",
         }
     
+    @staticmethod
+    def _summarize(family) -> Dict[str, Any]:
+        """JSON summary of one metric family."""
+        latest = family.get_latest()
+        summary = {
+            "type": family.type,
+            "latest_value": latest.value if latest else 0,
+            "average_5min": family.get_average(300),
+            "series": len(family.series),
+            "data_points": len(family),
+        }
+        if family.type == "histogram":
+            summary["percentiles"] = family.percentiles()
+        return summary
+    
     def get_health_response(self) -> Dict[str, Any]:
         """Get service health status."""
         stats = self.collector.get_system_stats()
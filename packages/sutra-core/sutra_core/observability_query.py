@@ -9,12 +9,26 @@ Uses Sutra's own reasoning engine to answer operational questions:
 - "Show me all high latency operations"
 
 Pure graph reasoning - no external tools needed.
+
+Answers come from the event rollups written by EventEmitter/SelfObserver
+(see events.py): each hour's anchor concept links the RollupIndex of every
+writer, the indexes say which rollups exist, then hour rollups (for past
+hours) and minute rollups (for the current hour) are fetched by ID and
+merged across writers.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
 import logging
 
+from .events import (
+    HOUR_FORMAT,
+    MINUTE_FORMAT,
+    EventRollup,
+    RollupIndex,
+    histogram_percentile,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,14 +40,16 @@ class ObservabilityQueryInterface:
     system performance, errors, and behavior patterns.
     """
     
-    def __init__(self, storage):
+    def __init__(self, storage, components: Optional[Iterable[str]] = None):
         """
         Initialize observability query interface.
         
         Args:
-            storage: Storage adapter (contains all events as concepts)
+            storage: Storage adapter (contains event rollups as concepts)
+            components: Only answer about these components (default: all)
         """
         self.storage = storage
+        self.components = set(components) if components else None
     
     def query(self, natural_language_query: str) -> Dict[str, Any]:
         """
@@ -59,25 +75,29 @@ class ObservabilityQueryInterface:
         # Extract metric type (count, average, etc)
         metric_type = self._extract_metric_type(query_lower)
         
-        # Search for matching events
-        events = self._search_events(
+        # Only count failures for "failed ...", "errors ..." questions
+        failures_only = any(w in query_lower for w in ('fail', 'error'))
+        
+        # Load matching rollups (most recent first)
+        rollups = self._load_rollups(
             event_types=event_types,
             time_range=time_filter,
-            query_text=natural_language_query
         )
+        if failures_only:
+            rollups = [r for r in rollups if r.failures]
         
         # Compute metrics
         answer, insights = self._compute_answer(
-            events=events,
+            rollups=rollups,
             metric_type=metric_type,
-            query=natural_language_query
+            failures_only=failures_only,
         )
         
         return {
             'query': natural_language_query,
             'answer': answer,
-            'events': events[:10],  # Top 10 events
-            'total_events': len(events),
+            'events': [self._summarize(r) for r in rollups[:10]],  # Top 10 rollups
+            'total_events': sum(r.failures if failures_only else r.count for r in rollups),
             'insights': insights,
             'time_range': time_filter,
         }
@@ -112,21 +132,27 @@ class ObservabilityQueryInterface:
         """Extract event types from query."""
         event_types = []
         
-        # Map query keywords to event types
+        # Map query keywords to event types (EventEmitter and SelfObserver names)
         if 'failed' in query or 'failure' in query or 'error' in query:
             event_types.extend(['query_failed', 'learn_failed', 'storage_error'])
         
         if 'query' in query or 'queries' in query:
-            event_types.extend(['query_completed', 'query_failed', 'query_received'])
+            event_types.extend([
+                'query_completed', 'query_failed', 'query_received',
+                'query_complete', 'query_start',
+            ])
         
         if 'learn' in query or 'learning' in query:
-            event_types.extend(['learn_completed', 'learn_failed'])
+            event_types.extend(['learn_completed', 'learn_failed', 'learn_complete'])
         
         if 'slow' in query or 'latency' in query or 'performance' in query:
-            event_types.extend(['query_high_latency', 'storage_slow'])
+            event_types.extend(['query_high_latency', 'storage_slow', 'high_latency'])
         
         if 'confidence' in query:
-            event_types.extend(['query_low_confidence', 'query_completed'])
+            event_types.extend([
+                'query_low_confidence', 'query_completed',
+                'low_confidence', 'query_complete',
+            ])
         
         return list(set(event_types)) if event_types else None
     
@@ -143,136 +169,178 @@ class ObservabilityQueryInterface:
         else:
             return 'list'
     
-    def _search_events(
+    def _load_rollups(
         self,
         event_types: Optional[List[str]],
         time_range: Dict[str, datetime],
-        query_text: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[EventRollup]:
         """
-        Search for events matching criteria.
+        Fetch the rollups covering a time range, most recent first.
         
-        Uses vector search on event concepts in storage.
+        Complete hours are answered from hour rollups and the current hour
+        from minute rollups; the first hour of the range is counted whole.
         """
         try:
-            # Search by category filter
-            results = []
+            start, end = time_range['start'], time_range['end']
+            wanted_types = set(event_types) if event_types else None
             
-            if event_types:
-                for event_type in event_types:
-                    # Get concepts with this event category
-                    category = f"event_{event_type}"
-                    # Note: Storage would need category filter support
-                    # For now, use vector search
-                    matches = self.storage.vector_search_by_content(
-                        query_text,
-                        k=50,
-                        category_filter=category
-                    )
-                    results.extend(matches)
-            else:
-                # General search across all events
-                results = self.storage.vector_search_by_content(
-                    query_text,
-                    k=100,
-                    category_filter="event_"
-                )
+            hours = []
+            hour = start.replace(minute=0, second=0, microsecond=0)
+            while hour <= end:
+                hours.append(hour.strftime(HOUR_FORMAT))
+                hour += timedelta(hours=1)
+            current_hour = end.strftime(HOUR_FORMAT)
+            start_minute = start.strftime(MINUTE_FORMAT)
+            end_minute = end.strftime(MINUTE_FORMAT)
             
-            # Convert to event dicts
-            events = []
-            for concept_id, similarity in results:
-                concept = self.storage.get_concept(concept_id)
-                if concept:
-                    # Parse timestamp from concept
-                    try:
-                        # Extract timestamp from category or created field
-                        ts = datetime.fromisoformat(concept.created.replace('Z', '+00:00'))
-                        
-                        # Filter by time range
-                        if time_range['start'] <= ts <= time_range['end']:
-                            events.append({
-                                'id': concept.id,
-                                'content': concept.content,
-                                'category': concept.category,
-                                'timestamp': concept.created,
-                                'similarity': similarity
-                            })
-                    except Exception:
-                        pass
+            # Hour indexes say which (component, event type) series exist
+            rollup_ids = []
+            for concept in self._get_concepts(self._index_ids(hours)):
+                index = RollupIndex.from_concept_content(concept.content)
+                if index is None:
+                    continue
+                for key, minutes in index.keys.items():
+                    component, _, event_type = key.partition('|')
+                    if wanted_types is not None and event_type not in wanted_types:
+                        continue
+                    if self.components is not None and component not in self.components:
+                        continue
+                    if index.hour < current_hour:
+                        rollup_ids.append(
+                            EventRollup.concept_id_for(
+                                component, event_type, index.hour, index.writer
+                            )
+                        )
+                    else:
+                        rollup_ids.extend(
+                            EventRollup.concept_id_for(
+                                component, event_type, minute, index.writer
+                            )
+                            for minute in minutes
+                            if start_minute <= minute <= end_minute
+                        )
             
-            return events
+            # One rollup per series and bucket, summed over writers
+            merged: Dict[tuple, EventRollup] = {}
+            for concept in self._get_concepts(rollup_ids):
+                rollup = EventRollup.from_concept_content(concept.content)
+                if rollup is None:
+                    continue
+                key = (rollup.component, rollup.event_type, rollup.bucket)
+                if key in merged:
+                    merged[key].merge(rollup)
+                else:
+                    merged[key] = rollup
+            rollups = sorted(merged.values(), key=lambda r: r.bucket, reverse=True)
+            return rollups
             
         except Exception as e:
-            logger.error(f\"Event search failed: {e}\")
+            logger.error(f"Rollup lookup failed: {e}")
             return []
     
+    def _index_ids(self, hours: List[str]) -> List[str]:
+        """IDs of every writer's RollupIndex for the given hours."""
+        ids = []
+        for hour in hours:
+            # Index written before writer IDs existed
+            ids.append(RollupIndex.concept_id_for(hour))
+            if hasattr(self.storage, 'get_neighbors'):
+                ids.extend(self.storage.get_neighbors(RollupIndex.anchor_id_for(hour)))
+        return list(dict.fromkeys(ids))
+    
+    def _get_concepts(self, concept_ids: List[str]) -> List[Any]:
+        """Fetch existing concepts, in bulk when the adapter supports it."""
+        if not concept_ids:
+            return []
+        if hasattr(self.storage, 'get_concepts'):
+            found = self.storage.get_concepts(concept_ids)
+            return [found[cid] for cid in concept_ids if found.get(cid)]
+        concepts = (self.storage.get_concept(cid) for cid in concept_ids)
+        return [c for c in concepts if c]
+    
+    @staticmethod
+    def _summarize(rollup: EventRollup) -> Dict[str, Any]:
+        return {
+            'component': rollup.component,
+            'event_type': rollup.event_type,
+            'bucket': rollup.bucket,
+            'count': rollup.count,
+            'failures': rollup.failures,
+            'avg_duration_ms': rollup.avg_duration_ms,
+            'content': rollup.to_concept_content().split('\n', 1)[0],
+        }
+    
     def _compute_answer(
         self,
-        events: List[Dict[str, Any]],
+        rollups: List[EventRollup],
         metric_type: str,
-        query: str
+        failures_only: bool = False,
     ) -> tuple[str, List[str]]:
-        \"\"\"Compute answer from events.\"\"\"
-        if not events:
+        """Compute answer from rollups."""
+        if not rollups:
             return (
-                \"No matching events found in the specified time range.\",
-                [\"Try expanding the time range or adjusting search criteria\"]
+                "No matching events found in the specified time range.",
+                ["Try expanding the time range or adjusting search criteria"]
             )
         
         insights = []
+        total = sum(r.failures if failures_only else r.count for r in rollups)
+        noun = "failed events" if failures_only else "events"
+        
+        # Latency aggregates (histograms share bucket bounds, so they add up)
+        timed = [r for r in rollups if r.duration_count]
+        duration_count = sum(r.duration_count for r in timed)
         
         if metric_type == 'count':
-            answer = f\"Found {len(events)} events matching your query.\"
-            
-            # Group by category for insights
-            categories = {}
-            for event in events:
-                cat = event.get('category', 'unknown')
-                categories[cat] = categories.get(cat, 0) + 1
+            answer = f"Found {total} {noun} matching your query."
             
-            if categories:
-                top_category = max(categories, key=categories.get)
-                insights.append(
-                    f\"Most common event type: {top_category} ({categories[top_category]} occurrences)\"
+            # Group by event type for insights
+            by_type: Dict[str, int] = {}
+            for r in rollups:
+                by_type[r.event_type] = by_type.get(r.event_type, 0) + (
+                    r.failures if failures_only else r.count
                 )
+            top_type = max(by_type, key=by_type.get)
+            insights.append(
+                f"Most common event type: {top_type} ({by_type[top_type]} occurrences)"
+            )
         
-        elif metric_type == 'average':
-            # Extract durations from event content if available
-            durations = []
-            for event in events:
-                content = event.get('content', '')
-                if 'ms' in content:
-                    try:
-                        # Extract duration like "123.4ms"
-                        parts = content.split('ms')[0].split()
-                        duration = float(parts[-1])
-                        durations.append(duration)
-                    except (ValueError, IndexError):
-                        pass
+        elif metric_type in ('average', 'max', 'min'):
+            if not duration_count:
+                return f"Found {total} {noun} but no duration data available.", insights
             
-            if durations:
-                avg = sum(durations) / len(durations)
-                answer = f\"Average duration: {avg:.1f}ms across {len(durations)} operations.\"
-                insights.append(f\"Min: {min(durations):.1f}ms, Max: {max(durations):.1f}ms\")
+            avg = sum(r.duration_sum_ms for r in timed) / duration_count
+            worst = max(r.duration_max_ms for r in timed)
+            best = min(r.duration_min_ms for r in timed)
+            if metric_type == 'average':
+                answer = f"Average duration: {avg:.1f}ms across {duration_count} operations."
+            elif metric_type == 'max':
+                answer = f"Maximum duration: {worst:.1f}ms across {duration_count} operations."
             else:
-                answer = f\"Found {len(events)} events but no duration data available.\"
-        
-        elif metric_type == 'list':
-            # Return sample events
-            answer = f\"Found {len(events)} matching events. Here are the most recent:\"
-            for event in events[:5]:
-                insights.append(f\"- {event.get('content', '')[:100]}\")
+                answer = f"Minimum duration: {best:.1f}ms across {duration_count} operations."
+            
+            histogram = [sum(col) for col in zip(*(r.latency_histogram for r in timed))]
+            p95 = histogram_percentile(histogram, 0.95, worst)
+            insights.append(f"Min: {best:.1f}ms, Max: {worst:.1f}ms, p95 under {p95:.0f}ms")
         
         else:
-            answer = f\"Found {len(events)} matching events.\"
+            # Most recent buckets
+            answer = f"Found {total} matching {noun}. Most recent activity:"
+            for r in rollups[:5]:
+                insights.append(f"- {self._summarize(r)['content'][:200]}")
+        
+        # Error samples carried by the rollups
+        samples = [s for r in rollups for s in r.error_samples][:3]
+        if samples:
+            insights.append(f"Recent errors: {'; '.join(samples)}")
         
         # Add general insights
-        if len(events) > 50:
-            insights.append(\"⚠️ High volume of events detected - consider investigating\")
+        if total > 50:
+            insights.append("⚠️ High volume of events detected - consider investigating")
         
         return answer, insights
 
 
 def create_observability_interface(storage) -> ObservabilityQueryInterface:
-    \"\"\"Factory function to create observability query interface.\"\"\"
+    """Factory function to create observability query interface."""
     return ObservabilityQueryInterface(storage)
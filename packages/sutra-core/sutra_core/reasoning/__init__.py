@@ -17,6 +17,7 @@ from .contradictions import (
     ContradictionResolver,
     ResolutionStrategy,
 )
+from .context import QueryContext
 from .engine import ReasoningEngine
 from .mppa import MultiPathAggregator
 from .paths import PathFinder
@@ -25,6 +26,7 @@ from .query import QueryProcessor
 
 __all__ = [
     "ReasoningEngine",
+    "QueryContext",
     "MultiPathAggregator",
     "PathFinder",
     "QueryProcessor",
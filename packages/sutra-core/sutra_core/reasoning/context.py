@@ -0,0 +1,85 @@
+"""
+Request-scoped query context.
+
+Carries the per-query artifacts that several layers need (query embedding,
+vector search hits, fetched concepts) so that a single request embeds and
+vector-searches the query exactly once:
+- ReasoningEngine.ask / QueryProcessor.process_query populate it
+- ReasoningEngine.search_concepts reuses it
+- The hybrid layer passes the same context through both calls
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..graph.concepts import Concept
+from ..utils.profiling import stage
+from ..utils.text import clean_text
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryContext:
+    """Per-request cache of query embedding and vector search results.
+
+    Not thread-safe; create one context per request.
+    """
+
+    query: str
+    text: str = ""
+    embedding: Optional[np.ndarray] = None
+    vector_hits: List[Tuple[str, float]] = field(default_factory=list)
+    vector_hits_k: int = 0
+    concepts: Dict[str, Optional[Concept]] = field(default_factory=dict)
+
+    # Counters so callers (and tests) can verify the "exactly once" contract
+    embedding_calls: int = 0
+    vector_search_calls: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.text:
+            # Same normalization QueryProcessor applies before embedding
+            self.text = clean_text(self.query.lower())
+
+    def get_embedding(
+        self, encoder: Callable[[str], Optional[Any]]
+    ) -> Optional[np.ndarray]:
+        """Return the query embedding, computing it with ``encoder`` on first use."""
+        if self.embedding is None:
+            self.embedding_calls += 1
+            with stage("embedding"):
+                embedding = encoder(self.text)
+            if embedding is not None and not isinstance(embedding, np.ndarray):
+                embedding = np.array(embedding, dtype=np.float32)
+            self.embedding = embedding
+        return self.embedding
+
+    def get_vector_hits(
+        self, storage, k: int, encoder: Callable[[str], Optional[Any]]
+    ) -> List[Tuple[str, float]]:
+        """
+        Return top-``k`` vector search hits for the query.
+
+        A search is only issued when no previous search in this context
+        covered ``k`` results; smaller requests are served by slicing.
+        """
+        if self.vector_hits_k < k:
+            embedding = self.get_embedding(encoder)
+            if embedding is None:
+                return []
+            self.vector_search_calls += 1
+            with stage("vector_search"):
+                self.vector_hits = list(storage.vector_search(embedding, k=k))
+            self.vector_hits_k = k
+        return self.vector_hits[:k]
+
+    def get_concept(self, storage, concept_id: str) -> Optional[Concept]:
+        """Fetch a concept once per request."""
+        if concept_id not in self.concepts:
+            with stage("get_concept"):
+                self.concepts[concept_id] = storage.get_concept(concept_id)
+        return self.concepts[concept_id]
@@ -13,6 +13,7 @@ import os
 import threading
 import time
 from collections import OrderedDict
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
@@ -20,14 +21,16 @@ if TYPE_CHECKING:
 
 import numpy as np
 
-from ..exceptions import StorageError
+from ..exceptions import BatchLearningError, StorageError
 from ..graph.concepts import AssociationType
 from ..learning.adaptive import AdaptiveLearner
 from ..learning.associations import AssociationExtractor
 from ..learning.associations_parallel import ParallelAssociationExtractor
 from ..learning.entity_cache import EntityCache
-from ..utils.nlp import TextProcessor
+from ..utils.nlp import TextProcessor, get_text_processor
+from ..utils.profiling import profile_request, stage
 from ..utils.text import extract_words
+from .context import QueryContext
 from .mppa import ConsensusResult, MultiPathAggregator
 from .paths import PathFinder
 from .query import QueryProcessor
@@ -96,6 +99,7 @@ class ReasoningEngine:
             enable_parallel_associations=config.enable_parallel_associations,
             association_workers=config.association_workers,
             enable_entity_cache=config.enable_entity_cache,
+            profile_sample_rate=config.profile_sample_rate,
         )
 
     def __init__(
@@ -113,6 +117,7 @@ class ReasoningEngine:
         enable_parallel_associations: bool = True,
         association_workers: int = 4,
         enable_entity_cache: bool = False,
+        profile_sample_rate: float = 0.0,
     ):
         """
         Initialize the reasoning engine.
@@ -133,6 +138,8 @@ class ReasoningEngine:
             enable_parallel_associations: Enable parallel association extraction (Phase 8A+)
             association_workers: Number of worker processes for parallel extraction
             enable_entity_cache: Enable cached entity extraction with background LLM service (Phase 10)
+            profile_sample_rate: Fraction of ask() calls to profile per stage
+                (exported as sutra_request_stage_* metrics; 0.0 = off)
         """
         # Storage backend (single source of truth - TCP only)
         self.storage_path = storage_path  # Kept for backward compatibility (unused)
@@ -144,7 +151,7 @@ class ReasoningEngine:
         # Initialize NLP processor first (needed for dimension detection)
         self.nlp_processor: Optional[TextProcessor] = None
         try:
-            self.nlp_processor = TextProcessor()
+            self.nlp_processor = get_text_processor()
             logger.info("NLP processor initialized with spaCy")
         except (ImportError, OSError) as e:
             logger.warning(f"NLP processor unavailable: {e}")
@@ -160,6 +167,7 @@ class ReasoningEngine:
             self.storage = TcpStorageAdapter(
                 server_address=storage_config.server_address,
                 vector_dimension=storage_config.vector_dimension,
+                slow_request_threshold_ms=storage_config.slow_request_threshold_ms,
             )
             logger.info(
                 f"TCP storage connected to {storage_config.server_address} "
@@ -262,6 +270,7 @@ class ReasoningEngine:
             OrderedDict()
         )
         self.max_cache_size = max_cache_size
+        self.profile_sample_rate = profile_sample_rate
 
         # Statistics
         self.query_count = 0
@@ -282,6 +291,15 @@ class ReasoningEngine:
     def close(self) -> None:
         """Close the engine and ensure all data is persisted."""
         self.save()
+        # Stop the association worker pool (parallel extractor only)
+        if hasattr(self.association_extractor, "close"):
+            self.association_extractor.close()
+        # Write out events still buffered by the emitter's writer thread
+        if self._event_emitter is not None:
+            self._event_emitter.close()
+        # Write out cache misses not yet merged into the processing queue
+        if self.entity_cache is not None:
+            self.entity_cache.close()
         logger.info("ReasoningEngine closed")
 
     def __enter__(self):
@@ -294,7 +312,12 @@ class ReasoningEngine:
         return False
 
     def ask(
-        self, question: str, num_reasoning_paths: int = 5, **kwargs: Any
+        self,
+        question: str,
+        num_reasoning_paths: int = 5,
+        context: Optional[QueryContext] = None,
+        profile: bool = False,
+        **kwargs: Any,
     ) -> ConsensusResult:
         """
         Ask the AI a question and get an explainable answer.
@@ -305,21 +328,44 @@ class ReasoningEngine:
         Args:
             question: Natural language question
             num_reasoning_paths: Number of reasoning paths to explore
+            context: Optional request-scoped QueryContext. Pass the same
+                context to search_concepts() to reuse the query embedding
+                and vector hits instead of recomputing them.
+            profile: Profile this request regardless of profile_sample_rate
+                and attach the per-stage breakdown to result.profile
             **kwargs: Additional options passed to query processor
 
         Returns:
             Consensus result with answer, confidence, and explanation
         """
+        with profile_request(
+            "ask", sample_rate=self.profile_sample_rate, force=profile
+        ) as request_profile:
+            result = self._ask(question, num_reasoning_paths, context, **kwargs)
+
+        if profile and request_profile is not None:
+            # Copy: the cached result is shared with later callers
+            result = replace(result, profile=request_profile.to_dict())
+        return result
+
+    def _ask(
+        self,
+        question: str,
+        num_reasoning_paths: int,
+        context: Optional[QueryContext],
+        **kwargs: Any,
+    ) -> ConsensusResult:
         self.query_count += 1
         start_time = time.time()
         
         # Emit query start event
         if self._event_emitter:
-            self._event_emitter.emit_query_start(question)
+            with stage("event_emission"):
+                self._event_emitter.emit_query_start(question)
 
         # Check cache first
         if self.enable_caching:
-            with self._cache_lock:
+            with stage("cache_lookup"), self._cache_lock:
                 cached = self.query_cache.get(question)
                 if cached:
                     cached_result, ts = cached
@@ -342,7 +388,10 @@ class ReasoningEngine:
         # Process query through full reasoning pipeline
         try:
             result = self.query_processor.process_query(
-                question, num_reasoning_paths=num_reasoning_paths, **kwargs
+                question,
+                num_reasoning_paths=num_reasoning_paths,
+                context=context,
+                **kwargs,
             )
 
             # Cache result
@@ -352,13 +401,16 @@ class ReasoningEngine:
             # Emit query complete event
             duration_ms = (time.time() - start_time) * 1000
             if self._event_emitter:
-                self._event_emitter.emit_query_complete(question, duration_ms, result.confidence)
-                
-                # Emit alerts for low confidence or high latency
-                if result.confidence < 0.3:
-                    self._event_emitter.emit_low_confidence(question, result.confidence)
-                if duration_ms > 1000:
-                    self._event_emitter.emit_high_latency(question, duration_ms)
+                with stage("event_emission"):
+                    self._event_emitter.emit_query_complete(
+                        question, duration_ms, result.confidence
+                    )
+
+                    # Emit alerts for low confidence or high latency
+                    if result.confidence < 0.3:
+                        self._event_emitter.emit_low_confidence(question, result.confidence)
+                    if duration_ms > 1000:
+                        self._event_emitter.emit_high_latency(question, duration_ms)
 
             # Log performance
             logger.debug(
@@ -580,23 +632,54 @@ class ReasoningEngine:
                 memory_mb = psutil.Process().memory_info().rss / 1024 / 1024
                 logger.info(f"🧹 Memory cleanup: {memory_mb:.1f} MB RSS")
 
-            batch_concept_ids = []
             batch_start_time = time.time()
 
+            # Fast path: whole batch with one embedding call and bulk storage
+            # I/O. Items it did not complete (all of them with extra learn
+            # options) are learned one by one below, with per-item error
+            # handling; concepts it already stored are found by learn_adaptive
+            # and not embedded again.
+            learned: Dict[int, str] = {}
+            if not kwargs:
+                try:
+                    learned = dict(
+                        enumerate(self.adaptive_learner.learn_adaptive_batch(current_batch))
+                    )
+                except BatchLearningError as e:
+                    learned = dict(e.completed)
+                    logger.warning(
+                        f"⚠️ Bulk learning incomplete for batch {batch_number}: {e} "
+                        f"(retrying {len(current_batch) - len(learned)} items individually)"
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️ Bulk learning failed for batch {batch_number}: {e} "
+                        f"(retrying per item)"
+                    )
+                self.learning_events += len(learned)
+
+            per_item = [i for i in range(len(current_batch)) if i not in learned]
+            if per_item:
+                # Batch NLP pre-parse (nlp.pipe) for extractors that use spaCy
+                prepare_batch = getattr(
+                    self.association_extractor, "prepare_batch", None
+                )
+                if prepare_batch is not None:
+                    prepare_batch([current_batch[i][0] for i in per_item])
+
             try:
-                # Learn all concepts in current batch
-                for item_idx, (content, source, category) in enumerate(current_batch):
+                # Learn remaining concepts in current batch
+                for item_idx in per_item:
+                    content, source, category = current_batch[item_idx]
                     try:
                         self.learning_events += 1
 
                         # Learn concept with adaptive system
                         # Storage auto-indexes vectors in native HNSW
-                        concept_id = self.adaptive_learner.learn_adaptive(
+                        learned[item_idx] = self.adaptive_learner.learn_adaptive(
                             content, source=source, category=category, **kwargs
                         )
 
-                        batch_concept_ids.append(concept_id)
-
                     except Exception as e:
                         error_msg = (
                             f"Failed to learn item {batch_idx + item_idx + 1}: {str(e)}"
@@ -613,6 +696,8 @@ class ReasoningEngine:
                         else:
                             logger.warning(f"⚠️ {error_msg} (continuing...)")
 
+                # Concept IDs in input order
+                batch_concept_ids = [learned[i] for i in sorted(learned)]
                 successfully_learned.extend(batch_concept_ids)
 
                 batch_duration = time.time() - batch_start_time
@@ -727,7 +812,11 @@ class ReasoningEngine:
         if not concept:
             return None
 
-        neighbors = self.storage.get_neighbors(concept_id) or []
+        return self._concept_info(concept)
+
+    def _concept_info(self, concept) -> Dict:
+        """Build the concept info dict for an already-fetched concept."""
+        neighbors = self.storage.get_neighbors(concept.id) or []
 
         return {
             "id": concept.id,
@@ -743,29 +832,42 @@ class ReasoningEngine:
             "neighbors": neighbors[:10],  # Limit for display
         }
 
-    def search_concepts(self, query: str, limit: int = 10) -> List[Dict]:
+    def search_concepts(
+        self,
+        query: str,
+        limit: int = 10,
+        context: Optional[QueryContext] = None,
+    ) -> List[Dict]:
         """
         Search for concepts using native Rust HNSW (O(log N)).
 
         PRODUCTION: Uses storage's internal HNSW index.
+
+        Args:
+            query: Natural language query
+            limit: Maximum number of results
+            context: Optional request-scoped QueryContext (e.g. the one passed
+                to ask()); its embedding, vector hits and fetched concepts
+                are reused instead of issuing new requests
         """
-        if not (self.storage and self.nlp_processor):
-            logger.error("Storage or NLP processor not initialized")
+        if not self.storage:
+            logger.error("Storage not initialized")
             return []
 
-        try:
-            query_embedding = self.nlp_processor.get_embedding(query)
-            if query_embedding is None:
-                logger.error("Failed to generate query embedding")
-                return []
+        if context is None:
+            context = QueryContext(query)
 
-            # Use storage's native HNSW search
-            vector_results = self.storage.vector_search(query_embedding, k=limit)
+        try:
+            # Use storage's native HNSW search (embeds at most once per context)
+            vector_results = context.get_vector_hits(
+                self.storage, limit, self.query_processor.encode_query
+            )
 
             results = []
             for concept_id, similarity in vector_results:
-                concept_info = self.get_concept_info(concept_id)
-                if concept_info:
+                concept = context.get_concept(self.storage, concept_id)
+                if concept:
+                    concept_info = self._concept_info(concept)
                     concept_info["relevance_score"] = similarity
                     results.append(concept_info)
 
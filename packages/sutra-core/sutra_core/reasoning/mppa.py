@@ -12,7 +12,7 @@ import logging
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import Counter as CounterType
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..graph.concepts import ReasoningPath
 
@@ -29,6 +29,8 @@ class ConsensusResult:
     supporting_paths: List[ReasoningPath]
     alternative_answers: List[Tuple[str, float]]
     reasoning_explanation: str
+    # Per-stage timing/RPC breakdown, set when ask(..., profile=True)
+    profile: Optional[Dict[str, Any]] = None
 
 
 @dataclass
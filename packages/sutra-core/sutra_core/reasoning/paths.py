@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from typing import Deque, Dict, List, Optional, Set, Tuple
 
 from ..graph.concepts import Association, Concept, ReasoningPath, ReasoningStep
+from ..utils.profiling import stage
 
 logger = logging.getLogger(__name__)
 
@@ -89,19 +90,20 @@ class PathFinder:
 
         all_paths = []
 
-        # Try each start-target combination
-        for start_id in start_concepts:
-            for target_id in target_concepts:
-                if start_id == target_id:
-                    continue
+        with stage("path_finding"):
+            # Try each start-target combination
+            for start_id in start_concepts:
+                for target_id in target_concepts:
+                    if start_id == target_id:
+                        continue
 
-                paths = self._find_paths_between_concepts(
-                    start_id, target_id, search_strategy
-                )
-                all_paths.extend(paths)
+                    paths = self._find_paths_between_concepts(
+                        start_id, target_id, search_strategy
+                    )
+                    all_paths.extend(paths)
 
-        # Diversify and rank paths
-        diverse_paths = self._diversify_paths(all_paths, num_paths)
+            # Diversify and rank paths
+            diverse_paths = self._diversify_paths(all_paths, num_paths)
 
         logger.debug(f"Found {len(diverse_paths)} diverse reasoning paths")
         return diverse_paths
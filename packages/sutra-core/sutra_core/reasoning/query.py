@@ -15,7 +15,9 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..graph.concepts import Association, Concept, ReasoningPath
 from ..learning.associations import AssociationExtractor
-from ..utils.text import clean_text, extract_words
+from ..utils.profiling import stage
+from ..utils.text import extract_words
+from .context import QueryContext
 from .mppa import ConsensusResult, MultiPathAggregator
 from .paths import PathFinder
 
@@ -81,7 +83,11 @@ class QueryProcessor:
         }
 
     def process_query(
-        self, query: str, num_reasoning_paths: int = 5, max_concepts: int = 10
+        self,
+        query: str,
+        num_reasoning_paths: int = 5,
+        max_concepts: int = 10,
+        context: Optional[QueryContext] = None,
     ) -> ConsensusResult:
         """
         Process natural language query and generate AI reasoning response.
@@ -90,6 +96,8 @@ class QueryProcessor:
             query: Natural language question
             num_reasoning_paths: Number of reasoning paths to explore
             max_concepts: Maximum relevant concepts to consider
+            context: Optional request-scoped context; populated with the query
+                embedding and vector hits so callers can reuse them
 
         Returns:
             Consensus result with explainable reasoning
@@ -98,14 +106,20 @@ class QueryProcessor:
 
         logger.debug(f"Processing query: {query}")
 
+        if context is None:
+            context = QueryContext(query)
+
         # Step 1: Clean and normalize query
-        cleaned_query = clean_text(query.lower())
+        cleaned_query = context.text
 
         # Step 2: Classify query intent
-        query_intent = self._classify_query_intent(cleaned_query)
+        with stage("intent_classification"):
+            query_intent = self._classify_query_intent(cleaned_query)
 
         # Step 3: Extract and rank relevant concepts
-        relevant_concepts = self._find_relevant_concepts(cleaned_query, max_concepts)
+        relevant_concepts = self._find_relevant_concepts(
+            cleaned_query, max_concepts, context
+        )
 
         if not relevant_concepts:
             return ConsensusResult(
@@ -118,12 +132,14 @@ class QueryProcessor:
             )
 
         # Step 4: Expand context with related concepts
-        expanded_concepts = self._expand_query_context(relevant_concepts, query_intent)
+        with stage("neighbor_expansion"):
+            expanded_concepts = self._expand_query_context(relevant_concepts, query_intent)
 
         # Step 5: Generate multiple reasoning paths
-        reasoning_paths = self._generate_reasoning_paths(
-            expanded_concepts, query_intent, num_reasoning_paths, cleaned_query
-        )
+        with stage("path_finding"):
+            reasoning_paths = self._generate_reasoning_paths(
+                expanded_concepts, query_intent, num_reasoning_paths, cleaned_query
+            )
 
         # PRODUCTION: Check if all paths are trivial self-loops (no real associations)
         # This happens when knowledge graph has no associations yet
@@ -142,17 +158,18 @@ class QueryProcessor:
             logger.debug(
                 f"No meaningful reasoning paths ({len(reasoning_paths)} trivial paths), using best vector search result"
             )
-            best_concept = self.storage.get_concept(relevant_concepts[0][0])
+            best_concept = context.get_concept(self.storage, relevant_concepts[0][0])
             if best_concept:
                 # Extract targeted answer from concept content
                 # Pass similarity score for intelligent extraction
                 similarity_score = relevant_concepts[0][1]
-                answer = self._extract_targeted_answer(
-                    best_concept.content,
-                    cleaned_query,
-                    query_intent,
-                    similarity_score=similarity_score,
-                )
+                with stage("answer_extraction"):
+                    answer = self._extract_targeted_answer(
+                        best_concept.content,
+                        cleaned_query,
+                        query_intent,
+                        similarity_score=similarity_score,
+                    )
                 return ConsensusResult(
                     primary_answer=answer,
                     confidence=best_concept.confidence,  # Full confidence for vector search
@@ -163,7 +180,8 @@ class QueryProcessor:
                 )
 
         # Step 6: Aggregate paths using MPPA (only when we have meaningful paths)
-        consensus_result = self.mppa.aggregate_reasoning_paths(reasoning_paths, query)
+        with stage("mppa"):
+            consensus_result = self.mppa.aggregate_reasoning_paths(reasoning_paths, query)
 
         # Step 7: Enhance result with query-specific information
         enhanced_result = self._enhance_consensus_result(
@@ -220,7 +238,10 @@ class QueryProcessor:
         return intent
 
     def _find_relevant_concepts(
-        self, query: str, max_concepts: int
+        self,
+        query: str,
+        max_concepts: int,
+        context: Optional[QueryContext] = None,
     ) -> List[Tuple[str, float]]:
         """Find and rank concepts relevant to the query.
 
@@ -228,19 +249,14 @@ class QueryProcessor:
         Embeddings naturally handle query variations, no expansion needed.
         Uses native HNSW in storage for O(log N) semantic search.
         """
-        return self._find_concepts_semantic(query, max_concepts)
+        return self._find_concepts_semantic(query, max_concepts, context)
 
-    def _find_concepts_semantic(
-        self, query: str, max_concepts: int
-    ) -> List[Tuple[str, float]]:
-        """Find concepts using semantic vector search (O(log N)).
+    def encode_query(self, query: str) -> Any:
+        """Embed a (normalized) query with the configured embedding processors.
 
-        PRODUCTION: Pure vector search, no fallbacks, no hacks.
-        Trust embeddings to handle semantic similarity correctly.
+        Raises:
+            RuntimeError: If no processor produced an embedding
         """
-        import numpy as np
-
-        # Generate query embedding
         query_embedding = None
 
         # Try embedding processor first (faster, batched)
@@ -273,21 +289,33 @@ class QueryProcessor:
                 "Vector search requires embedding_processor or nlp_processor."
             )
 
-        # Ensure numpy array
-        if not isinstance(query_embedding, np.ndarray):
-            query_embedding = np.array(query_embedding, dtype=np.float32)
+        return query_embedding
+
+    def _find_concepts_semantic(
+        self,
+        query: str,
+        max_concepts: int,
+        context: Optional[QueryContext] = None,
+    ) -> List[Tuple[str, float]]:
+        """Find concepts using semantic vector search (O(log N)).
+
+        PRODUCTION: Pure vector search, no fallbacks, no hacks.
+        Trust embeddings to handle semantic similarity correctly.
+        """
+        if context is None:
+            context = QueryContext(query, text=query)
 
-        # Search using native HNSW in storage (O(log N))
-        vector_results = self.storage.vector_search(
-            query_embedding,
-            k=max_concepts,
+        # Search using native HNSW in storage (O(log N)); the embedding and
+        # hits are kept on the context for reuse by later stages
+        vector_results = context.get_vector_hits(
+            self.storage, max_concepts, self.encode_query
         )
 
         # Score with concept metadata (strength, confidence)
         # NO lexical boost, NO word matching merge - trust embeddings
         relevant_concepts = []
         for concept_id, similarity in vector_results:
-            concept = self.storage.get_concept(concept_id)
+            concept = context.get_concept(self.storage, concept_id)
             if concept:
                 # Weight by concept quality metrics
                 strength_boost = min(concept.strength / 5.0, 1.0)
@@ -389,12 +417,13 @@ class QueryProcessor:
 
         # PRODUCTION: Extract targeted answer based on query type
         # For MPPA consensus, use conservative similarity (lower confidence in extraction)
-        enhanced_answer = self._extract_targeted_answer(
-            result.primary_answer,
-            original_query,
-            query_intent,
-            similarity_score=0.5,  # Conservative for aggregated results
-        )
+        with stage("answer_extraction"):
+            enhanced_answer = self._extract_targeted_answer(
+                result.primary_answer,
+                original_query,
+                query_intent,
+                similarity_score=0.5,  # Conservative for aggregated results
+            )
         if enhanced_answer != result.primary_answer:
             logger.debug(
                 f"Answer extraction: '{result.primary_answer}' → '{enhanced_answer}'"
@@ -460,7 +489,7 @@ class QueryProcessor:
         # WHO questions: Extract person/entity names using spaCy NER
         if qtype == "who" and self.nlp_processor:
             try:
-                doc = self.nlp_processor.nlp(answer)
+                doc = self.nlp_processor.parse(answer)
                 persons = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
                 orgs = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
                 entities = persons + orgs
@@ -474,7 +503,7 @@ class QueryProcessor:
         elif qtype == "when":
             if self.nlp_processor:
                 try:
-                    doc = self.nlp_processor.nlp(answer)
+                    doc = self.nlp_processor.parse(answer)
                     dates = [ent.text for ent in doc.ents if ent.label_ == "DATE"]
                     if dates:
                         extracted = dates[0]
@@ -492,7 +521,7 @@ class QueryProcessor:
         # WHERE questions: Extract locations using spaCy NER
         elif qtype == "where" and self.nlp_processor:
             try:
-                doc = self.nlp_processor.nlp(answer)
+                doc = self.nlp_processor.parse(answer)
                 locations = [
                     ent.text for ent in doc.ents if ent.label_ in ["GPE", "LOC"]
                 ]
@@ -509,7 +538,7 @@ class QueryProcessor:
             # If yes, keep it. If no, extract definition.
             if self.nlp_processor:
                 try:
-                    doc = self.nlp_processor.nlp(answer)
+                    doc = self.nlp_processor.parse(answer)
                     # If first token is proper noun, it's likely the subject we want
                     if doc and doc[0].pos_ == "PROPN":
                         logger.debug("Proper noun detected - returning full content")
@@ -7,6 +7,16 @@ Provides:
 - Graceful degradation
 """
 
-from .circuit_breaker import CircuitBreaker, CircuitBreakerState
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitBreakerState,
+)
 
-__all__ = ["CircuitBreaker", "CircuitBreakerState"]
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitBreakerError",
+    "CircuitBreakerState",
+]
@@ -12,7 +12,7 @@ States:
 import logging
 import time
 from enum import Enum
-from typing import Callable, Optional, TypeVar, Generic
+from typing import Awaitable, Callable, Optional, TypeVar, Generic
 from dataclasses import dataclass
 from threading import Lock
 
@@ -106,6 +106,56 @@ class CircuitBreaker(Generic[T]):
             CircuitBreakerError: If circuit is open
             Exception: If function raises (circuit may open)
         """
+        self._admit()
+
+        # Execute function (outside lock to allow parallelism)
+        try:
+            result = func()
+            self._on_success()
+            return result
+
+        except Exception as e:
+            self._on_failure(e)
+            raise
+
+        except BaseException:
+            self._on_abandon()
+            raise
+
+    async def call_async(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await coroutine function with circuit breaker protection.
+
+        Async counterpart of call(); shares state with synchronous callers.
+
+        Args:
+            func: Coroutine function to await (no arguments)
+
+        Returns:
+            Awaited return value
+
+        Raises:
+            CircuitBreakerError: If circuit is open
+            Exception: If function raises (circuit may open)
+        """
+        self._admit()
+
+        try:
+            result = await func()
+            self._on_success()
+            return result
+
+        except Exception as e:
+            self._on_failure(e)
+            raise
+
+        except BaseException:
+            # Cancelled (or interrupted): says nothing about the service
+            self._on_abandon()
+            raise
+
+    def _admit(self) -> None:
+        """Admit a request or raise CircuitBreakerError (OPEN / HALF_OPEN limit)."""
         with self._lock:
             current_state = self._state
 
@@ -132,16 +182,6 @@ class CircuitBreaker(Generic[T]):
                     )
                 self._half_open_requests += 1
 
-        # Execute function (outside lock to allow parallelism)
-        try:
-            result = func()
-            self._on_success()
-            return result
-
-        except Exception as e:
-            self._on_failure(e)
-            raise
-
     def _on_success(self) -> None:
         """Handle successful request."""
         with self._lock:
@@ -163,6 +203,15 @@ class CircuitBreaker(Generic[T]):
                     )
                     self._failure_count = 0
 
+    def _on_abandon(self) -> None:
+        """Release the HALF_OPEN slot of a request that ended without an outcome."""
+        with self._lock:
+            if (
+                self._state == CircuitBreakerState.HALF_OPEN
+                and self._half_open_requests > 0
+            ):
+                self._half_open_requests -= 1
+
     def _on_failure(self, exception: Exception) -> None:
         """Handle failed request."""
         with self._lock:
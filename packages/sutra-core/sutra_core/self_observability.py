@@ -21,9 +21,11 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 from contextlib import contextmanager
 
+from .events import EventAggregator, store_rollups
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +101,9 @@ class SelfObserver:
     - Predictive monitoring: "Will this query likely fail?"
     - Root cause analysis through path finding
     """
+
+    # Component name of this observer's event rollups
+    COMPONENT = "self_observer"
     
     def __init__(
         self,
@@ -121,9 +126,8 @@ class SelfObserver:
         self.latency_threshold_ms = latency_threshold_ms
         self.confidence_threshold = confidence_threshold
         
-        # In-memory buffer for batch learning
-        self._event_buffer: List[ObservabilityEvent] = []
-        self._buffer_size_limit = 100
+        # Per-minute/hour rollups; only exemplars and failures are stored individually
+        self._aggregator = EventAggregator()
         
         logger.info(
             f"Self-observer initialized (learning={'ON' if enable_learning else 'OFF'}, "
@@ -132,44 +136,76 @@ class SelfObserver:
         )
     
     def record_event(self, event: ObservabilityEvent):
-        """Record observability event into knowledge graph."""
+        """
+        Record observability event into knowledge graph.
+
+        Events are rolled up per event type and minute; only exemplars and
+        failures are stored as individual concepts (see events.EventAggregator).
+        """
         if not self.enable_learning:
             return
         
         try:
-            # Convert event to natural language concept
-            concept_content = event.to_concept()
-            
-            # Generate stable concept ID based on event
-            event_id = self._generate_event_id(event)
-            
-            # Store as concept with metadata
-            from ..graph.concepts import Concept
-            concept = Concept(
-                id=event_id,
-                content=concept_content,
-                confidence=1.0,
-                strength=1.0,
-                source="self_observability",
-                category=f"observability_{event.event_type.value}",
-                created=event.timestamp,
-                last_accessed=event.timestamp,
-                access_count=1,
-            )
-            
-            # Learn into storage (non-blocking)
-            self.storage.add_concept(concept)
-            
-            # Create associations for pattern detection
-            self._create_event_associations(event, event_id)
-            
-            logger.debug(
-                f"Recorded observability event: {event.event_type.value} -> {event_id[:8]}"
+            individual = self._aggregator.add(
+                self.COMPONENT,
+                event.event_type.value,
+                event.timestamp,
+                event.success,
+                event.duration_ms,
+                event.error_message,
             )
+            if individual:
+                self._write_event(event)
+            self._write_rollups()
             
         except Exception as e:
             # Never let observability crash the main system
             logger.warning(f"Failed to record observability event: {e}")
+
+    def flush(self) -> None:
+        """Write rollups of all buckets, including the still-open ones."""
+        if not self.enable_learning:
+            return
+        try:
+            self._write_rollups(include_open=True)
+        except Exception as e:
+            logger.warning(f"Failed to flush observability rollups: {e}")
+
+    def _write_event(self, event: ObservabilityEvent):
+        # Convert event to natural language concept
+        concept_content = event.to_concept()
+        
+        # Generate stable concept ID based on event
+        event_id = self._generate_event_id(event)
+        
+        # Store as concept with metadata
+        from .graph.concepts import Concept
+        concept = Concept(
+            id=event_id,
+            content=concept_content,
+            confidence=1.0,
+            strength=1.0,
+            source="self_observability",
+            category=f"observability_{event.event_type.value}",
+            created=event.timestamp,
+            last_accessed=event.timestamp,
+            access_count=1,
+        )
+        
+        # Learn into storage (events carry no embedding)
+        self.storage.add_concept(concept, None)
+        
+        # Create associations for pattern detection
+        self._create_event_associations(event, event_id)
+        
+        logger.debug(
+            f"Recorded observability event: {event.event_type.value} -> {event_id[:8]}"
+        )
+
+    def _write_rollups(self, include_open: bool = False):
+        items = self._aggregator.drain(include_open=include_open)
+        if items:
+            store_rollups(self.storage, items)
     
     def _generate_event_id(self, event: ObservabilityEvent) -> str:
         """Generate stable ID for event."""
@@ -185,13 +221,13 @@ class SelfObserver:
         type_concept_id = f"event_type_{event.event_type.value}"
         
         # Create association: event -> type
-        from ..graph.concepts import Association, AssociationType
+        from .graph.concepts import Association, AssociationType
         assoc = Association(
             source_id=event_id,
             target_id=type_concept_id,
-            assoc_type=AssociationType.CATEGORICAL,
+            assoc_type=AssociationType.HIERARCHICAL,
             confidence=1.0,
-            strength=1.0,
+            weight=1.0,
         )
         self.storage.add_association(assoc)
         
@@ -205,7 +241,7 @@ class SelfObserver:
                 target_id=error_concept_id,
                 assoc_type=AssociationType.CAUSAL,
                 confidence=0.9,
-                strength=1.0,
+                weight=1.0,
             )
             self.storage.add_association(error_assoc)
     
@@ -8,9 +8,11 @@ expected by ReasoningEngine and learning components.
 import logging
 import time
 import uuid
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Any
 
+from ..exceptions import PartialWriteError
 from ..graph.concepts import Association, Concept, AssociationType
+from ..utils.profiling import record_rpc
 from ..config.system import (
     association_type_to_int,
     int_to_association_type,
@@ -20,6 +22,102 @@ from ..config.system import (
 logger = logging.getLogger(__name__)
 
 
+def _embedding_list(embedding) -> list:
+    """Embedding as a plain list (numpy arrays converted, None -> no vector)."""
+    if hasattr(embedding, 'tolist'):
+        return embedding.tolist()
+    if isinstance(embedding, list):
+        return embedding
+    return []
+
+
+def _concept_from_result(result: Optional[Dict]) -> Optional[Concept]:
+    """Concept from a StorageClient query result (None if not found)."""
+    if not result:
+        return None
+    return Concept(
+        id=result["id"],
+        content=result["content"],
+        confidence=result.get("confidence", 1.0),
+        strength=result.get("strength", 1.0),
+        source=result.get("source"),
+        category=result.get("category"),
+        created=result.get("created", 0.0),
+        last_accessed=result.get("last_accessed", 0.0),
+        access_count=result.get("access_count", 0),
+    )
+
+
+class _StorageMetricsHook:
+    """
+    StorageClient hook feeding the internal metrics collector.
+
+    Exports sutra_storage_rpc_* metrics per request variant and attributes
+    each request to the current stage of a sampled request profile.
+    """
+
+    def __init__(self):
+        self.collector = None
+        try:
+            from ..monitoring.internal_metrics import HISTOGRAM, get_metrics_collector
+        except ImportError as e:
+            logger.debug(f"Storage RPC metrics not exported: {e}")
+            return
+        self.collector = get_metrics_collector()
+        self._histogram = HISTOGRAM
+        self._keys: Dict[Tuple[str, str], Tuple] = {}
+        self._retries = self.collector.metric_key("sutra_storage_rpc_retries_total")
+        self._reconnects = {
+            success: self.collector.metric_key(
+                "sutra_storage_rpc_reconnects_total",
+                {"outcome": "success" if success else "failure"},
+            )
+            for success in (True, False)
+        }
+
+    def _variant_keys(self, variant: str, status: str) -> Tuple:
+        keys = self._keys.get((variant, status))
+        if keys is None:
+            collector = self.collector
+            labels = {"variant": variant}
+            keys = self._keys[(variant, status)] = (
+                collector.metric_key(
+                    "sutra_storage_rpc_requests_total", {**labels, "status": status}
+                ),
+                collector.metric_key(
+                    "sutra_storage_rpc_duration_seconds", labels, self._histogram
+                ),
+                collector.metric_key(
+                    "sutra_storage_rpc_bytes_total", {**labels, "direction": "sent"}
+                ),
+                collector.metric_key(
+                    "sutra_storage_rpc_bytes_total", {**labels, "direction": "received"}
+                ),
+            )
+        return keys
+
+    def on_request_start(self, variant: str) -> None:
+        return None
+
+    def on_request_end(self, state, event) -> None:
+        record_rpc(event.bytes_sent, event.bytes_received)
+        if self.collector is None:
+            return
+        requests, duration, sent, received = self._variant_keys(event.variant, event.status)
+        self.collector.inc(requests)
+        self.collector.observe(duration, event.duration_seconds)
+        self.collector.inc(sent, event.bytes_sent)
+        self.collector.inc(received, event.bytes_received)
+
+    def on_retry(self, attempt: int, error: BaseException) -> None:
+        if self.collector is not None:
+            self.collector.inc(self._retries)
+
+    def on_reconnect(self, success: bool) -> None:
+        if self.collector is not None:
+            self.collector.inc(self._reconnects[success])
+
+
 class TcpStorageAdapter:
     """
     TCP-based storage adapter for distributed deployments.
@@ -27,22 +125,36 @@ class TcpStorageAdapter:
     Simple wrapper around StorageClient from sutra-storage-client-tcp.
     """
 
-    def __init__(self, server_address: str, vector_dimension: int = 768):
+    def __init__(
+        self,
+        server_address: str,
+        vector_dimension: int = 768,
+        slow_request_threshold_ms: Optional[float] = None,
+        hooks: Sequence[Any] = (),
+    ):
         """
         Initialize TCP storage adapter.
 
         Args:
             server_address: Storage server address (host:port)
             vector_dimension: Vector dimension for HNSW
+            slow_request_threshold_ms: Log storage requests slower than this
+                (None = disabled)
+            hooks: Extra StorageClient RpcHooks (e.g. a tracer); storage RPC
+                metrics are always exported to the internal metrics collector
         """
         self.server_address = server_address
         self.vector_dimension = vector_dimension
+        self.slow_request_threshold_ms = slow_request_threshold_ms
         self.client = None
         
         # Import the client class
         try:
-            from sutra_storage_client import StorageClient
+            from sutra_storage_client import ClientMetrics, StorageClient
             self.StorageClient = StorageClient
+            # Shared by every client instance so totals survive reconnects
+            self._client_metrics = ClientMetrics()
+            self._hooks = [_StorageMetricsHook(), *hooks]
         except ImportError as e:
             logger.error(f"Failed to import TCP storage client: {e}")
             raise RuntimeError(f"TCP storage client not available: {e}")
@@ -55,7 +167,12 @@ class TcpStorageAdapter:
         try:
             if self.client:
                 self.client.close()
-            self.client = self.StorageClient(self.server_address)
+            self.client = self.StorageClient(
+                self.server_address,
+                hooks=self._hooks,
+                slow_request_threshold_ms=self.slow_request_threshold_ms,
+                metrics=self._client_metrics,
+            )
             logger.info(f"TCP storage client connected to {self.server_address}")
         except Exception as e:
             logger.error(f"Failed to connect TCP storage client: {e}")
@@ -70,6 +187,7 @@ class TcpStorageAdapter:
             except (ConnectionError, BrokenPipeError, OSError) as e:
                 logger.warning(f"TCP connection lost (attempt {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
+                    self.client.record_retry(attempt + 1, e)
                     # Exponential backoff using system config
                     delay = SYSTEM_CONFIG.TCP_RETRY_BACKOFF_BASE * (2 ** attempt)
                     logger.info(f"Waiting {delay}s before reconnection attempt...")
@@ -80,7 +198,9 @@ class TcpStorageAdapter:
                         self._connect()
                     except Exception as reconnect_error:
                         logger.error(f"Reconnection failed: {reconnect_error}")
+                        self.client.record_reconnect(False)
                         continue
+                    self.client.record_reconnect(True)
                 else:
                     logger.error(f"All {max_retries} connection attempts failed")
                     raise
@@ -130,13 +250,7 @@ class TcpStorageAdapter:
 
     def add_concept(self, concept: Concept, embedding) -> None:
         """Add concept with its embedding via TCP storage server."""
-        # Convert embedding to list if it's numpy array
-        if hasattr(embedding, 'tolist'):
-            embedding_list = embedding.tolist()
-        elif isinstance(embedding, list):
-            embedding_list = embedding
-        else:
-            embedding_list = []
+        embedding_list = _embedding_list(embedding)
             
         def _operation():
             return self.client.learn_concept(
@@ -155,6 +269,32 @@ class TcpStorageAdapter:
             logger.error(f"Failed to add concept via TCP: {e}")
             raise
 
+    def add_concepts(self, items: List[Tuple[Concept, Any]]) -> int:
+        """
+        Add many (concept, embedding) pairs, pipelined on the open connection.
+
+        Every concept is attempted, as in add_associations().
+
+        Returns:
+            Number of concepts written
+
+        Raises:
+            PartialWriteError: If any concept was not stored (the rest are)
+        """
+        requests = [
+            (
+                concept.id,
+                concept.content,
+                _embedding_list(embedding),
+                concept.strength,
+                concept.confidence,
+            )
+            for concept, embedding in items
+        ]
+        return self._write_many(
+            "concepts", lambda: self.client.learn_concepts(requests), len(requests)
+        )
+
     def learn_association(
         self,
         source_id: str,
@@ -203,33 +343,87 @@ class TcpStorageAdapter:
             logger.error(f"Failed to add association via TCP: {e}")
             raise
 
+    def add_associations(self, associations: List[Association]) -> int:
+        """
+        Add many associations, pipelined on the open connection.
+
+        Every association is attempted; each is still its own server request,
+        but the round trips are shared (see StorageClient.pipeline).
+
+        Returns:
+            Number of associations written
+
+        Raises:
+            PartialWriteError: If any association was not stored (the rest are)
+        """
+        requests = [
+            (
+                a.source_id,
+                a.target_id,
+                association_type_to_int(a.assoc_type),
+                a.confidence,
+            )
+            for a in associations
+        ]
+        return self._write_many(
+            "associations", lambda: self.client.learn_associations(requests), len(requests)
+        )
+
+    def _write_many(self, what: str, operation, count: int) -> int:
+        """Run a pipelined multi-item write; raise PartialWriteError on failures."""
+        if not count:
+            return 0
+        try:
+            results = self._execute_with_retry(operation)
+        except Exception as e:
+            raise PartialWriteError(
+                f"Failed to add {count} {what} via TCP: {e}",
+                written=0,
+                failed=list(range(count)),
+            ) from e
+
+        failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+        written = count - len(failed)
+        logger.debug(f"Added {written}/{count} {what} via TCP")
+        if failed:
+            raise PartialWriteError(
+                f"Failed to add {len(failed)}/{count} {what} via TCP: {results[failed[0]]}",
+                written=written,
+                failed=failed,
+            )
+        return written
+
     def get_concept(self, concept_id: str) -> Optional[Concept]:
         """Get concept by ID via TCP storage server."""
         def _operation():
             return self.client.query_concept(concept_id)
             
         try:
-            result = self._execute_with_retry(_operation)
-            
-            if not result:
-                return None
-            
-            return Concept(
-                id=result["id"],
-                content=result["content"],
-                confidence=result.get("confidence", 1.0),
-                strength=result.get("strength", 1.0),
-                source=result.get("source"),
-                category=result.get("category"),
-                created=result.get("created", 0.0),
-                last_accessed=result.get("last_accessed", 0.0),
-                access_count=result.get("access_count", 0),
-            )
+            return _concept_from_result(self._execute_with_retry(_operation))
             
         except Exception as e:
             logger.error(f"Failed to get concept {concept_id[:8]} via TCP: {e}")
             return None
 
+    def get_concepts(self, concept_ids: Iterable[str]) -> Dict[str, Optional[Concept]]:
+        """
+        Fetch many concepts, pipelined on the open connection.
+
+        Duplicate IDs are fetched once.
+
+        Returns:
+            Mapping of concept ID to Concept (None if missing or on failure)
+        """
+        unique = list(dict.fromkeys(concept_ids))
+        if not unique:
+            return {}
+        try:
+            results = self._execute_with_retry(lambda: self.client.query_concepts(unique))
+        except Exception as e:
+            logger.error(f"Failed to get {len(unique)} concepts via TCP: {e}")
+            return dict.fromkeys(unique)
+        return {cid: _concept_from_result(result) for cid, result in zip(unique, results)}
+
     def get_neighbors(self, concept_id: str) -> List[str]:
         """Get neighboring concept IDs via TCP storage server."""
         def _operation():
@@ -385,6 +579,25 @@ class TcpStorageAdapter:
             logger.error(f"Failed to check existence for {concept_id[:8]} via TCP: {e}")
             return False
 
+    def contains_many(self, concept_ids: Iterable[str]) -> Set[str]:
+        """
+        Check existence of many concepts, pipelined on the open connection.
+
+        Duplicate IDs are checked once.
+
+        Returns:
+            Subset of ``concept_ids`` that exist in storage
+        """
+        unique = list(dict.fromkeys(concept_ids))
+        if not unique:
+            return set()
+        try:
+            results = self._execute_with_retry(lambda: self.client.query_concepts(unique))
+        except Exception as e:
+            logger.error(f"Failed to check existence for {len(unique)} concepts via TCP: {e}")
+            return set()
+        return {cid for cid, result in zip(unique, results) if result is not None}
+
     def stats(self) -> Dict[str, Any]:
         """Get storage statistics via TCP storage server."""
         def _operation():
@@ -421,6 +634,10 @@ class TcpStorageAdapter:
             logger.error(f"TCP health check failed: {e}")
             return {"status": "unhealthy", "error": str(e)}
 
+    def metrics(self) -> Dict[str, Any]:
+        """Storage client request metrics (per variant), across reconnects."""
+        return self._client_metrics.snapshot()
+
     def close(self) -> None:
         """Close TCP connection."""
         try:
@@ -12,10 +12,14 @@ Features:
 - Negation detection (spaCy)
 - High-performance embeddings (sentence-transformers)
 - Multi-language support (extensible)
+- Bounded parsed-document cache shared by all extraction stages
 """
 
+import hashlib
 import logging
-from typing import List, Literal, Optional, Set, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, List, Literal, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -42,15 +46,27 @@ class TextProcessor:
         spacy_model: str = "en_core_web_sm",
         embedding_model: str = "all-MiniLM-L6-v2",
         disable_spacy: Optional[List[str]] = None,
+        doc_cache_size: int = 1024,
     ):
         """
         Initialize text processor with spaCy for NLP and sentence-transformers for embeddings.
 
+        Prefer get_text_processor() over constructing instances directly;
+        every instance loads its own spaCy and sentence-transformers models.
+
         Args:
             spacy_model: spaCy model name (default: en_core_web_sm, used for tokenization only)
             embedding_model: sentence-transformers model (default: all-MiniLM-L6-v2, 384-dim)
             disable_spacy: Pipeline components to disable for speed (recommend: ["ner"] if not needed)
+            doc_cache_size: Parsed documents kept in the LRU cache (0 disables caching)
         """
+        # Parsed Doc cache keyed by content hash, shared by all extraction methods
+        self.doc_cache_size = doc_cache_size
+        self._doc_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._doc_cache_lock = threading.Lock()
+        self.doc_cache_hits = 0
+        self.doc_cache_misses = 0
+
         # Initialize spaCy for text processing (but NOT for embeddings)
         try:
             import spacy
@@ -110,6 +126,103 @@ class TextProcessor:
                 f"Failed to load embedding model '{embedding_model}': {e}"
             )
 
+    def parse(self, text: str):
+        """
+        Parse text with spaCy, reusing a cached Doc for repeated text.
+
+        Every extraction method goes through here, so a document that is
+        tokenized, chunked and entity-tagged is parsed only once. Callers
+        must treat the returned Doc as read-only.
+
+        Args:
+            text: Input text
+
+        Returns:
+            spaCy Doc
+        """
+        if self.doc_cache_size <= 0:
+            return self.nlp(text)
+
+        key = self._doc_key(text)
+        doc = self._cached_doc(key)
+        if doc is not None:
+            return doc
+
+        # Parse outside the lock; a concurrent duplicate parse is harmless
+        doc = self.nlp(text)
+        self._cache_doc(key, doc)
+        return doc
+
+    def parse_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        n_process: int = 1,
+        disable: Sequence[str] = (),
+    ) -> List[Any]:
+        """
+        Parse many texts with ``nlp.pipe``, in input order.
+
+        Cached Docs are reused. Docs parsed with the full pipeline are added
+        to the cache; Docs parsed with ``disable`` are not, since later
+        stages may need the disabled components.
+
+        Args:
+            texts: Input texts
+            batch_size: Texts per spaCy batch
+            n_process: Worker processes for spaCy (1 = in-process)
+            disable: Pipeline components to skip for this batch
+
+        Returns:
+            List of spaCy Docs aligned with ``texts``
+        """
+        disable = [name for name in disable if name in self.nlp.pipe_names]
+        use_cache = self.doc_cache_size > 0
+        docs: List[Any] = [None] * len(texts)
+
+        # Group duplicate texts so each distinct text is parsed at most once
+        pending: "OrderedDict[str, List[int]]" = OrderedDict()
+        for i, text in enumerate(texts):
+            doc = self._cached_doc(self._doc_key(text)) if use_cache else None
+            if doc is not None:
+                docs[i] = doc
+            else:
+                pending.setdefault(text, []).append(i)
+
+        if pending:
+            parsed = self.nlp.pipe(
+                list(pending),
+                batch_size=batch_size,
+                n_process=n_process,
+                disable=disable,
+            )
+            for (text, indices), doc in zip(pending.items(), parsed):
+                if use_cache and not disable:
+                    self._cache_doc(self._doc_key(text), doc)
+                for i in indices:
+                    docs[i] = doc
+
+        return docs
+
+    @staticmethod
+    def _doc_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cached_doc(self, key: bytes):
+        with self._doc_cache_lock:
+            doc = self._doc_cache.get(key)
+            if doc is not None:
+                self._doc_cache.move_to_end(key)
+                self.doc_cache_hits += 1
+            return doc
+
+    def _cache_doc(self, key: bytes, doc) -> None:
+        with self._doc_cache_lock:
+            self.doc_cache_misses += 1
+            self._doc_cache[key] = doc
+            while len(self._doc_cache) > self.doc_cache_size:
+                self._doc_cache.popitem(last=False)
+
     def extract_meaningful_tokens(
         self, text: str, min_length: int = 2, include_entities: bool = True
     ) -> List[str]:
@@ -127,7 +240,35 @@ class TextProcessor:
         if not text or not text.strip():
             return []
 
-        doc = self.nlp(text)
+        return self._tokens_from_doc(self.parse(text), min_length, include_entities)
+
+    def extract_meaningful_tokens_batch(
+        self,
+        texts: List[str],
+        min_length: int = 2,
+        include_entities: bool = True,
+        batch_size: int = 64,
+        n_process: int = 1,
+    ) -> List[List[str]]:
+        """
+        Batch version of extract_meaningful_tokens() using ``nlp.pipe``.
+
+        The dependency parser is skipped; tokens only need tags, lemmas
+        and entities.
+
+        Returns:
+            One token list per input text
+        """
+        docs = self._pipe_nonempty(texts, batch_size, n_process, ("parser",))
+        return [
+            self._tokens_from_doc(doc, min_length, include_entities)
+            if doc is not None
+            else []
+            for doc in docs
+        ]
+
+    @staticmethod
+    def _tokens_from_doc(doc, min_length: int, include_entities: bool) -> List[str]:
         tokens: List[str] = []
 
         # Add named entities first (as multi-word units)
@@ -162,9 +303,31 @@ class TextProcessor:
         if not text or not text.strip():
             return []
 
-        doc = self.nlp(text)
+        doc = self.parse(text)
         return [(ent.text, ent.label_) for ent in doc.ents]
 
+    def extract_entities_batch(
+        self, texts: List[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[List[Tuple[str, str]]]:
+        """
+        Batch version of extract_entities() using ``nlp.pipe``.
+
+        Only the NER component runs.
+
+        Returns:
+            One (entity_text, entity_label) list per input text
+        """
+        docs = self._pipe_nonempty(
+            texts,
+            batch_size,
+            n_process,
+            ("tagger", "parser", "attribute_ruler", "lemmatizer"),
+        )
+        return [
+            [(ent.text, ent.label_) for ent in doc.ents] if doc is not None else []
+            for doc in docs
+        ]
+
     def extract_noun_chunks(self, text: str) -> List[str]:
         """
         Extract noun phrases/chunks from text.
@@ -178,9 +341,24 @@ class TextProcessor:
         if not text or not text.strip():
             return []
 
-        doc = self.nlp(text)
+        doc = self.parse(text)
         return [chunk.text.lower() for chunk in doc.noun_chunks]
 
+    def extract_noun_chunks_batch(
+        self, texts: List[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[List[str]]:
+        """
+        Batch version of extract_noun_chunks() using ``nlp.pipe`` (NER skipped).
+
+        Returns:
+            One noun chunk list per input text
+        """
+        docs = self._pipe_nonempty(texts, batch_size, n_process, ("ner",))
+        return [
+            [chunk.text.lower() for chunk in doc.noun_chunks] if doc is not None else []
+            for doc in docs
+        ]
+
     def detect_negation(self, text: str) -> bool:
         """
         Detect if text contains negation.
@@ -194,7 +372,7 @@ class TextProcessor:
         if not text or not text.strip():
             return False
 
-        doc = self.nlp(text)
+        doc = self.parse(text)
 
         # Check for negation dependencies
         for token in doc:
@@ -220,7 +398,7 @@ class TextProcessor:
         if not text or not text.strip():
             return []
 
-        doc = self.nlp(text)
+        doc = self.parse(text)
         triples: List[Tuple[str, str, str, bool]] = []
 
         # Find root verbs
@@ -260,7 +438,41 @@ class TextProcessor:
         if not text or not text.strip():
             return []
 
-        doc = self.nlp(text)
+        return self._causal_from_doc(self.parse(text))
+
+    def extract_causal_relations_batch(
+        self, texts: List[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[List[Tuple[str, str, bool]]]:
+        """
+        Batch version of extract_causal_relations() using ``nlp.pipe`` (NER skipped).
+
+        Returns:
+            One (cause, effect, is_negated) list per input text
+        """
+        docs = self._pipe_nonempty(texts, batch_size, n_process, ("ner",))
+        return [self._causal_from_doc(doc) if doc is not None else [] for doc in docs]
+
+    def _pipe_nonempty(
+        self,
+        texts: List[str],
+        batch_size: int,
+        n_process: int,
+        disable: Sequence[str],
+    ) -> List[Any]:
+        """parse_batch() over non-blank texts; blank texts map to None."""
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        docs: List[Any] = [None] * len(texts)
+        parsed = self.parse_batch(
+            [texts[i] for i in indices],
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=disable,
+        )
+        for i, doc in zip(indices, parsed):
+            docs[i] = doc
+        return docs
+
+    def _causal_from_doc(self, doc) -> List[Tuple[str, str, bool]]:
         causal_relations: List[Tuple[str, str, bool]] = []
 
         # Causal verbs and markers
@@ -432,18 +644,44 @@ class TextProcessor:
             return intersection / union if union > 0 else 0.0
 
 
-# Backward compatibility: Simple functions for existing code
+# Process-wide shared processor (models are loaded once)
 _default_processor: Optional[TextProcessor] = None
+_default_processor_error: Optional[Exception] = None
+_default_processor_lock = threading.Lock()
 
 
-def _get_processor() -> TextProcessor:
-    """Get or create default text processor."""
-    global _default_processor
-    if _default_processor is None:
-        _default_processor = TextProcessor()
+def get_text_processor() -> TextProcessor:
+    """
+    Get the process-wide shared TextProcessor, creating it on first use.
+
+    A missing dependency or model (ImportError/OSError) is remembered and
+    re-raised on later calls instead of retrying the model load every time;
+    other failures are not cached, so the next call retries.
+
+    Raises:
+        ImportError: If spaCy or sentence-transformers is not installed
+        OSError: If the spaCy model is not downloaded
+    """
+    global _default_processor, _default_processor_error
+    if _default_processor is not None:
+        return _default_processor
+
+    with _default_processor_lock:
+        if _default_processor is None:
+            if _default_processor_error is not None:
+                raise _default_processor_error
+            try:
+                _default_processor = TextProcessor()
+            except (ImportError, OSError) as e:
+                _default_processor_error = e
+                raise
     return _default_processor
 
 
+# Backward compatibility alias
+_get_processor = get_text_processor
+
+
 def extract_words(text: str) -> List[str]:
     """
     Extract meaningful words from text (backward compatible).
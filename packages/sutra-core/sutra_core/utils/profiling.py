@@ -0,0 +1,198 @@
+"""
+Per-request stage profiling.
+
+A RequestProfile records how long each stage of a request took (embedding,
+vector search, path finding, ...) and how many storage RPCs and bytes each
+stage issued. The active profile lives in a context variable, so layers
+deep in the call stack (QueryProcessor, PathFinder, TcpStorageAdapter) mark
+stages and RPCs without it being passed around:
+
+    with profile_request("ask", sample_rate=0.01) as profile:
+        with stage("embedding"):
+            ...
+
+When no profile is active (the request was not sampled), stage() returns a
+shared no-op context manager and record_rpc() returns immediately.
+
+Finished profiles are exported to the internal metrics collector as
+``sutra_request_stage_duration_seconds{request,stage}`` histograms and
+``sutra_request_stage_rpcs_total`` / ``sutra_request_stage_bytes_total``
+counters.
+"""
+
+import logging
+import random
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_active_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "sutra_request_profile", default=None
+)
+
+_NO_STAGE = nullcontext()
+
+
+@dataclass
+class StageStats:
+    """Accumulated cost of one stage within a request."""
+
+    calls: int = 0
+    duration_ms: float = 0.0
+    rpcs: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+class RequestProfile:
+    """
+    Stage timings and storage RPC counts of one request.
+
+    Stage durations include nested stages; RPCs are attributed to the
+    innermost open stage (or to the request itself outside any stage).
+    Not thread-safe; one profile per request.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: Dict[str, StageStats] = {}
+        self._open: List[str] = []
+        self._start = time.perf_counter()
+        self.total_ms: Optional[float] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage (re-entering a stage name accumulates into it)."""
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        stats.calls += 1
+        self._open.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.duration_ms += (time.perf_counter() - start) * 1000
+            self._open.pop()
+
+    def record_rpc(self, bytes_sent: int = 0, bytes_received: int = 0) -> None:
+        """Attribute one storage RPC to the innermost open stage."""
+        name = self._open[-1] if self._open else self.name
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        stats.rpcs += 1
+        stats.bytes_sent += bytes_sent
+        stats.bytes_received += bytes_received
+
+    def finish(self) -> None:
+        self.total_ms = (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly summary (for ConsensusResult.profile)."""
+        return {
+            "request": self.name,
+            "total_ms": self.total_ms,
+            "rpcs": sum(s.rpcs for s in self.stages.values()),
+            "stages": {name: asdict(stats) for name, stats in self.stages.items()},
+        }
+
+    def export_metrics(self) -> None:
+        """Publish stage histograms and RPC/byte counters to the metrics collector."""
+        try:
+            from ..monitoring.internal_metrics import get_metrics_collector
+        except ImportError:
+            return
+
+        collector = get_metrics_collector()
+        for name, stats in self.stages.items():
+            labels = {"request": self.name, "stage": name}
+            if stats.calls:
+                collector.histogram_observe(
+                    "sutra_request_stage_duration_seconds",
+                    stats.duration_ms / 1000,
+                    labels,
+                )
+            if stats.rpcs:
+                collector.counter_inc(
+                    "sutra_request_stage_rpcs_total", labels, stats.rpcs
+                )
+                collector.counter_inc(
+                    "sutra_request_stage_bytes_total",
+                    {**labels, "direction": "sent"},
+                    stats.bytes_sent,
+                )
+                collector.counter_inc(
+                    "sutra_request_stage_bytes_total",
+                    {**labels, "direction": "received"},
+                    stats.bytes_received,
+                )
+        if self.total_ms is not None:
+            collector.histogram_observe(
+                "sutra_request_duration_seconds",
+                self.total_ms / 1000,
+                {"request": self.name},
+            )
+
+
+@contextmanager
+def profile_request(
+    name: str, sample_rate: float = 1.0, force: bool = False
+) -> Iterator[Optional[RequestProfile]]:
+    """
+    Profile the enclosed request if it is sampled.
+
+    Nested calls reuse the outer profile. On exit a sampled profile is
+    finished and exported to the metrics collector.
+
+    Args:
+        name: Request kind, used as the ``request`` label (e.g. "ask")
+        sample_rate: Fraction of requests to profile (0.0 - 1.0)
+        force: Profile regardless of sample_rate
+
+    Yields:
+        The active RequestProfile, or None when not sampled
+    """
+    outer = _active_profile.get()
+    if outer is not None:
+        yield outer
+        return
+    if not force and (sample_rate <= 0.0 or random.random() >= sample_rate):
+        yield None
+        return
+
+    profile = RequestProfile(name)
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+        profile.finish()
+        try:
+            profile.export_metrics()
+        except Exception as e:
+            logger.debug(f"Failed to export request profile: {e}")
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """The profile of the request being handled, if it is sampled."""
+    return _active_profile.get()
+
+
+def stage(name: str):
+    """Context manager timing a stage of the current request (no-op if unsampled)."""
+    profile = _active_profile.get()
+    if profile is None:
+        return _NO_STAGE
+    return profile.stage(name)
+
+
+def record_rpc(bytes_sent: int = 0, bytes_received: int = 0) -> None:
+    """Count a storage RPC against the current request's innermost stage."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.record_rpc(bytes_sent, bytes_received)
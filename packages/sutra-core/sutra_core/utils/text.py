@@ -59,6 +59,12 @@ STOP_WORDS = frozenset(
 )
 
 
+# Precompiled patterns for the hot tokenization paths
+_WORD_RE = re.compile(r"\b\w+\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s\-.,;:!?()]")
+
+
 def extract_words(text: str) -> List[str]:
     """
     Extract meaningful words from text.
@@ -72,8 +78,7 @@ def extract_words(text: str) -> List[str]:
     Returns:
         List of filtered words
     """
-    # Simple tokenization - could be enhanced with NLP
-    words = re.findall(r"\b\w+\b", text.lower())
+    words = _WORD_RE.findall(text.lower())
 
     # Filter out very short words and common stop words (using module constant)
     return [w for w in words if len(w) > 2 and w not in STOP_WORDS]
@@ -131,10 +136,10 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _WHITESPACE_RE.sub(" ", text.strip())
 
     # Remove special characters that might interfere with parsing
-    text = re.sub(r"[^\w\s\-.,;:!?()]", "", text)
+    text = _SPECIAL_CHARS_RE.sub("", text)
 
     return text
 
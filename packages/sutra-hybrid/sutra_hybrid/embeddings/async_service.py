@@ -0,0 +1,257 @@
+"""
+Async Embedding Service Provider for the dedicated Sutra Embedding Service.
+
+Non-blocking counterpart of EmbeddingServiceProvider for async (FastAPI)
+callers and bulk embedding:
+- Splits large inputs into service-sized chunks
+- Sends chunks concurrently over a pooled HTTP/1.1 keep-alive client,
+  bounded by a concurrency limit
+- Reassembles results in input order
+- Protects the service with sutra_core's CircuitBreaker (one admission per
+  encode() call, however many chunks it sends)
+
+Throughput scales with the number of service replicas behind the URL.
+Requires httpx (``pip install sutra-hybrid[async]``).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sutra_core.resilience import CircuitBreaker, CircuitBreakerConfig
+
+from .service import (
+    BINARY_CONTENT_TYPE,
+    decode_binary_embeddings,
+    parse_json_embeddings,
+)
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying (same policy as the synchronous provider)
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class AsyncEmbeddingServiceProvider:
+    """
+    Async, concurrent embedding provider using the Sutra Embedding Service.
+
+    Usage:
+        >>> async with AsyncEmbeddingServiceProvider() as provider:
+        ...     embeddings = await provider.encode(texts)
+    """
+
+    def __init__(
+        self,
+        service_url: Optional[str] = None,
+        timeout: float = 30.0,
+        chunk_size: int = 64,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        binary_transport: bool = True,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Initialize async embedding service provider.
+
+        Args:
+            service_url: URL of the embedding service
+            timeout: Per-request timeout in seconds
+            chunk_size: Texts per /embed request (service max is 1000)
+            max_concurrency: Maximum in-flight /embed requests (and pooled
+                connections)
+            max_retries: Maximum retries per chunk on transport errors / 429 / 5xx
+            backoff_factor: Exponential backoff factor for retries
+            binary_transport: Request float32 binary responses (JSON fallback)
+            circuit_breaker: Breaker to use (default: a new "embedding_service"
+                breaker)
+
+        Raises:
+            ImportError: If httpx is not installed
+            ValueError: If chunk_size or max_concurrency is not positive
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for AsyncEmbeddingServiceProvider. "
+                "Install with: pip install httpx"
+            )
+
+        if chunk_size <= 0 or max_concurrency <= 0:
+            raise ValueError("chunk_size and max_concurrency must be positive")
+
+        self.service_url = service_url or os.getenv(
+            "SUTRA_EMBEDDING_SERVICE_URL", "http://sutra-embedding-service:8888"
+        )
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.expected_dim = int(os.getenv("SUTRA_VECTOR_DIMENSION", "768"))
+
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            name="embedding_service",
+            config=CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30),
+        )
+
+        self._httpx = httpx
+        # HTTP/1.1 keep-alive pool sized to the concurrency limit
+        self._client = httpx.AsyncClient(
+            base_url=self.service_url,
+            timeout=timeout,
+            http2=False,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            headers={
+                "Accept": (
+                    f"{BINARY_CONTENT_TYPE}, application/json;q=0.9"
+                    if binary_transport
+                    else "application/json"
+                )
+            },
+        )
+        # Created lazily so the provider can be constructed outside a loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        logger.info(
+            f"Initialized AsyncEmbeddingServiceProvider at {self.service_url} "
+            f"(chunk_size={chunk_size}, max_concurrency={max_concurrency})"
+        )
+
+    async def __aenter__(self) -> "AsyncEmbeddingServiceProvider":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        await self.aclose()
+        return False
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts into embeddings, chunked and in parallel.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            numpy array of shape (len(texts), dim), rows in input order
+
+        Raises:
+            RuntimeError: If a chunk cannot be embedded (after retries)
+            CircuitBreakerError: If the embedding service circuit is open
+            ValueError: If the service returns an invalid response
+        """
+        if not texts:
+            return np.array([], dtype=np.float32).reshape(0, self.expected_dim)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        start_time = time.time()
+        chunks = [
+            texts[i : i + self.chunk_size]
+            for i in range(0, len(texts), self.chunk_size)
+        ]
+
+        # One breaker admission for the whole request, so a many-chunk call
+        # cannot use up the HALF_OPEN test budget on its own
+        embeddings = await self.circuit_breaker.call_async(
+            lambda: self._encode_chunks(chunks)
+        )
+
+        logger.debug(
+            f"Generated {len(texts)} embeddings in {len(chunks)} chunks "
+            f"in {(time.time() - start_time) * 1000:.1f}ms"
+        )
+        return embeddings
+
+    async def encode_single(
+        self, text: str, prompt_name: Optional[str] = None
+    ) -> np.ndarray:
+        """Encode a single text (prompt_name ignored, for compatibility)."""
+        return (await self.encode([text]))[0]
+
+    async def _encode_chunks(self, chunks: List[List[str]]) -> np.ndarray:
+        # gather() preserves chunk order; on the first failure (or if we are
+        # cancelled) the sibling chunks are cancelled instead of left running
+        tasks = [asyncio.ensure_future(self._encode_chunk(c)) for c in chunks]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return results[0] if len(results) == 1 else np.vstack(results)
+
+    async def _encode_chunk(self, texts: List[str]) -> np.ndarray:
+        async with self._semaphore:
+            return await self._post_with_retry(texts)
+
+    async def _post_with_retry(self, texts: List[str]) -> np.ndarray:
+        httpx = self._httpx
+        payload = {"texts": texts, "normalize": True}
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+            try:
+                response = await self._client.post("/embed", json=payload)
+                if response.status_code in RETRYABLE_STATUS:
+                    last_error = RuntimeError(
+                        f"Embedding service returned {response.status_code}"
+                    )
+                    logger.warning(
+                        f"Embedding chunk attempt {attempt + 1}/{self.max_retries + 1} "
+                        f"got HTTP {response.status_code}"
+                    )
+                    continue
+                response.raise_for_status()
+                return self._parse_response(response, len(texts))
+            except httpx.TransportError as e:
+                last_error = e
+                logger.warning(
+                    f"Embedding chunk attempt {attempt + 1}/{self.max_retries + 1} "
+                    f"failed: {e}"
+                )
+            except httpx.HTTPStatusError as e:
+                raise RuntimeError(f"Failed to get embeddings from service: {e}")
+
+        raise RuntimeError(f"Failed to get embeddings from service: {last_error}")
+
+    def _parse_response(self, response: Any, expected_count: int) -> np.ndarray:
+        if response.headers.get("content-type", "").startswith(BINARY_CONTENT_TYPE):
+            embeddings = decode_binary_embeddings(response.content)
+        else:
+            result: Dict[str, Any] = response.json()
+            embeddings = parse_json_embeddings(result, self.expected_dim)
+
+        if embeddings.shape[0] != expected_count:
+            raise ValueError(
+                f"Expected {expected_count} embeddings, got {embeddings.shape[0]}"
+            )
+        if embeddings.shape[1] != self.expected_dim:
+            raise ValueError(
+                f"Expected {self.expected_dim}-dimensional embeddings, "
+                f"got {embeddings.shape[1]}-d"
+            )
+        return embeddings
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension."""
+        return self.expected_dim
+
+    def get_name(self) -> str:
+        """Get provider name."""
+        return "embedding-service-nomic-v1.5-async"
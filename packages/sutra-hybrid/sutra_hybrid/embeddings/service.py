@@ -3,13 +3,19 @@ Embedding Service Provider using dedicated Sutra Embedding Service.
 
 High-performance embedding provider that connects to the dedicated
 embedding service using nomic-embed-text-v1.5 for production deployments.
+
+Binary transport: /embed requests advertise ``Accept: application/octet-stream``.
+A service that honours it replies with a little-endian ``<uint32 rows,
+uint32 dim>`` header followed by ``rows * dim`` float32 values, decoded
+zero-copy with ``np.frombuffer``. JSON responses are still accepted.
 """
 
 import json
 import logging
 import os
+import struct
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import requests
@@ -20,6 +26,56 @@ from .base import EmbeddingProvider
 
 logger = logging.getLogger(__name__)
 
+BINARY_CONTENT_TYPE = "application/octet-stream"
+# (rows, dimension) prefix of a binary /embed response
+BINARY_SHAPE_HEADER = struct.Struct("<II")
+
+
+def decode_binary_embeddings(payload: bytes) -> np.ndarray:
+    """
+    Decode a binary /embed response body into a (rows, dim) float32 array.
+
+    The returned array is a read-only view over ``payload`` (no copy).
+
+    Raises:
+        ValueError: If the payload size does not match its shape header
+    """
+    if len(payload) < BINARY_SHAPE_HEADER.size:
+        raise ValueError("Binary embedding payload shorter than shape header")
+
+    rows, dim = BINARY_SHAPE_HEADER.unpack_from(payload)
+    expected_size = BINARY_SHAPE_HEADER.size + rows * dim * 4
+    if len(payload) != expected_size:
+        raise ValueError(
+            f"Binary embedding payload is {len(payload)} bytes, "
+            f"expected {expected_size} for shape ({rows}, {dim})"
+        )
+
+    return np.frombuffer(
+        payload, dtype="<f4", count=rows * dim, offset=BINARY_SHAPE_HEADER.size
+    ).reshape(rows, dim)
+
+
+def parse_json_embeddings(result: Dict[str, Any], expected_dim: int) -> np.ndarray:
+    """
+    Validate a JSON /embed response and convert it to a float32 array.
+
+    Raises:
+        ValueError: If the response is malformed or has the wrong dimension
+    """
+    # Validate response format
+    if "embeddings" not in result:
+        raise ValueError(f"Invalid response format: missing 'embeddings' field")
+
+    # Try both 'dimension' (internal) and 'dimensions' (external service)
+    dimension = result.get("dimension") or result.get("dimensions")
+    if dimension != expected_dim:
+        raise ValueError(
+            f"Service returned {dimension}-d embeddings, expected {expected_dim}-d"
+        )
+
+    return np.array(result["embeddings"], dtype=np.float32)
+
 
 class EmbeddingServiceProvider(EmbeddingProvider):
     """
@@ -35,6 +91,7 @@ class EmbeddingServiceProvider(EmbeddingProvider):
         timeout: int = 30,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        binary_transport: bool = True,
     ):
         """
         Initialize embedding service provider.
@@ -44,6 +101,8 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries on failure
             backoff_factor: Exponential backoff factor for retries
+            binary_transport: Request float32 binary responses (falls back to
+                JSON when the service does not support them)
 
         Raises:
             ConnectionError: If cannot connect to embedding service
@@ -54,7 +113,18 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             or os.getenv("SUTRA_EMBEDDING_SERVICE_URL", "http://sutra-embedding-service:8888")
         )
         self.timeout = timeout
-        
+        self.binary_transport = binary_transport
+
+        # Expected dimension (Phase 0: Matryoshka support), read once
+        self.expected_dim = int(os.getenv("SUTRA_VECTOR_DIMENSION", "768"))
+        self._embed_headers = {
+            "Accept": (
+                f"{BINARY_CONTENT_TYPE}, application/json;q=0.9"
+                if binary_transport
+                else "application/json"
+            )
+        }
+
         # Configure requests session with connection pooling and retries
         self.session = requests.Session()
         
@@ -114,10 +184,12 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             info_data = info_response.json()
             logger.info(f"Embedding service info: {info_data}")
             
-            # Validate dimensions with a test embedding request
+            # Validate dimensions with a test embedding request (always JSON,
+            # the binary format carries no model name)
             test_response = self.session.post(
                 f"{self.service_url}/embed",
                 json={"texts": ["test validation"]},
+                headers={"Accept": "application/json"},
                 timeout=self.timeout
             )
             test_response.raise_for_status()
@@ -127,8 +199,7 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             dimension = test_data.get("dimension") or test_data.get("dimensions", 0)
             model = test_data.get("model", "")
             
-            # Get expected dimension from environment (Phase 0: Matryoshka support)
-            expected_dim = int(os.getenv("SUTRA_VECTOR_DIMENSION", "768"))
+            expected_dim = self.expected_dim
             
             if dimension != expected_dim:
                 raise ValueError(
@@ -157,7 +228,7 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             numpy array of shape (768,) - single embedding vector
         """
         result = self.encode([text])
-        return result[0] if len(result) > 0 else np.zeros(768, dtype=np.float32)
+        return result[0] if len(result) > 0 else np.zeros(self.expected_dim, dtype=np.float32)
     
     def encode(self, texts: List[str]) -> np.ndarray:
         """
@@ -174,7 +245,7 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             ValueError: If service returns invalid dimensions
         """
         if not texts:
-            return np.array([]).reshape(0, 768)
+            return np.array([], dtype=np.float32).reshape(0, self.expected_dim)
 
         start_time = time.time()
         
@@ -189,41 +260,34 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             response = self.session.post(
                 f"{self.service_url}/embed",
                 json=request_data,
+                headers=self._embed_headers,
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            # Parse response
-            result = response.json()
-            
-            # Validate response format
-            if "embeddings" not in result:
-                raise ValueError(f"Invalid response format: missing 'embeddings' field")
-            
-            # Get expected dimension from environment (Phase 0: Matryoshka support)
-            expected_dim = int(os.getenv("SUTRA_VECTOR_DIMENSION", "768"))
-            
-            if result.get("dimension") != expected_dim:
-                raise ValueError(
-                    f"Service returned {result.get('dimension')}-d embeddings, expected {expected_dim}-d"
-                )
-            
-            embeddings = result["embeddings"]
+            # Parse response (binary when the service supports it)
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith(BINARY_CONTENT_TYPE):
+                embeddings_array = decode_binary_embeddings(response.content)
+                result: Dict[str, Any] = {
+                    "processing_time_ms": float(
+                        response.headers.get("X-Processing-Time-Ms", 0)
+                    ),
+                }
+            else:
+                result = response.json()
+                embeddings_array = parse_json_embeddings(result, self.expected_dim)
             
             # Validate embedding count
-            if len(embeddings) != len(texts):
+            if embeddings_array.shape[0] != len(texts):
                 raise ValueError(
-                    f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                    f"Expected {len(texts)} embeddings, got {embeddings_array.shape[0]}"
                 )
             
-            # Convert to numpy array
-            embeddings_array = np.array(embeddings, dtype=np.float32)
-            
             # Validate dimensions
-            expected_dim = int(os.getenv("SUTRA_VECTOR_DIMENSION", "768"))
-            if embeddings_array.shape[1] != expected_dim:
+            if embeddings_array.shape[1] != self.expected_dim:
                 raise ValueError(
-                    f"Expected {expected_dim}-dimensional embeddings, got {embeddings_array.shape[1]}-d"
+                    f"Expected {self.expected_dim}-dimensional embeddings, got {embeddings_array.shape[1]}-d"
                 )
             
             # Log performance metrics
@@ -232,7 +296,7 @@ class EmbeddingServiceProvider(EmbeddingProvider):
             service_time = result.get("processing_time_ms", 0)
             
             logger.debug(
-                f"Generated {len(embeddings)} embeddings in {processing_time*1000:.1f}ms "
+                f"Generated {len(texts)} embeddings in {processing_time*1000:.1f}ms "
                 f"(service: {service_time:.1f}ms, cached: {cached_count})"
             )
             
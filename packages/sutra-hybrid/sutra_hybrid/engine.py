@@ -9,6 +9,7 @@ import hashlib
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -16,6 +17,7 @@ import numpy as np
 
 # Import ReasoningEngine from sutra-core (proper architecture)
 from sutra_core import ReasoningEngine
+from sutra_core.reasoning.context import QueryContext
 from sutra_core.reasoning.query import QueryProcessor
 # Using EmbeddingServiceProvider for all embedding operations
 
@@ -29,6 +31,7 @@ from .results import (
     MultiStrategyResult,
     ReasoningPathDetail,
 )
+from .result_store import ResultStore
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,9 @@ class SutraAI:
         self,
         storage_server: str = "storage-server:50051",
         enable_semantic: bool = True,
+        result_cache_size: int = 1000,
+        result_ttl_seconds: Optional[float] = 3600.0,
+        audit_log_path: Optional[str] = None,
     ) -> None:
         self.enable_semantic = enable_semantic
         # Use proper architecture: Hybrid -> Core -> Storage
@@ -87,7 +93,18 @@ class SutraAI:
         logger.info("Recreated QueryProcessor with EmbeddingServiceProvider")
         self._embedding_provider = self._init_embeddings(enable_semantic)
         self._explainer = ExplanationGenerator()
-        self._query_cache: Dict[str, ExplainableResult] = {}
+        # Bounded store for explain()/audit trail; optionally spills every
+        # record to an append-only audit log so old query IDs stay explainable
+        self._results = ResultStore(
+            max_entries=result_cache_size,
+            max_age_seconds=result_ttl_seconds,
+            spill_path=audit_log_path or os.getenv("SUTRA_AUDIT_LOG_PATH"),
+            explainer=self._explainer,
+        )
+        # Runs strategy-specific work concurrently in multi_strategy()
+        self._strategy_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="sutra-strategy"
+        )
         logger.info(
             "Initialized SutraAI (Hybrid->Core->Storage) with embeddings=%s",
             self._embedding_provider.get_name(),
@@ -149,15 +166,40 @@ class SutraAI:
         min_confidence: float = 0.0,
     ) -> ExplainableResult:
         start_time = time.time()
+
+        # One context per request: the query is embedded and vector-searched
+        # once and shared by core reasoning and the semantic boost below
+        context = QueryContext(query)
+
+        # Use ReasoningEngine for proper reasoning
+        core_result = self._core.ask(query, num_reasoning_paths=num_paths, context=context)
+
+        return self._build_result(
+            query,
+            core_result,
+            context,
+            start_time,
+            explain=explain,
+            semantic_boost=semantic_boost,
+            min_confidence=min_confidence,
+        )
+
+    def _build_result(
+        self,
+        query: str,
+        core_result,
+        context: QueryContext,
+        start_time: float,
+        explain: bool = True,
+        semantic_boost: bool = True,
+        min_confidence: float = 0.0,
+    ) -> ExplainableResult:
+        """Build (and cache) an ExplainableResult from a core reasoning result."""
         query_id = f"q_{uuid.uuid4().hex[:12]}"
 
         semantic_confidence = 0.0
         semantic_support: Optional[List[Dict[str, Any]]] = None
-        matched_concept: Optional[str] = None
 
-        # Use ReasoningEngine for proper reasoning
-        core_result = self._core.ask(query, num_reasoning_paths=num_paths)
-        
         # Extract answer and confidence from core result
         answer = core_result.primary_answer
         graph_confidence = core_result.confidence
@@ -165,9 +207,8 @@ class SutraAI:
         # Apply semantic boost if enabled
         if semantic_boost and self.enable_semantic:
             try:
-                qvec = self._embedding_provider.encode([query])[0]
-                # Use core's search capability
-                search_results = self._core.search_concepts(query, limit=5)
+                # Use core's search capability (reuses the context's embedding/hits)
+                search_results = self._core.search_concepts(query, limit=5, context=context)
                 if search_results:
                     semantic_confidence = search_results[0].get('relevance_score', 0.0)
                     semantic_support = [
@@ -238,41 +279,13 @@ class SutraAI:
             metadata={"query_id": query_id, "execution_time_ms": exec_ms},
         )
 
-        self._query_cache[query_id] = result
+        self._results.put(result)
         logger.info(
             f"Query {query_id} answered in {exec_ms:.1f}ms (confidence: {final_confidence:.2f})"
         )
         return result
 
     # --------------------------- Utilities --------------------------------
-    def multi_strategy(self, query: str) -> MultiStrategyResult:
-        # With gRPC-only architecture, we currently have one strategy (semantic)
-        semantic = self.ask(query, explain=True, semantic_boost=True)
-        return MultiStrategyResult(
-            query=query,
-            graph_only=semantic,  # Placeholder: graph handled by storage server
-            semantic_enhanced=semantic,
-            agreement_score=1.0,
-            recommended_strategy="semantic_only",
-            reasoning="Single available strategy in this service",
-        )
-
-    def get_audit_trail(self, limit: int = 10) -> List[Dict[str, Any]]:
-        entries = []
-        for qid, res in list(self._query_cache.items())[:limit]:
-            if res.audit_trail:
-                entries.append(
-                    {
-                        "query_id": qid,
-                        "timestamp": res.audit_trail.timestamp,
-                        "operation": "query",
-                        "input": {"query": res.audit_trail.query},
-                        "output": {"answer": res.answer},
-                        "confidence": res.confidence,
-                    }
-                )
-        return entries
-
     def get_stats(self) -> Dict[str, Any]:
         # Get stats from ReasoningEngine (proper architecture)
         s = self._core.get_system_stats()
@@ -286,7 +299,7 @@ class SutraAI:
             "average_strength": 1.0,  # Default value
             "semantic_enabled": self.enable_semantic,
             "version": "2.0.0",
-            "cached_queries": len(self._query_cache),
+            "cached_queries": len(self._results),
         }
 
     def save(self) -> None:
@@ -294,6 +307,8 @@ class SutraAI:
         self._core.save()
 
     def close(self) -> None:
+        self._strategy_executor.shutdown(wait=False)
+        self._results.close()
         try:
             self._core.close()
         except Exception:
@@ -315,7 +330,7 @@ class SutraAI:
         Returns:
             ExplainableResult with full explanation, or None if not found
         """
-        return self._query_cache.get(query_id)
+        return self._results.get(query_id)
 
     def multi_strategy(self, query: str) -> MultiStrategyResult:
         """
@@ -336,13 +351,33 @@ class SutraAI:
             >>> print(result.agreement_score)
             >>> print(result.recommended_strategy)
         """
-        # Strategy 1: Pure graph (no semantic)
-        graph_result = self.ask(query, explain=True, semantic_boost=False)
+        start_time = time.time()
+
+        # Both strategies share the same core reasoning result; only the
+        # semantic boost and explanation differ between them
+        context = QueryContext(query)
+        core_result = self._core.ask(query, context=context)
 
-        # Strategy 2: Semantic-enhanced
         if self.enable_semantic:
-            semantic_result = self.ask(query, explain=True, semantic_boost=True)
+            # Strategy 2: Semantic-enhanced (vector search runs in the background)
+            semantic_future = self._strategy_executor.submit(
+                self._build_result,
+                query,
+                core_result,
+                context,
+                start_time,
+                explain=True,
+                semantic_boost=True,
+            )
+            # Strategy 1: Pure graph (no semantic)
+            graph_result = self._build_result(
+                query, core_result, context, start_time, explain=True, semantic_boost=False
+            )
+            semantic_result = semantic_future.result()
         else:
+            graph_result = self._build_result(
+                query, core_result, context, start_time, explain=True, semantic_boost=False
+            )
             # If semantic not available, return same result
             semantic_result = graph_result
 
@@ -380,13 +415,15 @@ class SutraAI:
 
         Uses embeddings if available, falls back to word overlap.
         """
+        if answer1 == answer2:
+            return 1.0
+
         if not self.enable_semantic:
             return self._word_overlap_similarity(answer1, answer2)
 
         try:
-            # Use semantic embeddings for agreement
-            emb1 = self._embedding_provider.encode([answer1])[0]
-            emb2 = self._embedding_provider.encode([answer2])[0]
+            # Use semantic embeddings for agreement (one batched request)
+            emb1, emb2 = self._embedding_provider.encode([answer1, answer2])
 
             similarity = self._embedding_provider.similarity(emb1, emb2)
             return float(similarity)
@@ -418,18 +455,19 @@ class SutraAI:
         Returns:
             List of audit trail entries with timestamps, operations, and metadata
         """
-        # Return cached query results as audit trail
+        # Return recent stored query results as audit trail
         entries = []
-        for query_id, result in list(self._query_cache.items())[:limit]:
-            if result.audit_trail:
+        for record in self._results.recent(limit):
+            audit = record["audit"]
+            if audit:
                 entries.append(
                     {
-                        "query_id": query_id,
-                        "timestamp": result.audit_trail.timestamp,
+                        "query_id": record["query_id"],
+                        "timestamp": audit["timestamp"],
                         "operation": "query",
-                        "input": {"query": result.audit_trail.query},
-                        "output": {"answer": result.answer},
-                        "confidence": result.confidence,
+                        "input": {"query": audit["query"]},
+                        "output": {"answer": record["answer"]},
+                        "confidence": record["confidence"],
                     }
                 )
         return entries
@@ -0,0 +1,298 @@
+"""
+Bounded result store backing SutraAI.explain() and the audit trail.
+
+Keeps recent query results in memory with size- and age-based eviction.
+Results are stored compactly (paths, confidence breakdown, audit trail);
+explanation text is regenerated on lookup instead of being kept around.
+Optionally every record is appended to a JSON Lines audit log, indexed by
+query ID in an on-disk SQLite file next to it (``<log>.idx``), so evicted
+results can still be explained without keeping an entry per query in memory.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .explanation import ExplanationGenerator
+from .results import (
+    AuditTrail,
+    ConfidenceBreakdown,
+    ExplainableResult,
+    ReasoningPathDetail,
+)
+
+logger = logging.getLogger(__name__)
+
+# Index rows are committed in batches; rows lost in a crash are rebuilt
+# from the log tail past the last committed offset on the next start.
+INDEX_COMMIT_INTERVAL = 100
+
+
+class ResultStore:
+    """
+    LRU/TTL store of compact query results with optional append-only spill.
+
+    Thread-safe. Lookups that miss the in-memory store fall back to the
+    audit log (if configured) via its on-disk offset index.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_age_seconds: Optional[float] = 3600.0,
+        spill_path: Optional[str] = None,
+        explainer: Optional[ExplanationGenerator] = None,
+    ):
+        """
+        Initialize result store.
+
+        Args:
+            max_entries: Maximum results kept in memory
+            max_age_seconds: Evict in-memory results older than this
+                (None = no age limit)
+            spill_path: Optional JSON Lines file that receives every record
+            explainer: Generator used to rebuild explanation text on lookup
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.spill_path = spill_path
+        self._explainer = explainer or ExplanationGenerator()
+
+        self._lock = threading.Lock()
+        # query_id -> (stored_at monotonic time, compact record)
+        self._records: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.evictions = 0
+
+        # Spill log and its index (query_id -> byte offset of its latest line)
+        self._spill = None
+        self._index: Optional[sqlite3.Connection] = None
+        self._uncommitted = 0
+        if spill_path:
+            self._open_spill(spill_path)
+
+    # ------------------------------------------------------------------ API
+
+    def put(self, result: ExplainableResult) -> str:
+        """Store a result; returns its query ID."""
+        record = self._compact(result)
+        query_id = record["query_id"]
+
+        with self._lock:
+            self._records[query_id] = (time.monotonic(), record)
+            self._records.move_to_end(query_id)
+            self._evict_locked()
+            if self._spill is not None:
+                self._append_locked(record)
+
+        return query_id
+
+    def get(self, query_id: str) -> Optional[ExplainableResult]:
+        """Return the full result for ``query_id`` (memory first, then spill log)."""
+        with self._lock:
+            self._evict_locked()
+            entry = self._records.get(query_id)
+            record = entry[1] if entry else self._read_spilled_locked(query_id)
+
+        return self._expand(record) if record else None
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Return compact records of the most recent in-memory results, oldest first."""
+        with self._lock:
+            self._evict_locked()
+            records = [record for _, record in self._records.values()]
+        return records[-limit:] if limit > 0 else []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def close(self) -> None:
+        """Close the spill log and its index."""
+        with self._lock:
+            if self._index is not None:
+                self._index.commit()
+                self._index.close()
+                self._index = None
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    # ------------------------------------------------------------ internals
+
+    def _evict_locked(self) -> None:
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
+            self.evictions += 1
+
+        if self.max_age_seconds is None:
+            return
+
+        cutoff = time.monotonic() - self.max_age_seconds
+        while self._records:
+            stored_at, _ = next(iter(self._records.values()))
+            if stored_at >= cutoff:
+                break
+            self._records.popitem(last=False)
+            self.evictions += 1
+
+    def _open_spill(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._spill = open(path, "ab+")
+        self._index = sqlite3.connect(f"{path}.idx", check_same_thread=False)
+        self._index.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS records (
+                query_id TEXT PRIMARY KEY, offset INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY, value INTEGER NOT NULL
+            );
+            """
+        )
+
+        # Index lines appended after the last committed batch (or all of a
+        # log that predates its index)
+        indexed_to = self._get_indexed_to()
+        self._spill.seek(0, os.SEEK_END)
+        size = self._spill.tell()
+        if indexed_to > size:
+            logger.warning(f"Audit log {path} is shorter than its index; reindexing")
+            self._index.execute("DELETE FROM records")
+            indexed_to = 0
+        if indexed_to < size:
+            count = 0
+            self._spill.seek(indexed_to)
+            offset = indexed_to
+            for line in self._spill:
+                try:
+                    self._index_record(json.loads(line)["query_id"], offset)
+                    count += 1
+                except (ValueError, KeyError):
+                    logger.warning(f"Skipping corrupt audit record at offset {offset}")
+                offset += len(line)
+            self._set_indexed_to(offset)
+            logger.info(f"Indexed {count} audit records from {path}")
+        self._index.commit()
+
+    def _get_indexed_to(self) -> int:
+        row = self._index.execute(
+            "SELECT value FROM meta WHERE key = 'indexed_to'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _set_indexed_to(self, offset: int) -> None:
+        self._index.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('indexed_to', ?)",
+            (offset,),
+        )
+
+    def _index_record(self, query_id: str, offset: int) -> None:
+        self._index.execute(
+            "INSERT OR REPLACE INTO records (query_id, offset) VALUES (?, ?)",
+            (query_id, offset),
+        )
+
+    def _append_locked(self, record: Dict[str, Any]) -> None:
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        try:
+            self._spill.seek(0, os.SEEK_END)
+            offset = self._spill.tell()
+            self._spill.write(line)
+            self._spill.flush()
+        except OSError as e:
+            logger.warning(f"Failed to append audit record: {e}")
+            return
+
+        try:
+            self._index_record(record["query_id"], offset)
+            self._set_indexed_to(offset + len(line))
+            self._uncommitted += 1
+            if self._uncommitted >= INDEX_COMMIT_INTERVAL:
+                self._index.commit()
+                self._uncommitted = 0
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to index audit record: {e}")
+
+    def _read_spilled_locked(self, query_id: str) -> Optional[Dict[str, Any]]:
+        if self._index is None or self._spill is None:
+            return None
+        try:
+            row = self._index.execute(
+                "SELECT offset FROM records WHERE query_id = ?", (query_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._spill.seek(row[0])
+            return json.loads(self._spill.readline())
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.warning(f"Failed to read audit record {query_id}: {e}")
+            return None
+
+    @staticmethod
+    def _compact(result: ExplainableResult) -> Dict[str, Any]:
+        metadata = result.metadata or {}
+        query_id = metadata.get("query_id") or (
+            result.audit_trail.query_id if result.audit_trail else None
+        )
+        if not query_id:
+            raise ValueError("Result has no query_id")
+
+        return {
+            "query_id": query_id,
+            "answer": result.answer,
+            "confidence": result.confidence,
+            "explained": result.explanation is not None,
+            "paths": [asdict(p) for p in result.reasoning_paths or []],
+            "breakdown": (
+                asdict(result.confidence_breakdown)
+                if result.confidence_breakdown
+                else None
+            ),
+            "semantic_support": result.semantic_support,
+            "audit": asdict(result.audit_trail) if result.audit_trail else None,
+            "metadata": metadata,
+        }
+
+    def _expand(self, record: Dict[str, Any]) -> ExplainableResult:
+        paths = [ReasoningPathDetail(**p) for p in record["paths"]]
+        breakdown = (
+            ConfidenceBreakdown(**record["breakdown"]) if record["breakdown"] else None
+        )
+        audit = AuditTrail(**record["audit"]) if record["audit"] else None
+
+        explanation = None
+        if record["explained"]:
+            explanation = self._explainer.generate(
+                query=audit.query if audit else "",
+                answer=record["answer"],
+                confidence=record["confidence"],
+                reasoning_paths=paths,
+                semantic_boost=audit.semantic_boost_used if audit else False,
+                semantic_contribution=(
+                    breakdown.semantic_confidence if breakdown else 0.0
+                ),
+            )
+
+        return ExplainableResult(
+            answer=record["answer"],
+            confidence=record["confidence"],
+            explanation=explanation,
+            reasoning_paths=paths or None,
+            confidence_breakdown=breakdown,
+            semantic_support=record["semantic_support"],
+            audit_trail=audit,
+            metadata=record["metadata"],
+        )
@@ -0,0 +1,174 @@
+"""Tests for the async, chunked embedding service provider."""
+
+import asyncio
+import logging
+
+import httpx
+import numpy as np
+import pytest
+from sutra_core.resilience import CircuitBreaker, CircuitBreakerConfig
+from sutra_hybrid.embeddings.async_service import AsyncEmbeddingServiceProvider
+from sutra_hybrid.embeddings.service import BINARY_CONTENT_TYPE, BINARY_SHAPE_HEADER
+
+DIM = 768
+
+
+def _binary_response(rows: np.ndarray) -> httpx.Response:
+    body = BINARY_SHAPE_HEADER.pack(*rows.shape) + rows.astype("<f4").tobytes()
+    return httpx.Response(200, content=body, headers={"content-type": BINARY_CONTENT_TYPE})
+
+
+def _provider(handler, **kwargs) -> AsyncEmbeddingServiceProvider:
+    provider = AsyncEmbeddingServiceProvider(
+        service_url="http://embedding.test", backoff_factor=0, **kwargs
+    )
+    provider._client = httpx.AsyncClient(
+        base_url="http://embedding.test", transport=httpx.MockTransport(handler)
+    )
+    return provider
+
+
+def _embed_by_index(request: httpx.Request) -> httpx.Response:
+    """Row i of each response is filled with the integer in texts[i]."""
+    texts = __import__("json").loads(request.content)["texts"]
+    rows = np.repeat(np.array([[float(t)] for t in texts], dtype=np.float32), DIM, axis=1)
+    return _binary_response(rows)
+
+
+def test_encode_chunks_and_preserves_order():
+    provider = _provider(_embed_by_index, chunk_size=3, max_concurrency=2)
+    texts = [str(i) for i in range(10)]
+
+    embeddings = asyncio.run(provider.encode(texts))
+
+    assert embeddings.shape == (10, DIM)
+    np.testing.assert_array_equal(embeddings[:, 0], np.arange(10, dtype=np.float32))
+
+
+def test_encode_empty():
+    provider = _provider(_embed_by_index)
+    assert asyncio.run(provider.encode([])).shape == (0, DIM)
+
+
+def test_retries_retryable_status_and_logs(caplog):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return _embed_by_index(request)
+
+    provider = _provider(handler, max_retries=3)
+    with caplog.at_level(logging.WARNING):
+        embeddings = asyncio.run(provider.encode(["1"]))
+
+    assert embeddings.shape == (1, DIM)
+    assert len(calls) == 3
+    assert sum("HTTP 503" in r.getMessage() for r in caplog.records) == 2
+
+
+def test_gives_up_after_max_retries():
+    provider = _provider(lambda request: httpx.Response(500), max_retries=1)
+    with pytest.raises(RuntimeError):
+        asyncio.run(provider.encode(["1"]))
+
+
+def test_failed_chunk_cancels_siblings():
+    cancelled = []
+
+    async def run():
+        async def handler(request):
+            texts = __import__("json").loads(request.content)["texts"]
+            if texts == ["bad"]:
+                return httpx.Response(400)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(texts)
+                raise
+            return _embed_by_index(request)
+
+        provider = _provider(handler, chunk_size=1, max_concurrency=4)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(provider.encode(["1", "bad", "2", "3"]), timeout=5)
+        # Siblings were cancelled before encode() raised
+        assert sorted(cancelled) == [["1"], ["2"], ["3"]]
+
+    asyncio.run(run())
+
+
+def test_open_circuit_fails_fast():
+    breaker = CircuitBreaker(
+        name="test_embedding", config=CircuitBreakerConfig(failure_threshold=1)
+    )
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    provider = _provider(handler, max_retries=0, circuit_breaker=breaker)
+    with pytest.raises(RuntimeError):
+        asyncio.run(provider.encode(["1"]))
+    with pytest.raises(Exception, match="(?i)circuit"):
+        asyncio.run(provider.encode(["1"]))
+    assert len(calls) == 1
+
+
+def test_half_open_breaker_admits_a_many_chunk_request_once():
+    breaker = CircuitBreaker(
+        name="test_embedding",
+        config=CircuitBreakerConfig(
+            failure_threshold=1, timeout_seconds=0, half_open_max_requests=1
+        ),
+    )
+    failing = [True]
+
+    def handler(request):
+        if failing[0]:
+            return httpx.Response(500)
+        return _embed_by_index(request)
+
+    provider = _provider(handler, chunk_size=1, max_retries=0, circuit_breaker=breaker)
+    with pytest.raises(RuntimeError):
+        asyncio.run(provider.encode(["1"]))
+
+    # HALF_OPEN with one test slot: all 8 chunks go out under it
+    failing[0] = False
+    embeddings = asyncio.run(provider.encode([str(i) for i in range(8)]))
+    assert embeddings.shape == (8, DIM)
+    assert breaker.get_stats()["state"] == "closed"
+
+
+def test_cancelled_half_open_request_does_not_wedge_breaker():
+    breaker = CircuitBreaker(
+        name="test_embedding",
+        config=CircuitBreakerConfig(failure_threshold=1, timeout_seconds=0),
+    )
+    mode = ["fail"]
+
+    async def handler(request):
+        if mode[0] == "fail":
+            return httpx.Response(500)
+        if mode[0] == "hang":
+            await asyncio.sleep(10)
+        return _embed_by_index(request)
+
+    provider = _provider(handler, chunk_size=1, max_retries=0, circuit_breaker=breaker)
+    with pytest.raises(RuntimeError):
+        asyncio.run(provider.encode(["1"]))
+
+    async def hang_then_cancel():
+        for _ in range(4):  # more requests than half_open_max_requests
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    provider.encode([str(i) for i in range(8)]), timeout=0.05
+                )
+
+    mode[0] = "hang"
+    asyncio.run(hang_then_cancel())
+
+    mode[0] = "ok"
+    assert asyncio.run(provider.encode(["1"])).shape == (1, DIM)
+    assert breaker.get_stats()["state"] == "closed"
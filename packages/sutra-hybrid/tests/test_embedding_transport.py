@@ -0,0 +1,30 @@
+"""Tests for the binary /embed response format."""
+
+import numpy as np
+import pytest
+from sutra_hybrid.embeddings.service import (
+    BINARY_SHAPE_HEADER,
+    decode_binary_embeddings,
+)
+
+
+def _encode(array: np.ndarray) -> bytes:
+    rows, dim = array.shape
+    return BINARY_SHAPE_HEADER.pack(rows, dim) + array.astype("<f4").tobytes()
+
+
+def test_decode_roundtrip():
+    embeddings = np.random.rand(3, 768).astype(np.float32)
+
+    decoded = decode_binary_embeddings(_encode(embeddings))
+
+    assert decoded.shape == (3, 768)
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, embeddings)
+
+
+def test_decode_rejects_truncated_payload():
+    payload = _encode(np.ones((2, 4), dtype=np.float32))
+
+    with pytest.raises(ValueError):
+        decode_binary_embeddings(payload[:-4])
@@ -0,0 +1,79 @@
+"""Tests for the bounded result store and its audit log index."""
+
+import os
+
+import pytest
+from sutra_hybrid import result_store
+from sutra_hybrid.result_store import ResultStore
+from sutra_hybrid.results import ExplainableResult
+
+
+def _result(query_id: str, answer: str = "answer") -> ExplainableResult:
+    return ExplainableResult(
+        answer=answer, confidence=0.9, metadata={"query_id": query_id}
+    )
+
+
+def test_lru_eviction_keeps_most_recent():
+    store = ResultStore(max_entries=2, max_age_seconds=None)
+    for query_id in ("q1", "q2", "q3"):
+        store.put(_result(query_id))
+
+    assert len(store) == 2
+    assert store.get("q1") is None
+    assert store.get("q3").answer == "answer"
+    assert store.evictions == 1
+
+
+def test_ttl_eviction(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_store.time, "monotonic", lambda: now[0])
+    store = ResultStore(max_entries=10, max_age_seconds=60)
+    store.put(_result("old"))
+    now[0] += 30
+    store.put(_result("new"))
+
+    now[0] += 45
+    assert store.get("old") is None
+    assert store.get("new") is not None
+
+
+def test_spill_lookup_after_eviction(tmp_path):
+    log = str(tmp_path / "audit.jsonl")
+    store = ResultStore(max_entries=1, max_age_seconds=None, spill_path=log)
+    store.put(_result("q1", "first"))
+    store.put(_result("q2", "second"))
+
+    assert store.get("q1").answer == "first"  # served from the log
+    assert store.get("missing") is None
+    store.close()
+
+
+def test_index_persists_and_indexes_log_tail(tmp_path):
+    log = str(tmp_path / "audit.jsonl")
+    store = ResultStore(max_entries=1, max_age_seconds=None, spill_path=log)
+    store.put(_result("q1", "first"))
+    store.close()
+
+    # Lines appended without the index (e.g. before a crash) are picked up on open
+    other = ResultStore(max_entries=1, max_age_seconds=None, spill_path=log)
+    other._index.execute("DELETE FROM meta")
+    other._index.execute("DELETE FROM records")
+    other._index.commit()
+    other.close()
+
+    reopened = ResultStore(max_entries=1, max_age_seconds=None, spill_path=log)
+    assert reopened.get("q1").answer == "first"
+    reopened.put(_result("q2", "second"))
+    reopened.close()
+
+    final = ResultStore(max_entries=1, max_age_seconds=None, spill_path=log)
+    assert final.get("q1").answer == "first"
+    assert final.get("q2").answer == "second"
+    assert os.path.exists(f"{log}.idx")
+    final.close()
+
+
+def test_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        ResultStore(max_entries=0)
@@ -5,14 +5,43 @@ Replaces gRPC client while maintaining distributed architecture.
 Based on working test_tcp_client.py implementation.
 """
 
+import logging
 import socket
 import struct
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 try:
     import msgpack
 except ImportError:
     raise ImportError("msgpack package required: pip install msgpack")
 
+from .instrumentation import (
+    LATENCY_BUCKETS,
+    STATUS_ERROR,
+    STATUS_FAILED,
+    STATUS_OK,
+    ClientMetrics,
+    RpcEvent,
+    RpcHook,
+    call_hooks,
+)
+
+logger = logging.getLogger(__name__)
+
+# Request bytes pipeline() sends ahead of reading responses. Small enough to
+# always fit in the socket buffers, so neither side can block writing while
+# the other is not reading.
+PIPELINE_WINDOW_BYTES = 32 * 1024
+
+__all__ = [
+    "StorageClient",
+    "ClientMetrics",
+    "RpcEvent",
+    "RpcHook",
+    "LATENCY_BUCKETS",
+    "PIPELINE_WINDOW_BYTES",
+]
+
 
 class StorageClient:
     """
@@ -21,16 +50,30 @@ class StorageClient:
     Based on working test_tcp_client.py implementation.
     """
     
-    def __init__(self, server_address: str = "localhost:50051"):
+    def __init__(
+        self,
+        server_address: str = "localhost:50051",
+        hooks: Sequence[RpcHook] = (),
+        slow_request_threshold_ms: Optional[float] = None,
+        metrics: Optional[ClientMetrics] = None,
+    ):
         """
         Connect to storage server.
         
         Args:
             server_address: Address of storage server (host:port)
+            hooks: RpcHook objects notified of every request (tracing, metrics export)
+            slow_request_threshold_ms: Log a warning for requests slower than this
+                (None = disabled)
+            metrics: Metrics to record into; pass the previous client's metrics
+                when reconnecting to keep totals continuous
         """
         host, port = server_address.split(":")
         self.address = (host, int(port))
         self.socket = None
+        self.hooks = list(hooks)
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self._metrics = metrics if metrics is not None else ClientMetrics()
         self._connect()
         
         # Defaults for unified learning
@@ -60,47 +103,151 @@ class StorageClient:
             self.socket = None
             raise ConnectionError(f"Failed to connect to {self.address}: {e}")
     
-    def _send_request(self, variant_name: str, data: dict) -> dict:
-        """Send request and receive response.
-        
-        Rust enum format: {variant_name: variant_data}
+    @staticmethod
+    def _frame(variant_name: str, data: Optional[dict]) -> bytes:
+        """Length-prefixed msgpack frame.
+
+        Rust enum format: {variant_name: variant_data}, or just the variant
+        name for unit variants (data=None).
         """
+        packed = msgpack.packb(variant_name if data is None else {variant_name: data})
+        return struct.pack(">I", len(packed)) + packed
+
+    def _send_request(self, variant_name: str, data: Optional[dict] = None) -> Any:
+        """Send request and receive response."""
+        return self._exchange([variant_name], [self._frame(variant_name, data)])[0]
+
+    def pipeline(self, requests: Sequence[Tuple[str, Optional[dict]]]) -> List[Any]:
+        """
+        Send many requests back-to-back and return their responses in order.
+
+        The server handles a connection's requests one at a time in order, so
+        writing several frames before reading costs one round trip per window
+        (PIPELINE_WINDOW_BYTES of requests) instead of one per request. Each
+        request is still a separate server request and is recorded as such in
+        metrics().
+
+        Args:
+            requests: (variant_name, data) pairs; data=None for unit variants
+
+        Raises:
+            ConnectionError: If the connection fails; requests before the
+                failure may have been applied
+        """
+        responses: List[Any] = []
+        variants: List[str] = []
+        frames: List[bytes] = []
+        window = 0
+        for variant_name, data in requests:
+            frame = self._frame(variant_name, data)
+            if frames and window + len(frame) > PIPELINE_WINDOW_BYTES:
+                responses.extend(self._exchange(variants, frames))
+                variants, frames, window = [], [], 0
+            variants.append(variant_name)
+            frames.append(frame)
+            window += len(frame)
+        if frames:
+            responses.extend(self._exchange(variants, frames))
+        return responses
+
+    def _exchange(self, variants: List[str], frames: List[bytes]) -> List[Any]:
+        """Write frames in one send, then read one response per frame."""
         if not self.socket:
             raise ConnectionError("Not connected to storage server")
-            
-        # Pack request as enum: {variant_name: data}
-        request = {variant_name: data}
-        packed = msgpack.packb(request)
-        
-        # Send with length prefix
-        self.socket.sendall(struct.pack(">I", len(packed)))
-        self.socket.sendall(packed)
-        
-        # Receive response length
-        length_bytes = self.socket.recv(4)
-        if len(length_bytes) < 4:
-            raise ConnectionError("Connection closed")
-        length = struct.unpack(">I", length_bytes)[0]
-        
-        # Receive response
-        response_bytes = b""
-        while len(response_bytes) < length:
-            chunk = self.socket.recv(min(4096, length - len(response_bytes)))
-            if not chunk:
-                raise ConnectionError("Connection closed")
-            response_bytes += chunk
-        
-        return msgpack.unpackb(response_bytes, raw=False)
+
+        hooks = self.hooks
+        states = [
+            call_hooks(hooks, "on_request_start", variant) if hooks else ()
+            for variant in variants
+        ]
+        start = time.perf_counter()
+        responses: List[Any] = []
+        sent = False
+        try:
+            self.socket.sendall(b"".join(frames))
+            sent = True
+            for variant, frame, state in zip(variants, frames, states):
+                response, received = self._recv_response()
+                status = (
+                    STATUS_ERROR if isinstance(response, dict) and "Error" in response
+                    else STATUS_OK
+                )
+                self._record(
+                    RpcEvent(variant, status, time.perf_counter() - start, len(frame), received),
+                    state,
+                )
+                responses.append(response)
+            return responses
+        except BaseException as e:
+            elapsed = time.perf_counter() - start
+            for i in range(len(responses), len(variants)):
+                self._record(
+                    RpcEvent(
+                        variants[i], STATUS_FAILED, elapsed,
+                        len(frames[i]) if sent else 0, 0, e,
+                    ),
+                    states[i],
+                )
+            raise
+
+    def _recv_response(self) -> Tuple[Any, int]:
+        """Read one length-prefixed response; returns it and its wire size."""
+        length = struct.unpack(">I", self._recv_exactly(4))[0]
+        response_bytes = self._recv_exactly(length)
+        return msgpack.unpackb(response_bytes, raw=False), 4 + length
+
+    def _record(self, event: RpcEvent, states: Sequence[Any]):
+        """Record a finished request in metrics, hooks and the slow-request log."""
+        self._metrics.record(event)
+        for hook, state in zip(self.hooks, states):
+            try:
+                hook.on_request_end(state, event)
+            except Exception as e:
+                logger.debug(f"Storage client hook {type(hook).__name__} failed: {e}")
+        if (
+            self.slow_request_threshold_ms is not None
+            and event.duration_seconds * 1000 >= self.slow_request_threshold_ms
+        ):
+            logger.warning(
+                f"Slow storage request {event.variant}: {event.duration_seconds * 1000:.1f}ms "
+                f"({event.bytes_sent}B sent, {event.bytes_received}B received, {event.status})"
+            )
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-variant request counts, bytes and latencies, plus retry/reconnect counts."""
+        return self._metrics.snapshot()
+
+    @property
+    def bytes_sent(self) -> int:
+        """Wire bytes sent, including length prefixes."""
+        return self._metrics.bytes_sent
+
+    @property
+    def bytes_received(self) -> int:
+        """Wire bytes received, including length prefixes."""
+        return self._metrics.bytes_received
+
+    def record_retry(self, attempt: int, error: BaseException):
+        """Count a retry of a failed request (called by the caller's retry loop)."""
+        self._metrics.record_retry()
+        if self.hooks:
+            call_hooks(self.hooks, "on_retry", attempt, error)
+
+    def record_reconnect(self, success: bool):
+        """Count a reconnection attempt (called by the caller's retry loop)."""
+        self._metrics.record_reconnect(success)
+        if self.hooks:
+            call_hooks(self.hooks, "on_reconnect", success)
     
     def _recv_exactly(self, n: int) -> bytes:
         """Receive exactly n bytes"""
-        data = b''
+        data = bytearray()
         while len(data) < n:
             chunk = self.socket.recv(n - len(data))
             if not chunk:
                 raise ConnectionError("Connection closed by server")
             data += chunk
-        return data
+        return bytes(data)
     
     def learn_concept_v2(
         self,
@@ -159,23 +306,52 @@ class StorageClient:
         confidence: float = 1.0,
     ) -> int:
         """Learn a concept with optional embedding (legacy)."""
-        response = self._send_request("LearnConcept", {
+        response = self._send_request(
+            "LearnConcept",
+            self._concept_request(concept_id, content, embedding, strength, confidence),
+        )
+        result = self._sequence_from_response(response, "LearnConceptOk")
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def learn_concepts(
+        self, concepts: Sequence[Tuple[str, str, Optional[List[float]], float, float]]
+    ) -> List[Union[int, RuntimeError]]:
+        """
+        Learn many concepts (pipelined).
+
+        Args:
+            concepts: (concept_id, content, embedding, strength, confidence) tuples
+
+        Returns:
+            Per concept, in input order: its sequence number, or the
+            RuntimeError learn_concept() would have raised for it
+        """
+        responses = self.pipeline(
+            [("LearnConcept", self._concept_request(*c)) for c in concepts]
+        )
+        return [
+            self._sequence_from_response(response, "LearnConceptOk")
+            for response in responses
+        ]
+
+    @staticmethod
+    def _concept_request(
+        concept_id: str,
+        content: str,
+        embedding: Optional[List[float]] = None,
+        strength: float = 1.0,
+        confidence: float = 1.0,
+    ) -> dict:
+        return {
             "concept_id": concept_id,
             "content": content,
             "embedding": [float(x) for x in (embedding or [])],
             "strength": float(strength),
             "confidence": float(confidence),
-        })
-        
-        if "Error" in response:
-            raise RuntimeError(response["Error"]["message"])
-        
-        if "LearnConceptOk" in response:
-            sequence_list = response["LearnConceptOk"]
-            return sequence_list[0] if sequence_list else 0
-        
-        raise RuntimeError(f"Unexpected response: {response}")
-    
+        }
+
     def learn_association(
         self,
         source_id: str,
@@ -184,28 +360,75 @@ class StorageClient:
         confidence: float = 1.0,
     ) -> int:
         """Learn an association between concepts"""
-        response = self._send_request("LearnAssociation", {
+        response = self._send_request(
+            "LearnAssociation",
+            self._association_request(source_id, target_id, assoc_type, confidence),
+        )
+        result = self._sequence_from_response(response, "LearnAssociationOk")
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def learn_associations(
+        self, associations: Sequence[Tuple[str, str, int, float]]
+    ) -> List[Union[int, RuntimeError]]:
+        """
+        Learn many associations (pipelined).
+
+        Args:
+            associations: (source_id, target_id, assoc_type, confidence) tuples
+
+        Returns:
+            Per association, in input order: its sequence number, or the
+            RuntimeError learn_association() would have raised for it
+        """
+        responses = self.pipeline(
+            [("LearnAssociation", self._association_request(*a)) for a in associations]
+        )
+        return [
+            self._sequence_from_response(response, "LearnAssociationOk")
+            for response in responses
+        ]
+
+    @staticmethod
+    def _association_request(
+        source_id: str, target_id: str, assoc_type: int = 0, confidence: float = 1.0
+    ) -> dict:
+        return {
             "source_id": source_id,
             "target_id": target_id,
             "assoc_type": int(assoc_type),
             "confidence": float(confidence),
-        })
-        
+        }
+
+    @staticmethod
+    def _sequence_from_response(response: dict, ok_variant: str) -> Union[int, RuntimeError]:
+        """Sequence number of a write response, or the error it reports."""
         if "Error" in response:
-            raise RuntimeError(response["Error"]["message"])
+            return RuntimeError(response["Error"]["message"])
         
-        if "LearnAssociationOk" in response:
-            sequence_list = response["LearnAssociationOk"]
+        if ok_variant in response:
+            sequence_list = response[ok_variant]
             return sequence_list[0] if sequence_list else 0
         
-        raise RuntimeError(f"Unexpected response: {response}")
+        return RuntimeError(f"Unexpected response: {response}")
     
     def query_concept(self, concept_id: str) -> Optional[Dict]:
         """Query a concept by ID"""
         response = self._send_request("QueryConcept", {
             "concept_id": concept_id,
         })
-        
+        return self._concept_from_response(response)
+
+    def query_concepts(self, concept_ids: Sequence[str]) -> List[Optional[Dict]]:
+        """Query many concepts by ID (pipelined); results in input order."""
+        responses = self.pipeline(
+            [("QueryConcept", {"concept_id": concept_id}) for concept_id in concept_ids]
+        )
+        return [self._concept_from_response(response) for response in responses]
+
+    @staticmethod
+    def _concept_from_response(response: dict) -> Optional[Dict]:
         if "Error" in response:
             raise RuntimeError(response["Error"]["message"])
         
@@ -311,29 +534,7 @@ class StorageClient:
         # TODO: Implement GetAllConceptIds in storage server
         # For now, return stub to prevent errors
         try:
-            # GetAllConceptIds is a unit variant - send just the string
-            request = "GetAllConceptIds"
-            packed = msgpack.packb(request)
-            
-            # Send with length prefix
-            self.socket.sendall(struct.pack(">I", len(packed)))
-            self.socket.sendall(packed)
-            
-            # Receive response length
-            length_bytes = self.socket.recv(4)
-            if len(length_bytes) < 4:
-                raise ConnectionError("Connection closed")
-            length = struct.unpack(">I", length_bytes)[0]
-            
-            # Receive response
-            response_bytes = b""
-            while len(response_bytes) < length:
-                chunk = self.socket.recv(min(4096, length - len(response_bytes)))
-                if not chunk:
-                    raise ConnectionError("Connection closed")
-                response_bytes += chunk
-            
-            response = msgpack.unpackb(response_bytes, raw=False)
+            response = self._send_request("GetAllConceptIds")
             
             if "Error" in response:
                 return []
@@ -390,29 +591,7 @@ class StorageClient:
     
     def stats(self) -> Dict:
         """Get storage statistics"""
-        # GetStats is a unit variant - send just the string
-        request = "GetStats"
-        packed = msgpack.packb(request)
-        
-        # Send with length prefix
-        self.socket.sendall(struct.pack(">I", len(packed)))
-        self.socket.sendall(packed)
-        
-        # Receive response length
-        length_bytes = self.socket.recv(4)
-        if len(length_bytes) < 4:
-            raise ConnectionError("Connection closed")
-        length = struct.unpack(">I", length_bytes)[0]
-        
-        # Receive response
-        response_bytes = b""
-        while len(response_bytes) < length:
-            chunk = self.socket.recv(min(4096, length - len(response_bytes)))
-            if not chunk:
-                raise ConnectionError("Connection closed")
-            response_bytes += chunk
-        
-        response = msgpack.unpackb(response_bytes, raw=False)
+        response = self._send_request("GetStats")
         
         if "Error" in response:
             raise RuntimeError(response["Error"]["message"])
@@ -436,58 +615,14 @@ class StorageClient:
     
     def flush(self) -> None:
         """Force flush to disk"""
-        # Flush is a unit variant - send just the string
-        request = "Flush"
-        packed = msgpack.packb(request)
-        
-        # Send with length prefix
-        self.socket.sendall(struct.pack(">I", len(packed)))
-        self.socket.sendall(packed)
-        
-        # Receive response length
-        length_bytes = self.socket.recv(4)
-        if len(length_bytes) < 4:
-            raise ConnectionError("Connection closed")
-        length = struct.unpack(">I", length_bytes)[0]
-        
-        # Receive response
-        response_bytes = b""
-        while len(response_bytes) < length:
-            chunk = self.socket.recv(min(4096, length - len(response_bytes)))
-            if not chunk:
-                raise ConnectionError("Connection closed")
-            response_bytes += chunk
-        
-        response = msgpack.unpackb(response_bytes, raw=False)
+        response = self._send_request("Flush")
         
         if "Error" in response:
             raise RuntimeError(f"Flush failed: {response['Error']['message']}")
     
     def health_check(self) -> Dict:
         """Check server health"""
-        # HealthCheck is a unit variant - send just the string
-        request = "HealthCheck"
-        packed = msgpack.packb(request)
-        
-        # Send with length prefix
-        self.socket.sendall(struct.pack(">I", len(packed)))
-        self.socket.sendall(packed)
-        
-        # Receive response length
-        length_bytes = self.socket.recv(4)
-        if len(length_bytes) < 4:
-            raise ConnectionError("Connection closed")
-        length = struct.unpack(">I", length_bytes)[0]
-        
-        # Receive response
-        response_bytes = b""
-        while len(response_bytes) < length:
-            chunk = self.socket.recv(min(4096, length - len(response_bytes)))
-            if not chunk:
-                raise ConnectionError("Connection closed")
-            response_bytes += chunk
-        
-        response = msgpack.unpackb(response_bytes, raw=False)
+        response = self._send_request("HealthCheck")
         
         if "Error" in response:
             raise RuntimeError(response["Error"]["message"])
@@ -0,0 +1,204 @@
+"""
+Request instrumentation for StorageClient.
+
+Every request is recorded per protocol variant (QueryConcept, VectorSearch,
+...) in ClientMetrics: request/error counts, wire bytes and a latency
+histogram, plus retry/reconnect counters reported by the caller's retry loop.
+
+Hooks let tracers and external metrics systems observe the same events
+without this package depending on them. A hook is any object with the
+RpcHook methods; for example an OpenTelemetry tracer:
+
+    class OtelHook(RpcHook):
+        def __init__(self, tracer):
+            self.tracer = tracer
+
+        def on_request_start(self, variant):
+            return self.tracer.start_span(f"storage.{variant}")
+
+        def on_request_end(self, span, event):
+            span.set_attribute("rpc.request.size", event.bytes_sent)
+            span.set_attribute("rpc.response.size", event.bytes_received)
+            if event.error is not None:
+                span.record_exception(event.error)
+            span.end()
+
+    client = StorageClient("localhost:50051", hooks=[OtelHook(tracer)])
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram upper bounds (seconds)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Request outcomes
+STATUS_OK = "ok"
+STATUS_ERROR = "error"  # server replied with an Error variant
+STATUS_FAILED = "failed"  # transport/protocol failure (exception raised)
+
+
+@dataclass
+class RpcEvent:
+    """One completed storage request."""
+
+    variant: str
+    status: str
+    duration_seconds: float
+    bytes_sent: int
+    bytes_received: int
+    error: Optional[BaseException] = None
+
+
+class RpcHook:
+    """
+    Base class for request hooks; every method is a no-op.
+
+    Hooks are called on the requesting thread. Exceptions they raise are
+    logged and ignored.
+    """
+
+    def on_request_start(self, variant: str) -> Any:
+        """Called before sending; the return value is passed to on_request_end."""
+        return None
+
+    def on_request_end(self, state: Any, event: RpcEvent) -> None:
+        """Called after the response was received (or the request failed)."""
+
+    def on_retry(self, attempt: int, error: BaseException) -> None:
+        """Called when a failed request is about to be retried."""
+
+    def on_reconnect(self, success: bool) -> None:
+        """Called after a reconnection attempt."""
+
+
+class VariantStats:
+    """Counters and latency histogram of one request variant."""
+
+    __slots__ = (
+        "requests", "errors", "failures", "bytes_sent", "bytes_received",
+        "total_seconds", "max_seconds", "buckets",
+    )
+
+    def __init__(self, num_buckets: int):
+        self.requests = 0
+        self.errors = 0
+        self.failures = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (num_buckets + 1)  # last bucket: +Inf
+
+    def percentile(self, bounds: Sequence[float], q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the q-th percentile."""
+        if not self.requests:
+            return 0.0
+        rank = q / 100 * self.requests
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return bounds[i] if i < len(bounds) else self.max_seconds
+        return self.max_seconds
+
+    def to_dict(self, bounds: Sequence[float]) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "failures": self.failures,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "avg_ms": self.total_seconds / self.requests * 1000 if self.requests else 0.0,
+            "max_ms": self.max_seconds * 1000,
+            "p50_ms": self.percentile(bounds, 50) * 1000,
+            "p99_ms": self.percentile(bounds, 99) * 1000,
+            "latency_buckets": {
+                **{str(b): c for b, c in zip(bounds, self.buckets)},
+                "+Inf": self.buckets[-1],
+            },
+        }
+
+
+class ClientMetrics:
+    """
+    Request metrics of a StorageClient.
+
+    Pass the same instance to a replacement client after reconnecting to
+    keep the totals continuous.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.variants: Dict[str, VariantStats] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.reconnects = 0
+        self.reconnect_failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, event: RpcEvent) -> None:
+        with self._lock:
+            stats = self.variants.get(event.variant)
+            if stats is None:
+                stats = self.variants[event.variant] = VariantStats(len(self.buckets))
+            stats.requests += 1
+            if event.status == STATUS_ERROR:
+                stats.errors += 1
+            elif event.status == STATUS_FAILED:
+                stats.failures += 1
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received
+            stats.total_seconds += event.duration_seconds
+            if event.duration_seconds > stats.max_seconds:
+                stats.max_seconds = event.duration_seconds
+            stats.buckets[bisect_left(self.buckets, event.duration_seconds)] += 1
+            self.bytes_sent += event.bytes_sent
+            self.bytes_received += event.bytes_received
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_reconnect(self, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.reconnects += 1
+            else:
+                self.reconnect_failures += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Point-in-time copy of all counters, JSON-serializable."""
+        with self._lock:
+            return {
+                "requests": sum(s.requests for s in self.variants.values()),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "retries": self.retries,
+                "reconnects": self.reconnects,
+                "reconnect_failures": self.reconnect_failures,
+                "variants": {
+                    name: stats.to_dict(self.buckets)
+                    for name, stats in self.variants.items()
+                },
+            }
+
+
+def call_hooks(hooks: Sequence[RpcHook], method: str, *args) -> list:
+    """Call ``method`` on every hook, isolating hook failures."""
+    results = []
+    for hook in hooks:
+        try:
+            results.append(getattr(hook, method)(*args))
+        except Exception as e:
+            logger.debug(f"Storage client hook {type(hook).__name__}.{method} failed: {e}")
+            results.append(None)
+    return results
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Metrics middleware overhead benchmark.
+
+Measures the per-request cost SutraMetricsMiddleware adds on top of the
+downstream handler, with each thread running its own event loop (as with
+several uvicorn workers sharing one collector in-process):
+- bare: call_next alone
+- middleware: SutraMetricsMiddleware.dispatch around the same call_next
+
+Usage:
+    python scripts/benchmark_metrics_middleware.py [--requests 20000] [--threads 1,4,8] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from typing import Callable, List
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from sutra_core.monitoring.metrics_middleware import SutraMetricsMiddleware
+
+ENDPOINTS = ["/api/v1/learn", "/api/v1/query", "/api/v1/concepts/{id}", "/health"]
+RESPONSE = Response(status_code=200)
+
+
+class _Route:
+    def __init__(self, path: str):
+        self.path = path
+
+
+def make_requests() -> List[Request]:
+    """One request per endpoint, with the route already matched."""
+    return [
+        Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": path,
+                "route": _Route(path),
+                "headers": [],
+                "query_string": b"",
+            }
+        )
+        for path in ENDPOINTS
+    ]
+
+
+async def call_next(request: Request) -> Response:
+    return RESPONSE
+
+
+def run_threads(dispatch: Callable, requests: List[Request], num_requests: int, threads: int) -> float:
+    """Wall time for ``threads`` threads to each dispatch ``num_requests`` requests."""
+
+    async def loop():
+        for i in range(num_requests):
+            await dispatch(requests[i % len(requests)], call_next)
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        asyncio.run(loop())
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start
+
+
+def bench(threads: int, num_requests: int, repeat: int) -> None:
+    middleware = SutraMetricsMiddleware(app=None, service_name="bench")
+    requests = make_requests()
+    total = num_requests * threads
+
+    best_bare = min(run_threads(lambda r, n: n(r), requests, num_requests, threads) for _ in range(repeat))
+    best_mw = min(run_threads(middleware.dispatch, requests, num_requests, threads) for _ in range(repeat))
+    overhead = (best_mw - best_bare) / total * 1e6
+
+    print(
+        f"{threads:>3} threads {total / best_mw:>12,.0f} req/s "
+        f"{overhead:>8.2f} us/request middleware overhead"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per thread")
+    parser.add_argument("--threads", default="1,4,8", help="Comma-separated thread counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per configuration (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests per thread, best of {args.repeat} runs\n")
+    for threads in (int(t) for t in args.threads.split(",")):
+        bench(threads, args.requests, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
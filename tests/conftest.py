@@ -1,13 +1,111 @@
+import socket
+import struct
 import sys
 from pathlib import Path
 
-# Ensure sutra_core is importable when running tests from repo root
+import pytest
+
+# Ensure sutra_core (and the TCP storage client) are importable when running tests from repo root
 ROOT = Path(__file__).resolve().parents[1]
 CORE = ROOT / "packages" / "sutra-core"
-if str(CORE) not in sys.path:
-    sys.path.insert(0, str(CORE))
+STORAGE_CLIENT = ROOT / "packages" / "sutra-storage-client-tcp"
+for path in (CORE, STORAGE_CLIENT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 
 def pytest_configure(config):
     # Register custom markers
     config.addinivalue_line("markers", "integration: marks tests as integration (deselect with -m 'not integration')")
+
+
+class FakeStorageServer:
+    """
+    In-process stand-in for the storage server behind StorageClient sockets.
+
+    Answers each length-prefixed msgpack request frame in order via
+    handle(variant, data); a handler returning None drops the connection
+    at that request. Records every request and the size of every sendall().
+    """
+
+    def __init__(self):
+        self.requests = []  # (variant, data) in arrival order
+        self.sends = []  # bytes per sendall()
+        self.sockets = []
+        self.handler = self.default_handler
+
+    @staticmethod
+    def default_handler(variant, data):
+        """IDs starting with "known" exist; content/source "bad" is rejected."""
+        if variant == "QueryConcept":
+            concept_id = data["concept_id"]
+            return {"QueryConceptOk": [concept_id.startswith("known"), concept_id, "text", 1.0, 0.9]}
+        if variant == "LearnConcept":
+            if data["content"] == "bad":
+                return {"Error": {"message": "rejected"}}
+            return {"LearnConceptOk": [1]}
+        if variant == "LearnAssociation":
+            if data["source_id"] == "bad":
+                return {"Error": {"message": "rejected"}}
+            return {"LearnAssociationOk": [1]}
+        return {"Error": {"message": f"unsupported {variant}"}}
+
+    def socket(self, *args, **kwargs):
+        sock = _FakeSocket(self)
+        self.sockets.append(sock)
+        return sock
+
+
+class _FakeSocket:
+    def __init__(self, server: FakeStorageServer):
+        self.server = server
+        self.pending = bytearray()
+        self.dropped = False
+
+    def setsockopt(self, *args):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect(self, address):
+        pass
+
+    def close(self):
+        pass
+
+    def sendall(self, data: bytes):
+        import msgpack
+
+        self.server.sends.append(len(data))
+        offset = 0
+        while offset < len(data):
+            (length,) = struct.unpack_from(">I", data, offset)
+            request = msgpack.unpackb(data[offset + 4 : offset + 4 + length], raw=False)
+            offset += 4 + length
+            variant, payload = (
+                (request, None) if isinstance(request, str) else next(iter(request.items()))
+            )
+            self.server.requests.append((variant, payload))
+            if self.dropped:
+                continue
+            response = self.server.handler(variant, payload)
+            if response is None:
+                self.dropped = True
+                continue
+            packed = msgpack.packb(response)
+            self.pending += struct.pack(">I", len(packed)) + packed
+
+    def recv(self, n: int) -> bytes:
+        chunk = bytes(self.pending[:n])
+        del self.pending[:n]
+        return chunk  # b"" once drained: connection closed
+
+
+@pytest.fixture
+def storage_server(monkeypatch):
+    """FakeStorageServer answering every StorageClient connection made in the test."""
+    pytest.importorskip("msgpack")
+    server = FakeStorageServer()
+    monkeypatch.setattr(socket, "socket", server.socket)
+    return server
@@ -0,0 +1,155 @@
+"""Tests for MassLearningAdapter checkpointing and resume."""
+
+from sutra_core.adapters.base import ChunkMetadata, LearningCheckpoint, MassLearningAdapter
+
+
+class ListAdapter(MassLearningAdapter):
+    """Adapter over an in-memory list of chunk texts."""
+
+    def __init__(self, chunks, offset_resume=False, **kwargs):
+        super().__init__(**kwargs)
+        self.chunks = chunks
+        self.supports_offset_resume = offset_resume
+        self.starts = []
+
+    def get_chunks(self, source, start=0, **kwargs):
+        self.starts.append(start)
+        for i in range(start, len(self.chunks)):
+            yield self.chunks[i], ChunkMetadata(
+                chunk_id=str(i),
+                source=source,
+                size_chars=len(self.chunks[i]),
+                chunk_index=i,
+                extra={"resume": {"start": i + 1}},
+            )
+
+    def estimate_total_chunks(self, source, **kwargs):
+        return len(self.chunks)
+
+    def get_source_info(self, source, **kwargs):
+        return {"size_bytes": 0, "modified_time": 0.0}
+
+
+class FlakyLearner:
+    """Fails every batch containing one of ``fail`` (one-shot per content)."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.learned = []
+
+    def learn_adaptive_batch(self, items):
+        contents = [content for content, _, _ in items]
+        bad = self.fail.intersection(contents)
+        if bad:
+            self.fail -= bad
+            raise RuntimeError(f"cannot learn {sorted(bad)}")
+        self.learned.extend(contents)
+        return contents
+
+
+def _chunks(n):
+    return [f"chunk {i}" for i in range(n)]
+
+
+def test_failed_batch_is_retried_on_resume(tmp_path):
+    checkpoint = tmp_path / "cp.json"
+    adapter = ListAdapter(_chunks(10), batch_size=3, checkpoint_interval=1)
+    learner = FlakyLearner(fail={"chunk 4"})
+
+    progress = adapter.learn_from_source(learner, "src", checkpoint_path=str(checkpoint))
+    assert progress.errors
+    assert "chunk 4" not in learner.learned
+    saved = LearningCheckpoint.load(checkpoint)
+    assert saved.chunks_consumed == 10
+    assert saved.failed_ranges == [[3, 6]]
+
+    retry_learner = FlakyLearner()
+    progress = adapter.learn_from_source(
+        retry_learner, "src", resume=True, checkpoint_path=str(checkpoint)
+    )
+    assert not progress.errors
+    assert retry_learner.learned == ["chunk 3", "chunk 4", "chunk 5"]
+    assert progress.chunks_processed == 10
+    assert not checkpoint.exists()
+
+
+def test_resume_skips_learned_chunks(tmp_path):
+    checkpoint = tmp_path / "cp.json"
+    LearningCheckpoint(
+        source="src", source_size=0, source_mtime=0.0, chunks_consumed=6,
+        chunks_processed=6, concepts_created=6, associations_created=0,
+        bytes_processed=0,
+    ).save(checkpoint)
+
+    learner = FlakyLearner()
+    adapter = ListAdapter(_chunks(8), batch_size=3)
+    adapter.learn_from_source(learner, "src", resume=True, checkpoint_path=str(checkpoint))
+    assert learner.learned == ["chunk 6", "chunk 7"]
+
+
+def test_offset_resume_seeks_without_failures(tmp_path):
+    checkpoint = tmp_path / "cp.json"
+    adapter = ListAdapter(_chunks(6), offset_resume=True, batch_size=2)
+    LearningCheckpoint(
+        source="src", source_size=0, source_mtime=0.0, chunks_consumed=4,
+        chunks_processed=4, concepts_created=4, associations_created=0,
+        bytes_processed=0, resume_state={"start": 4},
+    ).save(checkpoint)
+
+    learner = FlakyLearner()
+    adapter.learn_from_source(learner, "src", resume=True, checkpoint_path=str(checkpoint))
+    assert adapter.starts == [4]
+    assert learner.learned == ["chunk 4", "chunk 5"]
+
+
+def test_offset_resume_rereads_to_retry_failures(tmp_path):
+    checkpoint = tmp_path / "cp.json"
+    adapter = ListAdapter(_chunks(6), offset_resume=True, batch_size=2, checkpoint_interval=1)
+    adapter.learn_from_source(
+        FlakyLearner(fail={"chunk 1"}), "src", checkpoint_path=str(checkpoint)
+    )
+    saved = LearningCheckpoint.load(checkpoint)
+    assert saved.failed_ranges == [[0, 2]]
+    assert saved.resume_state == {"start": 6}
+
+    learner = FlakyLearner()
+    adapter.starts.clear()
+    adapter.learn_from_source(learner, "src", resume=True, checkpoint_path=str(checkpoint))
+    assert adapter.starts == [0]
+    assert learner.learned == ["chunk 0", "chunk 1"]
+    assert not checkpoint.exists()
+
+
+def test_no_prefetch_reads_on_calling_thread(tmp_path):
+    import threading
+
+    class ThreadRecordingAdapter(ListAdapter):
+        def get_chunks(self, source, **kwargs):
+            self.reader_thread = threading.current_thread()
+            yield from super().get_chunks(source, **kwargs)
+
+    adapter = ThreadRecordingAdapter(_chunks(7), batch_size=3, prefetch_batches=0)
+    learner = FlakyLearner()
+    progress = adapter.learn_from_source(
+        learner, "src", checkpoint_path=str(tmp_path / "cp.json")
+    )
+
+    assert adapter.reader_thread is threading.current_thread()
+    assert learner.learned == _chunks(7)
+    assert progress.chunks_processed == 7
+
+
+def test_no_prefetch_read_error_keeps_earlier_batches(tmp_path):
+    class BrokenAdapter(ListAdapter):
+        def get_chunks(self, source, **kwargs):
+            yield from list(super().get_chunks(source, **kwargs))[:4]
+            raise OSError("disk gone")
+
+    adapter = BrokenAdapter(_chunks(10), batch_size=3, prefetch_batches=0)
+    learner = FlakyLearner()
+    progress = adapter.learn_from_source(
+        learner, "src", checkpoint_path=str(tmp_path / "cp.json")
+    )
+
+    assert learner.learned == _chunks(4)
+    assert any("disk gone" in error for error in progress.errors)
@@ -0,0 +1,186 @@
+"""Tests for AdaptiveLearner.learn_adaptive_batch and ReasoningEngine.learn_batch."""
+
+import hashlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sutra_core.exceptions import BatchLearningError, PartialWriteError
+from sutra_core.graph.concepts import Concept
+from sutra_core.learning.adaptive import AdaptiveLearner
+from sutra_core.reasoning.engine import ReasoningEngine
+
+
+def _id(content):
+    return hashlib.md5(content.encode()).hexdigest()[:16]
+
+
+class FakeStorage:
+    """Concept store; concepts with content in `reject` fail bulk writes."""
+
+    def __init__(self, reject=()):
+        self.concepts = {}
+        self.reject = set(reject)
+        self.bulk_writes = []
+
+    def get_concept(self, concept_id):
+        return self.concepts.get(concept_id)
+
+    def get_concepts(self, concept_ids):
+        return {cid: self.concepts.get(cid) for cid in concept_ids}
+
+    def add_concept(self, concept, embedding):
+        self.concepts[concept.id] = concept
+
+    def add_concepts(self, pairs):
+        self.bulk_writes.append([concept.id for concept, _ in pairs])
+        failed = []
+        for i, (concept, _) in enumerate(pairs):
+            if concept.content in self.reject:
+                failed.append(i)
+            else:
+                self.concepts[concept.id] = concept
+        if failed:
+            raise PartialWriteError(
+                "rejected", written=len(pairs) - len(failed), failed=failed
+            )
+        return len(pairs)
+
+    def save(self):
+        pass
+
+
+class FakeExtractor:
+    """Records (content, depth) per call; raises once for content in `fail_once`."""
+
+    def __init__(self, fail_once=()):
+        self.calls = []
+        self.fail_once = set(fail_once)
+
+    def extract_associations_adaptive(self, content, concept_id, depth=1):
+        if content in self.fail_once:
+            self.fail_once.discard(content)
+            raise RuntimeError(f"extraction failed for {content}")
+        self.calls.append((content, depth))
+        return 0
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.batches = []
+        self.singles = []
+
+    def encode_batch(self, texts, prompt_name=None):
+        self.batches.append(list(texts))
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+    def encode_single(self, text, prompt_name=None):
+        self.singles.append(text)
+        return np.ones(4, dtype=np.float32)
+
+
+@pytest.fixture
+def embedder(monkeypatch):
+    embedder = FakeEmbedder()
+    monkeypatch.setattr(AdaptiveLearner, "_embedding_processor", embedder)
+    return embedder
+
+
+def _items(*contents):
+    return [(content, None, None) for content in contents]
+
+
+def test_duplicates_embedded_and_stored_once(embedder):
+    storage, extractor = FakeStorage(), FakeExtractor()
+    learner = AdaptiveLearner(storage, extractor)
+
+    ids = learner.learn_adaptive_batch(_items("a", "b", "a"))
+
+    assert ids == [_id("a"), _id("b"), _id("a")]
+    assert embedder.batches == [["a", "b"]]
+    assert storage.bulk_writes == [[_id("a"), _id("b")]]
+    # Association extraction still runs per item
+    assert [content for content, _ in extractor.calls] == ["a", "b", "a"]
+    # The repeat was reinforced on a copy; the stored concept is untouched
+    assert storage.concepts[_id("a")].strength == 1.0
+    assert storage.concepts[_id("a")].access_count == 0
+
+
+def test_partial_bulk_write_skips_unstored_items(embedder):
+    storage, extractor = FakeStorage(reject={"bad"}), FakeExtractor()
+    learner = AdaptiveLearner(storage, extractor)
+
+    with pytest.raises(BatchLearningError) as exc_info:
+        learner.learn_adaptive_batch(_items("a", "bad", "c", "bad"))
+
+    assert exc_info.value.completed == {0: _id("a"), 2: _id("c")}
+    assert [content for content, _ in extractor.calls] == ["a", "c"]
+    assert _id("bad") not in storage.concepts
+
+
+def test_mid_batch_failure_reports_completed_items(embedder):
+    storage, extractor = FakeStorage(), FakeExtractor(fail_once={"c"})
+    learner = AdaptiveLearner(storage, extractor)
+
+    with pytest.raises(BatchLearningError) as exc_info:
+        learner.learn_adaptive_batch(_items("a", "b", "c", "d"))
+
+    assert exc_info.value.completed == {0: _id("a"), 1: _id("b")}
+    # All new concepts were stored before extraction started
+    assert set(storage.concepts) == {_id(c) for c in "abcd"}
+
+
+def test_existing_concepts_reinforced_not_overwritten(embedder):
+    storage, extractor = FakeStorage(), FakeExtractor()
+    existing = Concept(id=_id("x"), content="x", strength=3.9)
+    storage.concepts[existing.id] = existing
+    learner = AdaptiveLearner(storage, extractor)
+
+    assert learner.learn_adaptive_batch(_items("x", "x")) == [_id("x")] * 2
+
+    # Nothing re-embedded or re-written; stored state kept
+    assert embedder.batches == []
+    assert storage.bulk_writes == []
+    assert storage.concepts[_id("x")] is existing
+    assert existing.strength == 3.9
+    # Each occurrence is reinforced past the difficult threshold (depth 1)
+    assert extractor.calls == [("x", 1), ("x", 1)]
+
+
+def _engine(storage, extractor):
+    """Just the state ReasoningEngine.learn_batch uses."""
+    return SimpleNamespace(
+        adaptive_learner=AdaptiveLearner(storage, extractor),
+        association_extractor=extractor,
+        storage=storage,
+        learning_events=0,
+        enable_caching=False,
+    )
+
+
+def test_learn_batch_retries_only_unfinished_items(embedder):
+    storage, extractor = FakeStorage(), FakeExtractor(fail_once={"c"})
+    engine = _engine(storage, extractor)
+
+    ids = ReasoningEngine.learn_batch(engine, _items("a", "b", "c", "d"))
+
+    assert ids == [_id(c) for c in "abcd"]
+    # a and b were not learned again; c and d were, without re-embedding
+    assert [content for content, _ in extractor.calls] == ["a", "b", "c", "d"]
+    assert embedder.batches == [["a", "b", "c", "d"]]
+    assert embedder.singles == []
+    assert engine.learning_events == 4
+
+
+def test_learn_batch_relearns_unstored_concepts(embedder):
+    storage, extractor = FakeStorage(reject={"bad"}), FakeExtractor()
+    engine = _engine(storage, extractor)
+
+    ids = ReasoningEngine.learn_batch(engine, _items("a", "bad", "c"))
+
+    assert ids == [_id("a"), _id("bad"), _id("c")]
+    # The per-item path stored the rejected concept with its own embedding
+    assert embedder.singles == ["bad"]
+    assert _id("bad") in storage.concepts
+    assert [content for content, _ in extractor.calls] == ["a", "c", "bad"]
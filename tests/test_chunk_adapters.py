@@ -0,0 +1,319 @@
+"""Tests for DatasetAdapter and FileAdapter chunking against small fixtures."""
+
+import hashlib
+import re
+
+import pytest
+
+from sutra_core.adapters.dataset_adapter import DatasetAdapter
+from sutra_core.adapters.file_adapter import FileAdapter
+from sutra_core.adapters.text_processing import IntelligentTextProcessor
+
+BODY = (
+    "The river runs through the old city and past the harbour. "
+    "Its banks were settled in the ninth century by fishing families. "
+)
+
+ARTICLES = [
+    "Harbour\n" + BODY * 2,
+    "Too short",
+    BODY * 2,  # untitled: "Article <index>" title
+    "Long article\n" + "\n\n".join([BODY * 2] * 4),  # split into segments
+    "Bridges\n" + BODY * 3,
+]
+# Separators of varying length, so they straddle every small buffer size
+SEPARATORS = ["\n\n\n", "\n\n\n\n", "\n\n\n\n\n\n", "\n\n\n"]
+
+
+def _dataset_text(trailing=""):
+    text = "".join(a + s for a, s in zip(ARTICLES, SEPARATORS)) + ARTICLES[-1]
+    return text + trailing
+
+
+def _dataset_adapter(**kwargs):
+    return DatasetAdapter(min_article_length=50, max_article_length=400, **kwargs)
+
+
+def _summary(chunks):
+    return [
+        (text, m.chunk_id, m.chunk_index, m.category, m.extra.get("article_title"))
+        for text, m in chunks
+    ]
+
+
+def _buffered_reference(adapter, path, separator, buffer_size):
+    """The original buffered re.split reader, for comparison."""
+    chunks = []
+    article_index = 0
+    buffer = ""
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(buffer_size)
+            if not chunk:
+                if buffer.strip():
+                    chunks.extend(
+                        adapter._process_article(
+                            buffer.strip(), article_index, path.name, "encyclopedia"
+                        )
+                    )
+                return chunks
+            buffer += chunk
+            articles = re.split(separator, buffer)
+            buffer = articles[-1]
+            for article_text in articles[:-1]:
+                article_text = article_text.strip()
+                if len(article_text) >= adapter.min_article_length:
+                    chunks.extend(
+                        adapter._process_article(
+                            article_text, article_index, path.name, "encyclopedia"
+                        )
+                    )
+                    article_index += 1
+
+
+def _dataset_chunks(adapter, path, **kwargs):
+    kwargs.setdefault("text_format", "article_collection")
+    return list(adapter.get_chunks(str(path), **kwargs))
+
+
+@pytest.mark.parametrize("buffer_size", [1, 2, 3, 5, 7, 64, 8192])
+def test_dataset_chunks_match_buffered_reader(tmp_path, buffer_size):
+    path = tmp_path / "articles.txt"
+    path.write_text(_dataset_text())
+    adapter = _dataset_adapter()
+
+    chunks = _dataset_chunks(adapter, path)
+
+    assert _summary(chunks) == _summary(
+        _buffered_reference(adapter, path, r"\n\n\n+", buffer_size)
+    )
+    titles = [m.extra["article_title"] for _, m in chunks]
+    assert titles[0] == "Harbour"
+    assert "Article 1" in titles  # the short article does not take an index
+    assert sum(m.extra["is_split"] for _, m in chunks) > 1
+
+
+def test_dataset_short_trailing_article(tmp_path):
+    path = tmp_path / "articles.txt"
+    path.write_text(_dataset_text(trailing="\n\n\nTail\nshort"))
+    adapter = _dataset_adapter()
+
+    chunks = _dataset_chunks(adapter, path)
+
+    assert _summary(chunks) == _summary(
+        _buffered_reference(adapter, path, r"\n\n\n+", 8192)
+    )
+    assert all("short" not in text for text, _ in chunks)
+    # Resuming from the last chunk finds only the short tail
+    assert _dataset_chunks(adapter, path, **chunks[-1][1].extra["resume"]) == []
+
+
+def test_dataset_document_separator(tmp_path):
+    path = tmp_path / "docs.txt"
+    path.write_text("\n\n=====\n\n".join(ARTICLES))
+    adapter = _dataset_adapter()
+
+    chunks = _dataset_chunks(adapter, path, text_format="structured_docs")
+
+    assert _summary(chunks) == _summary(
+        _buffered_reference(adapter, path, r"\n\n={3,}\n\n", 8192)
+    )
+
+
+def test_dataset_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert _dataset_chunks(_dataset_adapter(), path) == []
+
+
+@pytest.mark.parametrize(
+    "newline, encoding",
+    [("\n", "utf-8"), ("\r\n", "utf-8"), ("\n", "utf-16")],
+    ids=["mmap", "crlf", "utf16"],
+)
+def test_dataset_resume_from_every_chunk(tmp_path, newline, encoding):
+    path = tmp_path / "articles.txt"
+    path.write_text(_dataset_text(), encoding=encoding, newline=newline)
+    adapter = _dataset_adapter()
+
+    chunks = _dataset_chunks(adapter, path, encoding=encoding)
+
+    # Byte scan and decoded-text fallback produce the same chunks
+    (tmp_path / "lf").mkdir()
+    reference = tmp_path / "lf" / "articles.txt"  # same name, same chunk IDs
+    reference.write_text(_dataset_text())
+    assert _summary(chunks) == _summary(_dataset_chunks(adapter, reference))
+
+    for i, (_, metadata) in enumerate(chunks):
+        resume = metadata.extra["resume"]
+        resumed = _dataset_chunks(adapter, path, encoding=encoding, **resume)
+        assert _summary(resumed) == _summary(chunks[i + 1 :])
+
+
+def test_dataset_resume_inside_split_article(tmp_path):
+    path = tmp_path / "articles.txt"
+    path.write_text(_dataset_text())
+    adapter = _dataset_adapter()
+    chunks = _dataset_chunks(adapter, path)
+    first_split = next(
+        i for i, (_, m) in enumerate(chunks) if m.extra.get("segment_index") == 0
+    )
+
+    resume = dict(chunks[first_split][1].extra["resume"])
+    assert resume["skip_segments"] == 1
+    resume["skip_segments"] = 0
+
+    resumed = _dataset_chunks(adapter, path, **resume)
+    assert _summary(resumed) == _summary(chunks[first_split:])
+
+
+WIKI_ARTICLES = [
+    ("Harbour", BODY * 2),
+    ("Stub", "Too short"),
+    ("River", f"{BODY}\n\nCourse\n------\n{BODY * 2}\n\nFlooding\n---\n{BODY}"),
+    ("Bridges", BODY * 30),  # longer than max_segment_length
+]
+
+
+def _wiki_text():
+    return "".join(f"{title}\n=======\n{body}\n\n" for title, body in WIKI_ARTICLES)
+
+
+def _plain_text():
+    paragraphs = [BODY, "Short.", BODY * 2, "", BODY * 30, BODY]
+    separators = ["\n\n", "\n  \n", "\n\n\n\n", "\n\n", "\n\t\n"]
+    text = "".join(p + s for p, s in zip(paragraphs, separators))
+    return text + paragraphs[-1]
+
+
+def _file_adapter(**kwargs):
+    return FileAdapter(min_segment_length=50, max_segment_length=1000, **kwargs)
+
+
+def _file_summary(chunks):
+    return [
+        (
+            text,
+            m.chunk_id,
+            m.chunk_index,
+            m.category,
+            m.extra["segment_type"],
+            m.extra["start_pos"],
+            m.extra["end_pos"],
+        )
+        for text, m in chunks
+    ]
+
+
+def _whole_text_reference(path, file_format):
+    """Segments of the original whole-file processors, as file chunk fields."""
+    adapter = _file_adapter()
+    processor = IntelligentTextProcessor(
+        min_segment_length=50, max_segment_length=1000
+    )
+    content = path.read_text()
+    if file_format == "wikipedia":
+        segments = processor.process_wikipedia_format(content)
+    else:
+        segments = processor.process_plain_text(content)
+    return [
+        (
+            s.content,
+            hashlib.md5(f"{path}:{s.start_pos}:{s.end_pos}".encode()).hexdigest()[:16],
+            index,
+            adapter._infer_category(s.content),
+            s.segment_type,
+            s.start_pos,
+            s.end_pos,
+        )
+        for index, s in enumerate(segments)
+    ]
+
+
+@pytest.mark.parametrize(
+    "file_format, make_text", [("wikipedia", _wiki_text), ("plain", _plain_text)]
+)
+def test_file_chunks_match_whole_text_processing(tmp_path, file_format, make_text):
+    path = tmp_path / "source.txt"
+    path.write_text(make_text())
+
+    chunks = list(_file_adapter().get_chunks(str(path), file_format=file_format))
+
+    assert _file_summary(chunks) == _whole_text_reference(path, file_format)
+    assert len({m.extra["segment_type"] for _, m in chunks}) > 1
+    # Context is taken around the segment's real position in the file
+    assert all(m.extra["context"] for _, m in chunks)
+
+
+@pytest.mark.parametrize("file_format", ["wikipedia", "plain"])
+def test_file_empty(tmp_path, file_format):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert list(_file_adapter().get_chunks(str(path), file_format=file_format)) == []
+
+
+@pytest.mark.parametrize(
+    "file_format, make_text", [("wikipedia", _wiki_text), ("plain", _plain_text)]
+)
+def test_file_crlf_and_utf16_fallback(tmp_path, file_format, make_text):
+    path = tmp_path / "source.txt"
+    path.write_text(make_text())
+    expected = _file_summary(
+        _file_adapter().get_chunks(str(path), file_format=file_format)
+    )
+
+    for newline, encoding in [("\r\n", "utf-8"), ("\n", "utf-16")]:
+        path.write_text(make_text(), encoding=encoding, newline=newline)
+        chunks = _file_adapter().get_chunks(
+            str(path), file_format=file_format, encoding=encoding
+        )
+        assert _file_summary(chunks) == expected
+
+
+def _details(chunks):
+    return [(text, vars(metadata)) for text, metadata in chunks]
+
+
+ENCODINGS = pytest.mark.parametrize(
+    "newline, encoding",
+    [("\n", "utf-8"), ("\r\n", "utf-8"), ("\n", "utf-16")],
+    ids=["mmap", "crlf", "utf16"],
+)
+
+
+@ENCODINGS
+def test_dataset_parallel_preprocessing_matches_inline(tmp_path, newline, encoding):
+    path = tmp_path / "articles.txt"
+    path.write_text(_dataset_text(), encoding=encoding, newline=newline)
+    # Small ranges: several worker tasks, untitled article in the middle
+    parallel = _dataset_adapter(preprocess_workers=2, preprocess_range_bytes=256)
+
+    expected = _dataset_chunks(_dataset_adapter(), path, encoding=encoding)
+    chunks = _dataset_chunks(parallel, path, encoding=encoding)
+
+    assert _details(chunks) == _details(expected)
+    assert "Article 1" in [m.extra["article_title"] for _, m in chunks]
+
+    resume = chunks[2][1].extra["resume"]
+    resumed = _dataset_chunks(parallel, path, encoding=encoding, **resume)
+    assert _details(resumed) == _details(expected[3:])
+
+
+@ENCODINGS
+@pytest.mark.parametrize(
+    "file_format, make_text", [("wikipedia", _wiki_text), ("plain", _plain_text)]
+)
+def test_file_parallel_preprocessing_matches_inline(
+    tmp_path, newline, encoding, file_format, make_text
+):
+    path = tmp_path / "source.txt"
+    path.write_text(make_text(), encoding=encoding, newline=newline)
+    parallel = _file_adapter(preprocess_workers=2, preprocess_range_bytes=256)
+
+    kwargs = {"file_format": file_format, "encoding": encoding}
+    expected = list(_file_adapter().get_chunks(str(path), **kwargs))
+    chunks = list(parallel.get_chunks(str(path), **kwargs))
+
+    assert _details(chunks) == _details(expected)
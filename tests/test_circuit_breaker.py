@@ -0,0 +1,104 @@
+"""Tests for CircuitBreaker.call_async (shares state with call())."""
+
+import asyncio
+
+import pytest
+
+from sutra_core.resilience import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitBreakerState,
+)
+
+
+async def _ok():
+    return "ok"
+
+
+async def _fail():
+    raise RuntimeError("boom")
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    return CircuitBreaker(name="test", config=CircuitBreakerConfig(**kwargs))
+
+
+def test_call_async_returns_result():
+    breaker = _breaker()
+    assert asyncio.run(breaker.call_async(_ok)) == "ok"
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+
+def test_call_async_opens_after_threshold_and_fails_fast():
+    breaker = _breaker(failure_threshold=2)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            asyncio.run(breaker.call_async(_fail))
+
+    assert breaker.state == CircuitBreakerState.OPEN
+    with pytest.raises(CircuitBreakerError):
+        asyncio.run(breaker.call_async(_ok))
+    # Sync callers see the same state
+    with pytest.raises(CircuitBreakerError):
+        breaker.call(lambda: "ok")
+
+
+def test_call_async_half_open_recovers():
+    breaker = _breaker(failure_threshold=1, timeout_seconds=0)
+    with pytest.raises(RuntimeError):
+        asyncio.run(breaker.call_async(_fail))
+
+    assert asyncio.run(breaker.call_async(_ok)) == "ok"
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+
+def test_call_async_half_open_failure_reopens():
+    breaker = _breaker(failure_threshold=1, timeout_seconds=0)
+    with pytest.raises(RuntimeError):
+        asyncio.run(breaker.call_async(_fail))
+    with pytest.raises(RuntimeError):
+        asyncio.run(breaker.call_async(_fail))
+
+    assert breaker.state == CircuitBreakerState.OPEN
+
+
+def test_cancelled_half_open_call_releases_its_slot():
+    breaker = _breaker(failure_threshold=1, timeout_seconds=0, half_open_max_requests=1)
+    with pytest.raises(RuntimeError):
+        asyncio.run(breaker.call_async(_fail))
+
+    async def cancel_probe():
+        task = asyncio.ensure_future(breaker.call_async(lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_probe())
+    # The cancelled probe neither closed nor reopened the circuit...
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    # ...and its slot is free for the next test request
+    assert asyncio.run(breaker.call_async(_ok)) == "ok"
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+
+def test_interrupted_sync_half_open_call_releases_its_slot():
+    class Interrupted(BaseException):
+        pass
+
+    def interrupted():
+        raise Interrupted()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    breaker = _breaker(failure_threshold=1, timeout_seconds=0, half_open_max_requests=1)
+    with pytest.raises(RuntimeError):
+        breaker.call(fail)
+    with pytest.raises(Interrupted):
+        breaker.call(interrupted)
+
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreakerState.CLOSED
@@ -0,0 +1,148 @@
+"""Tests for EntityCache and its files shared with the extraction service."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from sutra_core.learning.entity_cache import EntityCache
+
+
+def _queue(tmp_path):
+    return json.loads((tmp_path / "processing_queue.json").read_text())
+
+
+def _write_cache(tmp_path, data, mtime=None):
+    path = tmp_path / "entity_cache.json"
+    path.write_text(json.dumps(data))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_queue_written_in_legacy_format_on_flush(tmp_path):
+    cache = EntityCache(str(tmp_path))
+    cache.add_to_processing_queue("c1")
+    cache.add_to_processing_queue("c2")
+    assert not (tmp_path / "processing_queue.json").exists()
+
+    cache.flush()
+    assert _queue(tmp_path) == ["c1", "c2"]
+    assert "\n" not in (tmp_path / "processing_queue.json").read_text()
+
+
+def test_batch_threshold_flushes(tmp_path):
+    cache = EntityCache(str(tmp_path), flush_batch_size=3)
+    cache.add_to_processing_queue("c1")
+    cache.add_to_processing_queue("c2")
+    assert cache.stats()["pending_queue_writes"] == 2
+
+    cache.add_to_processing_queue("c3")
+    assert _queue(tmp_path) == ["c1", "c2", "c3"]
+    assert cache.stats()["pending_queue_writes"] == 0
+
+
+def test_timer_flushes(tmp_path):
+    cache = EntityCache(str(tmp_path), flush_interval=0.05)
+    cache.add_to_processing_queue("c1")
+
+    deadline = time.monotonic() + 5
+    while not (tmp_path / "processing_queue.json").exists():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert _queue(tmp_path) == ["c1"]
+
+
+def test_close_flushes(tmp_path):
+    cache = EntityCache(str(tmp_path))
+    cache.add_to_processing_queue("c1")
+    cache.close()
+    assert _queue(tmp_path) == ["c1"]
+
+
+def test_queue_dedup_and_cached_ids_skipped(tmp_path):
+    _write_cache(tmp_path, {"cached": {"entities": [{"text": "x"}]}})
+    (tmp_path / "processing_queue.json").write_text(json.dumps(["c1"]))
+    cache = EntityCache(str(tmp_path))
+
+    cache.add_to_processing_queue("c1")
+    cache.add_to_processing_queue("cached")
+    cache.add_to_processing_queue("c2")
+    cache.add_to_processing_queue("c2")
+    cache.flush()
+
+    assert _queue(tmp_path) == ["c1", "c2"]
+    assert cache.stats()["queued_concepts"] == 2
+
+
+def test_flush_merges_service_changes_and_compacts(tmp_path):
+    cache = EntityCache(str(tmp_path))
+    for cid in ("c1", "c2", "c3"):
+        cache.add_to_processing_queue(cid)
+    cache.flush()
+
+    # The service drained c1, queued x itself and extracted c2 without
+    # rewriting the queue
+    (tmp_path / "processing_queue.json").write_text(json.dumps(["c2", "c3", "x"]))
+    _write_cache(tmp_path, {"c2": []})
+    cache.reload()
+
+    cache.add_to_processing_queue("c4")
+    # c1 was drained, so a new miss queues it again
+    cache.add_to_processing_queue("c1")
+    cache.flush()
+    assert _queue(tmp_path) == ["c3", "x", "c4", "c1"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="flock is POSIX-only")
+def test_flush_waits_for_queue_lock(tmp_path):
+    import fcntl
+
+    cache = EntityCache(str(tmp_path))
+    cache.add_to_processing_queue("c1")
+
+    with open(tmp_path / "processing_queue.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        flusher = threading.Thread(target=cache.flush)
+        flusher.start()
+        flusher.join(0.2)
+        # The service holds the lock: the queue is not touched meanwhile
+        assert flusher.is_alive()
+        (tmp_path / "processing_queue.json").write_text(json.dumps(["svc"]))
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    flusher.join(5)
+    assert _queue(tmp_path) == ["svc", "c1"]
+
+
+def test_reload_only_reparses_changed_file(tmp_path, monkeypatch):
+    _write_cache(tmp_path, {"a": {"entities": [{"text": "A"}]}}, mtime=1000)
+    cache = EntityCache(str(tmp_path))
+    assert cache.get("a") == [{"text": "A"}]
+
+    reads = []
+    original = type(tmp_path).read_text
+
+    def read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(tmp_path), "read_text", read_text)
+    cache.reload()
+    assert reads == []
+
+    _write_cache(tmp_path, {"a": [], "b": [{"text": "B"}]}, mtime=2000)
+    cache.reload()
+    assert len(reads) == 1
+    assert cache.get("b") == [{"text": "B"}]
+    assert cache.get("a") == []
+
+
+def test_reload_keeps_cache_on_partial_file(tmp_path):
+    _write_cache(tmp_path, {"a": [{"text": "A"}]}, mtime=1000)
+    cache = EntityCache(str(tmp_path))
+
+    (tmp_path / "entity_cache.json").write_text('{"a": [')
+    cache.reload()
+    assert cache.get("a") == [{"text": "A"}]
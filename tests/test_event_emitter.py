@@ -0,0 +1,136 @@
+"""Tests for EventEmitter buffering, flushing and write accounting."""
+
+import threading
+
+from sutra_core.events import EventEmitter
+from sutra_core.exceptions import PartialWriteError
+
+
+class FakeStorage:
+    """Records writes; concepts whose index is in fail_indices are rejected."""
+
+    def __init__(self, fail_indices=()):
+        self.fail_indices = set(fail_indices)
+        self.concepts = []
+        self.associations = []
+
+    def add_concepts(self, items):
+        failed = [i for i in range(len(items)) if i in self.fail_indices]
+        self.concepts.extend(c for i, (c, _) in enumerate(items) if i not in failed)
+        if failed:
+            raise PartialWriteError("rejected", written=len(items) - len(failed), failed=failed)
+        return len(items)
+
+    def add_associations(self, associations):
+        self.associations.extend(associations)
+        return len(associations)
+
+
+class ConceptOnlyStorage:
+    """Storage without bulk writes; every second concept fails."""
+
+    def __init__(self):
+        self.calls = 0
+        self.concepts = []
+
+    def add_concept(self, concept, embedding):
+        self.calls += 1
+        if self.calls % 2 == 0:
+            raise RuntimeError("write failed")
+        self.concepts.append(concept)
+
+    def add_association(self, association):
+        pass
+
+
+def _emitter(storage, **kwargs) -> EventEmitter:
+    kwargs.setdefault("rollups", False)
+    kwargs.setdefault("flush_interval", 10)
+    return EventEmitter(storage, **kwargs)
+
+
+def test_overflow_drops_oldest():
+    storage = FakeStorage()
+    emitter = _emitter(storage, max_buffer_size=5, batch_size=100)
+    for i in range(8):
+        emitter.emit_query_start(f"q{i}")
+
+    stats = emitter.stats()
+    assert stats["dropped_oldest"] == 3
+    assert stats["buffered"] == 5
+
+    assert emitter.flush()
+    assert len(storage.concepts) == 5
+    assert emitter.stats()["written"] == 5
+    emitter.close()
+
+
+def test_flush_writes_everything():
+    storage = FakeStorage()
+    emitter = _emitter(storage, batch_size=3)
+    for i in range(10):
+        emitter.emit_query_start(f"q{i}")
+
+    assert emitter.flush()
+    stats = emitter.stats()
+    assert stats["written"] == 10
+    assert stats["failed"] == 0
+    assert stats["buffered"] == 0
+    assert len(storage.concepts) == 10
+    emitter.close()
+
+
+def test_partial_write_counts_persisted_events():
+    storage = FakeStorage(fail_indices={1})
+    emitter = _emitter(storage, batch_size=100)
+    for i in range(4):
+        emitter.emit_query_start(f"q{i}")
+
+    assert emitter.flush()
+    stats = emitter.stats()
+    assert stats["written"] == 3
+    assert stats["failed"] == 1
+    # Associations of the rejected event are not written
+    stored_ids = {c.id for c in storage.concepts}
+    assert storage.associations
+    assert {a.source_id for a in storage.associations} == stored_ids
+    emitter.close()
+
+
+def test_partial_write_without_bulk_api():
+    storage = ConceptOnlyStorage()
+    emitter = _emitter(storage, batch_size=100)
+    for i in range(4):
+        emitter.emit_query_start(f"q{i}")
+
+    assert emitter.flush()
+    stats = emitter.stats()
+    assert stats["written"] == 2
+    assert stats["failed"] == 2
+    emitter.close()
+
+
+def test_close_flushes_and_stops_writer():
+    storage = FakeStorage()
+    emitter = _emitter(storage, batch_size=100)
+    emitter.emit_query_start("q")
+    writer = emitter._writer
+
+    emitter.close()
+    assert not writer.is_alive()
+    assert emitter.stats()["written"] == 1
+    assert len(storage.concepts) == 1
+
+    # Emitting after close starts a new writer
+    emitter.emit_query_start("again")
+    emitter.close()
+    assert emitter.stats()["written"] == 2
+    assert not any(t.name.startswith("event-writer-") for t in threading.enumerate())
+
+
+def test_sync_writes_count_failures():
+    storage = FakeStorage(fail_indices={0})
+    emitter = _emitter(storage, async_writes=False)
+    emitter.emit_query_start("q")
+    assert emitter.stats()["failed"] == 1
+    assert emitter.stats()["written"] == 0
@@ -0,0 +1,84 @@
+"""Tests for event rollups written by several aggregators."""
+
+from datetime import datetime, timedelta, timezone
+
+from sutra_core.events import EventAggregator, EventRollup, RollupIndex, store_rollups
+from sutra_core.observability_query import ObservabilityQueryInterface
+
+
+class FakeStorage:
+    def __init__(self):
+        self.concepts = {}
+        self.neighbors = {}
+
+    def add_concepts(self, items):
+        for concept, _ in items:
+            self.concepts[concept.id] = concept
+        return len(items)
+
+    def add_associations(self, associations):
+        for a in associations:
+            self.neighbors.setdefault(a.source_id, []).append(a.target_id)
+        return len(associations)
+
+    def get_neighbors(self, concept_id):
+        return list(dict.fromkeys(self.neighbors.get(concept_id, [])))
+
+    def get_concepts(self, concept_ids):
+        return {cid: self.concepts.get(cid) for cid in concept_ids}
+
+
+def _flush(aggregator, storage, events):
+    for timestamp, duration_ms in events:
+        aggregator.add("api", "query_completed", timestamp.isoformat(), True, duration_ms)
+    store_rollups(storage, aggregator.drain(include_open=True))
+
+
+def test_two_writers_same_hour_are_both_counted():
+    storage = FakeStorage()
+    now = datetime.now(timezone.utc).replace(second=30, microsecond=0)
+    first = EventAggregator(writer_id="worker-1")
+    second = EventAggregator(writer_id="worker-2")
+
+    _flush(first, storage, [(now, 10.0)] * 3)
+    _flush(second, storage, [(now, 500.0)] * 2)
+
+    hour = now.strftime("%Y%m%d_%H")
+    # Neither writer overwrote the other's rollups or index
+    assert RollupIndex.concept_id_for(hour, "worker-1") in storage.concepts
+    assert RollupIndex.concept_id_for(hour, "worker-2") in storage.concepts
+    assert len(storage.get_neighbors(RollupIndex.anchor_id_for(hour))) == 2
+
+    rollups = ObservabilityQueryInterface(storage)._load_rollups(
+        ["query_completed"], {"start": now - timedelta(minutes=5), "end": now}
+    )
+    assert len(rollups) == 1  # one merged minute rollup
+    assert rollups[0].count == 5
+    assert rollups[0].duration_max_ms == 500.0
+    assert rollups[0].duration_min_ms == 10.0
+
+
+def test_default_writer_ids_are_unique():
+    assert EventAggregator().writer_id != EventAggregator().writer_id
+
+
+def test_rollup_without_writer_keeps_legacy_id():
+    rollup = EventRollup("api", "query_completed", "20250101_1200")
+    assert rollup.concept_id == EventRollup.concept_id_for(
+        "api", "query_completed", "20250101_1200"
+    )
+    assert rollup.concept_id != EventRollup.concept_id_for(
+        "api", "query_completed", "20250101_1200", "worker-1"
+    )
+
+
+def test_merge_sums_counts_and_histograms():
+    a = EventRollup("api", "query_completed", "20250101_1200")
+    b = EventRollup("api", "query_completed", "20250101_1200")
+    a.add(False, 5.0, "Timeout: a", 3)
+    b.add(True, 2000.0, None, 3)
+
+    a.merge(b)
+    assert (a.count, a.failures, a.duration_count) == (2, 1, 2)
+    assert sum(a.latency_histogram) == 2
+    assert a.error_samples == ["Timeout: a"]
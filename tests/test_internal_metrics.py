@@ -0,0 +1,129 @@
+"""Tests for the internal metrics collector and the FastAPI metrics middleware."""
+
+import threading
+
+import pytest
+
+from sutra_core.monitoring.internal_metrics import (
+    COUNTER,
+    GAUGE,
+    HISTOGRAM,
+    OVERFLOW_LABELS,
+    InternalMetricsCollector,
+    bucket_quantile,
+)
+
+
+@pytest.fixture
+def collector():
+    return InternalMetricsCollector()
+
+
+def test_labelled_counters_are_separate_series(collector):
+    collector.counter_inc("requests_total", {"endpoint": "/a"})
+    collector.counter_inc("requests_total", {"endpoint": "/a"})
+    collector.counter_inc("requests_total", {"endpoint": "/b"}, 3)
+
+    assert collector.get_series("requests_total", {"endpoint": "/a"}).value == 2
+    assert collector.get_series("requests_total", {"endpoint": "/b"}).value == 3
+    assert collector.get_metric("requests_total").get_latest().value == 5
+
+
+def test_histogram_quantiles(collector):
+    for value in [0.001] * 90 + [0.2] * 10:
+        collector.histogram_observe("latency_seconds", value)
+
+    series = collector.get_series("latency_seconds")
+    assert series.count == 100
+    assert series.percentile(0.5) <= 0.005
+    assert 0.1 < series.percentile(0.95) <= 0.2
+    assert bucket_quantile((1.0, 2.0), [0, 0, 0], 0.5, 0.0, 0.0) is None
+
+
+def test_prometheus_exposition(collector):
+    collector.counter_inc("hits_total", {"path": 'a"b'})
+    collector.gauge_set("temperature", 21.5)
+    collector.histogram_observe("wait_seconds", 0.3, buckets=(0.1, 0.5))
+
+    text = collector.export_prometheus_format()
+    assert "# TYPE hits_total counter" in text
+    assert 'hits_total{path="a\\"b"} 1.0' in text
+    assert "temperature 21.5" in text
+    assert 'wait_seconds_bucket{le="0.1"} 0' in text
+    assert 'wait_seconds_bucket{le="0.5"} 1' in text
+    assert 'wait_seconds_bucket{le="+Inf"} 1' in text
+    assert "wait_seconds_sum 0.3" in text
+    assert "wait_seconds_count 1" in text
+
+
+def test_shards_from_many_threads_merge(collector):
+    counter = collector.metric_key("work_total")
+    histogram = collector.metric_key("work_seconds", metric_type=HISTOGRAM)
+
+    def work():
+        for _ in range(1000):
+            collector.inc(counter)
+            collector.observe(histogram, 0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert collector.get_series("work_total").value == 4000
+    assert collector.get_series("work_seconds").count == 4000
+    # Merging again adds nothing
+    assert collector.get_series("work_total").value == 4000
+
+
+def test_gauge_increments_and_type_conflicts(collector):
+    active = collector.metric_key("active", metric_type=GAUGE)
+    collector.inc(active, 1)
+    collector.inc(active, 1)
+    collector.inc(active, -1)
+    assert collector.get_series("active").value == 1
+
+    with pytest.raises(ValueError):
+        collector.metric_key("active", metric_type=HISTOGRAM)
+
+
+def test_series_cap_folds_new_label_sets_into_overflow():
+    collector = InternalMetricsCollector(max_series_per_metric=2)
+    for i in range(10):
+        collector.counter_inc("paths_total", {"path": f"/p{i}"})
+
+    family = collector.get_metric("paths_total")
+    assert len(family.series) == 3  # two label sets + overflow
+    assert family.series[OVERFLOW_LABELS].value == 8
+    assert len(collector._interned) <= 3
+    assert family.type == COUNTER
+
+
+def test_middleware_labels_unmatched_paths():
+    fastapi = pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from sutra_core.monitoring.metrics_middleware import SutraMetricsMiddleware
+
+    collector = InternalMetricsCollector()
+    app = fastapi.FastAPI()
+    app.add_middleware(SutraMetricsMiddleware, service_name="t", metrics_collector=collector)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    for i in range(5):
+        assert client.get(f"/items/{i}").status_code == 200
+        assert client.get(f"/scan/{i}").status_code == 404
+
+    requests = collector.get_metric("t_requests_total").series
+    endpoints = {dict(key)["endpoint"] for key in requests}
+    assert endpoints == {"/items/{item_id}", "unmatched"}
+    assert collector.get_series(
+        "t_requests_total", {"method": "GET", "endpoint": "unmatched", "status": "404"}
+    ).value == 5
+    active = collector.get_series("t_active_requests")
+    assert active is None or active.value == 0
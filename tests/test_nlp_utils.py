@@ -0,0 +1,73 @@
+"""Tests for the shared TextProcessor and word extraction helpers."""
+
+import pytest
+
+from sutra_core.utils import nlp
+
+
+@pytest.fixture
+def fresh_processor(monkeypatch):
+    monkeypatch.setattr(nlp, "_default_processor", None)
+    monkeypatch.setattr(nlp, "_default_processor_error", None)
+
+
+def test_transient_init_failure_is_retried(fresh_processor, monkeypatch):
+    attempts = []
+
+    class FlakyProcessor:
+        def __init__(self):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("model download interrupted")
+
+    monkeypatch.setattr(nlp, "TextProcessor", FlakyProcessor)
+    with pytest.raises(RuntimeError):
+        nlp.get_text_processor()
+
+    processor = nlp.get_text_processor()
+    assert isinstance(processor, FlakyProcessor)
+    assert nlp.get_text_processor() is processor
+    assert len(attempts) == 2
+
+
+def test_missing_dependency_is_cached(fresh_processor, monkeypatch):
+    attempts = []
+
+    class MissingSpacy:
+        def __init__(self):
+            attempts.append(1)
+            raise ImportError("No module named 'spacy'")
+
+    monkeypatch.setattr(nlp, "TextProcessor", MissingSpacy)
+    for _ in range(3):
+        with pytest.raises(ImportError):
+            nlp.get_text_processor()
+    assert len(attempts) == 1
+
+
+def test_extract_words_without_spacy_keeps_inflections(fresh_processor, monkeypatch):
+    class MissingSpacy:
+        def __init__(self):
+            raise ImportError("No module named 'spacy'")
+
+    monkeypatch.setattr(nlp, "TextProcessor", MissingSpacy)
+    # Fallback tokens are lowercased, not stemmed (no making -> mak)
+    assert nlp.extract_words("The making of bleeding cells") == [
+        "making", "bleeding", "cells",
+    ]
+
+
+def test_extract_words_uses_spacy_processor(fresh_processor, monkeypatch):
+    class FakeProcessor:
+        def extract_meaningful_tokens(self, text):
+            return ["make", "bleed"]
+
+    monkeypatch.setattr(nlp, "_default_processor", FakeProcessor())
+    assert nlp.extract_words("making bleed") == ["make", "bleed"]
+
+
+def test_text_extract_words_and_clean_text():
+    from sutra_core.utils.text import clean_text, extract_words
+
+    assert extract_words("The quick brown fox, and the DOG!") == ["quick", "brown", "fox", "dog"]
+    assert clean_text("  a   b@#  c; d  ") == "a b c; d"
@@ -0,0 +1,148 @@
+"""Tests for per-request stage profiling and ReasoningEngine.ask(profile=True)."""
+
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from sutra_core.monitoring import internal_metrics
+from sutra_core.reasoning.engine import ReasoningEngine
+from sutra_core.reasoning.mppa import ConsensusResult
+from sutra_core.utils.profiling import (
+    current_profile,
+    profile_request,
+    record_rpc,
+    stage,
+)
+
+
+class FakeCollector:
+    def __init__(self):
+        self.counters = []
+        self.histograms = []
+
+    def counter_inc(self, name, labels=None, value=1):
+        self.counters.append((name, labels, value))
+
+    def histogram_observe(self, name, value, labels=None):
+        self.histograms.append((name, labels))
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    collector = FakeCollector()
+    monkeypatch.setattr(internal_metrics, "get_metrics_collector", lambda: collector)
+    return collector
+
+
+def test_unsampled_request_records_nothing(collector):
+    with profile_request("ask", sample_rate=0.0) as profile:
+        assert profile is None
+        assert current_profile() is None
+        with stage("embedding"):
+            record_rpc(10, 20)
+
+    assert collector.counters == []
+    assert collector.histograms == []
+
+
+def test_nested_request_reuses_outer_profile(collector):
+    with profile_request("ask", force=True) as outer:
+        with profile_request("search", sample_rate=0.0) as inner:
+            assert inner is outer
+            with stage("vector_search"):
+                record_rpc()
+        # The nested exit neither finished nor exported the profile
+        assert outer.total_ms is None
+        assert collector.histograms == []
+
+    assert current_profile() is None
+    assert outer.total_ms is not None
+    assert ("sutra_request_duration_seconds", {"request": "ask"}) in collector.histograms
+    assert all(labels["request"] == "ask" for _, labels, _ in collector.counters)
+
+
+def test_rpcs_attributed_to_innermost_stage(collector):
+    with profile_request("ask", force=True) as profile:
+        record_rpc(1, 1)
+        with stage("path_finding"):
+            record_rpc(10, 100)
+            with stage("storage"):
+                record_rpc(20, 200)
+                record_rpc(30, 300)
+            record_rpc(40, 400)
+        with stage("storage"):
+            pass
+
+    stages = profile.to_dict()["stages"]
+    assert stages["ask"]["rpcs"] == 1
+    assert stages["path_finding"]["rpcs"] == 2
+    assert stages["path_finding"]["bytes_sent"] == 50
+    assert stages["storage"]["rpcs"] == 2
+    assert stages["storage"]["bytes_received"] == 500
+    assert stages["storage"]["calls"] == 2
+    assert stages["path_finding"]["duration_ms"] >= stages["storage"]["duration_ms"]
+    assert profile.to_dict()["rpcs"] == 5
+    assert (
+        "sutra_request_stage_rpcs_total",
+        {"request": "ask", "stage": "storage"},
+        2,
+    ) in collector.counters
+
+
+class FakeQueryProcessor:
+    def __init__(self):
+        self.queries = []
+
+    def process_query(self, question, num_reasoning_paths=5, context=None, **kwargs):
+        self.queries.append(question)
+        with stage("path_finding"):
+            record_rpc(10, 100)
+        return ConsensusResult(
+            primary_answer="answer",
+            confidence=0.9,
+            consensus_strength=0.8,
+            supporting_paths=[],
+            alternative_answers=[],
+            reasoning_explanation="",
+        )
+
+
+def _engine():
+    """A caching engine with just the state ask() uses."""
+    engine = object.__new__(ReasoningEngine)
+    engine.profile_sample_rate = 0.0
+    engine.query_count = 0
+    engine.cache_hits = 0
+    engine._event_emitter = None
+    engine.enable_caching = True
+    engine.query_cache = OrderedDict()
+    engine.max_cache_size = 10
+    engine.cache_ttl_seconds = None
+    engine._cache_lock = threading.Lock()
+    engine.query_processor = FakeQueryProcessor()
+    return engine
+
+
+def test_ask_profile_returns_copy_and_keeps_cached_result(collector):
+    engine = _engine()
+
+    result = engine.ask("what?", profile=True)
+
+    assert result.primary_answer == "answer"
+    assert result.profile["request"] == "ask"
+    assert result.profile["stages"]["path_finding"]["rpcs"] == 1
+    cached, _ = engine.query_cache["what?"]
+    assert cached is not result
+    assert cached.profile is None
+
+    # A cache hit gets its own profile; the cached result stays unprofiled
+    hit = engine.ask("what?", profile=True)
+    assert engine.query_processor.queries == ["what?"]
+    assert "path_finding" not in hit.profile["stages"]
+    assert "cache_lookup" in hit.profile["stages"]
+    assert engine.query_cache["what?"][0].profile is None
+
+    plain = engine.ask("what?")
+    assert plain is cached
+    assert plain.profile is None
@@ -61,3 +61,51 @@ def test_query_processor_direct_semantic_answer():
     assert result.primary_answer and isinstance(result.primary_answer, str)
     assert result.confidence >= 0.99
     assert "Direct semantic match" in result.reasoning_explanation
+
+
+def test_query_context_embeds_and_searches_once():
+    from sutra_core.reasoning.context import QueryContext
+
+    concepts = {
+        "py": Concept(id="py", content="Python is a programming language.", strength=1.0, confidence=1.0),
+    }
+    calls = {"encode": 0, "search": 0, "get": 0}
+
+    class CountingEmbedder(FakeEmbeddingProcessor):
+        def encode_single(self, text, prompt_name="Retrieval-query"):
+            calls["encode"] += 1
+            return super().encode_single(text, prompt_name)
+
+    class FakeStorage:
+        def get_concept(self, cid):
+            calls["get"] += 1
+            return concepts.get(cid)
+        def vector_search(self, query_embedding, k=10):
+            calls["search"] += 1
+            return [("py", 0.99)][:k]
+        def get_neighbors(self, cid):
+            return []
+        def get_association(self, a, b):
+            return None
+        def find_paths(self, start_ids, target_ids, max_depth=5, num_paths=5, query=""):
+            return []
+
+    storage = FakeStorage()
+    qp = QueryProcessor(
+        storage=storage,
+        association_extractor=AssociationExtractor(storage),
+        path_finder=PathFinder(storage),
+        mppa=MultiPathAggregator(),
+        embedding_processor=CountingEmbedder({}),
+        nlp_processor=None,
+    )
+
+    context = QueryContext("What is Python?")
+    qp.process_query("What is Python?", max_concepts=10, context=context)
+    # A later, smaller search (e.g. the hybrid semantic boost) is served from the context
+    hits = context.get_vector_hits(storage, 5, qp.encode_query)
+    context.get_concept(storage, "py")
+
+    assert hits == [("py", 0.99)]
+    assert calls == {"encode": 1, "search": 1, "get": 1}
+    assert context.embedding_calls == 1 and context.vector_search_calls == 1
@@ -0,0 +1,221 @@
+"""Tests for StorageClient request metrics, hooks and the adapter's metrics export."""
+
+import logging
+import socket
+
+import pytest
+
+
+@pytest.fixture
+def client(storage_server):
+    from sutra_storage_client import StorageClient
+
+    return StorageClient("storage.test:50051")
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    from sutra_core.storage import tcp_adapter
+
+    monkeypatch.setattr(tcp_adapter.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    from sutra_core.monitoring import internal_metrics
+
+    collector = internal_metrics.InternalMetricsCollector()
+    monkeypatch.setattr(internal_metrics, "get_metrics_collector", lambda: collector)
+    return collector
+
+
+def _drop_first(storage_server, count=1):
+    """Drop the connection at the first ``count`` requests, then answer normally."""
+    drops = [count]
+
+    def handler(variant, data):
+        if drops[0] > 0:
+            drops[0] -= 1
+            return None
+        return storage_server.default_handler(variant, data)
+
+    storage_server.handler = handler
+
+
+def test_per_variant_counters(client, storage_server):
+    client.pipeline(
+        [("QueryConcept", {"concept_id": f"known-{i}"}) for i in range(3)]
+        + [("LearnConcept", {"content": "bad"}), ("LearnConcept", {"content": "ok"})]
+    )
+
+    metrics = client.metrics()
+    query = metrics["variants"]["QueryConcept"]
+    learn = metrics["variants"]["LearnConcept"]
+    assert metrics["requests"] == 5
+    assert (query["requests"], query["errors"], query["failures"]) == (3, 0, 0)
+    assert (learn["requests"], learn["errors"], learn["failures"]) == (2, 1, 0)
+    assert metrics["bytes_sent"] == sum(storage_server.sends) == client.bytes_sent
+    assert metrics["bytes_received"] == query["bytes_received"] + learn["bytes_received"]
+    assert sum(query["latency_buckets"].values()) == 3
+
+
+def test_latency_buckets_and_percentiles():
+    from sutra_storage_client import ClientMetrics, RpcEvent
+
+    metrics = ClientMetrics(buckets=(0.001, 0.01, 0.1))
+    assert metrics.snapshot()["variants"] == {}
+    for duration in [0.0005] * 90 + [0.05] * 9 + [2.0]:
+        metrics.record(RpcEvent("VectorSearch", "ok", duration, 10, 20))
+
+    stats = metrics.snapshot()["variants"]["VectorSearch"]
+    assert stats["latency_buckets"] == {"0.001": 90, "0.01": 0, "0.1": 9, "+Inf": 1}
+    assert stats["p50_ms"] == 1.0
+    assert stats["p99_ms"] == 100.0
+    assert stats["max_ms"] == 2000.0
+    assert stats["avg_ms"] == pytest.approx((0.045 + 0.45 + 2.0) / 100 * 1000)
+    # The +Inf bucket reports the maximum
+    assert metrics.variants["VectorSearch"].percentile(metrics.buckets, 100) == 2.0
+
+
+def test_failed_requests_are_counted_once(client, storage_server):
+    def handler(variant, data):
+        if data["concept_id"] == "known-2":
+            return None
+        return storage_server.default_handler(variant, data)
+
+    storage_server.handler = handler
+    with pytest.raises(ConnectionError):
+        client.pipeline([("QueryConcept", {"concept_id": f"known-{i}"}) for i in range(5)])
+
+    query = client.metrics()["variants"]["QueryConcept"]
+    # Two answered; the dropped request and the unanswered ones after it failed
+    assert (query["requests"], query["errors"], query["failures"]) == (5, 0, 3)
+    assert query["bytes_sent"] == sum(storage_server.sends)
+
+
+def test_failed_send_counts_no_bytes(client, monkeypatch):
+    def sendall(data):
+        raise BrokenPipeError("broken pipe")
+
+    monkeypatch.setattr(client.socket, "sendall", sendall)
+    with pytest.raises(BrokenPipeError):
+        client.query_concept("known-1")
+
+    metrics = client.metrics()
+    assert metrics["variants"]["QueryConcept"]["failures"] == 1
+    assert metrics["bytes_sent"] == 0
+
+
+class RecordingHook:
+    def __init__(self):
+        self.events = []
+        self.retries = []
+        self.reconnects = []
+
+    def on_request_start(self, variant):
+        return f"state-{variant}"
+
+    def on_request_end(self, state, event):
+        self.events.append((state, event.variant, event.status))
+
+    def on_retry(self, attempt, error):
+        self.retries.append(attempt)
+
+    def on_reconnect(self, success):
+        self.reconnects.append(success)
+
+
+class BrokenHook:
+    def __getattr__(self, name):
+        def fail(*args):
+            raise RuntimeError(f"{name} failed")
+
+        return fail
+
+
+def test_failing_hook_does_not_affect_request_or_other_hooks(storage_server):
+    from sutra_storage_client import StorageClient
+
+    recording = RecordingHook()
+    client = StorageClient("storage.test:50051", hooks=[BrokenHook(), recording])
+
+    assert client.query_concept("known-1") is not None
+    client.record_retry(1, ConnectionError("lost"))
+    client.record_reconnect(True)
+
+    assert recording.events == [("state-QueryConcept", "QueryConcept", "ok")]
+    assert recording.retries == [1]
+    assert recording.reconnects == [True]
+    assert client.metrics()["variants"]["QueryConcept"]["requests"] == 1
+
+
+def test_slow_request_log(storage_server, caplog):
+    from sutra_storage_client import StorageClient
+
+    slow = StorageClient("storage.test:50051", slow_request_threshold_ms=0)
+    fast = StorageClient("storage.test:50051", slow_request_threshold_ms=60_000)
+
+    with caplog.at_level(logging.WARNING, logger="sutra_storage_client"):
+        fast.query_concept("known-1")
+        assert caplog.records == []
+        slow.query_concept("known-1")
+
+    assert len(caplog.records) == 1
+    assert "Slow storage request QueryConcept" in caplog.records[0].getMessage()
+
+
+def test_adapter_counts_retries_and_reconnects(storage_server, no_backoff, monkeypatch):
+    from sutra_core.storage.tcp_adapter import TcpStorageAdapter
+
+    adapter = TcpStorageAdapter("storage.test:50051")
+    _drop_first(storage_server)
+    # The first reconnection attempt fails, so the second try cannot send
+    connects = [0]
+    fake_socket = socket.socket
+
+    def flaky_socket(*args, **kwargs):
+        connects[0] += 1
+        if connects[0] == 1:
+            raise OSError("connection refused")
+        return fake_socket(*args, **kwargs)
+
+    monkeypatch.setattr(socket, "socket", flaky_socket)
+
+    assert adapter.get_concept("known-1") is not None
+
+    metrics = adapter.metrics()
+    query = metrics["variants"]["QueryConcept"]
+    assert (metrics["retries"], metrics["reconnects"]) == (2, 1)
+    assert metrics["reconnect_failures"] == 1
+    assert (query["requests"], query["failures"]) == (2, 1)
+
+
+def test_adapter_exports_rpc_metrics(storage_server, collector, no_backoff):
+    from sutra_core.storage.tcp_adapter import TcpStorageAdapter
+    from sutra_core.utils.profiling import profile_request, stage
+
+    adapter = TcpStorageAdapter("storage.test:50051")
+    _drop_first(storage_server)
+
+    with profile_request("ask", force=True) as profile, stage("lookup"):
+        assert adapter.get_concept("known-1") is not None
+        adapter.contains_many(["known-2", "missing-1"])
+
+    def series(name, **labels):
+        return collector.get_series(name, labels)
+
+    requests = "sutra_storage_rpc_requests_total"
+    assert series(requests, variant="QueryConcept", status="ok").value == 3
+    assert series(requests, variant="QueryConcept", status="failed").value == 1
+    assert series("sutra_storage_rpc_duration_seconds", variant="QueryConcept").count == 4
+    assert series("sutra_storage_rpc_retries_total").value == 1
+    assert series("sutra_storage_rpc_reconnects_total", outcome="success").value == 1
+
+    metrics = adapter.metrics()
+    sent = series("sutra_storage_rpc_bytes_total", variant="QueryConcept", direction="sent")
+    assert sent.value == metrics["bytes_sent"]
+
+    lookup = profile.to_dict()["stages"]["lookup"]
+    assert lookup["rpcs"] == 4
+    assert lookup["bytes_sent"] == metrics["bytes_sent"]
+    assert lookup["bytes_received"] == metrics["bytes_received"]
@@ -0,0 +1,151 @@
+"""Tests for StorageClient pipelining and the TCP adapter's multi-item writes."""
+
+import pytest
+
+from sutra_core.exceptions import PartialWriteError
+from sutra_core.graph.concepts import Association, AssociationType, Concept
+
+
+@pytest.fixture
+def client(storage_server):
+    from sutra_storage_client import StorageClient
+
+    return StorageClient("storage.test:50051")
+
+
+@pytest.fixture
+def adapter(storage_server):
+    from sutra_core.storage.tcp_adapter import TcpStorageAdapter
+
+    return TcpStorageAdapter("storage.test:50051")
+
+
+def _query_requests(count, padding=0):
+    return [
+        ("QueryConcept", {"concept_id": f"known-{i:04d}" + "x" * padding})
+        for i in range(count)
+    ]
+
+
+def test_pipeline_splits_at_window(client, storage_server):
+    from sutra_storage_client import PIPELINE_WINDOW_BYTES
+
+    requests = _query_requests(200, padding=1000)
+    frame_size = len(client._frame(*requests[0]))
+    per_window = PIPELINE_WINDOW_BYTES // frame_size
+
+    responses = client.pipeline(requests)
+
+    assert len(responses) == 200
+    assert len(storage_server.requests) == 200
+    assert all(size <= PIPELINE_WINDOW_BYTES for size in storage_server.sends)
+    assert storage_server.sends[0] == per_window * frame_size
+    assert sum(storage_server.sends) == 200 * frame_size
+    assert len(storage_server.sends) == -(-200 // per_window)
+
+
+def test_pipeline_sends_oversized_frame_alone(client, storage_server):
+    from sutra_storage_client import PIPELINE_WINDOW_BYTES
+
+    requests = _query_requests(1) + _query_requests(1, padding=PIPELINE_WINDOW_BYTES)
+    requests += _query_requests(1)
+
+    assert len(client.pipeline(requests)) == 3
+    assert len(storage_server.sends) == 3
+    assert storage_server.sends[1] > PIPELINE_WINDOW_BYTES
+
+
+def test_pipeline_responses_in_request_order(client):
+    ids = [f"known-{i}" if i % 3 else f"missing-{i}" for i in range(500)]
+
+    results = client.query_concepts(ids + ["x" * 40_000])
+
+    assert [r["id"] if r else None for r in results[:-1]] == [
+        concept_id if concept_id.startswith("known") else None for concept_id in ids
+    ]
+    assert results[-1] is None
+
+
+def test_pipeline_connection_drop_raises(client, storage_server):
+    def handler(variant, data):
+        if data["concept_id"] == "known-0005":
+            return None
+        return storage_server.default_handler(variant, data)
+
+    storage_server.handler = handler
+    with pytest.raises(ConnectionError):
+        client.pipeline(_query_requests(10))
+
+
+def test_add_associations_partial_write_reports_failed_indices(adapter, storage_server):
+    sources = ["a", "bad", "c"] * 400 + ["bad"]  # several pipeline windows
+    associations = [
+        Association(source_id=s, target_id="t", assoc_type=AssociationType.SEMANTIC)
+        for s in sources
+    ]
+
+    with pytest.raises(PartialWriteError) as exc_info:
+        adapter.add_associations(associations)
+
+    expected_failed = [i for i, s in enumerate(sources) if s == "bad"]
+    assert exc_info.value.failed == expected_failed
+    assert exc_info.value.written == len(sources) - len(expected_failed)
+    # Every association was attempted, once
+    assert len(storage_server.requests) == len(sources)
+    assert len(storage_server.sends) > 1
+
+
+def test_add_concepts_partial_write(adapter):
+    items = [
+        (Concept(id=f"c{i}", content=content), [0.5] * 4)
+        for i, content in enumerate(["ok", "bad", "ok", "ok", "bad"])
+    ]
+
+    with pytest.raises(PartialWriteError) as exc_info:
+        adapter.add_concepts(items)
+
+    assert exc_info.value.failed == [1, 4]
+    assert exc_info.value.written == 3
+    assert adapter.add_concepts(items[:1]) == 1
+    assert adapter.add_concepts([]) == 0
+
+
+def test_unexpected_responses_fail_each_item(adapter, storage_server):
+    storage_server.handler = lambda variant, data: {"Unexpected": []}
+    association = Association(
+        source_id="a", target_id="b", assoc_type=AssociationType.SEMANTIC
+    )
+
+    with pytest.raises(PartialWriteError) as exc_info:
+        adapter.add_associations([association] * 3)
+
+    assert exc_info.value.failed == [0, 1, 2]
+    assert exc_info.value.written == 0
+
+
+def test_lost_connection_marks_every_item_failed(adapter, storage_server, monkeypatch):
+    from sutra_core.storage import tcp_adapter
+
+    monkeypatch.setattr(tcp_adapter.time, "sleep", lambda seconds: None)
+    storage_server.handler = lambda variant, data: None
+    association = Association(
+        source_id="a", target_id="b", assoc_type=AssociationType.SEMANTIC
+    )
+
+    with pytest.raises(PartialWriteError) as exc_info:
+        adapter.add_associations([association] * 3)
+
+    assert exc_info.value.failed == [0, 1, 2]
+    assert exc_info.value.written == 0
+    assert adapter.contains_many(["known-1"]) == set()
+
+
+def test_contains_many_mixed_ids(adapter, storage_server):
+    ids = ["known-1", "missing-1", "known-2", "known-1", "missing-2"]
+
+    assert adapter.contains_many(ids) == {"known-1", "known-2"}
+    # Duplicates are queried once
+    assert [data["concept_id"] for _, data in storage_server.requests] == [
+        "known-1", "missing-1", "known-2", "missing-2"
+    ]
+    assert adapter.contains_many([]) == set()